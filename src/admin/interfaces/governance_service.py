@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Hashable, List, Optional, Tuple
 from uuid import UUID
 from src.admin.domain.admin_command import AdminCommand
 from src.admin.domain.governance_decision import GovernanceDecision
@@ -24,4 +24,11 @@ class GovernanceService(ABC):
 
     @abstractmethod
     def get_audit_history(self) -> List[Tuple[AdminCommand, GovernanceDecision]]:
-        pass
\ No newline at end of file
+        pass
+
+    def revision(self) -> Optional[Hashable]:
+        """
+        Token that changes whenever the active decisions change.
+        None means unknown: callers must not cache anything derived from the decisions.
+        """
+        return None
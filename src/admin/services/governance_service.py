@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Hashable, List, Optional, Tuple
 from uuid import UUID
 from src.admin.interfaces.governance_service import GovernanceService
 from src.admin.interfaces.admin_command_handler import AdminCommandHandler
@@ -57,4 +57,7 @@ class StandardGovernanceService(GovernanceService):
         return self.state_store.get(decision_id)
 
     def get_audit_history(self) -> List[Tuple[AdminCommand, GovernanceDecision]]:
-        return self.audit_store.get_history()
\ No newline at end of file
+        return self.audit_store.get_history()
+
+    def revision(self) -> Optional[Hashable]:
+        return self.state_store.revision()
@@ -10,12 +10,14 @@ class GovernanceStateStore:
     def __init__(self):
         self._decisions: Dict[UUID, GovernanceDecision] = {}
         self._scope_index: Dict[GovernanceScope, List[UUID]] = {}
+        self._revision = 0
 
     def add(self, decision: GovernanceDecision) -> None:
         self._decisions[decision.id] = decision
         if decision.scope not in self._scope_index:
             self._scope_index[decision.scope] = []
         self._scope_index[decision.scope].append(decision.id)
+        self._revision += 1
 
     def get(self, decision_id: UUID) -> Optional[GovernanceDecision]:
         return self._decisions.get(decision_id)
@@ -25,4 +27,10 @@ class GovernanceStateStore:
         return [self._decisions[id] for id in ids]
 
     def list_all(self) -> List[GovernanceDecision]:
-        return list(self._decisions.values())
\ No newline at end of file
+        return list(self._decisions.values())
+
+    def revision(self) -> int:
+        """
+        Changes whenever the set of decisions changes.
+        """
+        return self._revision
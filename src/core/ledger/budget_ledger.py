@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
+from uuid import UUID
 from src.core.ledger.budget_event import BudgetEvent
 
 class BudgetLedger(ABC):
@@ -7,10 +8,51 @@ class BudgetLedger(ABC):
     Append-only log of budget events.
     Global scope (not context-scoped).
     """
+    DEFAULT_PAGE_SIZE = 500
+
     @abstractmethod
     def record(self, event: BudgetEvent) -> None:
         pass
 
     @abstractmethod
     def get_history(self) -> List[BudgetEvent]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def last_event_id(self) -> Optional[UUID]:
+        """
+        Returns the id of the most recently recorded event, or None if empty.
+        Must not materialize the full history.
+        """
+        pass
+
+    @abstractmethod
+    def iter_history_since(
+            self,
+            event_id: Optional[UUID],
+            page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[BudgetEvent]]:
+        """
+        Streams events recorded strictly after event_id, in pages of at most page_size.
+        None streams the full history; an unknown id yields nothing.
+        """
+        pass
+
+    def get_history_since(self, event_id: Optional[UUID]) -> List[BudgetEvent]:
+        return [event for page in self.iter_history_since(event_id) for event in page]
+
+    @abstractmethod
+    def compact(self, anchor_id: UUID, archive: bool = True) -> int:
+        """
+        Removes the events recorded before anchor_id, the last event covered by a durable budget
+        snapshot. The anchor itself is kept; an unknown anchor removes nothing. With archive,
+        removed events stay readable through iter_full_history. Runs concurrently with record().
+        Returns the number of events removed.
+        """
+        pass
+
+    def iter_full_history(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[BudgetEvent]]:
+        """
+        Streams archived events followed by the live history, for full-history checks.
+        """
+        return self.iter_history_since(None, page_size=page_size)
@@ -0,0 +1,91 @@
+from dataclasses import asdict, fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Tuple, Type
+from uuid import UUID
+
+from src.core.domain.strategic_trajectory import TrajectoryStatus
+from src.core.domain.strategy import StrategicMode
+
+# Immutable leaf types: asdict's deep copy of them is an equal value, so they pass through.
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None), UUID})
+_EVENT_ENUMS = (StrategicMode, TrajectoryStatus)
+
+# Marks a field value the fast path does not cover.
+_UNSUPPORTED = object()
+
+_field_names_cache: Dict[Type, Tuple[str, ...]] = {}
+
+
+def serialize_for_event(obj: Any) -> Any:
+    """
+    Converts a domain object into a StrategicEvent details value.
+
+    Output is identical to serialize_for_event_asdict (the original format, kept readable
+    by existing ledgers and replays) but reads dataclass fields directly instead of
+    deep-copying the object with asdict() first. Field values outside the common shapes
+    (nested dataclasses, tuples, dicts of non-leaf values) fall back to the asdict path.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, _EVENT_ENUMS):
+        return obj.value
+    if hasattr(obj, "__dataclass_fields__"):
+        names = _field_names_cache.get(type(obj))
+        if names is None:
+            names = _field_names_cache[type(obj)] = tuple(f.name for f in fields(obj))
+        result = {}
+        for name in names:
+            value = _field_value(getattr(obj, name))
+            if value is _UNSUPPORTED:
+                return serialize_for_event_asdict(obj)
+            result[name] = value
+        return result
+    if isinstance(obj, list):
+        return [serialize_for_event(i) for i in obj]
+    return obj
+
+
+def serialize_for_event_asdict(obj: Any) -> Any:
+    """
+    Reference serialization: dataclasses are flattened with asdict() and only their
+    top-level fields (and list items) get datetime/enum conversion.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, _EVENT_ENUMS):
+        return obj.value
+    if hasattr(obj, "__dataclass_fields__"):
+        return {k: serialize_for_event_asdict(v) for k, v in asdict(obj).items()}
+    if isinstance(obj, list):
+        return [serialize_for_event_asdict(i) for i in obj]
+    return obj
+
+
+def _field_value(value: Any) -> Any:
+    """
+    serialize_for_event_asdict applied to asdict's copy of a field value,
+    or _UNSUPPORTED.
+    """
+    value_type = type(value)
+    if value_type in _LEAF_TYPES:
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value if isinstance(value, _EVENT_ENUMS) else value
+    if value_type is list:
+        items = []
+        for item in value:
+            item = _field_value(item)
+            if item is _UNSUPPORTED:
+                return _UNSUPPORTED
+            items.append(item)
+        return items
+    if value_type is dict:
+        # Dict contents are copied but not converted.
+        for key, item in value.items():
+            if type(key) not in _LEAF_TYPES or type(item) not in _LEAF_TYPES:
+                return _UNSUPPORTED
+        return dict(value)
+    return _UNSUPPORTED
@@ -1,24 +1,56 @@
 import json
 import os
-from typing import List
+from typing import Iterator, List, Optional
 from datetime import datetime
 from uuid import UUID
 
 from src.core.ledger.budget_ledger import BudgetLedger
 from src.core.ledger.budget_event import BudgetEvent
+from src.core.ledger.jsonl_reader import (
+    READ_CHUNK_SIZE,
+    find_offset_after,
+    iter_lines_reversed,
+    iter_pages_from,
+)
+from src.core.ledger.jsonl_compaction import (
+    compact_jsonl,
+    compaction_lock_for,
+    default_archive_path,
+    iter_archived_records,
+    iter_records,
+    write_lock_for,
+)
+from src.core.ledger.group_commit import GroupCommitConfig, GroupCommitter
 
 
 class FileBudgetLedger(BudgetLedger):
     """
     File-backed append-only log of budget events.
+    Tail reads (last_event_id, iter_history_since) locate their start by scanning
+    backwards from EOF, so their cost is bounded by the tail rather than the full log.
+    With group_commit set, concurrent records share one write and one fsync.
+    compact() moves covered events to archive_path (default: <name>.archive.jsonl).
+    Appends and the compaction swap hold an flock on <name>.lock, so processes sharing the
+    file never append to a log that is being replaced.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(
+            self,
+            file_path: str,
+            read_chunk_size: int = READ_CHUNK_SIZE,
+            group_commit: Optional[GroupCommitConfig] = None,
+            archive_path: Optional[str] = None
+    ):
         self.file_path = file_path
+        self.read_chunk_size = read_chunk_size
+        self.archive_path = archive_path or default_archive_path(file_path)
+        self._compaction_lock = compaction_lock_for(file_path)
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         if not os.path.exists(file_path):
             with open(file_path, 'w') as f:
                 f.write("")
+        self._lock = write_lock_for(file_path)
+        self._committer = GroupCommitter(self._append_durably, group_commit) if group_commit else None
 
     def record(self, event: BudgetEvent) -> None:
         data = {
@@ -28,8 +60,20 @@ class FileBudgetLedger(BudgetLedger):
             "delta": event.delta,
             "reason": event.reason
         }
-        with open(self.file_path, 'a') as f:
-            f.write(json.dumps(data) + "\n")
+        line = json.dumps(data) + "\n"
+        if self._committer:
+            self._committer.submit(line)
+            return
+        with self._lock:
+            with open(self.file_path, 'a') as f:
+                f.write(line)
+
+    def _append_durably(self, lines: List[str]) -> None:
+        with self._lock:
+            with open(self.file_path, 'a') as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
 
     def get_history(self) -> List[BudgetEvent]:
         events = []
@@ -38,18 +82,91 @@ class FileBudgetLedger(BudgetLedger):
 
         with open(self.file_path, 'r') as f:
             for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    event = BudgetEvent(
-                        id=UUID(data['id']),
-                        timestamp=datetime.fromisoformat(data['timestamp']),
-                        event_type=data['event_type'],
-                        delta=data['delta'],
-                        reason=data['reason']
-                    )
+                event = self._decode(line)
+                if event is not None:
                     events.append(event)
-                except json.JSONDecodeError:
+        return events
+
+    def last_event_id(self) -> Optional[UUID]:
+        for _, raw in iter_lines_reversed(self.file_path, self.read_chunk_size):
+            event = self._decode(raw)
+            if event is not None:
+                return event.id
+        return None
+
+    def iter_history_since(
+            self,
+            event_id: Optional[UUID],
+            page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[BudgetEvent]]:
+        try:
+            f = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            if event_id is None:
+                offset = 0
+            else:
+                offset = find_offset_after(f, str(event_id), self.read_chunk_size)
+                if offset is None:
+                    return
+            yield from iter_pages_from(f, offset, self._decode, page_size)
+
+    def compact(self, anchor_id: UUID, archive: bool = True) -> int:
+        anchor = str(anchor_id)
+
+        def plan(source, end):
+            before_anchor = any(data is not None and data.get("id") == anchor for _, data in iter_records(source, end))
+
+            def covered(data: dict) -> bool:
+                nonlocal before_anchor
+                if before_anchor and data.get("id") == anchor:
+                    before_anchor = False
+                return before_anchor
+
+            return covered
+
+        with self._compaction_lock:
+            return compact_jsonl(self.file_path, self._lock, plan, self.archive_path if archive else None)
+
+    def iter_full_history(self, page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE) -> Iterator[List[BudgetEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        # A crash mid-compaction can leave an event both archived and live; ids dedupe it.
+        seen = set()
+        page: List[BudgetEvent] = []
+        for data in iter_archived_records(self.archive_path, seen):
+            page.append(self._from_data(data))
+            if len(page) >= page_size:
+                yield page
+                page = []
+        for live_page in self.iter_history_since(None, page_size=page_size):
+            for event in live_page:
+                if str(event.id) in seen:
                     continue
-        return events
\ No newline at end of file
+                page.append(event)
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+    @staticmethod
+    def _decode(line) -> Optional[BudgetEvent]:
+        if not line.strip():
+            return None
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return FileBudgetLedger._from_data(data)
+
+    @staticmethod
+    def _from_data(data: dict) -> BudgetEvent:
+        return BudgetEvent(
+            id=UUID(data['id']),
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            event_type=data['event_type'],
+            delta=data['delta'],
+            reason=data['reason']
+        )
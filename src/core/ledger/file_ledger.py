@@ -1,22 +1,48 @@
 import json
 import os
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 from uuid import UUID
 
 from src.core.ledger.strategic_ledger import StrategicLedger
 from src.core.ledger.strategic_event import StrategicEvent
 from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.jsonl_reader import READ_CHUNK_SIZE, find_offset_after, iter_pages_from
+from src.core.ledger.jsonl_compaction import (
+    compact_jsonl,
+    compaction_lock_for,
+    default_archive_path,
+    iter_archived_records,
+    iter_records,
+    write_lock_for,
+)
+from src.core.ledger.group_commit import GroupCommitConfig, GroupCommitter
 
 
 class FileStrategicLedger(StrategicLedger):
     """
     File-backed append-only log of strategic events.
     Ensures events persist across process restarts for true replay testing.
+    With group_commit set, concurrent records are appended in one write and one fsync;
+    record() returns only after its batch is on disk.
+    compact() moves covered events to archive_path (default: <name>.archive.jsonl).
+    Appends and the compaction swap hold an flock on <name>.lock, so processes sharing the
+    file never append to a log that is being replaced.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(
+            self,
+            file_path: str,
+            read_chunk_size: int = READ_CHUNK_SIZE,
+            group_commit: Optional[GroupCommitConfig] = None,
+            archive_path: Optional[str] = None
+    ):
         self.file_path = file_path
+        self.read_chunk_size = read_chunk_size
+        self.archive_path = archive_path or default_archive_path(file_path)
+        self._lock = write_lock_for(file_path)
+        self._compaction_lock = compaction_lock_for(file_path)
+        self._committer = GroupCommitter(self._append_durably, group_commit) if group_commit else None
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         # Ensure file exists
         if not os.path.exists(file_path):
@@ -34,8 +60,20 @@ class FileStrategicLedger(StrategicLedger):
             # In production, this might be structured.
             "context_key": str(event.context)
         }
-        with open(self.file_path, 'a') as f:
-            f.write(json.dumps(data) + "\n")
+        line = json.dumps(data) + "\n"
+        if self._committer:
+            self._committer.submit(line)
+            return
+        with self._lock:
+            with open(self.file_path, 'a') as f:
+                f.write(line)
+
+    def _append_durably(self, lines: List[str]) -> None:
+        with self._lock:
+            with open(self.file_path, 'a') as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
 
     def get_history(self, context: StrategicContext) -> List[StrategicEvent]:
         events = []
@@ -69,4 +107,157 @@ class FileStrategicLedger(StrategicLedger):
                         events.append(event)
                 except json.JSONDecodeError:
                     continue
-        return events
\ No newline at end of file
+        return events
+
+    def iter_history_since(
+            self,
+            context: StrategicContext,
+            event_id: Optional[UUID],
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        # The anchor is located by scanning backwards from EOF, so the cost is
+        # bounded by what was written after it (across all contexts), not the full log.
+        target_key = str(context)
+        key_marker = json.dumps(target_key).encode('utf-8')
+        try:
+            f = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            if event_id is None:
+                offset = 0
+            else:
+                offset = find_offset_after(
+                    f,
+                    str(event_id),
+                    self.read_chunk_size,
+                    match=lambda data: data.get("context_key") == target_key
+                )
+                if offset is None:
+                    return
+            yield from iter_pages_from(
+                f, offset, lambda raw: self._decode_line(raw, key_marker, target_key, context), page_size
+            )
+
+    def compact(self, anchors: Sequence[Tuple[StrategicContext, UUID]], archive: bool = True) -> int:
+        wanted = {str(context): str(event_id) for context, event_id in anchors}
+
+        def plan(source, end):
+            # Only contexts whose anchor is actually in the log are compacted.
+            present = set()
+            for _, data in iter_records(source, end):
+                if data is not None and wanted.get(data.get("context_key")) == data.get("id"):
+                    present.add(data["context_key"])
+            passed = set()
+
+            def covered(data: dict) -> bool:
+                key = data.get("context_key")
+                if key not in present or key in passed:
+                    return False
+                if data.get("id") == wanted[key]:
+                    passed.add(key)
+                    return False
+                return True
+
+            return covered
+
+        with self._compaction_lock:
+            return compact_jsonl(self.file_path, self._lock, plan, self.archive_path if archive else None)
+
+    def iter_full_history(
+            self,
+            context: StrategicContext,
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        target_key = str(context)
+        # A crash mid-compaction can leave an event both archived and live; ids dedupe it.
+        seen = set()
+        page: List[StrategicEvent] = []
+        for data in iter_archived_records(self.archive_path, seen):
+            if data.get("context_key") != target_key:
+                continue
+            page.append(self._to_event(data, context))
+            if len(page) >= page_size:
+                yield page
+                page = []
+        for live_page in self.iter_history_since(context, None, page_size=page_size):
+            for event in live_page:
+                if str(event.id) in seen:
+                    continue
+                page.append(event)
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+    def get_histories_since(
+            self,
+            anchors: Sequence[Tuple[StrategicContext, Optional[UUID]]]
+    ) -> Dict[str, List[StrategicEvent]]:
+        # One forward pass over the log serves every requested context.
+        contexts = {str(context): context for context, _ in anchors}
+        pending_anchor = {
+            str(context): str(event_id) if event_id is not None else None
+            for context, event_id in anchors
+        }
+        histories: Dict[str, List[StrategicEvent]] = {key: [] for key in contexts}
+
+        if not os.path.exists(self.file_path):
+            return histories
+
+        with open(self.file_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                key = data.get("context_key")
+                if key not in contexts:
+                    continue
+                anchor = pending_anchor[key]
+                if anchor is not None:
+                    if data['id'] == anchor:
+                        pending_anchor[key] = None
+                    continue
+                histories[key].append(StrategicEvent(
+                    id=UUID(data['id']),
+                    timestamp=datetime.fromisoformat(data['timestamp']),
+                    event_type=data['event_type'],
+                    details=data['details'],
+                    context=contexts[key]
+                ))
+        return histories
+
+    @staticmethod
+    def _to_event(data: dict, context: StrategicContext) -> StrategicEvent:
+        return StrategicEvent(
+            id=UUID(data['id']),
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            event_type=data['event_type'],
+            details=data['details'],
+            context=context
+        )
+
+    @classmethod
+    def _decode_line(
+            cls,
+            raw: bytes,
+            key_marker: bytes,
+            target_key: str,
+            context: StrategicContext
+    ) -> Optional[StrategicEvent]:
+        # Cheap byte-level prefilter before JSON decoding other contexts' lines.
+        if key_marker not in raw:
+            return None
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        if data.get("context_key") != target_key:
+            return None
+        return cls._to_event(data, context)
@@ -0,0 +1,32 @@
+import fcntl
+from threading import Lock
+from typing import Optional, TextIO
+
+
+class FileLock:
+    """
+    Thread lock plus an flock on lock_path, so other processes using the same path are
+    excluded too. The lock file is opened on first use and kept open.
+    """
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._thread_lock = Lock()
+        self._file: Optional[TextIO] = None
+
+    def __enter__(self) -> "FileLock":
+        self._thread_lock.acquire()
+        try:
+            if self._file is None:
+                self._file = open(self.lock_path, 'a')
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
@@ -0,0 +1,95 @@
+import time
+from dataclasses import dataclass
+from threading import Condition, Event
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GroupCommitConfig:
+    """
+    Group-commit window for ledger writes.
+    A batch is committed once it holds max_batch records or max_delay_ms has passed since it opened;
+    a batch with a single record is committed as soon as the commits before it are done.
+    """
+    max_batch: int = 64
+    max_delay_ms: float = 2.0
+
+    def __post_init__(self):
+        if self.max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        if self.max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be >= 0")
+
+
+class _Batch(Generic[T]):
+    def __init__(self, sequence: int):
+        self.sequence = sequence
+        self.opened_at = time.monotonic()
+        self.items: List[T] = []
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitter(Generic[T]):
+    """
+    Combines concurrent submissions into one durable commit.
+    The first submitter of a batch leads it. The batch gathers while earlier batches commit; once
+    it is its turn, a lone submitter commits at once, otherwise the leader keeps the window open
+    until it fills or expires, then runs commit() for the whole batch. Every submitter returns only
+    after its batch was committed, and re-raises the commit error if it failed. Batches commit
+    strictly in the order they were opened.
+    """
+
+    def __init__(self, commit: Callable[[List[T]], None], config: GroupCommitConfig):
+        self._commit = commit
+        self.config = config
+        self._cond = Condition()
+        self._open: Optional[_Batch[T]] = None
+        self._next_sequence = 0
+        self._next_to_commit = 0
+
+    def submit(self, item: T) -> None:
+        with self._cond:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch(self._next_sequence)
+                self._next_sequence += 1
+            batch.items.append(item)
+            if len(batch.items) >= self.config.max_batch:
+                self._open = None
+                self._cond.notify_all()
+
+        if not leader:
+            batch.done.wait()
+        else:
+            self._lead(batch)
+
+        if batch.error is not None:
+            raise batch.error
+
+    def _lead(self, batch: _Batch[T]) -> None:
+        with self._cond:
+            while self._next_to_commit != batch.sequence:
+                self._cond.wait()
+            if len(batch.items) > 1:
+                deadline = batch.opened_at + self.config.max_delay_ms / 1000.0
+                while self._open is batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            if self._open is batch:
+                self._open = None
+
+        try:
+            self._commit(batch.items)
+        except BaseException as e:
+            batch.error = e
+        finally:
+            with self._cond:
+                self._next_to_commit += 1
+                self._cond.notify_all()
+            batch.done.set()
@@ -1,13 +1,66 @@
-from typing import List
+from threading import Lock
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
 from src.core.ledger.budget_ledger import BudgetLedger
 from src.core.ledger.budget_event import BudgetEvent
 
 class InMemoryBudgetLedger(BudgetLedger):
     def __init__(self):
         self._events: List[BudgetEvent] = []
+        self._positions: Dict[UUID, int] = {}
+        # Events removed by compact(archive=True)
+        self._archive: List[BudgetEvent] = []
+        self._lock = Lock()
 
     def record(self, event: BudgetEvent) -> None:
-        self._events.append(event)
+        with self._lock:
+            self._positions[event.id] = len(self._events)
+            self._events.append(event)
 
     def get_history(self) -> List[BudgetEvent]:
-        return list(self._events)
\ No newline at end of file
+        return list(self._events)
+
+    def last_event_id(self) -> Optional[UUID]:
+        events = self._events
+        return events[-1].id if events else None
+
+    def iter_history_since(
+            self,
+            event_id: Optional[UUID],
+            page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[BudgetEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        events = self._events
+        if event_id is None:
+            start = 0
+        else:
+            position = self._positions.get(event_id)
+            if position is None or position >= len(events) or events[position].id != event_id:
+                return
+            start = position + 1
+        # Pages are bounded by the length at call time; later appends are not picked up.
+        end = len(events)
+        for offset in range(start, end, page_size):
+            yield events[offset:min(offset + page_size, end)]
+
+    def compact(self, anchor_id: UUID, archive: bool = True) -> int:
+        with self._lock:
+            position = self._positions.get(anchor_id)
+            if not position:
+                return 0
+            removed = self._events[:position]
+            if archive:
+                self._archive.extend(removed)
+            # A new list, so pages already handed out by iter_history_since stay valid
+            self._events = self._events[position:]
+            self._positions = {event.id: index for index, event in enumerate(self._events)}
+            return len(removed)
+
+    def iter_full_history(self, page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE) -> Iterator[List[BudgetEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        with self._lock:
+            events = self._archive + self._events
+        for offset in range(0, len(events), page_size):
+            yield events[offset:offset + page_size]
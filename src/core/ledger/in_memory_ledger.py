@@ -1,4 +1,6 @@
-from typing import List, Dict
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
 from src.core.ledger.strategic_ledger import StrategicLedger
 from src.core.ledger.strategic_event import StrategicEvent
 from src.core.domain.strategic_context import StrategicContext
@@ -12,14 +14,74 @@ class InMemoryStrategicLedger(StrategicLedger):
     def __init__(self):
         # Key: str(context), Value: List[StrategicEvent]
         self._store: Dict[str, List[StrategicEvent]] = {}
+        # Key: event id, Value: position within its context list
+        self._positions: Dict[UUID, int] = {}
+        # Key: str(context), Value: events removed by compact(archive=True)
+        self._archive: Dict[str, List[StrategicEvent]] = {}
+        self._lock = Lock()
 
     def record(self, event: StrategicEvent) -> None:
         # Internal implementation detail: use str(context) as key
         key = str(event.context)
-        if key not in self._store:
-            self._store[key] = []
-        self._store[key].append(event)
+        with self._lock:
+            if key not in self._store:
+                self._store[key] = []
+            self._positions[event.id] = len(self._store[key])
+            self._store[key].append(event)
 
     def get_history(self, context: StrategicContext) -> List[StrategicEvent]:
         key = str(context)
-        return list(self._store.get(key, []))
\ No newline at end of file
+        return list(self._store.get(key, []))
+
+    def iter_history_since(
+            self,
+            context: StrategicContext,
+            event_id: Optional[UUID],
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        events = self._store.get(str(context), [])
+        if event_id is None:
+            start = 0
+        else:
+            position = self._positions.get(event_id)
+            if position is None or position >= len(events) or events[position].id != event_id:
+                return
+            start = position + 1
+        end = len(events)
+        for offset in range(start, end, page_size):
+            yield events[offset:min(offset + page_size, end)]
+
+    def compact(self, anchors: Sequence[Tuple[StrategicContext, UUID]], archive: bool = True) -> int:
+        removed = 0
+        with self._lock:
+            for context, anchor_id in anchors:
+                key = str(context)
+                events = self._store.get(key, [])
+                position = self._positions.get(anchor_id)
+                if not position or position >= len(events) or events[position].id != anchor_id:
+                    continue
+                for event in events[:position]:
+                    del self._positions[event.id]
+                if archive:
+                    self._archive.setdefault(key, []).extend(events[:position])
+                # A new list, so pages already handed out by iter_history_since stay valid
+                self._store[key] = events[position:]
+                for index, event in enumerate(self._store[key]):
+                    self._positions[event.id] = index
+                removed += position
+        return removed
+
+    def iter_full_history(
+            self,
+            context: StrategicContext,
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        key = str(context)
+        with self._lock:
+            events = self._archive.get(key, []) + self._store.get(key, [])
+        for offset in range(0, len(events), page_size):
+            yield events[offset:offset + page_size]
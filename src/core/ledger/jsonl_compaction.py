@@ -0,0 +1,120 @@
+import json
+import os
+import shutil
+from typing import BinaryIO, Callable, ContextManager, Iterator, Optional, Set, Tuple
+
+from src.core.ledger.file_lock import FileLock
+
+# plan(source, end) inspects the first end bytes of the log and returns the predicate
+# selecting the records to remove from them.
+CompactionPlan = Callable[[BinaryIO, int], Callable[[dict], bool]]
+
+
+def iter_records(f: BinaryIO, end: int) -> Iterator[Tuple[bytes, Optional[dict]]]:
+    """
+    Yields (raw_line, decoded record or None for blank/corrupt lines) for the lines before end.
+    """
+    f.seek(0)
+    position = 0
+    while position < end:
+        raw = f.readline()
+        if not raw:
+            return
+        position += len(raw)
+        data = None
+        if raw.strip():
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError:
+                pass
+        yield raw, data
+
+
+def compact_jsonl(
+        file_path: str,
+        write_lock: ContextManager,
+        plan: CompactionPlan,
+        archive_path: Optional[str]
+) -> int:
+    """
+    Removes records from a JSONL log while writers keep appending.
+
+    Only the part of the log written before the call is considered; plan decides which of its
+    records go. The kept records are copied to a side file without holding write_lock, then,
+    under the lock, records appended meanwhile are copied over and the side file replaces the
+    log. Removed records are appended (and fsynced) to archive_path first, when given; a crash
+    before the swap can leave them both archived and live, never in neither.
+    write_lock must also exclude writers in other processes (see write_lock_for), and callers
+    must keep two compactions of one log from overlapping (see compaction_lock_for).
+    Blank and corrupt lines are dropped. Returns the number of records removed.
+    """
+    with write_lock:
+        end = os.path.getsize(file_path)
+    staging_path = file_path + ".compacting"
+    removed = 0
+    try:
+        with open(file_path, 'rb') as source, open(staging_path, 'wb') as staging:
+            is_covered = plan(source, end)
+            archive = None
+            try:
+                for raw, data in iter_records(source, end):
+                    if data is None:
+                        continue
+                    if is_covered(data):
+                        removed += 1
+                        if archive_path:
+                            if archive is None:
+                                archive = open(archive_path, 'ab')
+                            archive.write(raw if raw.endswith(b"\n") else raw + b"\n")
+                    else:
+                        staging.write(raw)
+                if archive is not None:
+                    archive.flush()
+                    os.fsync(archive.fileno())
+            finally:
+                if archive is not None:
+                    archive.close()
+            if removed == 0:
+                return 0
+
+            with write_lock:
+                # Same inode as the writers until the replace below.
+                source.seek(end)
+                shutil.copyfileobj(source, staging)
+                staging.flush()
+                os.fsync(staging.fileno())
+                os.replace(staging_path, file_path)
+        return removed
+    finally:
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+
+
+def iter_archived_records(archive_path: str, seen_ids: Set[str]) -> Iterator[dict]:
+    """
+    Yields archived records in order, skipping ids already in seen_ids and adding the rest.
+    """
+    if not os.path.exists(archive_path):
+        return
+    with open(archive_path, 'rb') as f:
+        for raw, data in iter_records(f, os.fstat(f.fileno()).st_size):
+            if data is None or data.get("id") in seen_ids:
+                continue
+            seen_ids.add(data.get("id"))
+            yield data
+
+
+def write_lock_for(file_path: str) -> FileLock:
+    """
+    Lock taken around every append to the log and around the compaction swap.
+    """
+    return FileLock(file_path + ".lock")
+
+
+def compaction_lock_for(file_path: str) -> FileLock:
+    return FileLock(file_path + ".compaction.lock")
+
+
+def default_archive_path(file_path: str) -> str:
+    root, ext = os.path.splitext(file_path)
+    return f"{root}.archive{ext or '.jsonl'}"
@@ -0,0 +1,107 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterator, List, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# A file path, or a binary file already open for reading. Readers that locate an offset and
+# then page from it should pass one open file to both steps, so a concurrent compaction
+# (which replaces the file) cannot shift the offset under them.
+Source = Union[str, BinaryIO]
+
+
+@contextmanager
+def _opened(source: Source) -> Iterator[Optional[BinaryIO]]:
+    if not isinstance(source, str):
+        yield source
+        return
+    if not os.path.exists(source):
+        yield None
+        return
+    with open(source, 'rb') as f:
+        yield f
+
+
+def iter_lines_reversed(source: Source, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[tuple]:
+    """
+    Yields (start_offset, raw_line) from the last line to the first, without newlines.
+    """
+    with _opened(source) as f:
+        if f is None:
+            return
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        end = position
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b"\n")
+            # The first piece may be a partial line; keep it for the next chunk.
+            remainder = lines.pop(0)
+            for raw in reversed(lines):
+                start = end - len(raw)
+                yield start, raw
+                end = start - 1
+        if remainder:
+            yield 0, remainder
+
+
+def find_offset_after(
+        source: Source,
+        event_id: str,
+        chunk_size: int = READ_CHUNK_SIZE,
+        match: Optional[Callable[[dict], bool]] = None
+) -> Optional[int]:
+    """
+    Scans backwards for the line recording event_id and returns the offset of the line after it.
+    Cost is bounded by the bytes written after that line. Returns None if the id is absent
+    or the recorded line is rejected by match.
+    """
+    needle = event_id.encode('utf-8')
+    for start_offset, raw in iter_lines_reversed(source, chunk_size):
+        if needle not in raw:
+            continue
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if data.get("id") == event_id:
+            if match is not None and not match(data):
+                return None
+            return start_offset + len(raw) + 1
+    return None
+
+
+def iter_pages_from(
+        source: Source,
+        offset: int,
+        decode: Callable[[bytes], Optional[T]],
+        page_size: int
+) -> Iterator[List[T]]:
+    """
+    Streams decoded records forward from offset in pages of at most page_size.
+    Lines for which decode returns None (blank, corrupt, filtered out) are skipped.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    page: List[T] = []
+    with _opened(source) as f:
+        if f is None:
+            return
+        f.seek(offset)
+        for raw in f:
+            record = decode(raw)
+            if record is None:
+                continue
+            page.append(record)
+            if len(page) >= page_size:
+                yield page
+                page = []
+    if page:
+        yield page
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from uuid import UUID
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.budget_ledger import BudgetLedger
+from src.core.ledger.strategic_ledger import StrategicLedger
+from src.core.persistence.budget_backend import BudgetPersistenceBackend, InMemoryBudgetBackend
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.persistence.strategic_state_backend import StrategicStateBackend
+from src.core.orchestration.shard_store import ShardStore
+from src.core.time.system_time_source import SystemTimeSource
+from src.core.time.time_source import TimeSource
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    contexts_compacted: int  # contexts with a snapshot anchor
+    events_removed: int
+    archived: bool
+
+
+class LedgerCompactor:
+    """
+    Compacts ledgers behind the snapshots stored in their state backends.
+
+    Anchors are read from the backend at call time. Snapshots only move forward, so a snapshot
+    saved while compaction runs still finds its anchor; contexts without a snapshot are not
+    touched. Backends that do not survive a restart are rejected: once the ledger prefix is
+    gone, the snapshot is the only record of it (or the archive, with archive=True).
+
+    A budget ledger shared by shards is compacted no further than the oldest budget event a live
+    shard in shard_store has reported applying, so every shard can still replay its own tail.
+    """
+
+    def __init__(
+            self,
+            ledger: Optional[StrategicLedger] = None,
+            backend: Optional[StrategicStateBackend] = None,
+            budget_ledger: Optional[BudgetLedger] = None,
+            budget_backend: Optional[BudgetPersistenceBackend] = None,
+            archive: bool = True,
+            shard_store: Optional[ShardStore] = None,
+            time_source: Optional[TimeSource] = None
+    ):
+        if isinstance(backend, InMemoryStrategicStateBackend) or isinstance(budget_backend, InMemoryBudgetBackend):
+            raise ValueError("Compaction requires durable snapshot backends")
+        self.ledger = ledger
+        self.backend = backend
+        self.budget_ledger = budget_ledger
+        self.budget_backend = budget_backend
+        self.archive = archive
+        self.shard_store = shard_store
+        self.time_source = time_source or SystemTimeSource()
+
+    def compact_contexts(self, contexts: Sequence[StrategicContext]) -> CompactionResult:
+        if self.ledger is None or self.backend is None:
+            raise ValueError("Strategic compaction needs a ledger and a state backend")
+        bundles = self.backend.load_many(contexts)
+        anchors = []
+        for context in contexts:
+            bundle = bundles.get(str(context))
+            if bundle is not None and bundle.last_event_id is not None:
+                anchors.append((context, bundle.last_event_id))
+        removed = self.ledger.compact(anchors, archive=self.archive) if anchors else 0
+        return CompactionResult(len(anchors), removed, self.archive)
+
+    def compact_budget(self) -> CompactionResult:
+        if self.budget_ledger is None or self.budget_backend is None:
+            raise ValueError("Budget compaction needs a budget ledger and a budget backend")
+        snapshot = self.budget_backend.load()
+        if snapshot is None or snapshot.last_event_id is None:
+            return CompactionResult(0, 0, self.archive)
+        anchor = self._budget_anchor(snapshot.last_event_id)
+        if anchor is None:
+            return CompactionResult(0, 0, self.archive)
+        removed = self.budget_ledger.compact(anchor, archive=self.archive)
+        return CompactionResult(1, removed, self.archive)
+
+    def _budget_anchor(self, snapshot_id: UUID) -> Optional[UUID]:
+        """
+        The earlier of the snapshot anchor and every live shard's cursor; None while a live shard
+        has not reported one. A cursor no longer in the ledger is passed over: that shard reloads
+        from the snapshot anyway.
+        """
+        if self.shard_store is None:
+            return snapshot_id
+        anchor = snapshot_id
+        for cursor in self.shard_store.budget_cursors(self.time_source.now()).values():
+            if cursor is None:
+                return None
+            # The cursor is older when the current anchor is still ahead of it
+            if cursor != anchor and any(
+                    event.id == anchor
+                    for page in self.budget_ledger.iter_history_since(cursor)
+                    for event in page
+            ):
+                anchor = cursor
+        return anchor
@@ -1,22 +1,33 @@
 import json
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 from src.core.ledger.budget_event import BudgetEvent
 from src.core.ledger.budget_ledger import BudgetLedger
+from src.core.ledger.group_commit import GroupCommitConfig, GroupCommitter
 
 
 class PostgresBudgetLedger(BudgetLedger):
-    def __init__(self, engine: Engine):
+    """
+    compact() moves covered events into budget_events_archive, COMPACTION_BATCH_ROWS rows per
+    transaction, so concurrent inserts are never blocked for long.
+    """
+
+    COMPACTION_BATCH_ROWS = 5000
+
+    def __init__(self, engine: Engine, group_commit: Optional[GroupCommitConfig] = None):
         self.engine = engine
+        # With group_commit, concurrent records are inserted in one multi-row transaction.
+        self._committer = GroupCommitter(self._insert, group_commit) if group_commit else None
         self.ensure_schema()
 
     @classmethod
-    def from_dsn(cls, dsn: str) -> "PostgresBudgetLedger":
+    def from_dsn(cls, dsn: str, group_commit: Optional[GroupCommitConfig] = None) -> "PostgresBudgetLedger":
         engine = create_engine(dsn, pool_pre_ping=True, future=True)
-        return cls(engine)
+        return cls(engine, group_commit=group_commit)
 
     def ensure_schema(self) -> None:
         with self.engine.begin() as conn:
@@ -41,8 +52,54 @@ class PostgresBudgetLedger(BudgetLedger):
                     """
                 )
             )
+            # Insertion sequence: tie-breaker for equal timestamps and cursor for tail reads.
+            conn.execute(text("ALTER TABLE budget_events ADD COLUMN IF NOT EXISTS seq BIGSERIAL"))
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_budget_events_timestamp_seq
+                    ON budget_events (timestamp ASC, seq ASC)
+                    """
+                )
+            )
+            # Compacted events; seq is carried over so full-history reads keep the original order.
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS budget_events_archive (
+                        id UUID PRIMARY KEY,
+                        timestamp TIMESTAMPTZ NOT NULL,
+                        event_type TEXT NOT NULL,
+                        delta JSONB NOT NULL DEFAULT '{}'::jsonb,
+                        reason TEXT NOT NULL,
+                        seq BIGINT NOT NULL
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_budget_events_archive_timestamp_seq
+                    ON budget_events_archive (timestamp ASC, seq ASC)
+                    """
+                )
+            )
 
     def record(self, event: BudgetEvent) -> None:
+        params = {
+            "id": event.id,
+            "timestamp": event.timestamp,
+            "event_type": event.event_type,
+            "delta": json.dumps(event.delta),
+            "reason": event.reason,
+        }
+        if self._committer:
+            self._committer.submit(params)
+        else:
+            self._insert([params])
+
+    def _insert(self, rows: List[Dict]) -> None:
         with self.engine.begin() as conn:
             conn.execute(
                 text(
@@ -51,13 +108,7 @@ class PostgresBudgetLedger(BudgetLedger):
                     VALUES (:id, :timestamp, :event_type, :delta::jsonb, :reason)
                     """
                 ),
-                {
-                    "id": event.id,
-                    "timestamp": event.timestamp,
-                    "event_type": event.event_type,
-                    "delta": json.dumps(event.delta),
-                    "reason": event.reason,
-                },
+                rows,
             )
 
     def get_history(self) -> List[BudgetEvent]:
@@ -67,17 +118,140 @@ class PostgresBudgetLedger(BudgetLedger):
                     """
                     SELECT id, timestamp, event_type, delta, reason
                     FROM budget_events
-                    ORDER BY timestamp ASC
+                    ORDER BY timestamp ASC, seq ASC
                     """
                 )
             ).fetchall()
-        return [
-            BudgetEvent(
-                id=row.id,
-                timestamp=row.timestamp,
-                event_type=row.event_type,
-                delta=dict(row.delta or {}),
-                reason=row.reason,
+        return [self._row_to_event(row) for row in rows]
+
+    def last_event_id(self) -> Optional[UUID]:
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT id
+                    FROM budget_events
+                    ORDER BY timestamp DESC, seq DESC
+                    LIMIT 1
+                    """
+                )
+            ).fetchone()
+        return row.id if row else None
+
+    def iter_history_since(
+            self,
+            event_id: Optional[UUID],
+            page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[BudgetEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        cursor = None
+        if event_id is not None:
+            with self.engine.begin() as conn:
+                anchor = conn.execute(
+                    text("SELECT timestamp, seq FROM budget_events WHERE id = :event_id"),
+                    {"event_id": event_id},
+                ).fetchone()
+            if anchor is None:
+                return
+            cursor = (anchor.timestamp, anchor.seq)
+        yield from self._iter_pages("budget_events", cursor, page_size)
+
+    def compact(self, anchor_id: UUID, archive: bool = True) -> int:
+        if archive:
+            sink = """,
+                archived AS (
+                    INSERT INTO budget_events_archive (id, timestamp, event_type, delta, reason, seq)
+                    SELECT id, timestamp, event_type, delta, reason, seq
+                    FROM moved
+                    RETURNING 1
+                )
+                SELECT count(*) AS removed FROM archived
+            """
+        else:
+            sink = "SELECT count(*) AS removed FROM moved"
+        # Oldest rows first, in bounded batches; SKIP LOCKED leaves rows a concurrent run holds.
+        statement = text(
+            """
+            WITH anchor AS (
+                SELECT timestamp, seq FROM budget_events WHERE id = :anchor_id
+            ),
+            doomed AS (
+                SELECT e.id
+                FROM budget_events e, anchor a
+                WHERE (e.timestamp, e.seq) < (a.timestamp, a.seq)
+                ORDER BY e.timestamp ASC, e.seq ASC
+                LIMIT :limit
+                FOR UPDATE OF e SKIP LOCKED
+            ),
+            moved AS (
+                DELETE FROM budget_events e
+                USING doomed d
+                WHERE e.id = d.id
+                RETURNING e.id, e.timestamp, e.event_type, e.delta, e.reason, e.seq
             )
-            for row in rows
-        ]
+            """ + sink
+        )
+
+        removed = 0
+        while True:
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    statement, {"anchor_id": anchor_id, "limit": self.COMPACTION_BATCH_ROWS}
+                ).fetchone()
+            removed += row.removed
+            if row.removed < self.COMPACTION_BATCH_ROWS:
+                return removed
+
+    def iter_full_history(self, page_size: int = BudgetLedger.DEFAULT_PAGE_SIZE) -> Iterator[List[BudgetEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        # Archived rows all precede the live ones: compaction moves a prefix.
+        yield from self._iter_pages("budget_events_archive", None, page_size)
+        yield from self._iter_pages("budget_events", None, page_size)
+
+    def _iter_pages(self, table: str, cursor: Optional[Tuple], page_size: int) -> Iterator[List[BudgetEvent]]:
+        # Keyset pagination on (timestamp, seq): each page is an index range scan.
+        while True:
+            with self.engine.begin() as conn:
+                if cursor is None:
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT id, timestamp, event_type, delta, reason, seq
+                            FROM {table}
+                            ORDER BY timestamp ASC, seq ASC
+                            LIMIT :limit
+                            """
+                        ),
+                        {"limit": page_size},
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT id, timestamp, event_type, delta, reason, seq
+                            FROM {table}
+                            WHERE (timestamp, seq) > (:timestamp, :seq)
+                            ORDER BY timestamp ASC, seq ASC
+                            LIMIT :limit
+                            """
+                        ),
+                        {"timestamp": cursor[0], "seq": cursor[1], "limit": page_size},
+                    ).fetchall()
+            if not rows:
+                return
+            yield [self._row_to_event(row) for row in rows]
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1].timestamp, rows[-1].seq)
+
+    @staticmethod
+    def _row_to_event(row) -> BudgetEvent:
+        return BudgetEvent(
+            id=row.id,
+            timestamp=row.timestamp,
+            event_type=row.event_type,
+            delta=dict(row.delta or {}),
+            reason=row.reason,
+        )
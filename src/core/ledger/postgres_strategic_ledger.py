@@ -1,5 +1,6 @@
 import json
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
@@ -7,17 +8,28 @@ from sqlalchemy.engine import Engine
 from src.core.domain.strategic_context import StrategicContext
 from src.core.ledger.strategic_event import StrategicEvent
 from src.core.ledger.strategic_ledger import StrategicLedger
+from src.core.ledger.group_commit import GroupCommitConfig, GroupCommitter
 
 
 class PostgresStrategicLedger(StrategicLedger):
-    def __init__(self, engine: Engine):
+    """
+    compact() moves covered events into strategic_events_archive, COMPACTION_BATCH_CONTEXTS
+    contexts per transaction. Deletes only touch rows older than each context's anchor, so
+    concurrent inserts are never blocked.
+    """
+
+    COMPACTION_BATCH_CONTEXTS = 500
+
+    def __init__(self, engine: Engine, group_commit: Optional[GroupCommitConfig] = None):
         self.engine = engine
+        # With group_commit, concurrent records are inserted in one multi-row transaction.
+        self._committer = GroupCommitter(self._insert, group_commit) if group_commit else None
         self.ensure_schema()
 
     @classmethod
-    def from_dsn(cls, dsn: str) -> "PostgresStrategicLedger":
+    def from_dsn(cls, dsn: str, group_commit: Optional[GroupCommitConfig] = None) -> "PostgresStrategicLedger":
         engine = create_engine(dsn, pool_pre_ping=True, future=True)
-        return cls(engine)
+        return cls(engine, group_commit=group_commit)
 
     def ensure_schema(self) -> None:
         with self.engine.begin() as conn:
@@ -46,9 +58,63 @@ class PostgresStrategicLedger(StrategicLedger):
                     """
                 )
             )
+            # Insertion sequence: tie-breaker for equal timestamps and cursor for paged reads.
+            conn.execute(text("ALTER TABLE strategic_events ADD COLUMN IF NOT EXISTS seq BIGSERIAL"))
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_strategic_events_context_time_seq
+                    ON strategic_events (context_key, timestamp ASC, seq ASC)
+                    """
+                )
+            )
+            # Compacted events; seq is carried over so full-history reads keep the original order.
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS strategic_events_archive (
+                        id UUID PRIMARY KEY,
+                        timestamp TIMESTAMPTZ NOT NULL,
+                        event_type TEXT NOT NULL,
+                        details JSONB NOT NULL DEFAULT '{}'::jsonb,
+                        country TEXT NOT NULL,
+                        region TEXT NULL,
+                        goal_id TEXT NULL,
+                        domain TEXT NOT NULL,
+                        context_key TEXT NOT NULL,
+                        seq BIGINT NOT NULL
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_strategic_events_archive_context_time_seq
+                    ON strategic_events_archive (context_key, timestamp ASC, seq ASC)
+                    """
+                )
+            )
 
     def record(self, event: StrategicEvent) -> None:
         context = event.context
+        params = {
+            "id": event.id,
+            "timestamp": event.timestamp,
+            "event_type": event.event_type,
+            "details": json.dumps(event.details),
+            "country": context.country,
+            "region": context.region,
+            "goal_id": context.goal_id,
+            "domain": context.domain,
+            "context_key": str(context),
+        }
+        if self._committer:
+            self._committer.submit(params)
+        else:
+            self._insert([params])
+
+    def _insert(self, rows: List[Dict]) -> None:
         with self.engine.begin() as conn:
             conn.execute(
                 text(
@@ -63,17 +129,7 @@ class PostgresStrategicLedger(StrategicLedger):
                     )
                     """
                 ),
-                {
-                    "id": event.id,
-                    "timestamp": event.timestamp,
-                    "event_type": event.event_type,
-                    "details": json.dumps(event.details),
-                    "country": context.country,
-                    "region": context.region,
-                    "goal_id": context.goal_id,
-                    "domain": context.domain,
-                    "context_key": str(context),
-                },
+                rows,
             )
 
     def get_history(self, context: StrategicContext) -> List[StrategicEvent]:
@@ -85,18 +141,197 @@ class PostgresStrategicLedger(StrategicLedger):
                     SELECT id, timestamp, event_type, details
                     FROM strategic_events
                     WHERE context_key = :context_key
-                    ORDER BY timestamp ASC
+                    ORDER BY timestamp ASC, seq ASC
                     """
                 ),
                 {"context_key": key},
             ).fetchall()
-        return [
-            StrategicEvent(
-                id=row.id,
-                timestamp=row.timestamp,
-                event_type=row.event_type,
-                details=dict(row.details or {}),
-                context=context,
+        return [self._row_to_event(row, context) for row in rows]
+
+    def iter_history_since(
+            self,
+            context: StrategicContext,
+            event_id: Optional[UUID],
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        key = str(context)
+        cursor = None
+        if event_id is not None:
+            with self.engine.begin() as conn:
+                anchor = conn.execute(
+                    text(
+                        """
+                        SELECT timestamp, seq
+                        FROM strategic_events
+                        WHERE id = :event_id AND context_key = :context_key
+                        """
+                    ),
+                    {"event_id": event_id, "context_key": key},
+                ).fetchone()
+            if anchor is None:
+                return
+            cursor = (anchor.timestamp, anchor.seq)
+        yield from self._iter_pages("strategic_events", context, cursor, page_size)
+
+    def compact(self, anchors: Sequence[Tuple[StrategicContext, UUID]], archive: bool = True) -> int:
+        if archive:
+            sink = """,
+                archived AS (
+                    INSERT INTO strategic_events_archive (
+                        id, timestamp, event_type, details,
+                        country, region, goal_id, domain, context_key, seq
+                    )
+                    SELECT id, timestamp, event_type, details,
+                           country, region, goal_id, domain, context_key, seq
+                    FROM moved
+                    RETURNING 1
+                )
+                SELECT count(*) AS removed FROM archived
+            """
+        else:
+            sink = "SELECT count(*) AS removed FROM moved"
+        statement = text(
+            """
+            WITH requested AS (
+                SELECT context_key, anchor_id
+                FROM unnest(CAST(:context_keys AS text[]), CAST(:anchor_ids AS uuid[])) AS r(context_key, anchor_id)
+            ),
+            cursors AS (
+                SELECT a.context_key, a.timestamp AS anchor_ts, a.seq AS anchor_seq
+                FROM requested r
+                JOIN strategic_events a ON a.id = r.anchor_id AND a.context_key = r.context_key
+            ),
+            moved AS (
+                DELETE FROM strategic_events e
+                USING cursors c
+                WHERE e.context_key = c.context_key
+                  AND (e.timestamp, e.seq) < (c.anchor_ts, c.anchor_seq)
+                RETURNING e.id, e.timestamp, e.event_type, e.details,
+                          e.country, e.region, e.goal_id, e.domain, e.context_key, e.seq
             )
-            for row in rows
-        ]
+            """ + sink
+        )
+
+        pairs = [(str(context), str(event_id)) for context, event_id in anchors]
+        removed = 0
+        for start in range(0, len(pairs), self.COMPACTION_BATCH_CONTEXTS):
+            batch = pairs[start:start + self.COMPACTION_BATCH_CONTEXTS]
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    statement,
+                    {
+                        "context_keys": [key for key, _ in batch],
+                        "anchor_ids": [event_id for _, event_id in batch],
+                    },
+                ).fetchone()
+            removed += row.removed
+        return removed
+
+    def iter_full_history(
+            self,
+            context: StrategicContext,
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        # Archived rows all precede the context's live rows: compaction moves a prefix.
+        yield from self._iter_pages("strategic_events_archive", context, None, page_size)
+        yield from self._iter_pages("strategic_events", context, None, page_size)
+
+    def _iter_pages(
+            self,
+            table: str,
+            context: StrategicContext,
+            cursor: Optional[Tuple],
+            page_size: int
+    ) -> Iterator[List[StrategicEvent]]:
+        key = str(context)
+        # Keyset pagination on (context_key, timestamp, seq): each page is an index range scan.
+        while True:
+            with self.engine.begin() as conn:
+                if cursor is None:
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT id, timestamp, event_type, details, seq
+                            FROM {table}
+                            WHERE context_key = :context_key
+                            ORDER BY timestamp ASC, seq ASC
+                            LIMIT :limit
+                            """
+                        ),
+                        {"context_key": key, "limit": page_size},
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        text(
+                            f"""
+                            SELECT id, timestamp, event_type, details, seq
+                            FROM {table}
+                            WHERE context_key = :context_key
+                              AND (timestamp, seq) > (:timestamp, :seq)
+                            ORDER BY timestamp ASC, seq ASC
+                            LIMIT :limit
+                            """
+                        ),
+                        {"context_key": key, "timestamp": cursor[0], "seq": cursor[1], "limit": page_size},
+                    ).fetchall()
+            if not rows:
+                return
+            yield [self._row_to_event(row, context) for row in rows]
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1].timestamp, rows[-1].seq)
+
+    def get_histories_since(
+            self,
+            anchors: Sequence[Tuple[StrategicContext, Optional[UUID]]]
+    ) -> Dict[str, List[StrategicEvent]]:
+        contexts = {str(context): context for context, _ in anchors}
+        histories: Dict[str, List[StrategicEvent]] = {key: [] for key in contexts}
+        if not contexts:
+            return histories
+        keys = list(contexts.keys())
+        anchor_ids = {str(context): event_id for context, event_id in anchors}
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    WITH requested AS (
+                        SELECT context_key, anchor_id
+                        FROM unnest(CAST(:context_keys AS text[]), CAST(:anchor_ids AS uuid[])) AS r(context_key, anchor_id)
+                    ),
+                    cursors AS (
+                        SELECT r.context_key, r.anchor_id, a.timestamp AS anchor_ts, a.seq AS anchor_seq
+                        FROM requested r
+                        LEFT JOIN strategic_events a
+                          ON a.id = r.anchor_id AND a.context_key = r.context_key
+                    )
+                    SELECT e.context_key, e.id, e.timestamp, e.event_type, e.details
+                    FROM cursors c
+                    JOIN strategic_events e ON e.context_key = c.context_key
+                    WHERE c.anchor_id IS NULL
+                       OR (c.anchor_seq IS NOT NULL AND (e.timestamp, e.seq) > (c.anchor_ts, c.anchor_seq))
+                    ORDER BY e.context_key, e.timestamp ASC, e.seq ASC
+                    """
+                ),
+                {
+                    "context_keys": keys,
+                    "anchor_ids": [str(anchor_ids[key]) if anchor_ids[key] else None for key in keys],
+                },
+            ).fetchall()
+        for row in rows:
+            histories[row.context_key].append(self._row_to_event(row, contexts[row.context_key]))
+        return histories
+
+    @staticmethod
+    def _row_to_event(row, context: StrategicContext) -> StrategicEvent:
+        return StrategicEvent(
+            id=row.id,
+            timestamp=row.timestamp,
+            event_type=row.event_type,
+            details=dict(row.details or {}),
+            context=context,
+        )
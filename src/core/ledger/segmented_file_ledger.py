@@ -0,0 +1,441 @@
+import json
+import os
+import shutil
+import struct
+import zlib
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.jsonl_compaction import default_archive_path, iter_archived_records
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.ledger.strategic_ledger import StrategicLedger
+
+
+# Frame: payload length, CRC32 of payload, payload (UTF-8 JSON).
+_FRAME_HEADER = struct.Struct(">II")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+# Compaction writes a copy next to the ledger and swaps it in (see segmented_ledger_tool.compact)
+COMPACTING_SUFFIX = ".compacting"
+RETIRED_SUFFIX = ".retired"
+COMPACTED_MARKER = "COMPACTED"
+
+
+def _encode_frame(payload: Dict) -> bytes:
+    body = json.dumps(payload).encode('utf-8')
+    return _FRAME_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def _read_frames(path: str, offset: int = 0) -> Iterator[Tuple[int, int, Dict]]:
+    """
+    Yields (offset, frame_length, payload) for every valid frame from offset.
+    Stops at the first torn or corrupt frame; its offset is the safe truncation point.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return
+            length, crc = _FRAME_HEADER.unpack(header)
+            body = f.read(length)
+            if len(body) < length or zlib.crc32(body) != crc:
+                return
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                return
+            frame_length = _FRAME_HEADER.size + length
+            yield offset, frame_length, payload
+            offset += frame_length
+
+
+def recover_compaction(base_dir: str) -> None:
+    """
+    Finishes or rolls back a compaction interrupted by a crash.
+    The retired copy is only deleted once the ledger in base_dir is known to be complete.
+    """
+    base_dir = base_dir.rstrip(os.sep)
+    staging_dir = base_dir + COMPACTING_SUFFIX
+    retired_dir = base_dir + RETIRED_SUFFIX
+    base_marker = os.path.join(base_dir, COMPACTED_MARKER)
+
+    if os.path.isdir(retired_dir):
+        if os.path.isdir(base_dir) and not os.path.exists(base_marker):
+            if os.listdir(base_dir):
+                raise ValueError(f"Cannot tell whether {base_dir} or {retired_dir} holds the ledger")
+            # Opened after a crash between the two renames
+            os.rmdir(base_dir)
+        if not os.path.isdir(base_dir):
+            if os.path.exists(os.path.join(staging_dir, COMPACTED_MARKER)):
+                os.rename(staging_dir, base_dir)
+            else:
+                os.rename(retired_dir, base_dir)
+        if os.path.exists(base_marker):
+            shutil.rmtree(retired_dir)
+    if os.path.isdir(staging_dir):
+        shutil.rmtree(staging_dir)
+    if os.path.exists(base_marker):
+        os.remove(base_marker)
+
+
+def rewrite_segments(base_dir: str, records: Iterable[Dict], segment_max_bytes: int) -> int:
+    """
+    Replaces the ledger in base_dir with densely packed segments holding records.
+    The copy is marked complete before it is swapped in, so a crash at any point leaves
+    either the old or the new ledger for recover_compaction(). Returns records written.
+    """
+    staged, written = stage_segments(base_dir, records, segment_max_bytes)
+    swap_in_segments(base_dir, staged)
+    return written
+
+
+def stage_segments(
+        base_dir: str,
+        records: Iterable[Dict],
+        segment_max_bytes: int
+) -> Tuple["SegmentedFileStrategicLedger", int]:
+    """
+    Writes records to the staging copy of base_dir; more can be appended to it before
+    swap_in_segments(). Returns the staging ledger and the records written.
+    """
+    staging_dir = base_dir.rstrip(os.sep) + COMPACTING_SUFFIX
+    if os.path.isdir(staging_dir):
+        shutil.rmtree(staging_dir)
+
+    staged = SegmentedFileStrategicLedger(staging_dir, segment_max_bytes=segment_max_bytes)
+    written = 0
+    for data in records:
+        staged.append_raw(data)
+        written += 1
+    return staged, written
+
+
+def swap_in_segments(base_dir: str, staged: "SegmentedFileStrategicLedger") -> None:
+    """
+    Makes the staging copy durable, marks it complete and swaps it in for base_dir.
+    """
+    base_dir = base_dir.rstrip(os.sep)
+    staging_dir = staged.base_dir
+    fsync_dir_files(staging_dir)
+    with open(os.path.join(staging_dir, COMPACTED_MARKER), 'w') as f:
+        f.flush()
+        os.fsync(f.fileno())
+    fsync_dir(staging_dir)
+
+    os.rename(base_dir, base_dir + RETIRED_SUFFIX)
+    os.rename(staging_dir, base_dir)
+    fsync_dir(os.path.dirname(os.path.abspath(base_dir)))
+    recover_compaction(base_dir)
+
+
+def fsync_dir(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_dir_files(path: str) -> None:
+    for name in os.listdir(path):
+        fd = os.open(os.path.join(path, name), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _read_frame_at(f, offset: int) -> Dict:
+    f.seek(offset)
+    length, crc = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+    body = f.read(length)
+    if len(body) < length or zlib.crc32(body) != crc:
+        raise ValueError(f"Corrupt ledger frame at offset {offset}")
+    return json.loads(body)
+
+
+class SegmentedFileStrategicLedger(StrategicLedger):
+    """
+    File-backed strategic ledger stored as append-only segments with a per-context offset index.
+
+    Each segment-NNNNNN.log holds CRC-framed event records; its segment-NNNNNN.idx sidecar holds
+    (offset, context_key, id) entries written after the record. Per-context and since-id reads
+    seek straight to the indexed offsets and never decode other contexts' records.
+
+    Appends are crash-safe: on open, torn or corrupt tail frames are truncated and records
+    missing from the index are re-indexed, and an interrupted compaction is finished or
+    rolled back. Single writer process per directory.
+    compact() copies the surviving records to a new segment set and the covered ones to
+    <base_dir>.archive.jsonl while record() carries on; record() only waits while the records
+    appended meanwhile are copied and the new segments are swapped in. Readers keep the segment
+    files they started on. Convert existing JSONL ledgers with src.core.ledger.segmented_ledger_tool.
+    """
+
+    DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, base_dir: str, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES, fsync: bool = False):
+        if segment_max_bytes < 1:
+            raise ValueError("segment_max_bytes must be >= 1")
+        self.base_dir = base_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self.archive_path = default_archive_path(base_dir.rstrip(os.sep))
+        self._lock = Lock()
+        self._compaction_lock = Lock()
+        # Key: str(context), Value: [(segment number, frame offset)] in append order
+        self._positions: Dict[str, List[Tuple[int, int]]] = {}
+        # Key: event id, Value: (str(context), position within that context's list)
+        self._event_index: Dict[str, Tuple[str, int]] = {}
+        self._active_segment = 0
+        self._active_size = 0
+        recover_compaction(base_dir)
+        os.makedirs(base_dir, exist_ok=True)
+        self._recover()
+
+    def record(self, event: StrategicEvent) -> None:
+        key = str(event.context)
+        frame = _encode_frame({
+            "id": str(event.id),
+            "timestamp": event.timestamp.isoformat(),
+            "event_type": event.event_type,
+            "details": event.details,
+            "context_key": key
+        })
+        with self._lock:
+            self._append(key, str(event.id), frame)
+
+    def get_history(self, context: StrategicContext) -> List[StrategicEvent]:
+        return [event for page in self.iter_history_since(context, None) for event in page]
+
+    def iter_history_since(
+            self,
+            context: StrategicContext,
+            event_id: Optional[UUID],
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        key = str(context)
+        with self._lock:
+            positions = self._positions.get(key, [])
+            if event_id is None:
+                start = 0
+            else:
+                indexed = self._event_index.get(str(event_id))
+                if indexed is None or indexed[0] != key:
+                    return
+                start = indexed[1] + 1
+            # Snapshot of the index at call time; later appends are not picked up.
+            positions = positions[start:]
+            # Opened together with the snapshot: a compaction swapping the segments
+            # afterwards does not move the frames these handles point at.
+            handles = {}
+            try:
+                for segment in {segment for segment, _ in positions}:
+                    handles[segment] = open(self._segment_path(segment), 'rb')
+            except BaseException:
+                for f in handles.values():
+                    f.close()
+                raise
+
+        try:
+            for page_start in range(0, len(positions), page_size):
+                page = []
+                for segment, offset in positions[page_start:page_start + page_size]:
+                    page.append(self._decode(_read_frame_at(handles[segment], offset), context))
+                yield page
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def compact(self, anchors: Sequence[Tuple[StrategicContext, UUID]], archive: bool = True) -> int:
+        with self._compaction_lock:
+            with self._lock:
+                covered: Set[Tuple[int, int]] = set()
+                for context, anchor_id in anchors:
+                    key = str(context)
+                    indexed = self._event_index.get(str(anchor_id))
+                    if indexed is not None and indexed[0] == key:
+                        covered.update(self._positions[key][:indexed[1]])
+                if not covered:
+                    return 0
+                # Frames before this position are copied without the lock; segments are append-only
+                cut = (self._active_segment, self._active_size)
+
+            if archive:
+                with open(self.archive_path, 'ab') as f:
+                    for data in self._iter_frames(lambda position: position in covered, end=cut):
+                        f.write((json.dumps(data) + "\n").encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+            staged, _ = stage_segments(
+                self.base_dir,
+                self._iter_frames(lambda position: position not in covered, end=cut),
+                self.segment_max_bytes
+            )
+            fsync_dir_files(staged.base_dir)
+
+            with self._lock:
+                for data in self._iter_frames(lambda position: True, start=cut):
+                    staged.append_raw(data)
+                swap_in_segments(self.base_dir, staged)
+                # The staging ledger indexed exactly what was swapped in
+                self._positions = staged._positions
+                self._event_index = staged._event_index
+                self._active_segment = staged._active_segment
+                self._active_size = staged._active_size
+            return len(covered)
+
+    def iter_full_history(
+            self,
+            context: StrategicContext,
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        target_key = str(context)
+        # A crash mid-compaction can leave an event both archived and live; ids dedupe it.
+        seen: Set[str] = set()
+        page: List[StrategicEvent] = []
+        for data in iter_archived_records(self.archive_path, seen):
+            if data.get("context_key") != target_key:
+                continue
+            page.append(self._decode(data, context))
+            if len(page) >= page_size:
+                yield page
+                page = []
+        for live_page in self.iter_history_since(context, None, page_size=page_size):
+            for event in live_page:
+                if str(event.id) in seen:
+                    continue
+                page.append(event)
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+    def iter_raw_records(self) -> Iterator[Dict]:
+        """
+        Yields every stored record as its serialized dict, in append order. Used by maintenance tools.
+        """
+        return self._iter_frames(lambda position: True)
+
+    def _iter_frames(
+            self,
+            select,
+            start: Tuple[int, int] = (0, 0),
+            end: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Dict]:
+        # select((segment, offset)) picks the records to yield among those in [start, end)
+        for number in self._segment_numbers():
+            if number < start[0] or (end is not None and number > end[0]):
+                continue
+            for offset, _, data in _read_frames(self._segment_path(number), start[1] if number == start[0] else 0):
+                if end is not None and (number, offset) >= end:
+                    break
+                if select((number, offset)):
+                    yield data
+
+    def append_raw(self, data: Dict) -> None:
+        """
+        Appends an already serialized event record (as written by FileStrategicLedger).
+        Used by migration; regular callers use record().
+        """
+        with self._lock:
+            self._append(data["context_key"], data["id"], _encode_frame(data))
+
+    def _append(self, key: str, event_id: str, frame: bytes) -> None:
+        if self._active_size > 0 and self._active_size + len(frame) > self.segment_max_bytes:
+            self._active_segment += 1
+            self._active_size = 0
+
+        offset = self._active_size
+        self._write(self._segment_path(self._active_segment), frame)
+        # The index entry follows the record; a crash in between is repaired on open.
+        self._write(
+            self._index_path(self._active_segment),
+            _encode_frame({"offset": offset, "context_key": key, "id": event_id})
+        )
+        self._active_size += len(frame)
+        self._index(key, event_id, self._active_segment, offset)
+
+    def _write(self, path: str, data: bytes) -> None:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _index(self, key: str, event_id: str, segment: int, offset: int) -> None:
+        positions = self._positions.setdefault(key, [])
+        self._event_index[event_id] = (key, len(positions))
+        positions.append((segment, offset))
+
+    def _recover(self) -> None:
+        numbers = self._segment_numbers()
+        for number in numbers:
+            segment_path = self._segment_path(number)
+            index_path = self._index_path(number)
+
+            # 1. Load index entries up to the first torn one. If the last entry does not point
+            #    at a valid record (lost segment write), rebuild this segment's index from scratch.
+            entries = list(_read_frames(index_path))
+            segment_end = 0
+            if entries:
+                last_record = next(_read_frames(segment_path, entries[-1][2]["offset"]), None)
+                if last_record is None:
+                    entries = []
+                else:
+                    segment_end = last_record[0] + last_record[1]
+            index_end = entries[-1][0] + entries[-1][1] if entries else 0
+            if os.path.exists(index_path) and os.path.getsize(index_path) != index_end:
+                os.truncate(index_path, index_end)
+            for _, _, entry in entries:
+                self._index(entry["context_key"], entry["id"], number, entry["offset"])
+
+            # 2. Index records written after the last index entry, then truncate a torn tail.
+            for offset, frame_length, data in _read_frames(segment_path, segment_end):
+                self._write(index_path, _encode_frame(
+                    {"offset": offset, "context_key": data["context_key"], "id": data["id"]}
+                ))
+                self._index(data["context_key"], data["id"], number, offset)
+                segment_end = offset + frame_length
+            if os.path.getsize(segment_path) != segment_end:
+                os.truncate(segment_path, segment_end)
+
+        if numbers:
+            self._active_segment = numbers[-1]
+            self._active_size = os.path.getsize(self._segment_path(self._active_segment))
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.base_dir):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                numbers.append(int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)]))
+        return sorted(numbers)
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.base_dir, f"{_SEGMENT_PREFIX}{number:06d}{_SEGMENT_SUFFIX}")
+
+    def _index_path(self, number: int) -> str:
+        return os.path.join(self.base_dir, f"{_SEGMENT_PREFIX}{number:06d}{_INDEX_SUFFIX}")
+
+    @staticmethod
+    def _decode(data: Dict, context: StrategicContext) -> StrategicEvent:
+        return StrategicEvent(
+            id=UUID(data['id']),
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            event_type=data['event_type'],
+            details=data['details'],
+            context=context
+        )
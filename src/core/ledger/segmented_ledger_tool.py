@@ -0,0 +1,80 @@
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from src.core.ledger.segmented_file_ledger import (
+    SegmentedFileStrategicLedger,
+    fsync_dir_files,
+    rewrite_segments,
+)
+
+
+def migrate_jsonl(
+        jsonl_path: str,
+        target_dir: str,
+        segment_max_bytes: int = SegmentedFileStrategicLedger.DEFAULT_SEGMENT_MAX_BYTES
+) -> int:
+    """
+    Converts a FileStrategicLedger JSONL file into a segmented ledger directory.
+    Blank and corrupt lines are skipped, as FileStrategicLedger does on read. Returns records written.
+    """
+    if os.path.isdir(target_dir) and os.listdir(target_dir):
+        raise ValueError(f"Target directory {target_dir} is not empty")
+
+    ledger = SegmentedFileStrategicLedger(target_dir, segment_max_bytes=segment_max_bytes)
+    written = 0
+    with open(jsonl_path, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            ledger.append_raw(data)
+            written += 1
+    fsync_dir_files(target_dir)
+    return written
+
+
+def compact(
+        base_dir: str,
+        segment_max_bytes: int = SegmentedFileStrategicLedger.DEFAULT_SEGMENT_MAX_BYTES
+) -> int:
+    """
+    Rewrites a segmented ledger into densely packed segments, dropping torn tails.
+    Must not run while a writer has the ledger open. Returns records kept.
+    A crash at any point leaves either the old or the new ledger for the next open to recover.
+    """
+    # Opening the source first recovers from an earlier interrupted run
+    source = SegmentedFileStrategicLedger(base_dir)
+    return rewrite_segments(base_dir, source.iter_raw_records(), segment_max_bytes)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Segmented strategic ledger maintenance")
+    parser.add_argument("--segment-max-bytes", type=int,
+                        default=SegmentedFileStrategicLedger.DEFAULT_SEGMENT_MAX_BYTES)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Convert a JSONL ledger into segments")
+    migrate_parser.add_argument("jsonl_path")
+    migrate_parser.add_argument("target_dir")
+
+    compact_parser = commands.add_parser("compact", help="Rewrite segments densely packed")
+    compact_parser.add_argument("base_dir")
+
+    args = parser.parse_args(argv)
+    if args.command == "migrate":
+        count = migrate_jsonl(args.jsonl_path, args.target_dir, args.segment_max_bytes)
+        print(f"Migrated {count} events into {args.target_dir}")
+    else:
+        count = compact(args.base_dir, args.segment_max_bytes)
+        print(f"Compacted {count} events in {args.base_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
 from src.core.ledger.strategic_event import StrategicEvent
 from src.core.domain.strategic_context import StrategicContext
 
@@ -8,6 +9,8 @@ class StrategicLedger(ABC):
     Append-only log of strategic events.
     Context-aware: stores and retrieves events scoped by StrategicContext.
     """
+    DEFAULT_PAGE_SIZE = 500
+
     @abstractmethod
     def record(self, event: StrategicEvent) -> None:
         pass
@@ -17,4 +20,52 @@ class StrategicLedger(ABC):
         """
         Retrieve events strictly belonging to the given context.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_history_since(
+            self,
+            context: StrategicContext,
+            event_id: Optional[UUID],
+            page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        """
+        Streams the context's events recorded strictly after event_id, in pages of at most page_size.
+        None streams the full history; an unknown id yields nothing.
+        """
+        pass
+
+    def get_history_since(self, context: StrategicContext, event_id: Optional[UUID]) -> List[StrategicEvent]:
+        return [event for page in self.iter_history_since(context, event_id) for event in page]
+
+    def get_histories_since(
+            self,
+            anchors: Sequence[Tuple[StrategicContext, Optional[UUID]]]
+    ) -> Dict[str, List[StrategicEvent]]:
+        """
+        Batched get_history_since for several contexts, keyed by str(context).
+        Ledgers that can serve all contexts in one read should override this.
+        """
+        return {str(context): self.get_history_since(context, event_id) for context, event_id in anchors}
+
+    @abstractmethod
+    def compact(self, anchors: Sequence[Tuple[StrategicContext, UUID]], archive: bool = True) -> int:
+        """
+        Removes, for each (context, anchor) pair, the context's events recorded before the anchor:
+        the anchor is the last event a durable snapshot covers. The anchor itself is kept, so
+        iter_history_since(context, anchor) still finds the tail; unknown anchors and contexts
+        not listed are left untouched. With archive, removed events stay readable through
+        iter_full_history. Runs concurrently with record(). Returns the number of events removed.
+        """
+        pass
+
+    def iter_full_history(
+            self,
+            context: StrategicContext,
+            page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[StrategicEvent]]:
+        """
+        Streams the context's archived events followed by its live history, for full-history checks.
+        Events dropped without archiving are gone.
+        """
+        return self.iter_history_since(context, None, page_size=page_size)
@@ -1,5 +1,6 @@
 import random
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import uuid4
@@ -21,12 +22,14 @@ from src.core.domain.strategic_trajectory import StrategicTrajectoryMemory, Traj
 from src.core.domain.strategy import StrategicPosture, StrategicMode
 from src.core.domain.window import ExecutionWindow
 from src.core.domain.window_decay import WindowDecayOutcome
+from src.core.ledger.event_serialization import serialize_for_event
 from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
 from src.core.ledger.strategic_event import StrategicEvent
 from src.core.ledger.strategic_ledger import StrategicLedger
 from src.core.lifecycle.signals import LifeSignals
 from src.core.observability.null_observer import NullStrategicObserver
 from src.core.observability.strategic_observer import StrategicObserver
+from src.core.observability.tick_profiler import TickProfiler, NullTickProfiler
 from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
 from src.core.persistence.snapshot_policy import SnapshotPolicy, DefaultSnapshotPolicy
 from src.core.persistence.strategic_state_backend import StrategicStateBackend
@@ -95,13 +98,15 @@ class LifeLoop:
             observer: Optional[StrategicObserver] = None,
             state_backend: Optional[StrategicStateBackend] = None,
             snapshot_policy: Optional[SnapshotPolicy] = None,
-            replay_engine: Optional[StrategicReplayEngine] = None  # [NEW] Injected
+            replay_engine: Optional[StrategicReplayEngine] = None,  # [NEW] Injected
+            profiler: Optional[TickProfiler] = None
     ):
         self.time_source = time_source or SystemTimeSource()
         self.ledger = ledger or InMemoryStrategicLedger()
         self.observer = observer or NullStrategicObserver()
         self.state_backend = state_backend or InMemoryStrategicStateBackend()
         self.snapshot_policy = snapshot_policy or DefaultSnapshotPolicy()
+        self.profiler = profiler or NullTickProfiler()
 
         # Replay Engine is now injected or created with dependencies
         self.replay_engine = replay_engine or StrategicReplayEngine(
@@ -130,6 +135,7 @@ class LifeLoop:
 
         self._current_window: Optional[ExecutionWindow] = None
         self._tick_count = 0
+        self._events_since_snapshot_check = 0
 
     def restore(self, human: AIHuman, context: StrategicContext) -> None:
         """
@@ -137,9 +143,17 @@ class LifeLoop:
         Delegates entirely to StrategicReplayEngine.
         """
         # 1. Replay Engine reconstructs state from snapshot + events
-        bundle = self.replay_engine.restore(context)
+        started = time.perf_counter()
+        bundle, replayed = self.replay_engine.restore_counted(context)
+        self.snapshot_policy.on_restored(context, replayed, time.perf_counter() - started)
 
         # 2. Apply restored state to runtime components
+        self.apply_restored_state(human, context, bundle)
+
+    def apply_restored_state(self, human: AIHuman, context: StrategicContext, bundle: StrategicStateBundle) -> None:
+        """
+        Applies an already reconstructed bundle. Used by bulk restore, which replays outside the LifeLoop.
+        """
         human.strategy = bundle.posture
         self.strategic_memory_store.save(context, bundle.memory)
         self.strategic_trajectory_memory_store.save(context, bundle.trajectory_memory)
@@ -154,19 +168,12 @@ class LifeLoop:
             context=context
         )
         self.ledger.record(event)
-        self.observer.on_event(event)
+        self._events_since_snapshot_check += 1
+        self.observer.on_strategic_event(event)
         return event
 
     def _serialize_for_event(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (StrategicMode, TrajectoryStatus)):
-            return obj.value
-        if hasattr(obj, "__dataclass_fields__"):
-            return {k: self._serialize_for_event(v) for k, v in asdict(obj).items()}
-        if isinstance(obj, list):
-            return [self._serialize_for_event(i) for i in obj]
-        return obj
+        return serialize_for_event(obj)
 
     def _persist_state(
             self,
@@ -209,10 +216,10 @@ class LifeLoop:
             path_statuses=path_statuses
         )
 
-    def _select_mask(self, human: AIHuman) -> Optional[PersonaMask]:
+    def _select_mask(self, human: AIHuman, rng: Optional[random.Random] = None) -> Optional[PersonaMask]:
         if not human.personas:
             return None
-        return random.choice(human.personas)
+        return (rng or random).choice(human.personas)
 
     def _calculate_feedback_modulation(self, signals: LifeSignals) -> FeedbackModulation:
         mod = FeedbackModulation()
@@ -247,10 +254,17 @@ class LifeLoop:
             tick_count: int,
             existing_window: Optional[ExecutionWindow] = None,
             existing_commitment: Optional[ExecutionCommitment] = None,
-            last_executed_intent: Optional[ExecutionIntent] = None
+            last_executed_intent: Optional[ExecutionIntent] = None,
+            rng: Optional[random.Random] = None
     ) -> InternalContext:
+        """
+        rng drives the probabilistic gates of this tick; None uses the global random module.
+        """
 
         now = self.time_source.now()
+        profiler = self.profiler.current()
+        profile_key = str(strategic_context)
+        mark = profiler.clock()
 
         # 1. Update State
         human.state.set_resting(signals.rest)
@@ -263,6 +277,7 @@ class LifeLoop:
             human.stance.update_topic(topic, p, s, now)
         for m in signals.memories:
             human.memory.add_short(m)
+        mark = profiler.lap(profile_key, "lifeloop.state_update", mark)
 
         # 2. Calculate Feedback Modulation & Strategic Adaptation
         modulation = self._calculate_feedback_modulation(signals)
@@ -394,11 +409,18 @@ class LifeLoop:
 
             current_memory = new_memory
             current_trajectory_memory = final_trajectory_memory
+        mark = profiler.lap(profile_key, "lifeloop.adaptation", mark)
 
         # Persistence Check
+        if self._events_since_snapshot_check:
+            self.snapshot_policy.on_events_recorded(strategic_context, self._events_since_snapshot_check)
+            self._events_since_snapshot_check = 0
         if self.snapshot_policy.should_save(strategic_context, tick_count, last_event, human.strategy):
+            started = time.perf_counter()
             self._persist_state(strategic_context, human.strategy, current_memory, current_trajectory_memory,
                                 last_event)
+            self.snapshot_policy.on_snapshot_saved(strategic_context, time.perf_counter() - started)
+        mark = profiler.lap(profile_key, "lifeloop.persistence", mark)
 
         # 3. Intention Decay
         surviving_intentions = []
@@ -421,6 +443,7 @@ class LifeLoop:
         else:
             base_decay = abs(total_pressure) if total_pressure < 0 else 2.0
             human.readiness.decay(base_decay * modulation.readiness_decay_factor)
+        mark = profiler.lap(profile_key, "lifeloop.intentions", mark)
 
         # 6. Physics of Volition
         temp_stance_snapshot = {t: s.intensity for t, s in human.stance.topics.items()}
@@ -432,13 +455,14 @@ class LifeLoop:
         )
         candidates = self.impulse_generator.generate(temp_context, now)
         for candidate in candidates:
-            if self.intention_gate.allow(candidate, human.state):
+            if self.intention_gate.allow(candidate, human.state, rng):
                 new_intention = Intention(
                     uuid4(), "generated", f"Focus on {candidate.topic}", float(candidate.pressure / 10.0),
                     now, 3600, {"origin": "impulse", "topic": candidate.topic}
                 )
                 human.intentions.append(new_intention)
                 human.state.apply_cost(5.0, 2.0)
+        mark = profiler.lap(profile_key, "lifeloop.impulses", mark)
 
         # 7. Strategic Filtering
         final_intentions = []
@@ -448,6 +472,7 @@ class LifeLoop:
                                                      current_trajectory_memory, strategic_context, now)
             if decision.allow: final_intentions.append(intention)
         human.intentions = final_intentions
+        mark = profiler.lap(profile_key, "lifeloop.strategy_filter", mark)
 
         # 8. Execution Window Logic
         decay_result = None
@@ -463,16 +488,16 @@ class LifeLoop:
 
             eligibility_map = {}
             if not active_window:
-                mask = self._select_mask(human)
+                mask = self._select_mask(human, rng)
                 if mask:
                     sorted_intentions = sorted(human.intentions, key=lambda x: x.priority, reverse=True)
                     for intention in sorted_intentions:
                         eligibility = self.eligibility_service.evaluate(intention, mask, human.state, human.readiness,
-                                                                        None, now)
+                                                                        None, now, rng)
                         eligibility_map[intention.id] = eligibility
                         if eligibility.allow and active_window is None:
                             new_window = self.commitment_evaluator.evaluate(intention, eligibility, mask, human.state,
-                                                                            human.readiness, now)
+                                                                            human.readiness, now, rng)
                             if new_window: active_window = new_window
 
             if active_window:
@@ -481,6 +506,7 @@ class LifeLoop:
                     active_commitment = resolution_result.commitment
                     self._emit_event("COMMITMENT_FORMED", {"id": str(active_commitment.id)}, strategic_context, now)
                 if resolution_result.window_consumed: active_window = None
+        mark = profiler.lap(profile_key, "lifeloop.execution_window", mark)
 
         # 9. Execution Binding
         execution_intent = None
@@ -497,6 +523,7 @@ class LifeLoop:
             stance_snapshot, eligibility_map if not active_commitment else {}, active_window, decay_result,
             active_commitment, execution_intent
         )
+        profiler.lap(profile_key, "lifeloop.binding", mark)
 
         return context
 
@@ -0,0 +1,35 @@
+from threading import Lock
+
+from src.core.observability.strategic_observer import StrategicObserver
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.ledger.budget_event import BudgetEvent
+from src.core.domain.execution_result import ExecutionResult
+from src.core.observability.telemetry_event import TelemetryEvent
+
+
+class SerializedStrategicObserver(StrategicObserver):
+    """
+    Delegates to another observer one call at a time.
+    Used when LifeLoops report from several tick workers at once.
+    """
+
+    def __init__(self, observer: StrategicObserver):
+        self.observer = observer
+        self._lock = Lock()
+
+    def on_strategic_event(self, event: StrategicEvent, is_replay: bool = False) -> None:
+        with self._lock:
+            self.observer.on_strategic_event(event, is_replay)
+
+    def on_budget_event(self, event: BudgetEvent, is_replay: bool = False) -> None:
+        with self._lock:
+            self.observer.on_budget_event(event, is_replay)
+
+    def on_execution_result(self, result: ExecutionResult, is_replay: bool = False) -> None:
+        with self._lock:
+            self.observer.on_execution_result(result, is_replay)
+
+    def on_telemetry(self, event: TelemetryEvent) -> None:
+        with self._lock:
+            self.observer.on_telemetry(event)
+
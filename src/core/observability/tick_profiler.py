@@ -0,0 +1,354 @@
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# context_key used for stages that are not tied to a single context
+TICK_SCOPE = "*"
+# context_key under which contexts evicted from the per-context histograms are summed
+EVICTED_SCOPE = "~evicted"
+
+
+@dataclass(frozen=True)
+class StageLatency:
+    """
+    Latency distribution of one (context, stage) pair, in milliseconds.
+    """
+    context_key: str
+    stage: str
+    count: int
+    total_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class TickProfiler(ABC):
+    """
+    Records per-stage tick latencies.
+    The orchestrator calls begin_tick() once per tick; every component then times its stages
+    as laps on current():
+        profiler = self.profiler.current()
+        mark = profiler.clock(); ...; mark = profiler.lap(key, stage, mark)
+    """
+
+    @abstractmethod
+    def begin_tick(self) -> "TickProfiler":
+        """
+        Decides whether the starting tick is sampled and returns current().
+        """
+        pass
+
+    @abstractmethod
+    def current(self) -> "TickProfiler":
+        """
+        This profiler while the current tick is sampled, a no-op profiler otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def clock(self) -> float:
+        pass
+
+    @abstractmethod
+    def lap(self, context_key: str, stage: str, started: float) -> float:
+        """
+        Records the time since started for the stage and returns the current clock.
+        """
+        pass
+
+    @abstractmethod
+    def tick_completed(self) -> None:
+        """
+        Called by the orchestrator once per tick.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Finishes pending exports and releases their resources.
+        """
+        pass
+
+
+class NullTickProfiler(TickProfiler):
+    """
+    Default no-op profiler.
+    """
+
+    def begin_tick(self) -> TickProfiler:
+        return self
+
+    def current(self) -> TickProfiler:
+        return self
+
+    def clock(self) -> float:
+        return 0.0
+
+    def lap(self, context_key: str, stage: str, started: float) -> float:
+        return 0.0
+
+    def tick_completed(self) -> None:
+        pass
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram: BUCKETS_PER_OCTAVE buckets per doubling from 1 microsecond.
+    Percentiles are reported as bucket upper bounds, so they overestimate by at most ~9%.
+    Only non-empty buckets are stored; a stage's latencies usually span a handful of them.
+    """
+
+    MIN_SECONDS = 1e-6
+    BUCKETS_PER_OCTAVE = 8
+    BUCKET_COUNT = 32 * BUCKETS_PER_OCTAVE  # up to ~4000 s
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = int(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_OCTAVE) + 1
+            if index >= self.BUCKET_COUNT:
+                index = self.BUCKET_COUNT - 1
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for index, bucket in sorted(self.counts.items()):
+            seen += bucket
+            if seen >= rank:
+                upper = self.MIN_SECONDS * 2 ** (index / self.BUCKETS_PER_OCTAVE)
+                return min(upper, self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for index, bucket in list(other.counts.items()):
+            counts[index] = counts.get(index, 0) + bucket
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+
+class _ThreadHistograms:
+    """
+    One thread's histograms: context_key -> stage -> histogram, least recently timed context
+    first, plus the per-stage sums of contexts evicted from it.
+    """
+
+    __slots__ = ("contexts", "evicted", "last")
+
+    def __init__(self):
+        self.contexts: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.evicted: Dict[str, LatencyHistogram] = {}
+        self.last: Optional[str] = None
+
+
+_NULL_PROFILER = NullTickProfiler()
+
+
+class HistogramTickProfiler(TickProfiler):
+    """
+    In-process profiler keeping a LatencyHistogram per (context, stage).
+
+    Only a sample_rate fraction of ticks is timed (all stages and contexts of a sampled
+    tick), which keeps the cost low enough to leave enabled. A LifeLoop ticked without an
+    orchestrator has to call begin_tick() itself. Each thread records into its own
+    histograms, merged on read, so the parallel tick workers never contend on a lock.
+    Each thread keeps per-context histograms for its max_contexts most recently timed
+    contexts; older ones are folded into EVICTED_SCOPE, so stage totals stay complete.
+
+    snapshot() reads the current distributions. If an exporter is given, it receives a
+    snapshot every export_every_ticks ticks, taken and exported on a background thread so
+    the tick never waits for it; an export due while the previous one still runs is
+    skipped. With reset_on_export each export covers only the ticks since the previous one.
+    close() waits for a pending export.
+    """
+
+    DEFAULT_SAMPLE_RATE = 1 / 32
+
+    def __init__(
+            self,
+            exporter: Optional[Callable[[List[StageLatency]], None]] = None,
+            export_every_ticks: int = 100,
+            reset_on_export: bool = False,
+            per_context: bool = True,
+            sample_rate: float = DEFAULT_SAMPLE_RATE,
+            seed: int = 0,
+            max_contexts: int = 1024
+    ):
+        if export_every_ticks < 1:
+            raise ValueError("export_every_ticks must be >= 1")
+        if max_contexts < 1:
+            raise ValueError("max_contexts must be >= 1")
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.exporter = exporter
+        self.export_every_ticks = export_every_ticks
+        self.reset_on_export = reset_on_export
+        self.per_context = per_context
+        self.sample_rate = sample_rate
+        self.max_contexts = max_contexts
+        # Private generator: sampling must not consume the global random state.
+        self._random = random.Random(seed).random
+        self._local = threading.local()
+        self._thread_histograms: List[_ThreadHistograms] = []
+        self._lock = Lock()
+        self._ticks = 0
+        self._export_executor: Optional[ThreadPoolExecutor] = None
+        self._export_future: Optional[Future] = None
+        self._current: TickProfiler = self if sample_rate >= 1.0 else _NULL_PROFILER
+
+    def begin_tick(self) -> TickProfiler:
+        if self.sample_rate < 1.0:
+            self._current = self if self._random() < self.sample_rate else _NULL_PROFILER
+        return self._current
+
+    def current(self) -> TickProfiler:
+        return self._current
+
+    def clock(self) -> float:
+        return time.perf_counter()
+
+    def lap(self, context_key: str, stage: str, started: float) -> float:
+        now = time.perf_counter()
+        try:
+            histograms = self._local.histograms
+        except AttributeError:
+            histograms = self._thread_local_histograms()
+        if not self.per_context:
+            context_key = TICK_SCOPE
+        contexts = histograms.contexts
+        stages = contexts.get(context_key)
+        if stages is None:
+            stages = contexts[context_key] = {}
+            if len(contexts) > self.max_contexts:
+                self._evict_oldest(histograms)
+        elif histograms.last != context_key:
+            # Re-insert to mark it most recently timed
+            contexts.pop(context_key, None)
+            contexts[context_key] = stages
+        histograms.last = context_key
+        histogram = stages.get(stage)
+        if histogram is None:
+            histogram = stages[stage] = LatencyHistogram()
+        histogram.add(now - started)
+        return now
+
+    def tick_completed(self) -> None:
+        if self.exporter is None:
+            return
+        with self._lock:
+            self._ticks += 1
+            due = self._ticks % self.export_every_ticks == 0
+            if not due or (self._export_future is not None and not self._export_future.done()):
+                return
+            if self._export_executor is None:
+                self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tick-profiler-export")
+            self._export_future = self._export_executor.submit(self._export)
+
+    def close(self) -> None:
+        with self._lock:
+            executor = self._export_executor
+            self._export_executor = None
+            self._export_future = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def snapshot(self, reset: bool = False) -> List[StageLatency]:
+        merged = self._merge(lambda key: key, reset)
+        return [self._latency(context_key, stage, h) for (context_key, stage), h in sorted(merged.items())]
+
+    def stage_totals(self) -> List[StageLatency]:
+        """
+        Per-stage distributions merged across contexts.
+        """
+        merged = self._merge(lambda key: key[1], reset=False)
+        return [self._latency(TICK_SCOPE, stage, h) for stage, h in sorted(merged.items())]
+
+    def reset(self) -> None:
+        self._merge(lambda key: key, reset=True)
+
+    def _export(self) -> None:
+        self.exporter(self.snapshot(reset=self.reset_on_export))
+
+    def _thread_local_histograms(self) -> _ThreadHistograms:
+        histograms = _ThreadHistograms()
+        with self._lock:
+            self._thread_histograms.append(histograms)
+        self._local.histograms = histograms
+        return histograms
+
+    @staticmethod
+    def _evict_oldest(histograms: _ThreadHistograms) -> None:
+        contexts = histograms.contexts
+        oldest = next(iter(contexts))
+        evicted = histograms.evicted
+        for stage, histogram in contexts.pop(oldest, {}).items():
+            target = evicted.get(stage)
+            if target is None:
+                target = evicted[stage] = LatencyHistogram()
+            target.merge(histogram)
+
+    def _merge(self, group: Callable[[Tuple[str, str]], Any], reset: bool) -> Dict[Any, LatencyHistogram]:
+        """
+        Sums the per-thread histograms by group((context_key, stage)). Runs without stopping
+        the workers: a lap racing with a read shows up in the next one, a lap racing with
+        reset may be lost.
+        """
+        merged: Dict[Any, LatencyHistogram] = {}
+        with self._lock:
+            sources = list(self._thread_histograms)
+        for histograms in sources:
+            contexts = dict(histograms.contexts)
+            evicted = dict(histograms.evicted)
+            if reset:
+                for context_key in contexts:
+                    histograms.contexts.pop(context_key, None)
+                for stage in evicted:
+                    histograms.evicted.pop(stage, None)
+                histograms.last = None
+            taken = [(EVICTED_SCOPE, evicted)] + list(contexts.items())
+            for context_key, stages in taken:
+                for stage, h in list(stages.items()):
+                    target = merged.get(group((context_key, stage)))
+                    if target is None:
+                        target = merged[group((context_key, stage))] = LatencyHistogram()
+                    target.merge(h)
+        return merged
+
+    @staticmethod
+    def _latency(context_key: str, stage: str, histogram: LatencyHistogram) -> StageLatency:
+        return StageLatency(
+            context_key=context_key,
+            stage=stage,
+            count=histogram.count,
+            total_ms=histogram.total * 1000.0,
+            max_ms=histogram.max * 1000.0,
+            p50_ms=histogram.quantile(0.50) * 1000.0,
+            p95_ms=histogram.quantile(0.95) * 1000.0,
+            p99_ms=histogram.quantile(0.99) * 1000.0
+        )
@@ -1,3 +1,4 @@
+import heapq
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple
 from src.core.domain.execution_intent import ExecutionIntent
@@ -17,10 +18,30 @@ class StrategicArbitrator(ABC):
     ) -> Optional[Tuple[StrategicContextRuntime, ExecutionIntent]]:
         pass
 
+    def select_top(
+            self,
+            candidates: List[Tuple[StrategicContextRuntime, ExecutionIntent, float]],
+            k: int
+    ) -> List[int]:
+        """
+        Indices into candidates of up to k winners, best first.
+        Arbitrators that only know how to pick one winner return select()'s pick.
+        """
+        if k < 1:
+            return []
+        winner = self.select(candidates)
+        if winner is None:
+            return []
+        for index, (runtime, intent, _) in enumerate(candidates):
+            if runtime is winner[0] and intent is winner[1]:
+                return [index]
+        return []
+
 
 class PriorityArbitrator(StrategicArbitrator):
     """
     Selects the intent with the highest calculated priority score.
+    Equal scores go to the earlier candidate (routing order), so outcomes are replay-stable.
     """
 
     def select(
@@ -30,9 +51,25 @@ class PriorityArbitrator(StrategicArbitrator):
         if not candidates:
             return None
 
-        # Sort by priority_score descending
-        # candidates is list of (runtime, intent, priority_score)
-        sorted_candidates = sorted(candidates, key=lambda x: x[2], reverse=True)
+        # Single linear pass; strict > keeps the first of equal scores
+        best = candidates[0]
+        for candidate in candidates[1:]:
+            if candidate[2] > best[2]:
+                best = candidate
+        return best[0], best[1]
 
-        winner = sorted_candidates[0]
-        return winner[0], winner[1]
\ No newline at end of file
+    def select_top(
+            self,
+            candidates: List[Tuple[StrategicContextRuntime, ExecutionIntent, float]],
+            k: int
+    ) -> List[int]:
+        if k < 1 or not candidates:
+            return []
+        if k == 1:
+            best = 0
+            for index in range(1, len(candidates)):
+                if candidates[index][2] > candidates[best][2]:
+                    best = index
+            return [best]
+        # O(n log k); ties ordered by position
+        return heapq.nsmallest(k, range(len(candidates)), key=lambda index: (-candidates[index][2], index))
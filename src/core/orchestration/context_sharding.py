@@ -0,0 +1,167 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from src.core.domain.entity import AIHuman
+from src.core.domain.execution_intent import ExecutionIntent
+from src.core.domain.strategic_context import StrategicContext
+from src.core.lifecycle.signals import LifeSignals
+from src.core.observability.telemetry_event import TelemetryEvent
+from src.core.orchestration.shard_store import ShardStore
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+
+
+def shard_for(context_key: str, shards: Sequence[str]) -> Optional[str]:
+    """
+    Rendezvous (highest random weight) hashing of a context key over the live shards.
+    Stable across processes; adding or removing a shard only moves the contexts it gains or
+    loses.
+    """
+    best: Optional[str] = None
+    best_weight = -1
+    for shard_id in shards:
+        digest = hashlib.blake2b(f"{shard_id}\x00{context_key}".encode("utf-8"), digest_size=8).digest()
+        weight = int.from_bytes(digest, "big")
+        if weight > best_weight or (weight == best_weight and shard_id < best):
+            best, best_weight = shard_id, weight
+    return best
+
+
+@dataclass(frozen=True)
+class ShardRebalance:
+    shards: List[str]  # live shards seen by this rebalance
+    owned: List[str]  # context keys this shard ticks after the rebalance
+    acquired: List[str]
+    released: List[str]  # handed over to the shard they now hash to
+    waiting: List[str]  # hash here, still leased by their previous owner
+    lost: List[str]  # our lease had expired and another shard took them
+
+
+class ContextShardManager:
+    """
+    Runs one shard of a sharded deployment: several orchestrator processes sharing the
+    strategic ledger and state backend, the budget ledger and backend (with a BudgetLock
+    passed to each orchestrator), and a ShardStore.
+
+    Every context is assigned to a live shard by shard_for() and ticked only by the shard
+    holding its ownership lease. rebalance() renews membership and leases, hands over
+    contexts that now hash elsewhere, and restores the ones it was handed from the shared
+    ledger. A context moves only once its previous owner has released it or that owner's
+    lease has run out. tick() is fenced by the same leases: it only ticks while at least
+    tick_margin_seconds of them remain, and once they lapse (a shard stalled past
+    lease_seconds) it drops its contexts instead, since another shard may own them by now.
+    So no context is ticked by two shards at once, provided a single tick takes less than
+    tick_margin_seconds. Call rebalance() every few ticks, well within lease_seconds.
+
+    Budget invariants hold across shards through the BudgetLock: every reservation is
+    re-evaluated against the budget all shards have left. Arbitration stays deterministic
+    within a shard; free slots go to shards in the order they reserve, not by global priority.
+    rebalance() also reports the last budget event the shard applied; pass the same store to
+    LedgerCompactor so budget compaction stays behind it.
+    """
+
+    def __init__(
+            self,
+            orchestrator: StrategicOrchestrator,
+            store: ShardStore,
+            shard_id: str,
+            lease_seconds: float = 30.0,
+            tick_margin_seconds: float = 5.0
+    ):
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be > 0")
+        if not 0 <= tick_margin_seconds < lease_seconds:
+            raise ValueError("tick_margin_seconds must be in [0, lease_seconds)")
+        self.orchestrator = orchestrator
+        self.store = store
+        self.shard_id = shard_id
+        self.lease_seconds = lease_seconds
+        self.tick_margin_seconds = tick_margin_seconds
+        # Expiry of the leases granted by the last rebalance; the store computes the same one
+        self._leases_expire_at: Optional[datetime] = None
+
+    def rebalance(self, registrations: Sequence[Tuple[StrategicContext, AIHuman]]) -> ShardRebalance:
+        """
+        registrations: every context of the deployment, as for register_contexts.
+        """
+        orchestrator = self.orchestrator
+        now = orchestrator.time_source.now()
+        lease = timedelta(seconds=self.lease_seconds)
+        self.store.heartbeat(self.shard_id, now, lease)
+        # Keeps budget compaction behind the events this shard has applied
+        self.store.record_budget_cursor(self.shard_id, orchestrator._last_budget_event_id)
+        shards = self.store.live_shards(now)
+
+        by_key = {}
+        for context, human in registrations:
+            by_key.setdefault(str(context), (context, human))
+        assigned = [key for key in by_key if shard_for(key, shards) == self.shard_id]
+        assigned_keys = set(assigned)
+
+        released = [key for key in orchestrator._runtimes if key not in assigned_keys]
+        for key in released:
+            orchestrator.remove_context(orchestrator._runtimes[key].context)
+        self.store.release_contexts(self.shard_id, released)
+
+        granted = self.store.acquire_contexts(self.shard_id, assigned, now, lease)
+        self._leases_expire_at = now + lease
+        granted_keys = set(granted)
+        lost = [key for key in orchestrator._runtimes if key not in granted_keys]
+        for key in lost:
+            orchestrator.remove_context(orchestrator._runtimes[key].context)
+
+        acquired = [key for key in granted if key not in orchestrator._runtimes]
+        orchestrator.register_contexts([by_key[key] for key in acquired])
+
+        result = ShardRebalance(
+            shards=shards,
+            owned=granted,
+            acquired=acquired,
+            released=released,
+            waiting=[key for key in assigned if key not in granted_keys],
+            lost=lost,
+        )
+        if result.acquired or result.released or result.lost:
+            orchestrator.observer.on_telemetry(
+                TelemetryEvent(now, "SHARD_REBALANCE", "Orchestrator", payload={
+                    "shard_id": self.shard_id,
+                    "shards": len(shards),
+                    "owned": len(result.owned),
+                    "acquired": len(result.acquired),
+                    "released": len(result.released),
+                    "waiting": len(result.waiting),
+                    "lost": len(result.lost),
+                })
+            )
+        return result
+
+    def tick(self, human: AIHuman, signals: LifeSignals) -> Optional[ExecutionIntent]:
+        """
+        orchestrator.tick() for the owned contexts, fenced by their ownership leases.
+        """
+        orchestrator = self.orchestrator
+        now = orchestrator.time_source.now()
+        margin = timedelta(seconds=self.tick_margin_seconds)
+        if self._leases_expire_at is not None and now + margin < self._leases_expire_at:
+            return orchestrator.tick(human, signals)
+
+        lapsed = list(orchestrator._runtimes)
+        for key in lapsed:
+            orchestrator.remove_context(orchestrator._runtimes[key].context)
+        if lapsed:
+            orchestrator.observer.on_telemetry(
+                TelemetryEvent(now, "SHARD_LEASE_LAPSED", "Orchestrator", payload={
+                    "shard_id": self.shard_id,
+                    "dropped": len(lapsed),
+                })
+            )
+        return None
+
+    def leave(self) -> None:
+        """
+        Stops ticking every context and frees them for the remaining shards.
+        """
+        for runtime in list(self.orchestrator._runtimes.values()):
+            self.orchestrator.remove_context(runtime.context)
+        self.store.leave(self.shard_id)
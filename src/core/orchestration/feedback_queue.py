@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque
+
+from src.core.domain.execution_result import ExecutionResult, ExecutionStatus
+
+
+class FeedbackOverflowPolicy(Enum):
+    # Evict the oldest queued result to make room for the new one.
+    DROP_OLDEST = "DROP_OLDEST"
+    # Merge the new result into the newest queued one; failures are never replaced by successes.
+    COALESCE = "COALESCE"
+
+
+@dataclass(frozen=True)
+class FeedbackQueueMetrics:
+    queued: int  # results waiting across all contexts
+    dropped: int  # evicted by DROP_OLDEST
+    coalesced: int  # merged by COALESCE
+    pending_execution_meta: int
+    expired_execution_meta: int  # intents that never reported back within the ttl
+
+
+def is_failure(result: ExecutionResult) -> bool:
+    return result.status in (ExecutionStatus.FAILED, ExecutionStatus.REJECTED)
+
+
+def push_feedback(
+        queue: Deque[ExecutionResult],
+        result: ExecutionResult,
+        cap: int,
+        policy: FeedbackOverflowPolicy
+) -> bool:
+    """
+    Appends result to a per-context queue holding at most cap results.
+    Returns True if the queue was full and policy had to drop or merge a result.
+    """
+    if len(queue) < cap:
+        queue.append(result)
+        return False
+    if policy == FeedbackOverflowPolicy.COALESCE:
+        if not (is_failure(queue[-1]) and not is_failure(result)):
+            queue[-1] = result
+        return True
+    queue.popleft()
+    queue.append(result)
+    return True
@@ -0,0 +1,158 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.core.orchestration.shard_store import ShardStore
+
+
+class PostgresShardStore(ShardStore):
+    """
+    Shard membership and context ownership in Postgres.
+    Ownership changes are single upserts guarded by the lease condition, so concurrent
+    shards can never both be granted the same context.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.ensure_schema()
+
+    @classmethod
+    def from_dsn(cls, dsn: str) -> "PostgresShardStore":
+        engine = create_engine(dsn, pool_pre_ping=True, future=True)
+        return cls(engine)
+
+    def ensure_schema(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS orchestrator_shards (
+                        shard_id TEXT PRIMARY KEY,
+                        expires_at TIMESTAMPTZ NOT NULL
+                    )
+                    """
+                )
+            )
+            conn.execute(text("ALTER TABLE orchestrator_shards ADD COLUMN IF NOT EXISTS budget_cursor UUID"))
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS orchestrator_context_owners (
+                        context_key TEXT PRIMARY KEY,
+                        shard_id TEXT NOT NULL,
+                        expires_at TIMESTAMPTZ NOT NULL
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    CREATE INDEX IF NOT EXISTS ix_orchestrator_context_owners_shard
+                    ON orchestrator_context_owners (shard_id)
+                    """
+                )
+            )
+
+    def heartbeat(self, shard_id: str, now: datetime, lease: timedelta) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO orchestrator_shards (shard_id, expires_at)
+                    VALUES (:shard_id, :expires_at)
+                    ON CONFLICT (shard_id) DO UPDATE SET expires_at = EXCLUDED.expires_at
+                    """
+                ),
+                {"shard_id": shard_id, "expires_at": now + lease},
+            )
+
+    def leave(self, shard_id: str) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM orchestrator_context_owners WHERE shard_id=:shard_id"),
+                         {"shard_id": shard_id})
+            conn.execute(text("DELETE FROM orchestrator_shards WHERE shard_id=:shard_id"),
+                         {"shard_id": shard_id})
+
+    def live_shards(self, now: datetime) -> List[str]:
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT shard_id FROM orchestrator_shards
+                    WHERE expires_at > :now
+                    ORDER BY shard_id ASC
+                    """
+                ),
+                {"now": now},
+            ).fetchall()
+        return [row.shard_id for row in rows]
+
+    def acquire_contexts(
+            self,
+            shard_id: str,
+            context_keys: Sequence[str],
+            now: datetime,
+            lease: timedelta
+    ) -> List[str]:
+        if not context_keys:
+            return []
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    INSERT INTO orchestrator_context_owners (context_key, shard_id, expires_at)
+                    SELECT key, :shard_id, :expires_at FROM unnest(:keys) AS key
+                    ON CONFLICT (context_key) DO UPDATE
+                    SET shard_id = EXCLUDED.shard_id, expires_at = EXCLUDED.expires_at
+                    WHERE orchestrator_context_owners.shard_id = EXCLUDED.shard_id
+                       OR orchestrator_context_owners.expires_at <= :now
+                    RETURNING context_key
+                    """
+                ),
+                {
+                    "shard_id": shard_id,
+                    "expires_at": now + lease,
+                    "now": now,
+                    "keys": list(dict.fromkeys(context_keys)),
+                },
+            ).fetchall()
+        granted = {row.context_key for row in rows}
+        return [key for key in context_keys if key in granted]
+
+    def release_contexts(self, shard_id: str, context_keys: Sequence[str]) -> None:
+        if not context_keys:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    DELETE FROM orchestrator_context_owners
+                    WHERE shard_id=:shard_id AND context_key = ANY(:keys)
+                    """
+                ),
+                {"shard_id": shard_id, "keys": list(context_keys)},
+            )
+
+    def owners(self) -> Dict[str, str]:
+        with self.engine.begin() as conn:
+            rows = conn.execute(text("SELECT context_key, shard_id FROM orchestrator_context_owners")).fetchall()
+        return {row.context_key: row.shard_id for row in rows}
+
+    def record_budget_cursor(self, shard_id: str, event_id: Optional[UUID]) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("UPDATE orchestrator_shards SET budget_cursor=:event_id WHERE shard_id=:shard_id"),
+                {"shard_id": shard_id, "event_id": event_id},
+            )
+
+    def budget_cursors(self, now: datetime) -> Dict[str, Optional[UUID]]:
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text("SELECT shard_id, budget_cursor FROM orchestrator_shards WHERE expires_at > :now"),
+                {"now": now},
+            ).fetchall()
+        return {row.shard_id: row.budget_cursor for row in rows}
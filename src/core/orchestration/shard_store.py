@@ -0,0 +1,171 @@
+import fcntl
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+
+class ShardStore(ABC):
+    """
+    Membership and context ownership shared by the orchestrator shards of one deployment.
+
+    Shards announce themselves with heartbeat() and are live until their lease runs out.
+    A context is ticked only by the shard holding its ownership lease; acquire_contexts()
+    grants a context that is free, already held by the caller, or whose lease has expired.
+    Each shard also reports the last budget event it has applied, so that budget compaction
+    never removes events a live shard has yet to read.
+    """
+
+    @abstractmethod
+    def heartbeat(self, shard_id: str, now: datetime, lease: timedelta) -> None:
+        pass
+
+    @abstractmethod
+    def leave(self, shard_id: str) -> None:
+        """
+        Drops the shard from membership and frees every context it owns.
+        """
+        pass
+
+    @abstractmethod
+    def live_shards(self, now: datetime) -> List[str]:
+        """
+        Sorted ids of the shards whose membership lease has not expired.
+        """
+        pass
+
+    @abstractmethod
+    def acquire_contexts(
+            self,
+            shard_id: str,
+            context_keys: Sequence[str],
+            now: datetime,
+            lease: timedelta
+    ) -> List[str]:
+        """
+        Claims or renews ownership of context_keys; returns the keys granted, in input order.
+        """
+        pass
+
+    @abstractmethod
+    def release_contexts(self, shard_id: str, context_keys: Sequence[str]) -> None:
+        pass
+
+    @abstractmethod
+    def owners(self) -> Dict[str, str]:
+        """
+        context key -> owning shard id, expired leases included.
+        """
+        pass
+
+    @abstractmethod
+    def record_budget_cursor(self, shard_id: str, event_id: Optional[UUID]) -> None:
+        pass
+
+    @abstractmethod
+    def budget_cursors(self, now: datetime) -> Dict[str, Optional[UUID]]:
+        """
+        live shard id -> last budget event it reported applying; None if it has not reported one.
+        """
+        pass
+
+
+class FileShardStore(ShardStore):
+    """
+    File-backed stand-in for PostgresShardStore, for shards on one host.
+    State lives in one JSON file, read and rewritten under an exclusive flock.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.lock_path = file_path + ".lock"
+        self._lock = Lock()  # flock does not exclude threads sharing the process
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def heartbeat(self, shard_id: str, now: datetime, lease: timedelta) -> None:
+        with self._state() as state:
+            state["shards"][shard_id] = (now + lease).isoformat()
+
+    def leave(self, shard_id: str) -> None:
+        with self._state() as state:
+            state["shards"].pop(shard_id, None)
+            state["budget_cursors"].pop(shard_id, None)
+            state["owners"] = {
+                key: owner for key, owner in state["owners"].items() if owner[0] != shard_id
+            }
+
+    def live_shards(self, now: datetime) -> List[str]:
+        with self._state(write=False) as state:
+            return sorted(
+                shard_id for shard_id, expires_at in state["shards"].items()
+                if datetime.fromisoformat(expires_at) > now
+            )
+
+    def acquire_contexts(
+            self,
+            shard_id: str,
+            context_keys: Sequence[str],
+            now: datetime,
+            lease: timedelta
+    ) -> List[str]:
+        granted = []
+        expires_at = (now + lease).isoformat()
+        with self._state() as state:
+            owners = state["owners"]
+            for key in context_keys:
+                owner = owners.get(key)
+                if owner is None or owner[0] == shard_id or datetime.fromisoformat(owner[1]) <= now:
+                    owners[key] = [shard_id, expires_at]
+                    granted.append(key)
+        return granted
+
+    def release_contexts(self, shard_id: str, context_keys: Sequence[str]) -> None:
+        with self._state() as state:
+            owners = state["owners"]
+            for key in context_keys:
+                owner = owners.get(key)
+                if owner is not None and owner[0] == shard_id:
+                    del owners[key]
+
+    def owners(self) -> Dict[str, str]:
+        with self._state(write=False) as state:
+            return {key: owner[0] for key, owner in state["owners"].items()}
+
+    def record_budget_cursor(self, shard_id: str, event_id: Optional[UUID]) -> None:
+        with self._state() as state:
+            state["budget_cursors"][shard_id] = str(event_id) if event_id is not None else None
+
+    def budget_cursors(self, now: datetime) -> Dict[str, Optional[UUID]]:
+        with self._state(write=False) as state:
+            cursors = state["budget_cursors"]
+            return {
+                shard_id: UUID(cursors[shard_id]) if cursors.get(shard_id) else None
+                for shard_id, expires_at in state["shards"].items()
+                if datetime.fromisoformat(expires_at) > now
+            }
+
+    @contextmanager
+    def _state(self, write: bool = True) -> Iterator[dict]:
+        with self._lock, open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                state = {"shards": {}, "owners": {}, "budget_cursors": {}}
+                if os.path.exists(self.file_path):
+                    with open(self.file_path, 'r') as f:
+                        state.update(json.load(f))
+                yield state
+                if write:
+                    staging_path = self.file_path + ".tmp"
+                    with open(staging_path, 'w') as f:
+                        json.dump(state, f)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(staging_path, self.file_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -1,5 +1,12 @@
-from typing import Dict, List, Optional, Tuple, Any, Callable
-from dataclasses import replace
+import random
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
+from contextlib import contextmanager
+from threading import Lock
+from typing import Deque, Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple, Any, Callable
+from dataclasses import dataclass, replace
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -15,6 +22,9 @@ from src.core.lifecycle.lifeloop import LifeLoop
 from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
 from src.core.orchestration.routing_policy import ContextRoutingPolicy, DefaultRoutingPolicy
 from src.core.orchestration.arbitrator import StrategicArbitrator, PriorityArbitrator
+from src.core.orchestration.feedback_queue import (
+    FeedbackOverflowPolicy, FeedbackQueueMetrics, is_failure, push_feedback
+)
 from src.core.services.resource_manager import StrategicResourceManager
 from src.core.services.strategic_priority import StrategicPriorityService
 from src.core.time.time_source import TimeSource
@@ -24,17 +34,23 @@ from src.core.ledger.in_memory_budget_ledger import InMemoryBudgetLedger
 from src.core.ledger.budget_event import BudgetEvent
 from src.core.persistence.strategic_state_backend import StrategicStateBackend
 from src.core.persistence.budget_backend import BudgetPersistenceBackend, InMemoryBudgetBackend
+from src.core.persistence.snapshot_policy import SnapshotPolicy
+from src.core.persistence.serialized_backend import SerializedStrategicStateBackend
+from src.core.persistence.budget_lock import BudgetLock
 from src.core.replay.budget_reducer import BudgetReplayReducer
+from src.core.replay.exceptions import ReplayIntegrityError
 from src.core.interfaces.execution_adapter import ExecutionAdapter
 from src.core.replay.strategic_replay_engine import StrategicReplayEngine
 from src.core.observability.strategic_observer import StrategicObserver
 from src.core.observability.null_observer import NullStrategicObserver
+from src.core.observability.serialized_observer import SerializedStrategicObserver
 from src.core.observability.telemetry_event import TelemetryEvent
+from src.core.observability.tick_profiler import TickProfiler, NullTickProfiler, TICK_SCOPE
 from src.core.domain.runtime_phase import RuntimePhase
 from src.integration.registry import ExecutionAdapterRegistry
 from src.integration.normalizer import ResultNormalizer
 from src.core.config.runtime_profile import RuntimeProfile, Environment
-from src.core.domain.exceptions import SafetyLimitExceeded, PanicMode
+from src.core.domain.exceptions import BudgetInvariantViolation, SafetyLimitExceeded, PanicMode
 from src.governance.runtime.governance_runtime_provider import GovernanceRuntimeProvider
 from src.admin.interfaces.governance_service import GovernanceService
 from src.autonomy.services.governance_execution_resolver import StandardGovernanceExecutionResolver
@@ -53,6 +69,7 @@ from src.memory.interfaces.memory_id_source import MemoryIdSource, SystemMemoryI
 from src.memory.services.memory_decay_policy import LinearDecay
 from src.memory.services.temporal_memory_analyzer import TemporalMemoryAnalyzer
 from src.memory.services.memory_signal_builder import MemorySignalBuilder
+from src.memory.services.memory_signal_tracker import MemorySignalTracker
 from src.memory.services.memory_strategy_adapter import MemoryStrategyAdapter
 from src.memory.services.memory_scope_resolver import MemoryScopeResolver
 from src.memory.store.counterfactual_memory_store import CounterfactualMemoryStore
@@ -68,15 +85,80 @@ from src.infrastructure.services.telegram_persona_projection import TelegramPers
 from src.execution.domain.execution_job import ExecutionJob
 from src.execution.queue.execution_queue import ExecutionQueue, InMemoryExecutionQueue
 from src.world.context.context_buffer import ContextBuffer
+from src.world.context.observation_index import ObservationIndex
 from src.world.store.world_observation_store import WorldObservationStore
 
 
+@dataclass
+class ContextTickPlan:
+    """
+    Per-context inputs resolved serially before the evaluation stage of a tick.
+    """
+    key: str
+    runtime: StrategicContextRuntime
+    human: AIHuman
+    governance_context: Optional[RuntimeGovernanceContext]
+    signals: LifeSignals
+    # Filled by the incremental memory stage; None means analyze inside the evaluation stage.
+    memory_signal: Any = None
+    memory_context: Any = None
+    recent_events: Optional[List[EventRecord]] = None
+    recent_counterfactuals: Optional[List[CounterfactualEvent]] = None
+    # Drives the LifeLoop's probabilistic gates for this context and tick
+    rng: Optional[random.Random] = None
+
+
+@dataclass
+class ContextTickEvaluation:
+    """
+    Outcome of the per-context evaluation stage (memory, analyzers, LifeLoop, budget).
+    Shared-state effects (counterfactuals, candidates) are applied later by the join stage.
+    """
+    plan: ContextTickPlan
+    memory_signal: Any
+    recent_events: List[EventRecord]
+    recent_counterfactuals: List[CounterfactualEvent]
+    intent: Optional[ExecutionIntent] = None
+    priority: Optional[float] = None
+    suppression: Optional[Tuple[str, str]] = None  # (reason, stage)
+
+
 class StrategicOrchestrator:
     """
     Top-level coordinator for the strategic AI core.
     Manages multiple isolated StrategicContexts, routes signals, and arbitrates execution.
     Owns context lifecycle, tick cadence, arbitration authority, and GLOBAL RESOURCE BUDGET.
     Enforces RuntimeProfile safety limits.
+
+    Per-context evaluation (memory resolution, analyzers, LifeLoop tick, budget evaluation)
+    runs serially by default. With tick_workers > 1 it is spread over a bounded thread pool;
+    contexts sharing an AIHuman are evaluated in order on the same worker, and arbitration,
+    counterfactual recording and enqueue always happen on the calling thread in routing order.
+    Each context's LifeLoop draws from its own RNG, seeded from the tick seed, the context and
+    its tick count, so both modes make the same decisions; rng_seed fixes the tick seed,
+    otherwise it is drawn from the global random module once per tick. The observer and state
+    backend are wrapped to serialize calls from tick workers.
+
+    Memory analysis looks at the last memory_window_size events per context; the default
+    scope resolver maintains that window incrementally on ingest. With incremental_memory_signals
+    each context's signal is carried over between ticks and only updated for new memory input
+    and elapsed time; otherwise each context's window is analyzed in its evaluation stage.
+
+    A HistogramTickProfiler passed as tick_profiler times the stages of sampled ticks, per
+    context for per-context stages; the same profiler is handed to LifeLoops built by
+    register_context.
+
+    A snapshot_policy given here is shared by all LifeLoops and receives restore costs from
+    register_contexts, so an AdaptiveSnapshotPolicy can bound restore time per context.
+
+    Execution results wait in per-context queues of at most feedback_queue_cap entries, drained
+    one per tick; feedback_overflow decides what a full queue gives up. Metadata of enqueued
+    intents is forgotten after execution_meta_ttl_seconds without a result. Both are counted
+    in feedback_metrics() and reported as telemetry.
+
+    Each tick dispatches up to min(max_dispatch_per_tick, free execution slots) winners, taken
+    in arbitration order; every winner is re-evaluated against the budget left by the ones
+    before it, so the default of one winner per tick behaves as before.
     """
 
     def __init__(
@@ -112,7 +194,19 @@ class StrategicOrchestrator:
             context_buffer: Optional[ContextBuffer] = None,
             world_store: Optional[WorldObservationStore] = None,
             governance_context_resolver: Optional[Callable[[StrategicContext, AIHuman], Any]] = None,
+            governance_revision: Optional[Callable[[], Optional[Hashable]]] = None,
             upward_aggregation_service: Optional[Any] = None,
+            tick_workers: int = 1,
+            memory_window_size: int = 50,
+            incremental_memory_signals: bool = True,
+            tick_profiler: Optional[TickProfiler] = None,
+            snapshot_policy: Optional[SnapshotPolicy] = None,
+            feedback_queue_cap: int = 64,
+            feedback_overflow: FeedbackOverflowPolicy = FeedbackOverflowPolicy.DROP_OLDEST,
+            execution_meta_ttl_seconds: Optional[float] = 3600.0,
+            max_dispatch_per_tick: int = 1,
+            budget_lock: Optional[BudgetLock] = None,
+            rng_seed: Optional[int] = None,
     ):
         self.time_source = time_source
         self.ledger = ledger
@@ -128,12 +222,19 @@ class StrategicOrchestrator:
         self.adapter_registry = adapter_registry or ExecutionAdapterRegistry()
         self.execution_queue = execution_queue or InMemoryExecutionQueue()
         self.observer = observer or NullStrategicObserver()
+        self.tick_profiler = tick_profiler or NullTickProfiler()
+        # Shared by every LifeLoop; None keeps the LifeLoop default (one DefaultSnapshotPolicy each)
+        self.snapshot_policy = snapshot_policy
         if execution_adapter is not None:
             self.adapter_registry.register("default", execution_adapter)
         self.governance_service = governance_service
         self.governance_provider = GovernanceRuntimeProvider(
             self.governance_service) if self.governance_service else None
         self.governance_context_resolver = governance_context_resolver
+        # Resolved governance contexts are reused while this token is unchanged (None: resolve every tick).
+        # Defaults to the revision() of the resolver's owner, or of the governance provider.
+        self.governance_revision = governance_revision or self._default_governance_revision()
+        self._governance_cache: Dict[str, Tuple[Hashable, UUID, Optional[RuntimeGovernanceContext]]] = {}
 
         self.governance_execution_resolver = StandardGovernanceExecutionResolver()
         self.governance_autonomy_resolver = StandardGovernanceAutonomyResolver()
@@ -147,10 +248,18 @@ class StrategicOrchestrator:
         self.temporal_analyzer = temporal_analyzer or TemporalMemoryAnalyzer(LinearDecay(3600))
         self.signal_builder = signal_builder or MemorySignalBuilder()
         self.memory_strategy_adapter = memory_strategy_adapter or MemoryStrategyAdapter()
-        self.memory_scope_resolver = memory_scope_resolver or MemoryScopeResolver(self.memory_store)
+        if memory_window_size < 1:
+            raise ValueError("memory_window_size must be >= 1")
+        self.memory_window_size = memory_window_size
+        self.memory_scope_resolver = memory_scope_resolver or MemoryScopeResolver(
+            self.memory_store, window_size=memory_window_size
+        )
 
         self.counterfactual_store = counterfactual_store or CounterfactualMemoryStore()
         self.counterfactual_analyzer = counterfactual_analyzer or CounterfactualAnalyzer()  # [FIXED] Use injected or default
+        self.memory_signal_tracker = MemorySignalTracker(
+            self.temporal_analyzer, self.counterfactual_analyzer, self.signal_builder, self.memory_strategy_adapter
+        ) if incremental_memory_signals else None
 
         self.learning_extractor = learning_extractor or LearningExtractor()
         self.learning_policy_adapter = learning_policy_adapter or LearningPolicyAdapter()
@@ -162,13 +271,42 @@ class StrategicOrchestrator:
 
         self._ticks_since_failure = 100
 
+        if tick_workers < 1:
+            raise ValueError("tick_workers must be >= 1")
+        self.tick_workers = tick_workers
+        self._tick_executor: Optional[ThreadPoolExecutor] = None
+        if tick_workers > 1:
+            self.observer = SerializedStrategicObserver(self.observer)
+            self.backend = SerializedStrategicStateBackend(self.backend)
+        self.rng_seed = rng_seed
+
         self._runtimes: Dict[str, StrategicContextRuntime] = {}
         self._last_executed_intent: Optional[ExecutionIntent] = None
-        self._pending_feedback_by_context: Dict[str, List[ExecutionResult]] = {}
-        self._pending_execution_meta: Dict[UUID, Dict[str, Any]] = {}
+        if feedback_queue_cap < 1:
+            raise ValueError("feedback_queue_cap must be >= 1")
+        if execution_meta_ttl_seconds is not None and execution_meta_ttl_seconds <= 0:
+            raise ValueError("execution_meta_ttl_seconds must be > 0")
+        if max_dispatch_per_tick < 1:
+            raise ValueError("max_dispatch_per_tick must be >= 1")
+        self.max_dispatch_per_tick = max_dispatch_per_tick
+        self.feedback_queue_cap = feedback_queue_cap
+        self.feedback_overflow = feedback_overflow
+        self.execution_meta_ttl_seconds = execution_meta_ttl_seconds
+        # Results reach these from execution workers; the tick drains them.
+        self._feedback_lock = Lock()
+        self._pending_feedback_by_context: Dict[str, Deque[ExecutionResult]] = {}
+        # In enqueue order, so expiry only looks at the oldest entries.
+        self._pending_execution_meta: "OrderedDict[UUID, Dict[str, Any]]" = OrderedDict()
+        self._feedback_dropped = 0
+        self._feedback_coalesced = 0
+        self._execution_meta_expired = 0
         self._panic_mode: bool = False
         self._disabled_platforms: set[str] = set()
 
+        # Set when several orchestrator processes (shards) share the budget ledger
+        self.budget_lock = budget_lock
+        self._budget_guard_state = threading.local()
+
         # Initialize Budget (Event Sourced)
         self._budget = self._restore_budget()
 
@@ -190,23 +328,70 @@ class StrategicOrchestrator:
             budget = StrategicResourceBudget(100.0, 100.0, 5, self.time_source.now())
             last_id = None
 
-        events = self.budget_ledger.get_history()
-        replay_events = []
-        found_snapshot = False
-        if last_id is None:
-            replay_events = events
-        else:
-            for event in events:
-                if found_snapshot:
-                    replay_events.append(event)
-                elif event.id == last_id:
-                    found_snapshot = True
-
-        for event in replay_events:
+        # Only the tail after the snapshot is read; the ledger resolves the position.
+        # The cursor follows what was replayed, not a second read that another shard may
+        # already have moved past.
+        events = self._budget_tail(last_id)
+        if events is None:
+            raise ReplayIntegrityError(f"Budget snapshot anchor {last_id} is not in the budget ledger")
+        for event in events:
             budget = self.budget_reducer.reduce(budget, event)
+            last_id = event.id
+
+        self._last_budget_event_id = last_id
         return budget
 
+    def _budget_tail(self, last_id: Optional[UUID]) -> Optional[List[BudgetEvent]]:
+        """
+        Budget events recorded after last_id, or None if last_id has been compacted out of the
+        ledger (an unknown id reads as an empty tail, so an empty tail is checked).
+        """
+        events = self.budget_ledger.get_history_since(last_id)
+        if events or last_id is None:
+            return events
+        latest = self.budget_ledger.last_event_id()
+        if latest is None or latest == last_id:
+            return events
+        # latest was recorded before this second read: a known last_id now has a tail
+        return self.budget_ledger.get_history_since(last_id) or None
+
+    @contextmanager
+    def _budget_guard(self) -> Iterator[None]:
+        """
+        With a budget_lock, holds it and first applies budget events other shards recorded
+        since ours. Re-entrant on the same thread; a no-op for a single orchestrator.
+        """
+        if self.budget_lock is None or getattr(self._budget_guard_state, "held", False):
+            yield
+            return
+        self.budget_lock.acquire()
+        self._budget_guard_state.held = True
+        try:
+            events = self._budget_tail(self._last_budget_event_id)
+            if events is None:
+                # Compaction ran past our cursor: the snapshot it was anchored at covers the gap
+                stale_id = self._last_budget_event_id
+                self._budget = self._restore_budget()
+                self.observer.on_telemetry(
+                    TelemetryEvent(self.time_source.now(), "BUDGET_RESYNC", "Orchestrator", payload={
+                        "stale_event_id": str(stale_id),
+                        "event_id": str(self._last_budget_event_id),
+                    })
+                )
+                events = []
+            for event in events:
+                self._budget = self.budget_reducer.reduce(self._budget, event)
+                self._last_budget_event_id = event.id
+            yield
+        finally:
+            self._budget_guard_state.held = False
+            self.budget_lock.release()
+
     def _emit_budget_event(self, event_type: str, delta: Dict[str, float], reason: str, now: datetime) -> None:
+        with self._budget_guard():
+            self._record_budget_event(event_type, delta, reason, now)
+
+    def _record_budget_event(self, event_type: str, delta: Dict[str, float], reason: str, now: datetime) -> None:
         # Safety Limit Check
         total_delta = sum(abs(v) for v in delta.values())
         if total_delta > self.profile.limits.max_budget_delta_per_tick:
@@ -226,21 +411,22 @@ class StrategicOrchestrator:
             reason=reason
         )
         self.budget_ledger.record(event)
+        self._last_budget_event_id = event.id
         self._budget = self.budget_reducer.reduce(self._budget, event)
 
         is_replay = (self.runtime_phase == RuntimePhase.REPLAY)
         self.observer.on_budget_event(event, is_replay=is_replay)
 
     def _persist_budget(self, now: datetime):
-        history = self.budget_ledger.get_history()
-        last_id = history[-1].id if history else None
-        snapshot = BudgetSnapshot(
-            budget=self._budget,
-            timestamp=now,
-            last_event_id=last_id,
-            version="1.1"
-        )
-        self.budget_backend.save(snapshot)
+        # Under the guard, so a shard never moves the shared snapshot back behind another's
+        with self._budget_guard():
+            snapshot = BudgetSnapshot(
+                budget=self._budget,
+                timestamp=now,
+                last_event_id=self._last_budget_event_id,
+                version="1.1"
+            )
+            self.budget_backend.save(snapshot)
 
     def register_context(self, context: StrategicContext, human: AIHuman) -> None:
         key = str(context)
@@ -248,18 +434,7 @@ class StrategicOrchestrator:
             self._runtimes[key].human = human
             return
 
-        replay_engine = StrategicReplayEngine(
-            self.backend, self.ledger, self.time_source
-        )
-
-        lifeloop = LifeLoop(
-            time_source=self.time_source,
-            ledger=self.ledger,
-            state_backend=self.backend,
-            replay_engine=replay_engine,
-            observer=self.observer
-        )
-
+        lifeloop = self._build_lifeloop()
         lifeloop.restore(human, context)
 
         runtime = StrategicContextRuntime(
@@ -271,10 +446,112 @@ class StrategicOrchestrator:
         )
         self._runtimes[key] = runtime
 
+    def register_contexts(
+            self,
+            registrations: Sequence[Tuple[StrategicContext, AIHuman]],
+            batch_size: int = 500,
+            progress: Optional[Callable[[int, int], None]] = None
+    ) -> None:
+        """
+        Bulk warm-start equivalent of calling register_context for each entry in order.
+        Snapshots and ledger tails are read once per batch, replay runs on the tick worker pool,
+        and restored state is applied on the calling thread in input order.
+        progress(restored, total) is called after each batch.
+        If a context fails to restore, the contexts before it stay registered and the error is raised.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        # Entries are (input position, context, human); repeated keys only rebind the human.
+        pending: List[Tuple[int, StrategicContext, AIHuman]] = []
+        pending_keys = set()
+        rebinds: List[Tuple[int, str, AIHuman]] = []
+        for position, (context, human) in enumerate(registrations):
+            key = str(context)
+            if key in self._runtimes or key in pending_keys:
+                rebinds.append((position, key, human))
+            else:
+                pending.append((position, context, human))
+                pending_keys.add(key)
+
+        total = len(pending)
+        restored = 0
+        replay_engine = self._build_replay_engine()
+        try:
+            for start in range(0, total, batch_size):
+                batch = pending[start:start + batch_size]
+                fetch_started = time.perf_counter()
+                inputs = replay_engine.fetch_many([context for _, context, _ in batch])
+                fetch_share = (time.perf_counter() - fetch_started) / len(batch)
+
+                def replay(context: StrategicContext) -> Any:
+                    bundle, events = inputs[str(context)]
+                    started = time.perf_counter()
+                    bundle = replay_engine.replay(context, bundle, events)
+                    return bundle, time.perf_counter() - started
+
+                futures = None
+                if self.tick_workers > 1 and len(batch) > 1:
+                    executor = self._get_tick_executor()
+                    futures = [executor.submit(replay, context) for _, context, _ in batch]
+                    wait(futures)
+
+                for index, (_, context, human) in enumerate(batch):
+                    bundle, replay_seconds = futures[index].result() if futures else replay(context)
+                    if self.snapshot_policy is not None:
+                        self.snapshot_policy.on_restored(
+                            context, len(inputs[str(context)][1]), replay_seconds + fetch_share
+                        )
+                    lifeloop = self._build_lifeloop()
+                    lifeloop.apply_restored_state(human, context, bundle)
+                    self._runtimes[str(context)] = StrategicContextRuntime(
+                        context=context,
+                        lifeloop=lifeloop,
+                        human=human,
+                        tick_count=0,
+                        active=True
+                    )
+                    restored += 1
+
+                self.observer.on_telemetry(
+                    TelemetryEvent(self.time_source.now(), "CONTEXT_RESTORE_PROGRESS", "Orchestrator",
+                                   payload={"restored": restored, "total": total})
+                )
+                if progress:
+                    progress(restored, total)
+        finally:
+            # Apply rebinds that sequential registration would have reached.
+            reached = pending[restored][0] if restored < total else len(registrations)
+            for position, key, human in rebinds:
+                if position < reached:
+                    self._runtimes[key].human = human
+
+    def _build_replay_engine(self) -> StrategicReplayEngine:
+        return StrategicReplayEngine(
+            self.backend, self.ledger, self.time_source
+        )
+
+    def _build_lifeloop(self) -> LifeLoop:
+        return LifeLoop(
+            time_source=self.time_source,
+            ledger=self.ledger,
+            state_backend=self.backend,
+            replay_engine=self._build_replay_engine(),
+            observer=self.observer,
+            snapshot_policy=self.snapshot_policy,
+            profiler=self.tick_profiler
+        )
+
     def remove_context(self, context: StrategicContext) -> None:
         key = str(context)
         if key in self._runtimes:
             del self._runtimes[key]
+        with self._feedback_lock:
+            self._pending_feedback_by_context.pop(context.domain, None)
+        if self.memory_signal_tracker is not None:
+            self.memory_signal_tracker.forget(key)
+        # Seeded afresh from the store if the context comes back
+        self.memory_scope_resolver.forget(context.domain)
 
     def set_phase(self, phase: RuntimePhase) -> None:
         self.runtime_phase = phase
@@ -298,7 +575,8 @@ class StrategicOrchestrator:
 
         meta: Optional[Dict[str, Any]] = None
         if intent_id:
-            meta = self._pending_execution_meta.pop(intent_id, None)
+            with self._feedback_lock:
+                meta = self._pending_execution_meta.pop(intent_id, None)
         if meta:
             if not context_domain:
                 context_domain = meta.get("context_domain")
@@ -311,7 +589,7 @@ class StrategicOrchestrator:
             return
 
         if context_domain:
-            self._pending_feedback_by_context.setdefault(context_domain, []).append(result)
+            self._queue_context_feedback(context_domain, result, now)
 
         if reservation_delta and result.status in (ExecutionStatus.FAILED, ExecutionStatus.REJECTED):
             rollback_delta = {k: -v for k, v in reservation_delta.items()}
@@ -351,8 +629,8 @@ class StrategicOrchestrator:
         if self.upward_aggregation_service and context_domain:
             try:
                 queue_lag = 0.0
-                if hasattr(self.execution_queue, "depth_by_context"):
-                    queue_lag = float(self.execution_queue.depth_by_context().get(context_domain, 0))
+                if hasattr(self.execution_queue, "depth_for_context"):
+                    queue_lag = float(self.execution_queue.depth_for_context(context_domain))
                 self.upward_aggregation_service.record_execution(
                     context_domain=context_domain,
                     result=result,
@@ -376,19 +654,22 @@ class StrategicOrchestrator:
             context_domain: str,
             fallback_feedback: Optional[ExecutionResult],
     ) -> Optional[ExecutionResult]:
-        queued = self._pending_feedback_by_context.get(context_domain)
-        if queued:
-            result = queued.pop(0)
-            if not queued:
-                self._pending_feedback_by_context.pop(context_domain, None)
-            if result.status in (ExecutionStatus.FAILED, ExecutionStatus.REJECTED):
+        result = None
+        with self._feedback_lock:
+            queued = self._pending_feedback_by_context.get(context_domain)
+            if queued:
+                result = queued.popleft()
+                if not queued:
+                    self._pending_feedback_by_context.pop(context_domain, None)
+        if result is not None:
+            if is_failure(result):
                 self._ticks_since_failure = 0
             else:
                 self._ticks_since_failure += 1
             return result
 
         if fallback_feedback:
-            if fallback_feedback.status in (ExecutionStatus.FAILED, ExecutionStatus.REJECTED):
+            if is_failure(fallback_feedback):
                 self._ticks_since_failure = 0
             else:
                 self._ticks_since_failure += 1
@@ -397,28 +678,100 @@ class StrategicOrchestrator:
         self._ticks_since_failure += 1
         return None
 
+    def _queue_context_feedback(self, context_domain: str, result: ExecutionResult, now: datetime) -> None:
+        with self._feedback_lock:
+            queue = self._pending_feedback_by_context.get(context_domain)
+            if queue is None:
+                queue = self._pending_feedback_by_context[context_domain] = deque()
+            overflowed = push_feedback(queue, result, self.feedback_queue_cap, self.feedback_overflow)
+            if not overflowed:
+                return
+            if self.feedback_overflow == FeedbackOverflowPolicy.COALESCE:
+                self._feedback_coalesced += 1
+                count = self._feedback_coalesced
+            else:
+                self._feedback_dropped += 1
+                count = self._feedback_dropped
+        self.observer.on_telemetry(
+            TelemetryEvent(
+                now,
+                "FEEDBACK_OVERFLOW",
+                "Orchestrator",
+                context_id=context_domain,
+                payload={"policy": self.feedback_overflow.value, "cap": self.feedback_queue_cap, "total": count},
+            )
+        )
+
+    def _remember_execution_meta(self, intent_id: UUID, meta: Dict[str, Any]) -> None:
+        with self._feedback_lock:
+            self._pending_execution_meta[intent_id] = meta
+            self._pending_execution_meta.move_to_end(intent_id)
+
+    def _expire_execution_meta(self, now: datetime) -> None:
+        """
+        Forgets enqueued intents whose results have not come back within execution_meta_ttl_seconds.
+        """
+        if self.execution_meta_ttl_seconds is None:
+            return
+        expired = 0
+        with self._feedback_lock:
+            pending = self._pending_execution_meta
+            while pending:
+                oldest = pending[next(iter(pending))]
+                if (now - oldest["enqueued_at"]).total_seconds() < self.execution_meta_ttl_seconds:
+                    break
+                pending.popitem(last=False)
+                expired += 1
+            self._execution_meta_expired += expired
+            total = self._execution_meta_expired
+        if expired:
+            self.observer.on_telemetry(
+                TelemetryEvent(
+                    now,
+                    "EXECUTION_META_EXPIRED",
+                    "Orchestrator",
+                    payload={"expired": expired, "total": total, "ttl_seconds": self.execution_meta_ttl_seconds},
+                )
+            )
+
+    def feedback_metrics(self) -> FeedbackQueueMetrics:
+        with self._feedback_lock:
+            return FeedbackQueueMetrics(
+                queued=sum(len(queue) for queue in self._pending_feedback_by_context.values()),
+                dropped=self._feedback_dropped,
+                coalesced=self._feedback_coalesced,
+                pending_execution_meta=len(self._pending_execution_meta),
+                expired_execution_meta=self._execution_meta_expired,
+            )
+
     def tick(self, human: AIHuman, signals: LifeSignals) -> Optional[ExecutionIntent]:
         now = self.time_source.now()
         is_replay = (self.runtime_phase == RuntimePhase.REPLAY)
 
         self.observer.on_telemetry(TelemetryEvent(now, "TICK_START", "Orchestrator", is_replay=is_replay))
 
+        profiler = self.tick_profiler.begin_tick()
+        mark = profiler.clock()
         try:
             # 0. Context-scoped Governance Context
             governance_context_by_context: Dict[str, Optional[RuntimeGovernanceContext]] = {}
 
             # 0.1 Ingest Buffered Observations [NEW]
-            # Pull observations from buffer; each context receives only its scoped subset.
-            new_observations = self.context_buffer.pop_all()
+            # Pull observations from buffer, indexed by domain; each context receives only its scoped subset.
+            new_observations = self.context_buffer.pop_indexed()
+            self._expire_execution_meta(now)
 
             # 1. Recover Resources
-            recovery_delta = self.resource_manager.calculate_recovery_delta(self._budget, now)
-            if any(v > 0 for v in recovery_delta.values()):
-                self._emit_budget_event("BUDGET_RECOVERED", recovery_delta, "Time-based recovery", now)
+            with self._budget_guard():
+                recovery_delta = self.resource_manager.calculate_recovery_delta(self._budget, now)
+                if any(v > 0 for v in recovery_delta.values()):
+                    self._emit_budget_event("BUDGET_RECOVERED", recovery_delta, "Time-based recovery", now)
+            mark = profiler.lap(TICK_SCOPE, "recovery", mark)
 
             # 2. Route Signals
             available_contexts = [r.context for r in self._runtimes.values() if r.active]
             target_contexts = self.routing_policy.resolve(signals, available_contexts)
+            mark = profiler.lap(TICK_SCOPE, "routing", mark)
 
             candidates: List[Tuple[StrategicContextRuntime, ExecutionIntent, float]] = []
             runtimes_with_intent = set()
@@ -426,196 +779,59 @@ class StrategicOrchestrator:
             context_analysis_results = {}
 
             # 3. Tick LifeLoops & Analyze Memory
-            for context in target_contexts:
-                key = str(context)
-                runtime = self._runtimes.get(key)
-                if not runtime:
-                    continue
-                runtime_human = runtime.human or human
-                runtime_governance_context = self._resolve_governance_context(context, runtime_human)
-                governance_context_by_context[key] = runtime_governance_context
-
-                if runtime.tick_count >= self.profile.limits.max_ticks:
-                    if self.profile.fail_fast:
-                        raise SafetyLimitExceeded(f"Context {key} exceeded max ticks {self.profile.limits.max_ticks}")
-                    continue
-
-                # A. Resolve Scoped Memory
-                scoped_view = self.memory_scope_resolver.resolve(context)
-                scoped_counterfactuals = self.counterfactual_store.list_by_context(context.domain)
-
-                # B. Analyze Scoped Memory
-                recent_events = scoped_view.events[-50:]
-                weighted_events = self.temporal_analyzer.analyze(recent_events, now)
-
-                recent_counterfactuals = scoped_counterfactuals[-50:]
-                cf_metrics = self.counterfactual_analyzer.analyze(recent_counterfactuals, now)
-
-                memory_signal = self.signal_builder.build(weighted_events, self.temporal_analyzer, cf_metrics)
-                memory_context = self.memory_strategy_adapter.adapt(memory_signal)
-
-                context_analysis_results[key] = {
-                    "memory_signal": memory_signal,
-                    "recent_events": recent_events,
-                    "recent_counterfactuals": recent_counterfactuals
+            plans = self._prepare_context_ticks(
+                target_contexts, human, signals, new_observations, governance_context_by_context,
+                self._current_governance_revision()
+            )
+            mark = profiler.lap(TICK_SCOPE, "prepare", mark)
+            if self.memory_signal_tracker is not None:
+                self._track_context_memory(plans, now)
+            mark = profiler.lap(TICK_SCOPE, "memory", mark)
+            evaluations = self._evaluate_context_ticks(plans, now)
+            mark = profiler.lap(TICK_SCOPE, "evaluate", mark)
+
+            # Join: apply shared-state effects in routing order so both tick modes stay identical
+            for evaluation in evaluations:
+                plan = evaluation.plan
+                context_analysis_results[plan.key] = {
+                    "memory_signal": evaluation.memory_signal,
+                    "recent_events": evaluation.recent_events,
+                    "recent_counterfactuals": evaluation.recent_counterfactuals
                 }
-
-                # C. Tick LifeLoop
-                runtime.tick_count += 1
-                context_feedback = self._pop_context_feedback(
-                    context_domain=context.domain,
-                    fallback_feedback=signals.execution_feedback,
-                )
-                scoped_signals = self._build_scoped_signals(
-                    base_signals=signals,
-                    observations=new_observations,
-                    context_domain=context.domain,
-                    execution_feedback=context_feedback
-                )
-                internal_context = runtime.lifeloop.tick(
-                    human=runtime_human,
-                    signals=scoped_signals,
-                    strategic_context=context,
-                    tick_count=runtime.tick_count,
-                    last_executed_intent=self._last_executed_intent,
-                    # governance_context=governance_context
-                )
-
-                if internal_context.execution_intent:
-                    intent = internal_context.execution_intent
-                    if intent.estimated_cost:
-                        # D. Filter by Memory Context (Cooldown)
-                        if memory_context.cooldown_required:
-                            if intent.risk_level > 0.1:
-                                runtime.lifeloop.suppress_pending_intentions(runtime_human)
-                                self._record_counterfactual(intent, "Memory Cooldown", "Memory", runtime_governance_context,
-                                                            context, now)
-                                continue
-
-                        # E. Budget Check
-                        allocation = self.resource_manager.evaluate(intent, self._budget)
-                        if allocation.approved:
-                            # F. Compute Priority (Memory Aware)
-                            priority = self.priority_service.compute_priority(intent, runtime, memory_context)
-                            candidates.append((runtime, intent, priority))
-                            runtimes_with_intent.add(key)
-                        else:
-                            runtime.lifeloop.suppress_pending_intentions(runtime_human)
-                            self._record_counterfactual(intent, "Budget Insufficient", "Budget", runtime_governance_context,
-                                                        context, now)
-
-            # 4. Arbitrate
+                if evaluation.suppression:
+                    reason, stage = evaluation.suppression
+                    self._record_counterfactual(evaluation.intent, reason, stage, plan.governance_context,
+                                                plan.runtime.context, now)
+                elif evaluation.priority is not None:
+                    candidates.append((plan.runtime, evaluation.intent, evaluation.priority))
+                    runtimes_with_intent.add(plan.key)
+            mark = profiler.lap(TICK_SCOPE, "join", mark)
+
+            # 4. Arbitrate: up to one winner per free execution slot, at most max_dispatch_per_tick
             winner_intent: Optional[ExecutionIntent] = None
-            winner_runtime: Optional[StrategicContextRuntime] = None
+            dispatched_intents: List[ExecutionIntent] = []
+            winner_keys = set()
+            settled_keys = set()  # winners whose counterfactual _dispatch_winner already recorded
 
             if candidates:
-                winner = self.arbitrator.select(candidates)
-                if winner:
-                    winner_runtime, winner_intent = winner
-                    winner_human = winner_runtime.human or human
-                    winner_governance_context = governance_context_by_context.get(str(winner_runtime.context))
-
-                    # 5. Governance Execution Gate
-                    if winner_governance_context:
-                        gate_decision = ExecutionGateDecision.ALLOW
-                        final_gate = self.governance_execution_resolver.apply(gate_decision, winner_governance_context)
-
-                        if final_gate == ExecutionGateDecision.DENY:
-                            self._record_counterfactual(winner_intent, "Governance Execution Gate", "Governance",
-                                                        winner_governance_context, winner_runtime.context, now)
-                            winner_intent = None
-                            winner_runtime = None
-
-                    if winner_intent:
-                        # 6. Reserve Budget
-                        if winner_intent.estimated_cost:
-                            reservation_delta = self.resource_manager.calculate_reservation_delta(
-                                winner_intent.estimated_cost)
-                            self._emit_budget_event("BUDGET_RESERVED", reservation_delta,
-                                                    f"Reservation for {winner_intent.id}", now)
-                            winner_intent, projection_error = self._project_intent_with_persona(
-                                winner_intent, winner_human
-                            )
-                            self._last_executed_intent = winner_intent
-                            winner_priority = 0.0
-                            for runtime_candidate, intent_candidate, priority_candidate in candidates:
-                                if runtime_candidate == winner_runtime and intent_candidate.id == winner_intent.id:
-                                    winner_priority = priority_candidate
-                                    break
-
-                            if projection_error:
-                                self.post_execution_pipeline(
-                                    {
-                                        "intent_id": winner_intent.id,
-                                        "intent": winner_intent,
-                                        "context_domain": winner_runtime.context.domain,
-                                        "reservation_delta": reservation_delta,
-                                        "result": ResultNormalizer.failure(
-                                            reason=f"Persona projection failed: {projection_error}",
-                                            failure_type=ExecutionFailureType.INTERNAL,
-                                        ),
-                                    }
-                                )
-                            elif self.runtime_phase == RuntimePhase.REPLAY or not self.profile.allow_execution:
-                                self.post_execution_pipeline(
-                                    {
-                                        "intent_id": winner_intent.id,
-                                        "intent": winner_intent,
-                                        "context_domain": winner_runtime.context.domain,
-                                        "reservation_delta": reservation_delta,
-                                        "result": ResultNormalizer.rejection(
-                                            reason="Execution disabled by runtime profile"
-                                        ),
-                                    }
-                                )
-                            elif self._panic_mode:
-                                self.post_execution_pipeline(
-                                    {
-                                        "intent_id": winner_intent.id,
-                                        "intent": winner_intent,
-                                        "context_domain": winner_runtime.context.domain,
-                                        "reservation_delta": reservation_delta,
-                                        "result": ResultNormalizer.rejection(
-                                            reason="Execution blocked by panic mode"
-                                        ),
-                                    }
-                                )
-                            else:
-                                platform = str(winner_intent.constraints.get("platform", "default"))
-                                if platform in self._disabled_platforms:
-                                    self.post_execution_pipeline(
-                                        {
-                                            "intent_id": winner_intent.id,
-                                            "intent": winner_intent,
-                                            "context_domain": winner_runtime.context.domain,
-                                            "reservation_delta": reservation_delta,
-                                            "result": ResultNormalizer.rejection(
-                                                reason=f"Execution blocked: platform '{platform}' disabled"
-                                            ),
-                                        }
-                                    )
-                                else:
-                                    job = ExecutionJob.new(
-                                        intent=winner_intent,
-                                        context_domain=winner_runtime.context.domain,
-                                        reservation_delta=reservation_delta,
-                                        priority=winner_priority,
-                                    )
-                                    self.execution_queue.enqueue(job)
-                                    self._pending_execution_meta[winner_intent.id] = {
-                                        "intent": winner_intent,
-                                        "context_domain": winner_runtime.context.domain,
-                                        "reservation_delta": reservation_delta,
-                                        "governance_context": winner_governance_context,
-                                    }
-
-                        else:
-                            winner_intent = None
-                            winner_runtime = None
+                k = min(self.max_dispatch_per_tick, max(1, self._budget.execution_slots))
+                winner_indices = self.arbitrator.select_top(candidates, k)
+                mark = profiler.lap(TICK_SCOPE, "arbitration", mark)
+                for index in winner_indices:
+                    runtime, intent, priority = candidates[index]
+                    dispatched = self._dispatch_winner(
+                        runtime, intent, priority, human, governance_context_by_context, now, profiler,
+                        settled_keys
+                    )
+                    if dispatched is not None:
+                        winner_keys.add(str(runtime.context))
+                        dispatched_intents.append(dispatched)
+                winner_intent = dispatched_intents[0] if dispatched_intents else None
+                mark = profiler.clock()
 
             # 7. Suppress Losers
             for runtime, intent, _ in candidates:
-                if runtime != winner_runtime:
+                if str(runtime.context) not in winner_keys and str(runtime.context) not in settled_keys:
                     loser_human = runtime.human or human
                     runtime.lifeloop.suppress_pending_intentions(loser_human)
                     loser_governance_context = governance_context_by_context.get(str(runtime.context))
@@ -625,10 +841,11 @@ class StrategicOrchestrator:
             # 8. Update Starvation
             for key, runtime in self._runtimes.items():
                 if not runtime.active: continue
-                is_winner = (runtime == winner_runtime)
+                is_winner = (key in winner_keys)
                 has_intent = (key in runtimes_with_intent)
                 runtime.starvation_score = self.priority_service.update_starvation(runtime, is_winner, has_intent)
                 if is_winner: runtime.last_win_tick = runtime.tick_count
+            mark = profiler.lap(TICK_SCOPE, "suppression", mark)
 
             # 9. Strategic Learning Loop (Post-Execution)
             aggregated_learning_signal = None
@@ -684,12 +901,16 @@ class StrategicOrchestrator:
                 if new_posture != current_posture:
                     human.strategy = new_posture
                     # No event emission here per M.6 FIX requirements
+            mark = profiler.lap(TICK_SCOPE, "learning", mark)
 
             # 10. Persist Budget
             self._persist_budget(now)
+            profiler.lap(TICK_SCOPE, "budget_persist", mark)
+            self.tick_profiler.tick_completed()
 
             self.observer.on_telemetry(TelemetryEvent(now, "TICK_END", "Orchestrator", payload={
-                "winner": str(winner_intent.id) if winner_intent else None}, is_replay=is_replay))
+                "winner": str(winner_intent.id) if winner_intent else None,
+                "winners": [str(intent.id) for intent in dispatched_intents]}, is_replay=is_replay))
 
             return winner_intent
  
@@ -702,19 +923,355 @@ class StrategicOrchestrator:
                                    is_replay=is_replay))
                 return None
 
+    def _dispatch_winner(
+            self,
+            runtime: StrategicContextRuntime,
+            intent: ExecutionIntent,
+            priority: float,
+            human: AIHuman,
+            governance_context_by_context: Dict[str, Optional[RuntimeGovernanceContext]],
+            now: datetime,
+            profiler: TickProfiler,
+            settled_keys: Set[str]
+    ) -> Optional[ExecutionIntent]:
+        """
+        Gates, reserves and dispatches one arbitration winner.
+        Returns the dispatched (persona-projected) intent, or None if governance or the
+        budget left by earlier winners of the tick turned it down. A winner the budget turns
+        down is recorded as a Budget counterfactual here and its key added to settled_keys.
+        """
+        mark = profiler.clock()
+        winner_human = runtime.human or human
+        governance_context = governance_context_by_context.get(str(runtime.context))
+
+        # 5. Governance Execution Gate
+        if governance_context:
+            gate_decision = ExecutionGateDecision.ALLOW
+            final_gate = self.governance_execution_resolver.apply(gate_decision, governance_context)
+
+            if final_gate == ExecutionGateDecision.DENY:
+                self._record_counterfactual(intent, "Governance Execution Gate", "Governance",
+                                            governance_context, runtime.context, now)
+                profiler.lap(TICK_SCOPE, "governance_gate", mark)
+                return None
+        mark = profiler.lap(TICK_SCOPE, "governance_gate", mark)
+
+        if not intent.estimated_cost:
+            return intent
+
+        # 6. Reserve Budget
+        # Evaluation saw the budget before this tick's reservations (and other shards'); the
+        # reservation against what is left is the gate.
+        reservation_delta = None
+        with self._budget_guard():
+            try:
+                self.resource_manager.reserve(self._budget, intent.estimated_cost)
+            except BudgetInvariantViolation:
+                pass
+            else:
+                reservation_delta = self.resource_manager.calculate_reservation_delta(intent.estimated_cost)
+                self._emit_budget_event("BUDGET_RESERVED", reservation_delta, f"Reservation for {intent.id}", now)
+        if reservation_delta is None:
+            runtime.lifeloop.suppress_pending_intentions(winner_human)
+            self._record_counterfactual(intent, "Budget Insufficient", "Budget", governance_context,
+                                        runtime.context, now)
+            settled_keys.add(str(runtime.context))
+            return None
+        intent, projection_error = self._project_intent_with_persona(intent, winner_human)
+        self._last_executed_intent = intent
+        context_domain = runtime.context.domain
+
+        if projection_error:
+            self.post_execution_pipeline(
+                {
+                    "intent_id": intent.id,
+                    "intent": intent,
+                    "context_domain": context_domain,
+                    "reservation_delta": reservation_delta,
+                    "result": ResultNormalizer.failure(
+                        reason=f"Persona projection failed: {projection_error}",
+                        failure_type=ExecutionFailureType.INTERNAL,
+                    ),
+                }
+            )
+        elif self.runtime_phase == RuntimePhase.REPLAY or not self.profile.allow_execution:
+            self.post_execution_pipeline(
+                {
+                    "intent_id": intent.id,
+                    "intent": intent,
+                    "context_domain": context_domain,
+                    "reservation_delta": reservation_delta,
+                    "result": ResultNormalizer.rejection(
+                        reason="Execution disabled by runtime profile"
+                    ),
+                }
+            )
+        elif self._panic_mode:
+            self.post_execution_pipeline(
+                {
+                    "intent_id": intent.id,
+                    "intent": intent,
+                    "context_domain": context_domain,
+                    "reservation_delta": reservation_delta,
+                    "result": ResultNormalizer.rejection(
+                        reason="Execution blocked by panic mode"
+                    ),
+                }
+            )
+        else:
+            platform = str(intent.constraints.get("platform", "default"))
+            if platform in self._disabled_platforms:
+                self.post_execution_pipeline(
+                    {
+                        "intent_id": intent.id,
+                        "intent": intent,
+                        "context_domain": context_domain,
+                        "reservation_delta": reservation_delta,
+                        "result": ResultNormalizer.rejection(
+                            reason=f"Execution blocked: platform '{platform}' disabled"
+                        ),
+                    }
+                )
+            else:
+                job = ExecutionJob.new(
+                    intent=intent,
+                    context_domain=context_domain,
+                    reservation_delta=reservation_delta,
+                    priority=priority,
+                )
+                self.execution_queue.enqueue(job)
+                self._remember_execution_meta(intent.id, {
+                    "intent": intent,
+                    "context_domain": context_domain,
+                    "reservation_delta": reservation_delta,
+                    "governance_context": governance_context,
+                    "enqueued_at": now,
+                })
+        profiler.lap(TICK_SCOPE, "dispatch", mark)
+        return intent
+
+    def shutdown(self) -> None:
+        """
+        Releases the parallel tick worker pool, if one was started, and waits for a pending
+        profiler export.
+        """
+        if self._tick_executor:
+            self._tick_executor.shutdown(wait=True)
+            self._tick_executor = None
+        self.tick_profiler.close()
+
+    def _get_tick_executor(self) -> ThreadPoolExecutor:
+        if self._tick_executor is None:
+            self._tick_executor = ThreadPoolExecutor(
+                max_workers=self.tick_workers, thread_name_prefix="orchestrator-tick"
+            )
+        return self._tick_executor
+
+    def _prepare_context_ticks(
+            self,
+            target_contexts: List[StrategicContext],
+            human: AIHuman,
+            signals: LifeSignals,
+            observations: ObservationIndex,
+            governance_context_by_context: Dict[str, Optional[RuntimeGovernanceContext]],
+            governance_revision: Optional[Hashable] = None
+    ) -> List[ContextTickPlan]:
+        """
+        Serial stage: governance resolution, safety limits and feedback draining.
+        Kept on the calling thread because feedback draining updates orchestrator-wide counters.
+        """
+        plans: List[ContextTickPlan] = []
+        for context in target_contexts:
+            key = str(context)
+            runtime = self._runtimes.get(key)
+            if not runtime:
+                continue
+            runtime_human = runtime.human or human
+            runtime_governance_context = self._resolve_governance_context(
+                context, runtime_human, governance_revision
+            )
+            governance_context_by_context[key] = runtime_governance_context
+
+            if runtime.tick_count >= self.profile.limits.max_ticks:
+                if self.profile.fail_fast:
+                    raise SafetyLimitExceeded(f"Context {key} exceeded max ticks {self.profile.limits.max_ticks}")
+                continue
+
+            runtime.tick_count += 1
+            context_feedback = self._pop_context_feedback(
+                context_domain=context.domain,
+                fallback_feedback=signals.execution_feedback,
+            )
+            scoped_signals = self._build_scoped_signals(
+                base_signals=signals,
+                observations=observations,
+                context_domain=context.domain,
+                execution_feedback=context_feedback
+            )
+            plans.append(ContextTickPlan(key, runtime, runtime_human, runtime_governance_context, scoped_signals))
+        return plans
+
+    def _track_context_memory(self, plans: List[ContextTickPlan], now: datetime) -> None:
+        """
+        Incremental stage: reuses or updates each planned context's tracked memory signal.
+        Memory is only resolved for contexts whose store version changed.
+        """
+        for plan in plans:
+            domain = plan.runtime.context.domain
+            tracked = self.memory_signal_tracker.track(
+                plan.key,
+                now,
+                self.memory_scope_resolver.version(domain),
+                self.counterfactual_store.version(domain),
+                lambda: self.memory_scope_resolver.resolve(plan.runtime.context).events[-self.memory_window_size:],
+                lambda: self.counterfactual_store.list_by_context(domain)[-self.memory_window_size:]
+            )
+            plan.memory_signal = tracked.signal
+            plan.memory_context = tracked.memory_context
+            plan.recent_events = tracked.recent_events
+            plan.recent_counterfactuals = tracked.recent_counterfactuals
+
+    def _evaluate_context_ticks(self, plans: List[ContextTickPlan], now: datetime) -> List[ContextTickEvaluation]:
+        tick_seed = self.rng_seed if self.rng_seed is not None else random.getrandbits(64)
+        for plan in plans:
+            plan.rng = random.Random(f"{tick_seed}:{plan.key}:{plan.runtime.tick_count}")
+
+        if self.tick_workers <= 1 or len(plans) <= 1:
+            return [self._evaluate_context_tick(plan, now) for plan in plans]
+
+        # LifeLoop mutates the AIHuman it ticks, so contexts sharing one are chained on a single worker.
+        chains: Dict[int, List[int]] = {}
+        for index, plan in enumerate(plans):
+            chains.setdefault(id(plan.human), []).append(index)
+
+        evaluations: List[Optional[ContextTickEvaluation]] = [None] * len(plans)
+
+        def run_chain(indices: List[int]) -> None:
+            for index in indices:
+                evaluations[index] = self._evaluate_context_tick(plans[index], now)
+
+        executor = self._get_tick_executor()
+        futures = [executor.submit(run_chain, indices) for indices in chains.values()]
+        wait(futures)
+        for future in futures:
+            future.result()
+        return evaluations
+
+    def _evaluate_context_tick(self, plan: ContextTickPlan, now: datetime) -> ContextTickEvaluation:
+        """
+        Per-context stage. Touches only the context's own runtime and human,
+        and reads memory as of the start of the tick.
+        """
+        context = plan.runtime.context
+        profiler = self.tick_profiler.current()
+        mark = profiler.clock()
+
+        if plan.memory_signal is not None:
+            # A/B already done by the incremental memory stage
+            memory_signal = plan.memory_signal
+            recent_events = plan.recent_events
+            recent_counterfactuals = plan.recent_counterfactuals
+        else:
+            # A. Resolve Scoped Memory
+            scoped_view = self.memory_scope_resolver.resolve(context)
+            scoped_counterfactuals = self.counterfactual_store.list_by_context(context.domain)
+
+            # B. Analyze Scoped Memory
+            recent_events = scoped_view.events[-self.memory_window_size:]
+            weighted_events = self.temporal_analyzer.analyze(recent_events, now)
+
+            recent_counterfactuals = scoped_counterfactuals[-self.memory_window_size:]
+            cf_metrics = self.counterfactual_analyzer.analyze(recent_counterfactuals, now)
+
+            memory_signal = self.signal_builder.build(weighted_events, self.temporal_analyzer, cf_metrics)
+            mark = profiler.lap(plan.key, "memory_analysis", mark)
+        memory_context = plan.memory_context
+        if memory_context is None:
+            memory_context = self.memory_strategy_adapter.adapt(memory_signal)
+
+        evaluation = ContextTickEvaluation(plan, memory_signal, recent_events, recent_counterfactuals)
+
+        # C. Tick LifeLoop
+        internal_context = plan.runtime.lifeloop.tick(
+            human=plan.human,
+            signals=plan.signals,
+            strategic_context=context,
+            tick_count=plan.runtime.tick_count,
+            last_executed_intent=self._last_executed_intent,
+            rng=plan.rng,
+            # governance_context=governance_context
+        )
+        mark = profiler.lap(plan.key, "lifeloop", mark)
+
+        intent = internal_context.execution_intent
+        if not intent or not intent.estimated_cost:
+            return evaluation
+        evaluation.intent = intent
+
+        # D. Filter by Memory Context (Cooldown)
+        if memory_context.cooldown_required and intent.risk_level > 0.1:
+            plan.runtime.lifeloop.suppress_pending_intentions(plan.human)
+            evaluation.suppression = ("Memory Cooldown", "Memory")
+            return evaluation
+
+        # E. Budget Check
+        allocation = self.resource_manager.evaluate(intent, self._budget)
+        if allocation.approved:
+            # F. Compute Priority (Memory Aware)
+            evaluation.priority = self.priority_service.compute_priority(intent, plan.runtime, memory_context)
+        else:
+            plan.runtime.lifeloop.suppress_pending_intentions(plan.human)
+            evaluation.suppression = ("Budget Insufficient", "Budget")
+        profiler.lap(plan.key, "budget_priority", mark)
+        return evaluation
+
+    def _default_governance_revision(self) -> Optional[Callable[[], Optional[Hashable]]]:
+        if self.governance_context_resolver:
+            owner = getattr(self.governance_context_resolver, "__self__", None)
+            return getattr(owner, "revision", None)
+        if self.governance_provider:
+            return self.governance_provider.revision
+        return None
+
+    def _current_governance_revision(self) -> Optional[Hashable]:
+        """
+        Read once per tick, so a governance change is picked up by the next tick.
+        """
+        if not self.governance_revision:
+            return None
+        try:
+            return self.governance_revision()
+        except Exception as exc:
+            self.observer.on_telemetry(
+                TelemetryEvent(
+                    self.time_source.now(),
+                    "GOVERNANCE_REVISION_ERROR",
+                    "Orchestrator",
+                    payload={"error": str(exc)},
+                )
+            )
+            return None
+
     def _resolve_governance_context(
             self,
             context: StrategicContext,
-            human: AIHuman
+            human: AIHuman,
+            revision: Optional[Hashable] = None
     ) -> Optional[RuntimeGovernanceContext]:
+        key = str(context)
+        if revision is not None:
+            cached = self._governance_cache.get(key)
+            if cached is not None and cached[0] == revision and cached[1] == human.id:
+                return cached[2]
+
         if self.governance_context_resolver:
             try:
                 resolved = self.governance_context_resolver(context, human)
                 if isinstance(resolved, RuntimeGovernanceContext):
-                    return resolved
+                    return self._cache_governance_context(key, revision, human, resolved)
                 candidate = getattr(resolved, "context", None)
                 if isinstance(candidate, RuntimeGovernanceContext):
-                    return candidate
+                    return self._cache_governance_context(key, revision, human, candidate)
             except Exception as exc:
                 self.observer.on_telemetry(
                     TelemetryEvent(
@@ -725,30 +1282,34 @@ class StrategicOrchestrator:
                         payload={"error": str(exc)},
                     )
                 )
+                # Not cached: the resolver is retried next tick.
+                if self.governance_provider:
+                    return self.governance_provider.get_context()
+                return None
         if self.governance_provider:
-            return self.governance_provider.get_context()
-        return None
+            return self._cache_governance_context(key, revision, human, self.governance_provider.get_context())
+        return self._cache_governance_context(key, revision, human, None)
+
+    def _cache_governance_context(
+            self,
+            key: str,
+            revision: Optional[Hashable],
+            human: AIHuman,
+            governance_context: Optional[RuntimeGovernanceContext]
+    ) -> Optional[RuntimeGovernanceContext]:
+        if revision is not None:
+            self._governance_cache[key] = (revision, human.id, governance_context)
+        return governance_context
 
     def _build_scoped_signals(
             self,
             base_signals: LifeSignals,
-            observations: List[Any],
+            observations: ObservationIndex,
             context_domain: str,
             execution_feedback: Optional[ExecutionResult]
     ) -> LifeSignals:
         scoped_memories = list(base_signals.memories)
-
-        for obs in observations:
-            obs_domain = getattr(obs, "context_domain", None)
-            if obs_domain and obs_domain != context_domain:
-                continue
-
-            if obs.interaction:
-                scoped_memories.append(
-                    f"Observed interaction: {obs.interaction.message_type} from {obs.interaction.user_id}"
-                )
-            elif obs.signal:
-                scoped_memories.append(f"Observed signal: {obs.signal.source_id}")
+        scoped_memories.extend(observations.memories_for(context_domain))
 
         return LifeSignals(
             pressure_delta=base_signals.pressure_delta,
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from datetime import datetime
 from dataclasses import asdict
+from uuid import UUID
 
 from src.core.domain.budget_snapshot import BudgetSnapshot
 from src.core.domain.resource import StrategicResourceBudget
@@ -59,9 +60,12 @@ class FileBudgetBackend(BudgetPersistenceBackend):
                 slot_recovery_rate=budget_data['slot_recovery_rate']
             )
 
+            last_event_id = UUID(data['last_event_id']) if data.get('last_event_id') else None
+
             return BudgetSnapshot(
                 budget=budget,
                 timestamp=datetime.fromisoformat(data['timestamp']),
+                last_event_id=last_event_id,
                 version=data.get('version', "1.0")
             )
         except Exception as e:
@@ -72,6 +76,7 @@ class FileBudgetBackend(BudgetPersistenceBackend):
         data = {
             "budget": asdict(snapshot.budget),
             "timestamp": snapshot.timestamp.isoformat(),
+            "last_event_id": str(snapshot.last_event_id) if snapshot.last_event_id else None,
             "version": snapshot.version
         }
         # Handle datetime serialization inside asdict result if needed,
@@ -0,0 +1,55 @@
+import fcntl
+import os
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Optional, TextIO
+
+
+class BudgetLock(ABC):
+    """
+    Serializes budget changes across orchestrator processes sharing one budget ledger.
+    Held by the orchestrator while it catches up on the ledger and records its own event,
+    so every reservation is evaluated against the budget all shards have left.
+    """
+
+    @abstractmethod
+    def acquire(self) -> None:
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        pass
+
+
+class FileBudgetLock(BudgetLock):
+    """
+    flock on a lock file; for shards on one host sharing a file budget ledger.
+    """
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._thread_lock = Lock()
+        self._file: Optional[TextIO] = None
+        directory = os.path.dirname(lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            self._file = open(self.lock_path, 'a')
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+        finally:
+            self._file = None
+            self._thread_lock.release()
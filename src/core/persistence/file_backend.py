@@ -53,8 +53,8 @@ class FileStrategicStateBackend(StrategicStateBackend):
         return obj
 
     def _deserialize_posture(self, data: dict) -> StrategicPosture:
+        # horizon_days is derived from mode and is not stored
         return StrategicPosture(
-            horizon_days=data['horizon_days'],
             engagement_policy=data['engagement_policy'],
             risk_tolerance=data['risk_tolerance'],
             confidence_baseline=data['confidence_baseline'],
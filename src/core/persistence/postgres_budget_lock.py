@@ -0,0 +1,45 @@
+from threading import Lock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.core.persistence.budget_lock import BudgetLock
+
+
+class PostgresBudgetLock(BudgetLock):
+    """
+    Session-level advisory lock, held on a dedicated connection between acquire and release.
+    """
+
+    DEFAULT_LOCK_KEY = 0x6275646765740001  # "budget", 1
+
+    def __init__(self, engine: Engine, lock_key: int = DEFAULT_LOCK_KEY):
+        self.engine = engine
+        self.lock_key = lock_key
+        self._thread_lock = Lock()
+        self._conn = None
+
+    @classmethod
+    def from_dsn(cls, dsn: str) -> "PostgresBudgetLock":
+        engine = create_engine(dsn, pool_pre_ping=True, future=True)
+        return cls(engine)
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            self._conn = self.engine.connect()
+            self._conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": self.lock_key})
+        except BaseException:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+            self._conn.close()
+        finally:
+            self._conn = None
+            self._thread_lock.release()
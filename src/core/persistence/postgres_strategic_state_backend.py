@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
@@ -63,6 +63,26 @@ class PostgresStrategicStateBackend(StrategicStateBackend):
             return None
         return decode_payload(row.payload)
 
+    def load_many(self, contexts: Sequence[StrategicContext]) -> Dict[str, Optional[StrategicStateBundle]]:
+        keys = [str(context) for context in contexts]
+        bundles: Dict[str, Optional[StrategicStateBundle]] = {key: None for key in keys}
+        if not keys:
+            return bundles
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT context_key, payload
+                    FROM strategic_state_bundles
+                    WHERE context_key = ANY(:context_keys)
+                    """
+                ),
+                {"context_keys": keys},
+            ).fetchall()
+        for row in rows:
+            bundles[row.context_key] = decode_payload(row.payload)
+        return bundles
+
     def save(self, context: StrategicContext, bundle: StrategicStateBundle) -> None:
         key = str(context)
         with self.engine.begin() as conn:
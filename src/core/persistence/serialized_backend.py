@@ -0,0 +1,29 @@
+from threading import Lock
+from typing import Dict, Optional, Sequence
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.persistence.strategic_state_backend import StrategicStateBackend
+from src.core.persistence.strategic_state_bundle import StrategicStateBundle
+
+
+class SerializedStrategicStateBackend(StrategicStateBackend):
+    """
+    Delegates to another backend one call at a time.
+    Used when LifeLoops persist state from several tick workers at once.
+    """
+
+    def __init__(self, backend: StrategicStateBackend):
+        self.backend = backend
+        self._lock = Lock()
+
+    def load(self, context: StrategicContext) -> Optional[StrategicStateBundle]:
+        with self._lock:
+            return self.backend.load(context)
+
+    def save(self, context: StrategicContext, bundle: StrategicStateBundle) -> None:
+        with self._lock:
+            self.backend.save(context, bundle)
+
+    def load_many(self, contexts: Sequence[StrategicContext]) -> Dict[str, Optional[StrategicStateBundle]]:
+        with self._lock:
+            return self.backend.load_many(contexts)
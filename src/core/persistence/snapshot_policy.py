@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
 from src.core.domain.strategic_context import StrategicContext
 from src.core.domain.strategy import StrategicPosture
 from src.core.ledger.strategic_event import StrategicEvent
@@ -15,6 +18,21 @@ class SnapshotPolicy(ABC):
     ) -> bool:
         pass
 
+    # Cost feedback from the LifeLoop and restore paths. Policies that only look at
+    # should_save() arguments can ignore it.
+
+    def on_events_recorded(self, context: StrategicContext, count: int) -> None:
+        """
+        count strategic events were recorded for the context since the last should_save().
+        """
+        pass
+
+    def on_snapshot_saved(self, context: StrategicContext, write_seconds: float) -> None:
+        pass
+
+    def on_restored(self, context: StrategicContext, events_replayed: int, replay_seconds: float) -> None:
+        pass
+
 
 class DefaultSnapshotPolicy(SnapshotPolicy):
     def __init__(self, interval_ticks: int = 100):
@@ -35,4 +53,181 @@ class DefaultSnapshotPolicy(SnapshotPolicy):
         if tick_count % self.interval_ticks == 0:
             return True
 
-        return False
\ No newline at end of file
+        return False
+
+
+@dataclass(frozen=True)
+class SnapshotMetrics:
+    """
+    Snapshot frequency and cost model of one context under AdaptiveSnapshotPolicy.
+    """
+    context_key: str
+    ticks: int
+    events: int
+    snapshots: int
+    ticks_per_snapshot: Optional[float]  # None until the first snapshot
+    events_per_snapshot: Optional[float]
+    pending_events: int
+    replay_ms_per_event: float
+    write_ms: Optional[float]  # smoothed snapshot write time, None until measured
+    projected_restore_ms: float  # replay time of the current tail
+
+
+class _ContextCosts:
+    __slots__ = (
+        "ticks", "events", "snapshots", "pending_events", "peak_tick_events",
+        "replay_seconds_per_event", "write_seconds"
+    )
+
+    def __init__(self):
+        self.ticks = 0
+        self.events = 0
+        self.snapshots = 0
+        self.pending_events = 0  # recorded since the last snapshot
+        self.peak_tick_events = 0.0  # decays every tick, so one burst does not pin it
+        self.replay_seconds_per_event: Optional[float] = None  # measured on this context's restore
+        self.write_seconds: Optional[float] = None
+
+
+class AdaptiveSnapshotPolicy(SnapshotPolicy):
+    """
+    Snapshots a context when replaying its ledger tail would take longer than
+    target_restore_seconds, instead of on a fixed tick interval.
+
+    Restore time is modelled as events since the last snapshot times the replay cost per
+    event. That cost is measured on restores (per context once it has been restored, the
+    smoothed average of all restores before that, default_replay_seconds_per_event until
+    the first restore). A snapshot is taken once the tail, plus the peak number of events a
+    single tick has added, would exceed headroom * target; quiet contexts are never snapshotted
+    for ticks alone. The peak shrinks by peak_decay every tick, so the snapshot interval
+    recovers after a burst. On boundary events (REBINDING, MODE_SHIFT) a context is also
+    snapshotted early if the replay it removes costs more than its measured snapshot write.
+
+    One instance can serve every LifeLoop of an orchestrator; state is kept per context.
+    metrics() exposes the resulting snapshot frequency.
+    """
+
+    BOUNDARY_EVENT_TYPES = ("MODE_SHIFT", "REBINDING")
+
+    def __init__(
+            self,
+            target_restore_seconds: float = 0.05,
+            headroom: float = 0.8,
+            default_replay_seconds_per_event: float = 0.0002,
+            smoothing: float = 0.2,
+            peak_decay: float = 0.1
+    ):
+        if target_restore_seconds <= 0:
+            raise ValueError("target_restore_seconds must be > 0")
+        if not 0.0 < headroom <= 1.0:
+            raise ValueError("headroom must be in (0, 1]")
+        if default_replay_seconds_per_event <= 0:
+            raise ValueError("default_replay_seconds_per_event must be > 0")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+        if not 0.0 <= peak_decay < 1.0:
+            raise ValueError("peak_decay must be in [0, 1)")
+        self.target_restore_seconds = target_restore_seconds
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.peak_decay = peak_decay
+        self._replay_seconds_per_event = default_replay_seconds_per_event
+        self._contexts: Dict[str, _ContextCosts] = {}
+
+    def should_save(
+            self,
+            context: StrategicContext,
+            tick_count: int,
+            last_event: StrategicEvent,
+            current_posture: StrategicPosture
+    ) -> bool:
+        costs = self._costs(str(context))
+        costs.ticks += 1
+        peak_tick_events = costs.peak_tick_events
+        costs.peak_tick_events *= 1.0 - self.peak_decay
+        if costs.pending_events == 0:
+            return False
+
+        per_event = self._replay_cost(costs)
+        projected = (costs.pending_events + peak_tick_events) * per_event
+        if projected > self.headroom * self.target_restore_seconds:
+            return True
+
+        if last_event and last_event.event_type in self.BOUNDARY_EVENT_TYPES:
+            write_seconds = costs.write_seconds or 0.0
+            return costs.pending_events * per_event >= write_seconds
+
+        return False
+
+    def on_events_recorded(self, context: StrategicContext, count: int) -> None:
+        costs = self._costs(str(context))
+        costs.events += count
+        costs.pending_events += count
+        if count > costs.peak_tick_events:
+            costs.peak_tick_events = count
+
+    def on_snapshot_saved(self, context: StrategicContext, write_seconds: float) -> None:
+        costs = self._costs(str(context))
+        costs.snapshots += 1
+        costs.pending_events = 0
+        costs.write_seconds = self._smooth(costs.write_seconds, write_seconds)
+
+    def on_restored(self, context: StrategicContext, events_replayed: int, replay_seconds: float) -> None:
+        costs = self._costs(str(context))
+        # The replayed tail is still in the ledger until the next snapshot.
+        costs.pending_events = events_replayed
+        if events_replayed <= 0:
+            return
+        per_event = replay_seconds / events_replayed
+        costs.replay_seconds_per_event = self._smooth(costs.replay_seconds_per_event, per_event)
+        self._replay_seconds_per_event = self._smooth(self._replay_seconds_per_event, per_event)
+
+    def metrics(self, context_keys: Optional[Iterable[str]] = None) -> List[SnapshotMetrics]:
+        keys = sorted(list(self._contexts)) if context_keys is None else list(context_keys)
+        result = []
+        for key in keys:
+            costs = self._contexts.get(key)
+            if costs is None:
+                continue
+            per_event = self._replay_cost(costs)
+            snapshots = costs.snapshots
+            result.append(SnapshotMetrics(
+                context_key=key,
+                ticks=costs.ticks,
+                events=costs.events,
+                snapshots=snapshots,
+                ticks_per_snapshot=costs.ticks / snapshots if snapshots else None,
+                events_per_snapshot=costs.events / snapshots if snapshots else None,
+                pending_events=costs.pending_events,
+                replay_ms_per_event=per_event * 1000.0,
+                write_ms=costs.write_seconds * 1000.0 if costs.write_seconds is not None else None,
+                projected_restore_ms=costs.pending_events * per_event * 1000.0
+            ))
+        return result
+
+    def snapshot_frequency(self) -> float:
+        """
+        Snapshots per tick across all contexts.
+        """
+        ticks = snapshots = 0
+        for costs in list(self._contexts.values()):
+            ticks += costs.ticks
+            snapshots += costs.snapshots
+        return snapshots / ticks if ticks else 0.0
+
+    def _costs(self, key: str) -> _ContextCosts:
+        costs = self._contexts.get(key)
+        if costs is None:
+            # setdefault: LifeLoops of different contexts may run on different tick workers
+            costs = self._contexts.setdefault(key, _ContextCosts())
+        return costs
+
+    def _replay_cost(self, costs: _ContextCosts) -> float:
+        if costs.replay_seconds_per_event is not None:
+            return costs.replay_seconds_per_event
+        return self._replay_seconds_per_event
+
+    def _smooth(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
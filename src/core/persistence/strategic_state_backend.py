@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 from src.core.domain.strategic_context import StrategicContext
 from src.core.persistence.strategic_state_bundle import StrategicStateBundle
@@ -23,4 +23,11 @@ class StrategicStateBackend(ABC):
         """
         Persist the strategic state for a given context.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def load_many(self, contexts: Sequence[StrategicContext]) -> Dict[str, Optional[StrategicStateBundle]]:
+        """
+        Load the strategic state for several contexts, keyed by str(context).
+        Backends with a cheaper batched read should override this.
+        """
+        return {str(context): self.load(context) for context in contexts}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Type, Any
+from typing import Dict, Type, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import asdict
 
@@ -11,54 +11,90 @@ from src.core.domain.strategic_trajectory import StrategicTrajectoryMemory, Stra
 from src.core.replay.exceptions import ReplayIntegrityError
 
 
+class StrategicReplayState:
+    """
+    Mutable working state used while replaying a run of events.
+    Dicts are shared with the source bundle until their first write, then copied once and
+    mutated in place, so applying an event costs about the size of its change instead of
+    a full copy. to_bundle() produces a bundle equal to per-event immutable reduction.
+    """
+
+    def __init__(self, bundle: StrategicStateBundle):
+        self._base = bundle
+        self.posture = bundle.posture
+        self.last_event_id = bundle.last_event_id
+        self._paths: Optional[Dict[Tuple[str, ...], PathStatus]] = None
+        self._trajectories: Optional[Dict[str, StrategicTrajectory]] = None
+
+    def set_path(self, path_key: Tuple[str, ...], status: PathStatus) -> None:
+        if self._paths is None:
+            self._paths = self._base.memory.paths.copy()
+        self._paths[path_key] = status
+
+    def set_trajectory(self, trajectory_id: str, trajectory: StrategicTrajectory) -> None:
+        if self._trajectories is None:
+            self._trajectories = self._base.trajectory_memory.trajectories.copy()
+        self._trajectories[trajectory_id] = trajectory
+
+    def to_bundle(self) -> StrategicStateBundle:
+        memory = self._base.memory if self._paths is None else StrategicMemory(self._paths)
+        trajectory_memory = (
+            self._base.trajectory_memory if self._trajectories is None
+            else StrategicTrajectoryMemory(self._trajectories)
+        )
+        bundle = StrategicStateBundle(
+            posture=self.posture,
+            memory=memory,
+            trajectory_memory=trajectory_memory,
+            last_snapshot=self._base.last_snapshot,
+            last_event_id=self.last_event_id,
+            version=self._base.version
+        )
+        # The returned bundle now owns the dicts; further writes must copy again.
+        self._base = bundle
+        self._paths = None
+        self._trajectories = None
+        return bundle
+
+
 class StrategicEventReducer(ABC):
     """
     Pure interface for applying an event to a state bundle.
+    Implementations write into a StrategicReplayState; reduce() wraps a single application.
     """
 
     @abstractmethod
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         pass
 
+    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+        state = StrategicReplayState(bundle)
+        self.apply(state, event)
+        return state.to_bundle()
+
 
 class StrategyAdaptationReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         posture_data = event.details.get("posture_after")
         if not posture_data:
             raise ReplayIntegrityError("Missing posture_after in STRATEGY_ADAPTATION event")
 
-        new_posture = StrategicPosture.from_dict(posture_data)
-
-        return StrategicStateBundle(
-            posture=new_posture,
-            memory=bundle.memory,
-            trajectory_memory=bundle.trajectory_memory,
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.posture = StrategicPosture.from_dict(posture_data)
+        state.last_event_id = event.id
 
 
 class HorizonShiftReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         posture_data = event.details.get("posture_after")
         if not posture_data:
             raise ReplayIntegrityError("Missing posture_after in HORIZON_SHIFT event")
 
-        new_posture = StrategicPosture.from_dict(posture_data)
-
-        return StrategicStateBundle(
-            posture=new_posture,
-            memory=bundle.memory,
-            trajectory_memory=bundle.trajectory_memory,
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.posture = StrategicPosture.from_dict(posture_data)
+        state.last_event_id = event.id
 
 
 class TrajectoryUpdateReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         traj_data = event.details.get("trajectory_after")
         traj_id = event.details.get("trajectory_id")
 
@@ -67,21 +103,12 @@ class TrajectoryUpdateReducer(StrategicEventReducer):
 
         new_trajectory = StrategicTrajectory.from_dict(traj_data)
 
-        new_trajectories = bundle.trajectory_memory.trajectories.copy()
-        new_trajectories[traj_id] = new_trajectory
-
-        return StrategicStateBundle(
-            posture=bundle.posture,
-            memory=bundle.memory,
-            trajectory_memory=StrategicTrajectoryMemory(new_trajectories),
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.set_trajectory(traj_id, new_trajectory)
+        state.last_event_id = event.id
 
 
 class PathAbandonmentReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         path_key_list = event.details.get("path_key")
         status_data = event.details.get("path_status_after")
 
@@ -91,21 +118,12 @@ class PathAbandonmentReducer(StrategicEventReducer):
         path_key = tuple(path_key_list)
         new_status = PathStatus.from_dict(status_data)
 
-        new_paths = bundle.memory.paths.copy()
-        new_paths[path_key] = new_status
-
-        return StrategicStateBundle(
-            posture=bundle.posture,
-            memory=StrategicMemory(new_paths),
-            trajectory_memory=bundle.trajectory_memory,
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.set_path(path_key, new_status)
+        state.last_event_id = event.id
 
 
 class RebindingReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         source_data = event.details.get("source_trajectory_after")
         target_data = event.details.get("target_trajectory_after")
 
@@ -115,31 +133,15 @@ class RebindingReducer(StrategicEventReducer):
         source_traj = StrategicTrajectory.from_dict(source_data)
         target_traj = StrategicTrajectory.from_dict(target_data)
 
-        new_trajectories = bundle.trajectory_memory.trajectories.copy()
-        new_trajectories[source_traj.id] = source_traj
-        new_trajectories[target_traj.id] = target_traj
-
-        return StrategicStateBundle(
-            posture=bundle.posture,
-            memory=bundle.memory,
-            trajectory_memory=StrategicTrajectoryMemory(new_trajectories),
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.set_trajectory(source_traj.id, source_traj)
+        state.set_trajectory(target_traj.id, target_traj)
+        state.last_event_id = event.id
 
 
 class ReflectionReducer(StrategicEventReducer):
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         # Reflection is observational, no state change in bundle except ID
-        return StrategicStateBundle(
-            posture=bundle.posture,
-            memory=bundle.memory,
-            trajectory_memory=bundle.trajectory_memory,
-            last_snapshot=bundle.last_snapshot,
-            last_event_id=event.id,
-            version=bundle.version
-        )
+        state.last_event_id = event.id
 
 
 class CompositeStrategicReducer(StrategicEventReducer):
@@ -157,9 +159,9 @@ class CompositeStrategicReducer(StrategicEventReducer):
             "REFLECTION": ReflectionReducer(),
         }
 
-    def reduce(self, bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    def apply(self, state: StrategicReplayState, event: StrategicEvent) -> None:
         reducer = self._reducers.get(event.event_type)
         if not reducer:
             raise ReplayIntegrityError(f"Unknown event type: {event.event_type}")
 
-        return reducer.reduce(bundle, event)
\ No newline at end of file
+        reducer.apply(state, event)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 import json
 
@@ -11,7 +11,7 @@ from src.core.time.time_source import TimeSource
 from src.core.domain.strategy import StrategicPosture, StrategicMode
 from src.core.domain.strategic_memory import StrategicMemory
 from src.core.domain.strategic_trajectory import StrategicTrajectoryMemory
-from src.core.replay.strategic_reducer import CompositeStrategicReducer
+from src.core.replay.strategic_reducer import CompositeStrategicReducer, StrategicReplayState
 from src.core.replay.exceptions import ReplayIntegrityError
 
 
@@ -38,14 +38,22 @@ class StrategicReplayEngine:
             self,
             backend: StrategicStateBackend,
             ledger: StrategicLedger,
-            time_source: TimeSource
+            time_source: TimeSource,
+            page_size: int = StrategicLedger.DEFAULT_PAGE_SIZE
     ):
         self.backend = backend
         self.ledger = ledger
         self.time_source = time_source
+        self.page_size = page_size
         self.reducer = CompositeStrategicReducer()
 
     def restore(self, context: StrategicContext) -> StrategicStateBundle:
+        return self.restore_counted(context)[0]
+
+    def restore_counted(self, context: StrategicContext) -> Tuple[StrategicStateBundle, int]:
+        """
+        restore() that also returns the number of events replayed on top of the snapshot.
+        """
         # 1. Load latest snapshot for THIS context
         try:
             bundle = self.backend.load(context)
@@ -53,59 +61,117 @@ class StrategicReplayEngine:
             raise ReplayIntegrityError(f"Failed to load snapshot for {context}: {e}")
 
         # If no snapshot, start from default state but DO NOT skip replay
-        if not bundle:
-            current_bundle = StrategicStateBundle(
-                posture=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
-                memory=StrategicMemory(),
-                trajectory_memory=StrategicTrajectoryMemory(),
-                version="1.1"
-            )
-            last_id = None
-        else:
-            current_bundle = bundle
-            last_id = bundle.last_event_id
-
-        # 2. Replay events since snapshot for THIS context
-        replay_events = []
+        current_bundle = bundle or self._initial_bundle()
+        last_id = bundle.last_event_id if bundle else None
 
+        # 2. Stream events since snapshot for THIS context, page by page.
+        # An unknown last_event_id yields nothing (snapshot is ahead of, or detached from, the ledger).
         try:
-            context_history = self.ledger.get_history(context)
+            pages = self.ledger.iter_history_since(context, last_id, page_size=self.page_size)
         except Exception as e:
             raise ReplayIntegrityError(f"Failed to load ledger history for {context}: {e}")
 
-        found_snapshot = False
-        if last_id is None:
-            # If no ID recorded (or cold start), replay all events
-            replay_events = context_history
-        else:
-            for event in context_history:
-                if found_snapshot:
-                    replay_events.append(event)
-                elif event.id == last_id:
-                    found_snapshot = True
-
-            if not found_snapshot and last_id is not None:
-                # If history exists but ID not found, it's a gap.
-                if context_history:
-                    pass
-
-                    # 3. Apply Reducers with Strict Validation
-        for event in replay_events:
-            # Poisoning Protection: Validate event type against allowlist
-            if event.event_type not in self.ALLOWED_EVENT_TYPES:
-                raise ReplayIntegrityError(
-                    f"Unknown event_type '{event.event_type}' in ledger for {context}. "
-                    f"Allowed types: {self.ALLOWED_EVENT_TYPES}"
-                )
-
-            # Poisoning Protection: Validate structure
-            if not event.details:
-                raise ReplayIntegrityError(f"Malformed event {event.id}: missing details")
-
+        # 3. Apply Reducers with Strict Validation
+        replayed = 0
+        while True:
             try:
-                current_bundle = self.reducer.reduce(current_bundle, event)
+                page = next(pages, None)
             except Exception as e:
-                raise ReplayIntegrityError(
-                    f"Failed to replay event {event.id} ({event.event_type}) for context {context}: {e}")
+                raise ReplayIntegrityError(f"Failed to load ledger history for {context}: {e}")
+            if page is None:
+                break
+            current_bundle = self.replay(context, current_bundle, page)
+            replayed += len(page)
+
+        return current_bundle, replayed
+
+    def replay_full_history(self, context: StrategicContext) -> StrategicStateBundle:
+        """
+        Rebuilds the context's state from the initial bundle over its archived and live events,
+        ignoring snapshots. After compaction this is the full-history determinism check:
+        its posture, memory and trajectories must equal restore()'s.
+        """
+        bundle = self._initial_bundle()
+        try:
+            pages = self.ledger.iter_full_history(context, page_size=self.page_size)
+            for page in pages:
+                bundle = self.replay(context, bundle, page)
+        except ReplayIntegrityError:
+            raise
+        except Exception as e:
+            raise ReplayIntegrityError(f"Failed to load full ledger history for {context}: {e}")
+        return bundle
+
+    def fetch_many(
+            self,
+            contexts: Sequence[StrategicContext]
+    ) -> Dict[str, Tuple[StrategicStateBundle, List[StrategicEvent]]]:
+        """
+        Batched read half of restore(): one snapshot read and one ledger read for all contexts.
+        Returns (base bundle, events to replay) keyed by str(context); feed each pair to replay().
+        """
+        try:
+            bundles = self.backend.load_many(contexts)
+        except Exception as e:
+            raise ReplayIntegrityError(f"Failed to load snapshots for {len(contexts)} contexts: {e}")
+
+        anchors = []
+        for context in contexts:
+            bundle = bundles.get(str(context))
+            anchors.append((context, bundle.last_event_id if bundle else None))
 
-        return current_bundle
\ No newline at end of file
+        try:
+            histories = self.ledger.get_histories_since(anchors)
+        except Exception as e:
+            raise ReplayIntegrityError(f"Failed to load ledger history for {len(contexts)} contexts: {e}")
+
+        return {
+            str(context): (bundles.get(str(context)) or self._initial_bundle(), histories.get(str(context), []))
+            for context in contexts
+        }
+
+    def replay(
+            self,
+            context: StrategicContext,
+            bundle: StrategicStateBundle,
+            events: List[StrategicEvent]
+    ) -> StrategicStateBundle:
+        """
+        Applies events on top of bundle with strict validation. Pure; safe to run concurrently.
+        The bundle is materialized once at the end rather than after every event.
+        """
+        state = StrategicReplayState(bundle)
+        for event in events:
+            self._apply(state, event, context)
+        return state.to_bundle()
+
+    def _initial_bundle(self) -> StrategicStateBundle:
+        return StrategicStateBundle(
+            posture=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
+            memory=StrategicMemory(),
+            trajectory_memory=StrategicTrajectoryMemory(),
+            version="1.1"
+        )
+
+    def _apply(
+            self,
+            state: StrategicReplayState,
+            event: StrategicEvent,
+            context: StrategicContext
+    ) -> None:
+        # Poisoning Protection: Validate event type against allowlist
+        if event.event_type not in self.ALLOWED_EVENT_TYPES:
+            raise ReplayIntegrityError(
+                f"Unknown event_type '{event.event_type}' in ledger for {context}. "
+                f"Allowed types: {self.ALLOWED_EVENT_TYPES}"
+            )
+
+        # Poisoning Protection: Validate structure
+        if not event.details:
+            raise ReplayIntegrityError(f"Malformed event {event.id}: missing details")
+
+        try:
+            self.reducer.apply(state, event)
+        except Exception as e:
+            raise ReplayIntegrityError(
+                f"Failed to replay event {event.id} ({event.event_type}) for context {context}: {e}")
\ No newline at end of file
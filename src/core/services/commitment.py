@@ -24,7 +24,8 @@ class CommitmentEvaluator:
             mask: PersonaMask,
             state: BehaviorState,
             readiness: ActionReadiness,
-            now: datetime
+            now: datetime,
+            rng: Optional[random.Random] = None
     ) -> Optional[ExecutionWindow]:
 
         # 1. Hard Gate: Eligibility
@@ -46,7 +47,7 @@ class CommitmentEvaluator:
 
         total_chance = min(0.8, base_chance + readiness_bonus + priority_bonus)
 
-        if random.random() > total_chance:
+        if (rng or random).random() > total_chance:
             return None
 
         # 5. Open Window
@@ -23,8 +23,10 @@ class ExecutionEligibilityService:
             state: BehaviorState,
             readiness: ActionReadiness,
             reputation: Optional[ReputationProfile],
-            now: datetime
+            now: datetime,
+            rng: Optional[random.Random] = None
     ) -> ExecutionEligibilityResult:
+        rng = rng or random
 
         # 1. Fatigue & Energy Safety Check
         # If too tired, deny immediately to preserve resources.
@@ -59,7 +61,7 @@ class ExecutionEligibilityService:
         # Deterministic check for simulation (using hash or similar would be better for pure func,
         # but random is allowed in gates per architecture if controlled).
         # We use a simple threshold check against a random value.
-        if random.random() > mask.activity_rate:
+        if rng.random() > mask.activity_rate:
             return ExecutionEligibilityResult(
                 allow=False,
                 reason="Activity rate gate",
@@ -68,7 +70,7 @@ class ExecutionEligibilityService:
 
         # 4. Global Silence Bias
         # Final probabilistic filter to ensure silence is default.
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             return ExecutionEligibilityResult(
                 allow=False,
                 reason="Global silence bias",
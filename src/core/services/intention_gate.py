@@ -1,4 +1,6 @@
 import random
+from typing import Optional
+
 from src.core.domain.behavior import BehaviorState
 from src.core.domain.intention_candidate import IntentionCandidate
 
@@ -9,7 +11,12 @@ class IntentionGate:
     Decides if a candidate becomes an Intention.
     """
 
-    def allow(self, candidate: IntentionCandidate, state: BehaviorState) -> bool:
+    def allow(
+            self,
+            candidate: IntentionCandidate,
+            state: BehaviorState,
+            rng: Optional[random.Random] = None
+    ) -> bool:
         # 1. Energy Check
         # Forming an intention costs energy. If low, reject.
         if state.energy < 20.0:
@@ -30,4 +37,4 @@ class IntentionGate:
         # Higher pressure = higher chance, but never 100%.
         acceptance_chance = (candidate.pressure / 200.0)  # Max 50% chance at 100 pressure
 
-        return random.random() < acceptance_chance
\ No newline at end of file
+        return (rng or random).random() < acceptance_chance
\ No newline at end of file
@@ -0,0 +1,105 @@
+from uuid import UUID
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategy import StrategicPosture
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.persistence.snapshot_policy import AdaptiveSnapshotPolicy
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, _human, _signals
+
+BUSY = StrategicContext("global", None, None, "busy")
+QUIET = StrategicContext("global", None, None, "quiet")
+POSTURE = StrategicPosture([])
+
+
+def _event(i: int, event_type: str = "REFLECTION") -> StrategicEvent:
+    return StrategicEvent(UUID(int=i + 1), NOW, event_type, {"n": i}, BUSY)
+
+
+def _tick(policy, context, events: int, last_event=None) -> bool:
+    if events:
+        policy.on_events_recorded(context, events)
+    saved = policy.should_save(context, 0, last_event, POSTURE)
+    if saved:
+        policy.on_snapshot_saved(context, 0.002)
+    return saved
+
+
+def test_snapshots_bound_projected_restore_time():
+    # 1 ms per event, 50 ms target, 80% headroom: the tail stays under 40 ms
+    policy = AdaptiveSnapshotPolicy(target_restore_seconds=0.05, default_replay_seconds_per_event=0.001)
+
+    saves = [tick for tick in range(200) if _tick(policy, BUSY, 3)]
+    for _ in range(200):
+        _tick(policy, QUIET, 0)
+
+    busy, quiet = policy.metrics([str(BUSY), str(QUIET)])
+    assert saves[:2] == [12, 25]
+    assert busy.snapshots == len(saves)
+    assert busy.events_per_snapshot == 600 / len(saves)
+    assert busy.projected_restore_ms < 40.0
+    assert quiet.snapshots == 0 and quiet.ticks_per_snapshot is None
+    assert policy.snapshot_frequency() == len(saves) / 400
+
+
+def test_restore_measurements_recalibrate_replay_cost():
+    policy = AdaptiveSnapshotPolicy(target_restore_seconds=0.05, default_replay_seconds_per_event=0.001)
+    # Replay turned out 10x cheaper; the restored tail is still pending
+    policy.on_restored(BUSY, 100, 0.01)
+
+    [metrics] = policy.metrics([str(BUSY)])
+    assert metrics.pending_events == 100
+    assert abs(metrics.replay_ms_per_event - 0.1) < 1e-12
+    assert not _tick(policy, BUSY, 1)
+    assert [tick for tick in range(400) if _tick(policy, BUSY, 1)][0] == 298
+
+
+def test_boundary_event_snapshots_only_when_replay_outweighs_write():
+    policy = AdaptiveSnapshotPolicy(target_restore_seconds=1.0, default_replay_seconds_per_event=0.001)
+    policy.on_snapshot_saved(BUSY, 0.005)
+
+    assert not _tick(policy, BUSY, 2, _event(0, "REBINDING"))
+    assert not _tick(policy, BUSY, 2, _event(1))
+    assert _tick(policy, BUSY, 1, _event(2, "REBINDING"))
+
+
+def test_orchestrator_shares_policy_and_reports_restores():
+    ledger = InMemoryStrategicLedger()
+    for i in range(30):
+        ledger.record(_event(i))
+    policy = AdaptiveSnapshotPolicy()
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=ledger,
+        backend=InMemoryStrategicStateBackend(),
+        snapshot_policy=policy,
+    )
+
+    orchestrator.register_contexts([(BUSY, _human()), (QUIET, _human())])
+    for _ in range(3):
+        orchestrator.tick(_human(), _signals())
+
+    busy, quiet = policy.metrics([str(BUSY), str(QUIET)])
+    assert busy.pending_events == 30 and quiet.pending_events == 0
+    assert busy.ticks == quiet.ticks == 3
+    assert busy.snapshots == quiet.snapshots == 0
+    assert all(runtime.lifeloop.snapshot_policy is policy for runtime in orchestrator._runtimes.values())
+
+
+def test_snapshot_interval_recovers_after_a_burst():
+    def saves_after_burst(peak_decay):
+        policy = AdaptiveSnapshotPolicy(
+            target_restore_seconds=0.05, default_replay_seconds_per_event=0.001, peak_decay=peak_decay
+        )
+        steady = [tick for tick in range(200) if _tick(policy, BUSY, 1)]
+        assert steady[-2:] == [159, 199]
+        assert _tick(policy, BUSY, 30)
+        return [tick for tick in range(200) if _tick(policy, BUSY, 1)]
+
+    # Back to one snapshot every 40 ticks once the burst has decayed
+    assert saves_after_burst(0.1) == [39, 79, 119, 159, 199]
+    # A peak that never decays keeps snapshotting every 11 ticks
+    assert saves_after_burst(0.0)[:3] == [10, 21, 32]
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.budget_snapshot import BudgetSnapshot
+from src.core.domain.resource import StrategicResourceBudget
+from src.core.ledger.budget_event import BudgetEvent
+from src.core.ledger.file_budget_ledger import FileBudgetLedger
+from src.core.ledger.in_memory_budget_ledger import InMemoryBudgetLedger
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.budget_backend import FileBudgetBackend
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.replay.exceptions import ReplayIntegrityError
+from src.core.time.frozen_time_source import FrozenTimeSource
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def _event(i: int) -> BudgetEvent:
+    return BudgetEvent(UUID(int=i + 1), NOW, "BUDGET_RESERVED", {"energy": -1.0}, f"r{i}")
+
+
+class NoScanBudgetLedger(InMemoryBudgetLedger):
+    def get_history(self):
+        raise AssertionError("full history read")
+
+
+@pytest.fixture(params=["memory", "file"])
+def ledger(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryBudgetLedger()
+    # Small chunks exercise lines spanning chunk boundaries.
+    file_ledger = FileBudgetLedger(str(tmp_path / "budget.jsonl"))
+    file_ledger.READ_CHUNK_SIZE = 37
+    return file_ledger
+
+
+def test_tail_reads_match_full_history(ledger):
+    assert ledger.last_event_id() is None
+    assert ledger.get_history_since(None) == []
+
+    for i in range(10):
+        ledger.record(_event(i))
+
+    history = ledger.get_history()
+    assert ledger.last_event_id() == history[-1].id
+    assert ledger.get_history_since(None) == history
+    assert ledger.get_history_since(history[3].id) == history[4:]
+    assert ledger.get_history_since(history[-1].id) == []
+    assert ledger.get_history_since(UUID(int=999)) == []
+
+
+def test_persist_and_restore_do_not_scan_budget_history(tmp_path):
+    def orchestrator(budget_ledger):
+        return StrategicOrchestrator(
+            time_source=FrozenTimeSource(NOW),
+            ledger=InMemoryStrategicLedger(),
+            backend=InMemoryStrategicStateBackend(),
+            budget_backend=FileBudgetBackend(str(tmp_path / "budget.json")),
+            budget_ledger=budget_ledger,
+        )
+
+    budget_ledger = NoScanBudgetLedger()
+    first = orchestrator(budget_ledger)
+    for i in range(3):
+        first._emit_budget_event("BUDGET_RESERVED", {"energy": -1.0}, f"r{i}", NOW)
+    first._persist_budget(NOW)
+    first._emit_budget_event("BUDGET_RESERVED", {"energy": -2.0}, "after-snapshot", NOW)
+
+    restored = orchestrator(budget_ledger)
+    assert restored._budget == first._budget
+    assert restored._last_budget_event_id == budget_ledger.last_event_id()
+
+
+class RacingBudgetLedger(InMemoryBudgetLedger):
+    """Another shard records an event right after the restore read the tail."""
+
+    def __init__(self):
+        super().__init__()
+        self.raced = None
+
+    def get_history_since(self, last_event_id):
+        tail = super().get_history_since(last_event_id)
+        if self.raced is None:
+            self.raced = _event(100)
+            self.record(self.raced)
+        return tail
+
+
+def test_restore_resumes_after_the_last_replayed_event():
+    budget_ledger = RacingBudgetLedger()
+    for i in range(3):
+        budget_ledger.record(_event(i))
+
+    restored = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        budget_ledger=budget_ledger,
+    )
+    assert restored._last_budget_event_id == _event(2).id
+    assert budget_ledger.get_history_since(restored._last_budget_event_id) == [budget_ledger.raced]
+
+
+def test_restore_rejects_a_snapshot_anchor_missing_from_the_ledger(tmp_path):
+    budget_ledger = InMemoryBudgetLedger()
+    for i in range(3):
+        budget_ledger.record(_event(i))
+    backend = FileBudgetBackend(str(tmp_path / "budget.json"))
+    backend.save(BudgetSnapshot(StrategicResourceBudget(90.0, 100.0, 5, NOW), NOW, UUID(int=999)))
+
+    with pytest.raises(ReplayIntegrityError):
+        StrategicOrchestrator(
+            time_source=FrozenTimeSource(NOW),
+            ledger=InMemoryStrategicLedger(),
+            backend=InMemoryStrategicStateBackend(),
+            budget_ledger=budget_ledger,
+            budget_backend=backend,
+        )
+
+
+def test_file_budget_backend_round_trips_last_event_id(tmp_path):
+    backend = FileBudgetBackend(str(tmp_path / "budget.json"))
+    snapshot = BudgetSnapshot(
+        budget=StrategicResourceBudget(10.0, 20.0, 3, NOW),
+        timestamp=NOW,
+        last_event_id=UUID(int=7)
+    )
+    backend.save(snapshot)
+    assert backend.load().last_event_id == UUID(int=7)
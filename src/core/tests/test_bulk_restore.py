@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.behavior import BehaviorState
+from src.core.domain.entity import AIHuman
+from src.core.domain.identity import Identity
+from src.core.domain.memory import MemorySystem
+from src.core.domain.readiness import ActionReadiness
+from src.core.domain.stance import Stance
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategic_memory import StrategicMemory
+from src.core.domain.strategic_trajectory import StrategicTrajectoryMemory
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.file_ledger import FileStrategicLedger
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.file_backend import FileStrategicStateBackend
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.persistence.strategic_state_bundle import StrategicStateBundle
+from src.core.replay.exceptions import ReplayIntegrityError
+from src.core.time.frozen_time_source import FrozenTimeSource
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def _human() -> AIHuman:
+    return AIHuman(
+        id=UUID(int=99),
+        identity=Identity("test-human", 30, "n/a", "bio", [], [], {}),
+        state=BehaviorState(100.0, 100.0, 0.0, NOW, False),
+        memory=MemorySystem([], []),
+        stance=Stance({}),
+        readiness=ActionReadiness(60.0, 40.0, 80.0),
+        intentions=[],
+        personas=[],
+        strategy=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
+        deferred_actions=[],
+        created_at=NOW
+    )
+
+
+def _posture(i: int, j: int) -> StrategicPosture:
+    return StrategicPosture([f"p{i}"], 0.1 + 0.01 * j, 0.5, 1.0, StrategicMode.BALANCED)
+
+
+def _populate(ledger, backend, contexts):
+    """
+    Each context gets a few adaptation events; every other context has a snapshot mid-history.
+    """
+    event_id = 0
+    for round_index in range(4):
+        for i, context in enumerate(contexts):
+            event_id += 1
+            posture = _posture(i, round_index)
+            event = StrategicEvent(
+                UUID(int=event_id), NOW, "STRATEGY_ADAPTATION",
+                {"posture_after": {
+                    "engagement_policy": posture.engagement_policy,
+                    "risk_tolerance": posture.risk_tolerance,
+                    "confidence_baseline": posture.confidence_baseline,
+                    "persistence_factor": posture.persistence_factor,
+                    "mode": posture.mode.value,
+                }},
+                context
+            )
+            ledger.record(event)
+            if round_index == 1 and i % 2 == 0:
+                backend.save(context, StrategicStateBundle(
+                    posture=posture,
+                    memory=StrategicMemory(),
+                    trajectory_memory=StrategicTrajectoryMemory(),
+                    last_event_id=event.id
+                ))
+
+
+def _orchestrator(ledger, backend, tick_workers=1):
+    return StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=ledger,
+        backend=backend,
+        tick_workers=tick_workers,
+    )
+
+
+@pytest.mark.parametrize("store", ["memory", "file"])
+def test_bulk_restore_matches_sequential_registration(store, tmp_path):
+    if store == "memory":
+        ledger, backend = InMemoryStrategicLedger(), InMemoryStrategicStateBackend()
+    else:
+        ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+        backend = FileStrategicStateBackend(str(tmp_path / "state"))
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(20)]
+    _populate(ledger, backend, contexts)
+
+    sequential = _orchestrator(ledger, backend)
+    sequential_humans = [_human() for _ in contexts]
+    for context, human in zip(contexts, sequential_humans):
+        sequential.register_context(context, human)
+
+    bulk = _orchestrator(ledger, backend, tick_workers=4)
+    bulk_humans = [_human() for _ in contexts]
+    progress = []
+    bulk.register_contexts(list(zip(contexts, bulk_humans)), batch_size=6,
+                           progress=lambda done, total: progress.append((done, total)))
+    bulk.shutdown()
+
+    assert progress == [(6, 20), (12, 20), (18, 20), (20, 20)]
+    assert [h.strategy for h in bulk_humans] == [h.strategy for h in sequential_humans]
+    assert list(bulk._runtimes.keys()) == list(sequential._runtimes.keys())
+    for key, runtime in bulk._runtimes.items():
+        expected = sequential._runtimes[key]
+        assert runtime.human is bulk_humans[contexts.index(runtime.context)]
+        assert runtime.lifeloop.strategic_memory_store.load(runtime.context) == \
+               expected.lifeloop.strategic_memory_store.load(expected.context)
+
+
+def test_bulk_restore_rebinds_duplicates_and_stops_at_first_failure():
+    ledger, backend = InMemoryStrategicLedger(), InMemoryStrategicStateBackend()
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(4)]
+    _populate(ledger, backend, contexts[:2])
+    ledger.record(StrategicEvent(UUID(int=10_000), NOW, "POISONED", {"x": 1}, contexts[2]))
+
+    orchestrator = _orchestrator(ledger, backend, tick_workers=2)
+    first, second = _human(), _human()
+    with pytest.raises(ReplayIntegrityError):
+        orchestrator.register_contexts([
+            (contexts[0], first),
+            (contexts[1], _human()),
+            (contexts[0], second),
+            (contexts[2], _human()),
+            (contexts[3], _human()),
+        ])
+    orchestrator.shutdown()
+
+    assert list(orchestrator._runtimes.keys()) == [str(contexts[0]), str(contexts[1])]
+    assert first.strategy == _posture(0, 3)
+    assert orchestrator._runtimes[str(contexts[0])].human is second
@@ -0,0 +1,210 @@
+import multiprocessing
+import os
+from collections import Counter
+from datetime import timedelta
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.file_budget_ledger import FileBudgetLedger
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.ledger.ledger_compactor import LedgerCompactor
+from src.core.orchestration.context_sharding import ContextShardManager, shard_for
+from src.core.orchestration.shard_store import FileShardStore
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.budget_backend import FileBudgetBackend
+from src.core.persistence.budget_lock import FileBudgetLock
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, SlowLifeLoop, _human, _signals
+
+CONTEXTS = [StrategicContext("global", None, None, f"chat-{i}") for i in range(24)]
+
+
+class _ShardLoop(SlowLifeLoop):
+    def apply_restored_state(self, human, context, bundle) -> None:
+        pass
+
+
+class _ShardOrchestrator(StrategicOrchestrator):
+    def _build_lifeloop(self):
+        return _ShardLoop(len(self._runtimes))
+
+
+def _registrations():
+    return [(context, _human()) for context in CONTEXTS]
+
+
+def _orchestrator(root, budget_lock=None):
+    return _ShardOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        budget_ledger=FileBudgetLedger(os.path.join(root, "budget.jsonl")),
+        budget_backend=FileBudgetBackend(os.path.join(root, "budget.json")),
+        budget_lock=budget_lock,
+        max_dispatch_per_tick=10,
+    )
+
+
+def test_rendezvous_assignment_is_stable_and_moves_only_to_new_shards():
+    keys = [f"ctx-{i}" for i in range(2000)]
+    before = {key: shard_for(key, ["a", "b", "c"]) for key in keys}
+    after = {key: shard_for(key, ["a", "b", "c", "d"]) for key in keys}
+
+    assert before == {key: shard_for(key, ["c", "a", "b"]) for key in keys}
+    assert all(after[key] in (before[key], "d") for key in keys)
+    assert min(Counter(before.values()).values()) > 550
+    assert shard_for("ctx", []) is None
+
+
+def test_handover_never_overlaps_and_covers_all_contexts(tmp_path):
+    store = FileShardStore(str(tmp_path / "shards.json"))
+    a = ContextShardManager(_orchestrator(str(tmp_path / "a")), store, "a")
+    b = ContextShardManager(_orchestrator(str(tmp_path / "b")), store, "b")
+    all_keys = {str(context) for context in CONTEXTS}
+
+    def owned(manager):
+        return set(manager.orchestrator._runtimes)
+
+    assert set(a.rebalance(_registrations()).owned) == all_keys
+
+    # b joins: what hashes to b stays with a until a hands it over
+    joined = b.rebalance(_registrations())
+    assert joined.owned == [] and joined.waiting
+    handed = a.rebalance(_registrations())
+    assert set(handed.released) == set(joined.waiting)
+    assert set(b.rebalance(_registrations()).acquired) == set(joined.waiting)
+    assert not owned(a) & owned(b) and owned(a) | owned(b) == all_keys
+    assert store.owners() == {**{k: "a" for k in owned(a)}, **{k: "b" for k in owned(b)}}
+
+    # b leaves: a takes everything back
+    b.leave()
+    assert set(a.rebalance(_registrations()).acquired) == set(joined.waiting)
+    assert owned(a) == all_keys and owned(b) == set()
+
+
+def test_expired_owner_loses_contexts(tmp_path):
+    store = FileShardStore(str(tmp_path / "shards.json"))
+    a = ContextShardManager(_orchestrator(str(tmp_path / "a")), store, "a", lease_seconds=10)
+    a.rebalance(_registrations())
+
+    # a stalls; b comes up after a's leases ran out and takes everything
+    later = NOW + timedelta(seconds=11)
+    store.heartbeat("b", later, timedelta(seconds=10))
+    assert store.live_shards(later) == ["b"]
+    assert len(store.acquire_contexts("b", [str(c) for c in CONTEXTS], later, timedelta(seconds=10))) == 24
+
+    # a wakes up (its clock still at NOW): its leases are gone and it drops the contexts
+    result = a.rebalance(_registrations())
+    assert set(result.lost) | set(result.released) == {str(c) for c in CONTEXTS}
+    assert a.orchestrator._runtimes == {}
+
+
+def test_stalled_shard_stops_ticking_once_its_leases_lapse(tmp_path):
+    store = FileShardStore(str(tmp_path / "shards.json"))
+    a = ContextShardManager(_orchestrator(str(tmp_path / "a")), store, "a", lease_seconds=10, tick_margin_seconds=2)
+    clock = a.orchestrator.time_source
+    a.rebalance(_registrations())
+    a.tick(_human(), _signals())
+    assert a.orchestrator._runtimes[str(CONTEXTS[0])].tick_count == 1
+
+    # Past the margin the shard drops its contexts without waiting for a rebalance
+    clock.advance(timedelta(seconds=8))
+    assert a.tick(_human(), _signals()) is None
+    assert a.orchestrator._runtimes == {}
+
+    # The next rebalance renews the leases and ticking resumes
+    assert len(a.rebalance(_registrations()).acquired) == 24
+    a.tick(_human(), _signals())
+    assert a.orchestrator._runtimes[str(CONTEXTS[0])].tick_count == 1
+
+
+def _budget_shards(root):
+    lock_path = os.path.join(root, "budget.lock")
+    a = _orchestrator(root, FileBudgetLock(lock_path))
+    b = _orchestrator(root, FileBudgetLock(lock_path))
+    a._emit_budget_event("BUDGET_RESERVED", {"energy": -1.0}, "a0", NOW)
+    with b._budget_guard():
+        pass  # b caught up to a0 only
+    for i in range(1, 4):
+        a._emit_budget_event("BUDGET_RESERVED", {"energy": -10.0}, f"a{i}", NOW)
+    a._persist_budget(NOW)
+    return a, b
+
+
+def test_shard_behind_a_compaction_reloads_from_the_snapshot(tmp_path):
+    a, b = _budget_shards(str(tmp_path))
+    compactor = LedgerCompactor(budget_ledger=a.budget_ledger, budget_backend=a.budget_backend)
+    assert compactor.compact_budget().events_removed == 3
+
+    with b._budget_guard():
+        assert b._budget.energy_budget == a._budget.energy_budget == 69.0
+    assert b._last_budget_event_id == a._last_budget_event_id
+
+
+def test_budget_compaction_stays_behind_live_shard_cursors(tmp_path):
+    a, b = _budget_shards(str(tmp_path))
+    store = FileShardStore(str(tmp_path / "shards.json"))
+    for shard_id, orchestrator in (("a", a), ("b", b)):
+        store.heartbeat(shard_id, NOW, timedelta(seconds=30))
+        store.record_budget_cursor(shard_id, orchestrator._last_budget_event_id)
+    compactor = LedgerCompactor(
+        budget_ledger=a.budget_ledger,
+        budget_backend=a.budget_backend,
+        shard_store=store,
+        time_source=FrozenTimeSource(NOW),
+    )
+
+    # b has applied a0 only: nothing before it goes, and b replays its own tail
+    assert compactor.compact_budget().events_removed == 0
+    with b._budget_guard():
+        assert b._budget.energy_budget == 69.0
+    store.record_budget_cursor("b", b._last_budget_event_id)
+    assert compactor.compact_budget().events_removed == 3
+
+    # A shard that has not reported a cursor yet holds compaction back
+    store.heartbeat("c", NOW, timedelta(seconds=30))
+    a._emit_budget_event("BUDGET_RESERVED", {"energy": -1.0}, "a4", NOW)
+    a._persist_budget(NOW)
+    assert compactor.compact_budget().events_removed == 0
+    store.leave("c")
+    assert set(store.budget_cursors(NOW)) == {"a", "b"}
+
+
+def _run_shard(root, shard_id, barrier, results):
+    store = FileShardStore(os.path.join(root, "shards.json"))
+    orchestrator = _orchestrator(root, FileBudgetLock(os.path.join(root, "budget.lock")))
+    manager = ContextShardManager(orchestrator, store, shard_id)
+    store.heartbeat(shard_id, NOW, timedelta(seconds=30))
+    barrier.wait()
+    result = manager.rebalance(_registrations())
+    while result.waiting:
+        result = manager.rebalance(_registrations())
+    barrier.wait()
+    for _ in range(3):
+        manager.tick(_human(), _signals())
+    results.put((shard_id, sorted(orchestrator._runtimes), orchestrator.execution_queue.depth()))
+
+
+def test_shards_in_separate_processes_partition_contexts_and_share_the_budget(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(3)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_run_shard, args=(str(tmp_path), f"shard-{i}", barrier, results)) for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    owned = [key for _, keys, _ in reports for key in keys]
+    assert sorted(owned) == sorted(str(context) for context in CONTEXTS)
+    assert all(keys for _, keys, _ in reports)
+
+    # 5 execution slots in total, whichever shards got them
+    events = FileBudgetLedger(str(tmp_path / "budget.jsonl")).get_history()
+    reserved = [e for e in events if e.event_type == "BUDGET_RESERVED"]
+    assert len(reserved) == 5 == sum(dispatched for _, _, dispatched in reports)
+    assert FileBudgetBackend(str(tmp_path / "budget.json")).load().budget.execution_slots == 0
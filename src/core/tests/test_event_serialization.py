@@ -0,0 +1,67 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.core.domain.intention import Intention
+from src.core.domain.strategic_memory import PathStatus
+from src.core.domain.strategic_trajectory import StrategicTrajectory, TrajectoryStatus
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.event_serialization import serialize_for_event, serialize_for_event_asdict
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class _Nested:
+    trajectory: StrategicTrajectory
+    pair: Tuple[int, datetime]
+    history: List[StrategicTrajectory]
+    extra: Dict[str, Any]
+    when: Optional[datetime] = None
+
+
+def _samples():
+    trajectory = StrategicTrajectory("expand", TrajectoryStatus.ACTIVE, 0.7, NOW, NOW + timedelta(hours=1))
+    return [
+        StrategicPosture(["engage", "observe"], 0.4, 0.6, 1.2, StrategicMode.TACTICAL),
+        trajectory,
+        PathStatus(2, "FAILED", "soft", NOW),
+        PathStatus(5, "FAILED", "hard", NOW, cooldown_until=NOW + timedelta(days=1)),
+        Intention(UUID(int=1), "post", "hello", 0.8, NOW, 600, {"source": "impulse", "weight": 0.5}),
+        Intention(UUID(int=2), "post", "nested", 0.1, NOW, 60, {"at": [NOW]}),
+        _Nested(trajectory, (1, NOW), [trajectory], {"mode": StrategicMode.BALANCED}, NOW),
+        [trajectory, NOW, StrategicMode.STRATEGIC],
+        None,
+        NOW,
+    ]
+
+
+def test_fast_serialization_matches_asdict_serialization():
+    for sample in _samples():
+        fast = serialize_for_event(sample)
+        reference = serialize_for_event_asdict(sample)
+        assert fast == reference
+        assert repr(fast) == repr(reference)
+
+
+def test_serialized_domain_objects_are_json_compatible():
+    posture, trajectory, path_status = _samples()[:3]
+    payload = {
+        "posture_after": serialize_for_event(posture),
+        "trajectory_after": serialize_for_event(trajectory),
+        "path_status_after": serialize_for_event(path_status),
+    }
+
+    assert json.loads(json.dumps(payload)) == payload
+    assert payload["trajectory_after"]["status"] == "ACTIVE"
+    assert StrategicTrajectory.from_dict(payload["trajectory_after"]) == trajectory
+
+
+def test_serialized_lists_do_not_alias_the_domain_object():
+    posture = StrategicPosture(["engage"])
+    serialized = serialize_for_event(posture)
+    serialized["engagement_policy"].append("mutated")
+
+    assert posture.engagement_policy == ["engage"]
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.execution_result import ExecutionResult, ExecutionStatus
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.orchestration.feedback_queue import FeedbackOverflowPolicy
+from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, SlowLifeLoop, _human, _signals
+from src.core.tests.test_t3_correction_orchestrator import RecordingObserver
+
+
+def _of_type(observer, event_type):
+    return [e for e in observer.telemetry if e.event_type == event_type]
+
+
+def _result(i: int, status: ExecutionStatus = ExecutionStatus.SUCCESS) -> ExecutionResult:
+    return ExecutionResult(status, NOW, observations={"n": i})
+
+
+def _orchestrator(**kwargs):
+    observer = RecordingObserver()
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        observer=observer,
+        **kwargs
+    )
+    return orchestrator, observer
+
+
+def _deliver(orchestrator, domain, result):
+    orchestrator.post_execution_pipeline({"context_domain": domain, "result": result})
+
+
+def _drain(orchestrator, domain):
+    drained = []
+    while True:
+        result = orchestrator._pop_context_feedback(domain, None)
+        if result is None:
+            return drained
+        drained.append(result.observations["n"])
+
+
+def test_drop_oldest_keeps_newest_results_and_counts_drops():
+    orchestrator, observer = _orchestrator(feedback_queue_cap=3)
+    for i in range(5):
+        _deliver(orchestrator, "chat", _result(i))
+
+    metrics = orchestrator.feedback_metrics()
+    assert (metrics.queued, metrics.dropped, metrics.coalesced) == (3, 2, 0)
+    assert [e.payload["total"] for e in _of_type(observer, "FEEDBACK_OVERFLOW")] == [1, 2]
+    assert _drain(orchestrator, "chat") == [2, 3, 4]
+    assert "chat" not in orchestrator._pending_feedback_by_context
+
+
+def test_coalesce_merges_into_newest_and_keeps_failures():
+    orchestrator, _ = _orchestrator(feedback_queue_cap=2, feedback_overflow=FeedbackOverflowPolicy.COALESCE)
+    _deliver(orchestrator, "chat", _result(0))
+    _deliver(orchestrator, "chat", _result(1))
+    _deliver(orchestrator, "chat", _result(2, ExecutionStatus.FAILED))
+    _deliver(orchestrator, "chat", _result(3))
+
+    assert orchestrator.feedback_metrics().coalesced == 2
+    assert _drain(orchestrator, "chat") == [0, 2]
+
+
+def test_unanswered_execution_meta_expires():
+    time_source = FrozenTimeSource(NOW)
+    context = StrategicContext("global", None, None, "chat")
+    observer = RecordingObserver()
+    orchestrator = StrategicOrchestrator(
+        time_source=time_source,
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        observer=observer,
+        execution_meta_ttl_seconds=60.0,
+    )
+    orchestrator._runtimes[str(context)] = StrategicContextRuntime(context, SlowLifeLoop(0), _human())
+
+    orchestrator.tick(_human(), _signals())
+    time_source.advance(timedelta(seconds=30))
+    orchestrator.tick(_human(), _signals())
+    assert orchestrator.feedback_metrics().pending_execution_meta == 2
+
+    time_source.advance(timedelta(seconds=40))
+    orchestrator.tick(_human(), _signals())
+    metrics = orchestrator.feedback_metrics()
+    # The first intent is past the ttl; the second and the one just enqueued are not.
+    assert (metrics.pending_execution_meta, metrics.expired_execution_meta) == (2, 1)
+    assert UUID(int=1) not in orchestrator._pending_execution_meta
+    assert _of_type(observer, "EXECUTION_META_EXPIRED")[0].payload["expired"] == 1
+
+
+def test_invalid_feedback_settings_are_rejected():
+    with pytest.raises(ValueError):
+        _orchestrator(feedback_queue_cap=0)
+    with pytest.raises(ValueError):
+        _orchestrator(execution_meta_ttl_seconds=0)
@@ -0,0 +1,130 @@
+from datetime import datetime
+from uuid import uuid4
+
+from src.admin.domain.admin_command import AdminCommand
+from src.admin.domain.governance_action import GovernanceAction
+from src.admin.domain.governance_scope import GovernanceScope
+from src.admin.services.admin_command_handler import StaticAdminCommandHandler
+from src.admin.services.governance_service import StandardGovernanceService
+from src.admin.store.audit_log_store import AuditLogStore
+from src.admin.store.governance_state_store import GovernanceStateStore
+from src.admin.tests.test_governance_service import FixedTimeSource, FixedIdSource
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, SlowLifeLoop, _human, _signals
+from src.governance.runtime.governance_runtime_provider import GovernanceRuntimeProvider
+from src.hierarchy.domain.hierarchy_models import HierarchyDirective, HierarchyGraph, HierarchyLevel
+from src.hierarchy.services.hierarchical_governance_resolver import HierarchicalGovernanceResolver
+from src.hierarchy.services.hierarchy_projection_service import HierarchyProjectionService
+
+
+class _VersionedConfigLoader:
+    def __init__(self):
+        self.graph = HierarchyGraph.default()
+        self.version = 0
+        self.loads = 0
+
+    def load(self) -> HierarchyGraph:
+        self.loads += 1
+        return self.graph
+
+    def revision(self):
+        return self.version
+
+    def add_directive(self, directive: HierarchyDirective) -> None:
+        self.graph = HierarchyGraph(self.graph.nodes, self.graph.edges, self.graph.directives + [directive])
+        self.version += 1
+
+
+class _CountingResolver(HierarchicalGovernanceResolver):
+    calls = 0
+
+    def resolve(self, context, human=None):
+        self.calls += 1
+        return super().resolve(context, human)
+
+
+def _governance_service() -> StandardGovernanceService:
+    return StandardGovernanceService(
+        StaticAdminCommandHandler(),
+        GovernanceStateStore(),
+        AuditLogStore(),
+        FixedTimeSource(datetime(2024, 1, 1)),
+        FixedIdSource(uuid4()),
+    )
+
+
+def _orchestrator(contexts, **kwargs) -> StrategicOrchestrator:
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        **kwargs
+    )
+    for index, context in enumerate(contexts):
+        orchestrator._runtimes[str(context)] = StrategicContextRuntime(
+            context=context, lifeloop=SlowLifeLoop(index), human=_human()
+        )
+    return orchestrator
+
+
+def _resolved(orchestrator, context):
+    return orchestrator._resolve_governance_context(
+        context, _human(), orchestrator._current_governance_revision()
+    )
+
+
+def test_hierarchy_resolution_is_reused_until_a_directive_or_decision_changes():
+    contexts = [StrategicContext("global", None, None, f"telegram:chat-{i}") for i in range(3)]
+    loader = _VersionedConfigLoader()
+    service = _governance_service()
+    resolver = _CountingResolver(HierarchyProjectionService(config_loader=loader), GovernanceRuntimeProvider(service))
+    orchestrator = _orchestrator(contexts, governance_context_resolver=resolver.resolve)
+
+    for _ in range(4):
+        orchestrator.tick(_human(), _signals())
+    assert resolver.calls == 3
+    assert loader.loads == 1
+
+    loader.add_directive(HierarchyDirective(uuid4(), HierarchyLevel.L1, "telegram:chat-1", execution_locked=True))
+    orchestrator.tick(_human(), _signals())
+    assert resolver.calls == 6
+    assert _resolved(orchestrator, contexts[1]).is_execution_locked
+    assert not _resolved(orchestrator, contexts[0]).is_execution_locked
+
+    service.process_command(AdminCommand(uuid4(), GovernanceAction.LOCK_AUTONOMY, GovernanceScope.AUTONOMY))
+    orchestrator.tick(_human(), _signals())
+    assert resolver.calls == 9
+    assert all(_resolved(orchestrator, context).is_autonomy_locked for context in contexts)
+    orchestrator.tick(_human(), _signals())
+    assert resolver.calls == 9
+
+
+def test_provider_context_follows_governance_decisions():
+    contexts = [StrategicContext("global", None, None, "chat")]
+    service = _governance_service()
+    orchestrator = _orchestrator(contexts, governance_service=service)
+
+    first = _resolved(orchestrator, contexts[0])
+    assert _resolved(orchestrator, contexts[0]) is first
+    assert not first.is_execution_locked
+
+    service.process_command(AdminCommand(
+        uuid4(), GovernanceAction.IMPOSE_CONSTRAINT, GovernanceScope.EXECUTION, payload={"constraint": "EMERGENCY_STOP"}
+    ))
+    assert _resolved(orchestrator, contexts[0]).is_execution_locked
+
+
+def test_resolver_without_revision_is_called_every_tick():
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(2)]
+    calls = []
+    orchestrator = _orchestrator(contexts, governance_context_resolver=lambda context, human: calls.append(context))
+
+    orchestrator.tick(_human(), _signals())
+    orchestrator.tick(_human(), _signals())
+
+    assert len(calls) == 4
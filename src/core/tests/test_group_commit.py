@@ -0,0 +1,139 @@
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.budget_event import BudgetEvent
+from src.core.ledger.file_budget_ledger import FileBudgetLedger
+from src.core.ledger.file_ledger import FileStrategicLedger
+from src.core.ledger.group_commit import GroupCommitConfig, GroupCommitter
+from src.core.ledger.strategic_event import StrategicEvent
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def _run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_submissions_share_commits_and_ack_after_commit():
+    committed = []
+    batches = []
+
+    def commit(items):
+        batches.append(list(items))
+        committed.extend(items)
+        time.sleep(0.002)  # stands in for the fsync that submitters queue up behind
+
+    committer = GroupCommitter(commit, GroupCommitConfig(max_batch=8, max_delay_ms=20))
+    acked_before_commit = []
+
+    def worker(i):
+        for j in range(10):
+            item = (i, j)
+            committer.submit(item)
+            if item not in committed:
+                acked_before_commit.append(item)
+
+    _run_threads(8, worker)
+
+    assert not acked_before_commit
+    assert sorted(committed) == sorted((i, j) for i in range(8) for j in range(10))
+    assert len(batches) < 80
+    assert all(len(batch) <= 8 for batch in batches)
+    # Per-thread submission order is preserved across batches.
+    for i in range(8):
+        assert [j for t, j in committed if t == i] == list(range(10))
+
+
+def test_commit_failure_is_raised_to_every_member_of_the_batch():
+    def commit(items):
+        raise IOError("disk full")
+
+    committer = GroupCommitter(commit, GroupCommitConfig(max_batch=4, max_delay_ms=50))
+    errors = []
+
+    def worker(i):
+        try:
+            committer.submit(i)
+        except IOError as e:
+            errors.append(e)
+
+    _run_threads(4, worker)
+    assert len(errors) == 4
+
+
+def test_file_ledgers_in_group_commit_mode(tmp_path):
+    config = GroupCommitConfig(max_batch=16, max_delay_ms=5)
+    ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"), group_commit=config)
+    budget_ledger = FileBudgetLedger(str(tmp_path / "budget.jsonl"), group_commit=config)
+    context = StrategicContext("global", None, None, "social")
+
+    def worker(i):
+        for j in range(5):
+            n = i * 100 + j + 1
+            ledger.record(StrategicEvent(UUID(int=n), NOW, "REFLECTION", {"n": n}, context))
+            budget_ledger.record(BudgetEvent(UUID(int=n), NOW, "BUDGET_RESERVED", {"energy": -1.0}, "r"))
+
+    _run_threads(6, worker)
+
+    assert sorted(e.id.int for e in ledger.get_history(context)) == \
+           sorted(i * 100 + j + 1 for i in range(6) for j in range(5))
+    assert len(budget_ledger.get_history()) == 30
+
+
+def test_group_commit_config_is_validated():
+    with pytest.raises(ValueError):
+        GroupCommitConfig(max_batch=0)
+    with pytest.raises(ValueError):
+        GroupCommitConfig(max_delay_ms=-1)
+
+
+def test_single_writer_does_not_wait_for_the_window():
+    committed = []
+    committer = GroupCommitter(committed.append, GroupCommitConfig(max_batch=64, max_delay_ms=200))
+
+    started = time.perf_counter()
+    for i in range(20):
+        committer.submit(i)
+    elapsed = time.perf_counter() - started
+
+    assert committed == [[i] for i in range(20)]
+    # Waiting out the window would take 20 * 200ms
+    assert elapsed < 0.5
+
+
+def test_next_batch_gathers_while_a_commit_is_in_flight():
+    batches = []
+    first_commit_started = threading.Event()
+    release_first_commit = threading.Event()
+
+    def commit(items):
+        batches.append(list(items))
+        if len(batches) == 1:
+            first_commit_started.set()
+            release_first_commit.wait()
+
+    committer = GroupCommitter(commit, GroupCommitConfig(max_batch=64, max_delay_ms=0))
+    first = threading.Thread(target=committer.submit, args=("first",))
+    first.start()
+    first_commit_started.wait()
+
+    followers = [threading.Thread(target=committer.submit, args=(i,)) for i in range(5)]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.05)
+    release_first_commit.set()
+    for thread in [first] + followers:
+        thread.join()
+
+    assert batches[0] == ["first"]
+    assert sorted(batches[1]) == list(range(5))
@@ -0,0 +1,225 @@
+import multiprocessing
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.budget_snapshot import BudgetSnapshot
+from src.core.domain.resource import StrategicResourceBudget
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.budget_event import BudgetEvent
+from src.core.ledger.event_serialization import serialize_for_event
+from src.core.ledger.file_budget_ledger import FileBudgetLedger
+from src.core.ledger.file_ledger import FileStrategicLedger
+from src.core.ledger.in_memory_budget_ledger import InMemoryBudgetLedger
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.ledger.ledger_compactor import LedgerCompactor
+from src.core.ledger.segmented_file_ledger import SegmentedFileStrategicLedger
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.persistence.budget_backend import FileBudgetBackend
+from src.core.persistence.file_backend import FileStrategicStateBackend
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.replay.strategic_replay_engine import StrategicReplayEngine
+from src.core.time.frozen_time_source import FrozenTimeSource
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+SOCIAL = StrategicContext("global", None, None, "social")
+FINANCE = StrategicContext("global", None, None, "finance")
+
+
+def _shift(i: int, context: StrategicContext) -> StrategicEvent:
+    posture = StrategicPosture([f"p{i}"], risk_tolerance=i / 100.0,
+                               mode=StrategicMode.TACTICAL if i % 3 else StrategicMode.STRATEGIC)
+    return StrategicEvent(UUID(int=i + 1), NOW + timedelta(seconds=i), "HORIZON_SHIFT",
+                          {"posture_after": serialize_for_event(posture)}, context)
+
+
+def _budget_event(i: int) -> BudgetEvent:
+    return BudgetEvent(UUID(int=i + 1), NOW, "BUDGET_RESERVED", {"energy": -1.0}, f"r{i}")
+
+
+def _full(pages):
+    return [event for page in pages for event in page]
+
+
+def test_strategic_compaction_keeps_restore_and_full_history_deterministic(tmp_path):
+    ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+    backend = FileStrategicStateBackend(str(tmp_path / "state"))
+    engine = StrategicReplayEngine(backend, ledger, FrozenTimeSource(NOW), page_size=4)
+    events = [_shift(i, SOCIAL if i % 2 == 0 else FINANCE) for i in range(30)]
+    for event in events:
+        ledger.record(event)
+    social = [e for e in events if e.context == SOCIAL]
+    finance = [e for e in events if e.context == FINANCE]
+
+    backend.save(SOCIAL, engine.replay(SOCIAL, engine._initial_bundle(), social[:10]))
+    before = engine.restore(SOCIAL)
+
+    result = LedgerCompactor(ledger, backend).compact_contexts([SOCIAL, FINANCE])
+
+    assert (result.contexts_compacted, result.events_removed) == (1, 9)
+    # The snapshot anchor stays live; the context without a snapshot is untouched.
+    assert ledger.get_history(SOCIAL) == social[9:]
+    assert ledger.get_history(FINANCE) == finance
+    assert engine.restore(SOCIAL) == before
+    assert _full(ledger.iter_full_history(SOCIAL, page_size=4)) == social
+
+    full = engine.replay_full_history(SOCIAL)
+    assert (full.posture, full.memory, full.trajectory_memory, full.last_event_id) == \
+           (before.posture, before.memory, before.trajectory_memory, before.last_event_id)
+
+    # Nothing left to remove behind the same snapshot.
+    assert LedgerCompactor(ledger, backend).compact_contexts([SOCIAL]).events_removed == 0
+
+
+def test_compaction_runs_alongside_concurrent_records(tmp_path):
+    ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+    social = [_shift(i, SOCIAL) for i in range(200)]
+    for event in social:
+        ledger.record(event)
+    finance = [_shift(1000 + i, FINANCE) for i in range(300)]
+
+    writer = threading.Thread(target=lambda: [ledger.record(event) for event in finance])
+    writer.start()
+    removed = ledger.compact([(SOCIAL, social[150].id)])
+    writer.join()
+
+    assert removed == 150
+    assert ledger.get_history(SOCIAL) == social[150:]
+    assert ledger.get_history(FINANCE) == finance
+    assert ledger.get_history_since(SOCIAL, social[150].id) == social[151:]
+
+
+def test_unknown_anchor_and_drop_mode(tmp_path):
+    ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+    events = [_shift(i, SOCIAL) for i in range(10)]
+    for event in events:
+        ledger.record(event)
+
+    assert ledger.compact([(SOCIAL, UUID(int=999)), (FINANCE, events[5].id)]) == 0
+    assert ledger.get_history(SOCIAL) == events
+
+    assert ledger.compact([(SOCIAL, events[5].id)], archive=False) == 5
+    assert not os.path.exists(ledger.archive_path)
+    assert _full(ledger.iter_full_history(SOCIAL)) == events[5:]
+
+
+def test_budget_compaction_behind_snapshot(tmp_path):
+    ledger = FileBudgetLedger(str(tmp_path / "budget.jsonl"))
+    backend = FileBudgetBackend(str(tmp_path / "budget.json"))
+    events = [_budget_event(i) for i in range(10)]
+    for event in events:
+        ledger.record(event)
+    backend.save(BudgetSnapshot(StrategicResourceBudget(90.0, 100.0, 5, NOW), NOW, events[6].id))
+
+    result = LedgerCompactor(budget_ledger=ledger, budget_backend=backend).compact_budget()
+
+    assert result.events_removed == 6
+    assert ledger.get_history() == events[6:]
+    assert ledger.get_history_since(events[6].id) == events[7:]
+    assert ledger.last_event_id() == events[-1].id
+    assert _full(ledger.iter_full_history(page_size=3)) == events
+
+
+def test_full_history_skips_events_left_live_by_an_interrupted_compaction(tmp_path):
+    ledger = FileBudgetLedger(str(tmp_path / "budget.jsonl"))
+    events = [_budget_event(i) for i in range(6)]
+    for event in events:
+        ledger.record(event)
+    # Archive written, live swap lost: the first three events are in both.
+    with open(ledger.file_path, 'rb') as live, open(ledger.archive_path, 'wb') as archive:
+        archive.write(b"".join(live.readlines()[:3]))
+
+    assert _full(ledger.iter_full_history()) == events
+
+
+def test_compactor_rejects_volatile_snapshots(tmp_path):
+    ledger = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+    with pytest.raises(ValueError):
+        LedgerCompactor(ledger, InMemoryStrategicStateBackend())
+
+
+@pytest.mark.parametrize("kind", ["memory", "file", "segmented"])
+def test_every_strategic_ledger_compacts_behind_its_snapshot(kind, tmp_path):
+    ledger = {
+        "memory": lambda: InMemoryStrategicLedger(),
+        "file": lambda: FileStrategicLedger(str(tmp_path / "ledger.jsonl")),
+        "segmented": lambda: SegmentedFileStrategicLedger(str(tmp_path / "segments"), segment_max_bytes=600),
+    }[kind]()
+    backend = FileStrategicStateBackend(str(tmp_path / "state"))
+    engine = StrategicReplayEngine(backend, ledger, FrozenTimeSource(NOW))
+    events = [_shift(i, SOCIAL if i % 2 == 0 else FINANCE) for i in range(30)]
+    for event in events:
+        ledger.record(event)
+    social = [e for e in events if e.context == SOCIAL]
+    finance = [e for e in events if e.context == FINANCE]
+    backend.save(SOCIAL, engine.replay(SOCIAL, engine._initial_bundle(), social[:10]))
+    before = engine.restore(SOCIAL)
+
+    pages = ledger.iter_history_since(FINANCE, None, page_size=5)
+    first_page = next(pages)
+    result = LedgerCompactor(ledger, backend).compact_contexts([SOCIAL, FINANCE])
+
+    assert (result.contexts_compacted, result.events_removed) == (1, 9)
+    # A read started before the compaction still sees its snapshot
+    assert first_page + _full(pages) == finance
+    assert ledger.get_history(SOCIAL) == social[9:]
+    assert ledger.get_history_since(SOCIAL, social[9].id) == social[10:]
+    assert ledger.get_history(FINANCE) == finance
+    assert engine.restore(SOCIAL) == before
+    assert _full(ledger.iter_full_history(SOCIAL, page_size=4)) == social
+    assert ledger.compact([(SOCIAL, social[9].id), (FINANCE, UUID(int=999))]) == 0
+
+    ledger.record(_shift(100, SOCIAL))
+    assert ledger.get_history(SOCIAL)[-1].id == UUID(int=101)
+
+
+@pytest.mark.parametrize("kind", ["memory", "file"])
+def test_every_budget_ledger_compacts_behind_its_anchor(kind, tmp_path):
+    ledger = InMemoryBudgetLedger() if kind == "memory" else FileBudgetLedger(str(tmp_path / "budget.jsonl"))
+    events = [_budget_event(i) for i in range(10)]
+    for event in events:
+        ledger.record(event)
+
+    assert ledger.compact(UUID(int=999)) == 0
+    assert ledger.compact(events[6].id) == 6
+    assert ledger.get_history() == events[6:]
+    assert ledger.get_history_since(events[6].id) == events[7:]
+    assert ledger.get_history_since(events[2].id) == []
+    assert _full(ledger.iter_full_history(page_size=3)) == events
+
+
+def _record_finance(path, barrier):
+    ledger = FileStrategicLedger(path)
+    barrier.wait()
+    for i in range(1000):
+        ledger.record(_shift(1000 + i, FINANCE))
+
+
+def test_compaction_does_not_lose_appends_from_other_processes(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = FileStrategicLedger(path)
+    social = [_shift(i, SOCIAL) for i in range(2000)]
+    for event in social:
+        ledger.record(event)
+
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(2)
+    writer = ctx.Process(target=_record_finance, args=(path, barrier))
+    writer.start()
+    barrier.wait()
+    # Many small compactions, so swaps keep landing between the other process's appends
+    removed = 0
+    anchor = 0
+    while writer.is_alive() and anchor < 1990:
+        anchor += 5
+        removed += ledger.compact([(SOCIAL, social[anchor].id)], archive=False)
+    writer.join(timeout=60)
+    assert writer.exitcode == 0
+
+    assert removed == anchor
+    assert ledger.get_history(SOCIAL) == social[anchor:]
+    assert [e.id.int for e in ledger.get_history(FINANCE)] == [1001 + i for i in range(1000)]
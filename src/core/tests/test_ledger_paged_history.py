@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategic_memory import StrategicMemory
+from src.core.domain.strategic_trajectory import StrategicTrajectoryMemory
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.budget_event import BudgetEvent
+from src.core.ledger.file_budget_ledger import FileBudgetLedger
+from src.core.ledger.file_ledger import FileStrategicLedger
+from src.core.ledger.in_memory_budget_ledger import InMemoryBudgetLedger
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.persistence.strategic_state_bundle import StrategicStateBundle
+from src.core.replay.exceptions import ReplayIntegrityError
+from src.core.replay.strategic_replay_engine import StrategicReplayEngine
+from src.core.time.frozen_time_source import FrozenTimeSource
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+SOCIAL = StrategicContext("global", None, None, "social")
+FINANCE = StrategicContext("global", None, None, "finance")
+
+
+def _strategic_event(i: int, context: StrategicContext, event_type: str = "REFLECTION") -> StrategicEvent:
+    return StrategicEvent(UUID(int=i + 1), NOW, event_type, {"n": i}, context)
+
+
+@pytest.fixture(params=["memory", "file"])
+def strategic_ledger(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStrategicLedger()
+    # Small chunks exercise lines spanning chunk boundaries.
+    return FileStrategicLedger(str(tmp_path / "ledger.jsonl"), read_chunk_size=41)
+
+
+@pytest.fixture(params=["memory", "file"])
+def budget_ledger(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryBudgetLedger()
+    return FileBudgetLedger(str(tmp_path / "budget.jsonl"), read_chunk_size=41)
+
+
+def test_strategic_pages_are_bounded_and_context_scoped(strategic_ledger):
+    for i in range(23):
+        strategic_ledger.record(_strategic_event(i, SOCIAL if i % 2 else FINANCE))
+
+    history = strategic_ledger.get_history(SOCIAL)
+    pages = list(strategic_ledger.iter_history_since(SOCIAL, None, page_size=4))
+    assert all(0 < len(page) <= 4 for page in pages)
+    assert [e for page in pages for e in page] == history
+
+    anchor = history[3]
+    assert strategic_ledger.get_history_since(SOCIAL, anchor.id) == history[4:]
+    assert strategic_ledger.get_history_since(SOCIAL, history[-1].id) == []
+    assert strategic_ledger.get_history_since(SOCIAL, UUID(int=999)) == []
+    # An anchor recorded for another context never leaks that context's position.
+    assert strategic_ledger.get_history_since(FINANCE, anchor.id) == []
+
+
+def test_budget_pages_are_bounded(budget_ledger):
+    for i in range(11):
+        budget_ledger.record(BudgetEvent(UUID(int=i + 1), NOW, "BUDGET_RESERVED", {"energy": -1.0}, f"r{i}"))
+
+    history = budget_ledger.get_history()
+    pages = list(budget_ledger.iter_history_since(history[2].id, page_size=3))
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert [e for page in pages for e in page] == history[3:]
+
+
+def test_restore_replays_only_events_after_snapshot(strategic_ledger):
+    class NoScanLedger:
+        def __init__(self, inner):
+            self.inner = inner
+
+        def get_history(self, context):
+            raise AssertionError("full history read")
+
+        def iter_history_since(self, context, event_id, page_size):
+            return self.inner.iter_history_since(context, event_id, page_size)
+
+    # Events before the snapshot would fail validation if they were replayed.
+    for i in range(5):
+        strategic_ledger.record(_strategic_event(i, SOCIAL, event_type="POISONED"))
+    backend = InMemoryStrategicStateBackend()
+    bundle = StrategicStateBundle(
+        posture=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
+        memory=StrategicMemory(),
+        trajectory_memory=StrategicTrajectoryMemory(),
+        last_event_id=UUID(int=5)
+    )
+    backend.save(SOCIAL, bundle)
+    engine = StrategicReplayEngine(backend, NoScanLedger(strategic_ledger), FrozenTimeSource(NOW), page_size=2)
+
+    assert engine.restore(SOCIAL) == bundle
+
+    strategic_ledger.record(_strategic_event(5, SOCIAL, event_type="POISONED"))
+    with pytest.raises(ReplayIntegrityError):
+        engine.restore(SOCIAL)
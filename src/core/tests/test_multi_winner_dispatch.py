@@ -0,0 +1,88 @@
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, SlowLifeLoop, _human, _signals
+from src.core.tests.test_t3_correction_orchestrator import RecordingObserver
+from src.execution.queue.execution_queue import InMemoryExecutionQueue
+
+CONTEXTS = [StrategicContext("global", None, None, f"chat-{i}") for i in range(8)]
+
+
+def _orchestrator(max_dispatch_per_tick: int):
+    observer = RecordingObserver()
+    queue = InMemoryExecutionQueue()
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        execution_queue=queue,
+        observer=observer,
+        max_dispatch_per_tick=max_dispatch_per_tick,
+    )
+    for index, context in enumerate(CONTEXTS):
+        orchestrator._runtimes[str(context)] = StrategicContextRuntime(context, SlowLifeLoop(index), _human())
+    return orchestrator, observer, queue
+
+
+def _winners(observer):
+    return [e.payload["winners"] for e in observer.telemetry if e.event_type == "TICK_END"]
+
+
+def test_dispatches_up_to_free_slots_and_per_tick_ceiling():
+    orchestrator, observer, queue = _orchestrator(max_dispatch_per_tick=3)
+    assert orchestrator._budget.execution_slots == 5
+
+    first = orchestrator.tick(_human(), _signals())
+    orchestrator.tick(_human(), _signals())
+    orchestrator.tick(_human(), _signals())
+
+    # 3 winners, then the 2 slots left, then nothing to reserve
+    assert [len(w) for w in _winners(observer)] == [3, 2, 0]
+    assert orchestrator._budget.execution_slots == 0
+    assert queue.depth() == 5
+    assert str(first.id) == _winners(observer)[0][0]
+    winning_runtimes = [r for r in orchestrator._runtimes.values() if r.last_win_tick == 1]
+    assert len(winning_runtimes) == 3
+
+
+def test_first_winner_matches_single_dispatch_and_runs_are_replay_stable():
+    single, single_observer, _ = _orchestrator(max_dispatch_per_tick=1)
+    multi, multi_observer, _ = _orchestrator(max_dispatch_per_tick=4)
+    again, again_observer, _ = _orchestrator(max_dispatch_per_tick=4)
+
+    for _ in range(2):
+        single.tick(_human(), _signals())
+        multi.tick(_human(), _signals())
+        again.tick(_human(), _signals())
+
+    assert _winners(single_observer)[0][0] == _winners(multi_observer)[0][0]
+    assert _winners(multi_observer) == _winners(again_observer)
+    # Every candidate that was not dispatched lost arbitration
+    lost = [e for e in multi.counterfactual_store.list_all() if e.reason == "Lost Arbitration"]
+    assert len(lost) == 8 - 4 + 8 - 1
+
+
+def test_winner_turned_down_by_the_budget_is_a_budget_counterfactual():
+    orchestrator, observer, queue = _orchestrator(max_dispatch_per_tick=3)
+    # Every candidate passes evaluation; only two reservations fit
+    orchestrator._budget = replace(orchestrator._budget, energy_budget=2.0)
+
+    orchestrator.tick(_human(), _signals())
+
+    assert [len(w) for w in _winners(observer)] == [2]
+    assert queue.depth() == 2 and orchestrator._budget.energy_budget == 0.0
+    reasons = Counter((e.reason, e.suppression_stage) for e in orchestrator.counterfactual_store.list_all())
+    assert reasons == {("Lost Arbitration", "Arbitration"): 5, ("Budget Insufficient", "Budget"): 1}
+
+
+def test_invalid_dispatch_ceiling_is_rejected():
+    with pytest.raises(ValueError):
+        _orchestrator(max_dispatch_per_tick=0)
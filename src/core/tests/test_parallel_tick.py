@@ -0,0 +1,214 @@
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.core.context.internal import InternalContext
+from src.core.domain.behavior import BehaviorState
+from src.core.domain.entity import AIHuman
+from src.core.domain.execution_intent import ExecutionIntent
+from src.core.domain.identity import Identity
+from src.core.domain.memory import MemorySystem
+from src.core.domain.persona import PersonaMask
+from src.core.domain.readiness import ActionReadiness
+from src.core.domain.resource import ResourceCost
+from src.core.domain.stance import Stance
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.lifecycle.signals import LifeSignals
+from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.execution.queue.execution_queue import InMemoryExecutionQueue
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+class SlowLifeLoop:
+    """
+    Deterministic LifeLoop stand-in: emits an intent on every tick with a fixed risk level.
+    """
+
+    def __init__(self, index: int, delay_seconds: float = 0.0):
+        self.index = index
+        self.delay_seconds = delay_seconds
+        self.suppressed = 0
+
+    def tick(self, human, signals, strategic_context, tick_count, last_executed_intent=None, rng=None):
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        intent = ExecutionIntent(
+            id=UUID(int=self.index * 1000 + tick_count),
+            commitment_id=UUID(int=1),
+            intention_id=UUID(int=2),
+            persona_id=UUID(int=3),
+            abstract_action="communicate",
+            constraints={"platform": "dev", "target_id": strategic_context.domain},
+            created_at=NOW,
+            reversible=False,
+            risk_level=0.05 + (self.index % 7) * 0.01,
+            estimated_cost=ResourceCost(1.0, 1.0, 1),
+        )
+        return InternalContext(
+            identity_summary="test",
+            current_mood="neutral",
+            energy_level="high",
+            recent_thoughts=[],
+            active_intentions_count=1,
+            readiness_level="ready",
+            readiness_value=100.0,
+            world_perception=None,
+            execution_intent=intent
+        )
+
+    def suppress_pending_intentions(self, human) -> None:
+        self.suppressed += 1
+
+
+def _human() -> AIHuman:
+    return AIHuman(
+        id=UUID(int=99),
+        identity=Identity("test-human", 30, "n/a", "bio", [], [], {}),
+        state=BehaviorState(100.0, 100.0, 0.0, NOW, False),
+        memory=MemorySystem([], []),
+        stance=Stance({}),
+        readiness=ActionReadiness(60.0, 40.0, 80.0),
+        intentions=[],
+        personas=[],
+        strategy=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
+        deferred_actions=[],
+        created_at=NOW
+    )
+
+
+def _signals() -> LifeSignals:
+    return LifeSignals(0.0, 0.0, 0.0, False, {}, [], None)
+
+
+def _persona_human(index: int) -> AIHuman:
+    human = _human()
+    human.personas = [
+        PersonaMask(UUID(int=1000 + index * 10 + i), human.id, "dev", f"persona-{i}", "", "en", "formal", "medium",
+                    0.8, 0.9, list(range(24)))
+        for i in range(3)
+    ]
+    return human
+
+
+def _orchestrator(contexts, tick_workers: int, delay_seconds: float = 0.0):
+    queue = InMemoryExecutionQueue()
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        execution_queue=queue,
+        tick_workers=tick_workers,
+    )
+    loops = []
+    for index, context in enumerate(contexts):
+        loop = SlowLifeLoop(index, delay_seconds)
+        loops.append(loop)
+        orchestrator._runtimes[str(context)] = StrategicContextRuntime(
+            context=context,
+            lifeloop=loop,
+            human=_human()
+        )
+    return orchestrator, loops, queue
+
+
+def test_parallel_tick_matches_serial_outcomes():
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(12)]
+    serial, serial_loops, serial_queue = _orchestrator(contexts, tick_workers=1)
+    parallel, parallel_loops, parallel_queue = _orchestrator(contexts, tick_workers=4)
+
+    for _ in range(3):
+        serial_winner = serial.tick(_human(), _signals())
+        parallel_winner = parallel.tick(_human(), _signals())
+        assert serial_winner.id == parallel_winner.id
+
+    assert serial._budget == parallel._budget
+    assert [l.suppressed for l in serial_loops] == [l.suppressed for l in parallel_loops]
+    assert [(e.context_domain, e.reason) for e in serial.counterfactual_store.list_all()] == \
+           [(e.context_domain, e.reason) for e in parallel.counterfactual_store.list_all()]
+    assert [(r.starvation_score, r.tick_count) for r in serial._runtimes.values()] == \
+           [(r.starvation_score, r.tick_count) for r in parallel._runtimes.values()]
+    assert serial_queue.depth() == parallel_queue.depth()
+    parallel.shutdown()
+
+
+def test_contexts_sharing_a_domain_read_counterfactuals_as_of_the_start_of_the_tick():
+    # Counterfactuals are recorded by the join stage, so in serial mode too the second context
+    # no longer sees the one the first context's suppression produced earlier in the same tick
+    contexts = [StrategicContext("global", None, f"goal-{i}", "shared") for i in range(2)]
+    for tick_workers in (1, 2):
+        orchestrator, loops, _ = _orchestrator(contexts, tick_workers=tick_workers)
+        orchestrator._budget = replace(orchestrator._budget, energy_budget=0.0)
+        seen = []
+        evaluate = orchestrator._evaluate_context_tick
+
+        def spy(plan, now):
+            evaluation = evaluate(plan, now)
+            seen.append((plan.key, len(evaluation.recent_counterfactuals)))
+            return evaluation
+
+        orchestrator._evaluate_context_tick = spy
+        orchestrator.tick(_human(), _signals())
+        orchestrator.shutdown()
+
+        assert sorted(seen) == [(str(context), 0) for context in contexts]
+        assert [e.reason for e in orchestrator.counterfactual_store.list_by_context("shared")] == \
+               ["Budget Insufficient", "Budget Insufficient"]
+
+
+def test_parallel_tick_bounds_latency_by_worker_count():
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(8)]
+    parallel, _, _ = _orchestrator(contexts, tick_workers=4, delay_seconds=0.05)
+
+    started = time.perf_counter()
+    parallel.tick(_human(), _signals())
+    elapsed = time.perf_counter() - started
+    parallel.shutdown()
+
+    # Serial would take at least 8 * 50ms.
+    assert elapsed < 0.3
+
+
+def _run_real_lifeloops(tick_workers: int, rng_seed: int):
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(8)]
+    ledger = InMemoryStrategicLedger()
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=ledger,
+        backend=InMemoryStrategicStateBackend(),
+        execution_queue=InMemoryExecutionQueue(),
+        tick_workers=tick_workers,
+        rng_seed=rng_seed,
+    )
+    humans = [_persona_human(index) for index in range(len(contexts))]
+    for context, human in zip(contexts, humans):
+        orchestrator.register_context(context, human)
+
+    signals = LifeSignals(10.0, 0.0, 0.0, False, {"topic-a": (1.8, 0.5), "topic-b": (1.5, -0.2)}, [], None)
+    for _ in range(10):
+        orchestrator.tick(_human(), signals)
+    orchestrator.shutdown()
+
+    # Ids are uuid4, so compare what was decided rather than the records themselves
+    return [
+        (
+            sorted((intention.content, intention.priority) for intention in human.intentions),
+            human.readiness.value,
+            [event.event_type for event in ledger.get_history(context)],
+        )
+        for context, human in zip(contexts, humans)
+    ]
+
+
+def test_parallel_tick_with_real_lifeloops_matches_serial_decisions():
+    serial = _run_real_lifeloops(tick_workers=1, rng_seed=7)
+    assert any(intentions for intentions, _, _ in serial)
+    assert _run_real_lifeloops(tick_workers=4, rng_seed=7) == serial
+    assert _run_real_lifeloops(tick_workers=1, rng_seed=8) != serial
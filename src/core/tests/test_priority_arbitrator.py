@@ -0,0 +1,51 @@
+import random
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.orchestration.arbitrator import PriorityArbitrator, StrategicArbitrator
+from src.core.orchestration.strategic_context_runtime import StrategicContextRuntime
+from src.core.tests.test_parallel_tick import SlowLifeLoop
+
+
+def _candidates(scores):
+    candidates = []
+    for index, score in enumerate(scores):
+        loop = SlowLifeLoop(index)
+        context = StrategicContext("global", None, None, f"chat-{index}")
+        intent = loop.tick(None, None, context, 1).execution_intent
+        candidates.append((StrategicContextRuntime(context, loop), intent, score))
+    return candidates
+
+
+def _sorted_order(candidates):
+    # Reference: full stable sort, as select() used to do
+    return [i for i, _ in sorted(enumerate(candidates), key=lambda x: x[1][2], reverse=True)]
+
+
+def test_select_matches_full_sort_with_first_of_equal_scores():
+    arbitrator = PriorityArbitrator()
+    rng = random.Random(7)
+    for _ in range(50):
+        candidates = _candidates([rng.choice([0.1, 0.5, 0.5, 0.9]) for _ in range(rng.randint(1, 30))])
+        expected = candidates[_sorted_order(candidates)[0]]
+        assert arbitrator.select(candidates) == (expected[0], expected[1])
+    assert arbitrator.select([]) is None
+
+
+def test_select_top_returns_k_best_in_priority_then_routing_order():
+    arbitrator = PriorityArbitrator()
+    rng = random.Random(11)
+    for k in (1, 2, 5, 40):
+        candidates = _candidates([round(rng.random(), 1) for _ in range(30)])
+        assert arbitrator.select_top(candidates, k) == _sorted_order(candidates)[:k]
+    assert arbitrator.select_top(_candidates([0.3]), 0) == []
+    assert arbitrator.select_top([], 3) == []
+
+
+def test_single_winner_arbitrators_fall_back_to_select():
+    class LastWins(StrategicArbitrator):
+        def select(self, candidates):
+            return (candidates[-1][0], candidates[-1][1]) if candidates else None
+
+    candidates = _candidates([0.9, 0.1, 0.2])
+    assert LastWins().select_top(candidates, 3) == [2]
+    assert LastWins().select_top([], 3) == []
@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.file_ledger import FileStrategicLedger
+from src.core.ledger import segmented_file_ledger
+from src.core.ledger.segmented_file_ledger import SegmentedFileStrategicLedger
+from src.core.ledger.segmented_ledger_tool import compact, main, migrate_jsonl
+from src.core.ledger.strategic_event import StrategicEvent
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+CONTEXTS = [StrategicContext("global", None, None, f"chat-{i}") for i in range(3)]
+
+
+def _event(i: int) -> StrategicEvent:
+    return StrategicEvent(UUID(int=i + 1), NOW, "REFLECTION", {"n": i}, CONTEXTS[i % 3])
+
+
+def test_reads_match_jsonl_ledger_across_segments(tmp_path):
+    jsonl = FileStrategicLedger(str(tmp_path / "ledger.jsonl"))
+    segmented = SegmentedFileStrategicLedger(str(tmp_path / "segments"), segment_max_bytes=512)
+    for i in range(40):
+        jsonl.record(_event(i))
+        segmented.record(_event(i))
+
+    assert len([p for p in os.listdir(tmp_path / "segments") if p.endswith(".log")]) > 1
+    reopened = SegmentedFileStrategicLedger(str(tmp_path / "segments"), segment_max_bytes=512)
+    for ledger in (segmented, reopened):
+        for context in CONTEXTS:
+            history = jsonl.get_history(context)
+            assert ledger.get_history(context) == history
+            assert ledger.get_history_since(context, history[4].id) == history[5:]
+            pages = list(ledger.iter_history_since(context, None, page_size=5))
+            assert [len(p) for p in pages] == [5, 5, len(history) - 10]
+        assert ledger.get_history_since(CONTEXTS[1], UUID(int=1)) == []
+
+
+def test_recovers_torn_tail_and_missing_index_entries(tmp_path):
+    base = tmp_path / "segments"
+    ledger = SegmentedFileStrategicLedger(str(base))
+    for i in range(6):
+        ledger.record(_event(i))
+
+    segment = base / "segment-000000.log"
+    index = base / "segment-000000.idx"
+    # Lose the last two index entries and tear the final record in half.
+    entry_size = os.path.getsize(index) // 6
+    os.truncate(index, entry_size * 4 + 3)
+    with open(segment, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    recovered = SegmentedFileStrategicLedger(str(base))
+    assert recovered.get_history(CONTEXTS[0]) == [_event(0), _event(3)]
+    assert recovered.get_history(CONTEXTS[2]) == [_event(2), _event(5)]
+
+    recovered.record(_event(6))
+    assert SegmentedFileStrategicLedger(str(base)).get_history(CONTEXTS[0]) == [_event(0), _event(3), _event(6)]
+
+
+def test_migrate_and_compact(tmp_path):
+    jsonl_path = tmp_path / "ledger.jsonl"
+    jsonl = FileStrategicLedger(str(jsonl_path))
+    for i in range(30):
+        jsonl.record(_event(i))
+    with open(jsonl_path, "a") as f:
+        f.write("not json\n\n")
+
+    target = tmp_path / "segments"
+    assert migrate_jsonl(str(jsonl_path), str(target), segment_max_bytes=400) == 30
+    with pytest.raises(ValueError):
+        migrate_jsonl(str(jsonl_path), str(target))
+
+    assert main(["compact", str(target)]) == 0
+    compacted = SegmentedFileStrategicLedger(str(target))
+    assert sorted(os.listdir(target)) == ["segment-000000.idx", "segment-000000.log"]
+    for context in CONTEXTS:
+        assert compacted.get_history(context) == jsonl.get_history(context)
+    assert [json.loads(json.dumps(r))["id"] for r in compacted.iter_raw_records()] == \
+           [str(UUID(int=i + 1)) for i in range(30)]
+    assert compact(str(target)) == 30
+
+
+def test_compaction_interrupted_between_renames_is_recovered(tmp_path, monkeypatch):
+    base = tmp_path / "segments"
+    ledger = SegmentedFileStrategicLedger(str(base), segment_max_bytes=400)
+    for i in range(12):
+        ledger.record(_event(i))
+    expected = {str(context): ledger.get_history(context) for context in CONTEXTS}
+
+    def history(path):
+        reopened = SegmentedFileStrategicLedger(str(path))
+        return {str(context): reopened.get_history(context) for context in CONTEXTS}
+
+    # Crash after the ledger was moved aside: the complete copy is swapped in on open
+    real_rename = os.rename
+    renames = []
+
+    def crash_on_second_rename(src, dst):
+        renames.append(dst)
+        if len(renames) == 2:
+            raise OSError("simulated crash")
+        real_rename(src, dst)
+
+    monkeypatch.setattr(os, "rename", crash_on_second_rename)
+    with pytest.raises(OSError):
+        compact(str(base))
+    monkeypatch.setattr(os, "rename", real_rename)
+    assert not base.exists()
+    assert history(base) == expected
+    assert sorted(os.listdir(tmp_path)) == ["segments"]
+    assert sorted(os.listdir(base)) == ["segment-000000.idx", "segment-000000.log"]
+
+    # Same point, but the copy never got marked complete: the old ledger is moved back
+    real_rename(base, str(base) + ".retired")
+    os.makedirs(str(base) + ".compacting")
+    with open(os.path.join(str(base) + ".compacting", "segment-000000.log"), "wb") as f:
+        f.write(b"partial")
+    assert history(base) == expected
+    assert sorted(os.listdir(tmp_path)) == ["segments"]
+
+    # A crash after the swap only leaves the retired copy to delete
+    def crash(path):
+        raise OSError("simulated crash")
+
+    monkeypatch.setattr(shutil, "rmtree", crash)
+    with pytest.raises(OSError):
+        compact(str(base))
+    monkeypatch.undo()
+    assert (tmp_path / "segments.retired").exists()
+    assert history(base) == expected
+    assert sorted(os.listdir(tmp_path)) == ["segments"]
+    assert compact(str(base)) == 12
+
+
+def test_records_made_while_compacting_are_not_blocked_and_survive(tmp_path, monkeypatch):
+    ledger = SegmentedFileStrategicLedger(str(tmp_path / "segments"), segment_max_bytes=400)
+    events = [_event(i) for i in range(30)]
+    for event in events[:12]:
+        ledger.record(event)
+    real_fsync = segmented_file_ledger.fsync_dir_files
+    recorded = []
+
+    def record_mid_copy(path):
+        # The surviving frames are copied; record() must not wait for the rest of compact()
+        if not recorded:
+            writer = threading.Thread(target=lambda: [ledger.record(event) for event in events[12:]])
+            writer.start()
+            writer.join(timeout=10)
+            recorded.append(not writer.is_alive())
+        real_fsync(path)
+
+    monkeypatch.setattr(segmented_file_ledger, "fsync_dir_files", record_mid_copy)
+    assert ledger.compact([(CONTEXTS[0], events[9].id)]) == 3
+    assert recorded == [True]
+
+    expected = {context: [e for e in events if e.context == context] for context in CONTEXTS}
+    expected[CONTEXTS[0]] = expected[CONTEXTS[0]][3:]
+    for reopened in (ledger, SegmentedFileStrategicLedger(str(tmp_path / "segments"))):
+        assert {context: reopened.get_history(context) for context in CONTEXTS} == expected
+    assert ledger.get_history_since(CONTEXTS[1], events[28].id) == []
+    assert ledger.get_history_since(CONTEXTS[0], events[9].id)[0] == events[12]
@@ -0,0 +1,135 @@
+import random
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.core.domain.strategic_context import StrategicContext
+from src.core.domain.strategic_memory import PathStatus, StrategicMemory
+from src.core.domain.strategic_trajectory import StrategicTrajectory, StrategicTrajectoryMemory
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.strategic_event import StrategicEvent
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+from src.core.persistence.strategic_state_bundle import StrategicStateBundle
+from src.core.replay.strategic_reducer import CompositeStrategicReducer
+from src.core.replay.strategic_replay_engine import StrategicReplayEngine
+from src.core.time.frozen_time_source import FrozenTimeSource
+
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+CONTEXT = StrategicContext("global", None, None, "social")
+
+
+def _trajectory(trajectory_id: str, weight: float) -> dict:
+    return {
+        "id": trajectory_id,
+        "status": "ACTIVE",
+        "commitment_weight": weight,
+        "created_at": NOW.isoformat(),
+        "last_updated": NOW.isoformat(),
+    }
+
+
+def _events(count: int, seed: int):
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        kind = rng.choice(["STRATEGY_ADAPTATION", "TRAJECTORY_UPDATE", "PATH_ABANDONMENT", "REBINDING", "REFLECTION"])
+        if kind == "STRATEGY_ADAPTATION":
+            details = {"posture_after": {
+                "engagement_policy": ["p"], "risk_tolerance": rng.random(),
+                "confidence_baseline": 0.5, "persistence_factor": 1.0, "mode": StrategicMode.BALANCED.value,
+            }}
+        elif kind == "TRAJECTORY_UPDATE":
+            trajectory_id = f"t{rng.randrange(8)}"
+            details = {"trajectory_id": trajectory_id, "trajectory_after": _trajectory(trajectory_id, rng.random())}
+        elif kind == "PATH_ABANDONMENT":
+            details = {"path_key": ["communicate", f"chat-{rng.randrange(8)}"], "path_status_after": {
+                "failure_count": rng.randrange(5), "last_outcome": "failure",
+                "abandonment_level": "soft", "last_updated": NOW.isoformat(),
+            }}
+        elif kind == "REBINDING":
+            details = {
+                "source_trajectory_after": _trajectory(f"t{rng.randrange(8)}", 0.1),
+                "target_trajectory_after": _trajectory(f"t{rng.randrange(8)}", 0.9),
+            }
+        else:
+            details = {"note": i}
+        events.append(StrategicEvent(UUID(int=i + 1), NOW, kind, details, CONTEXT))
+    return events
+
+
+def _initial() -> StrategicStateBundle:
+    return StrategicStateBundle(
+        posture=StrategicPosture([], 0.5, 0.5, 1.0, StrategicMode.BALANCED),
+        memory=StrategicMemory(),
+        trajectory_memory=StrategicTrajectoryMemory(),
+        version="1.1"
+    )
+
+
+def _baseline_reduce(bundle: StrategicStateBundle, event: StrategicEvent) -> StrategicStateBundle:
+    """
+    The per-event reducers as they were before copy-on-write replay: every event builds a
+    new bundle and copies the dict it changes.
+    """
+    details = event.details
+    posture = bundle.posture
+    memory = bundle.memory
+    trajectory_memory = bundle.trajectory_memory
+    if event.event_type in ("STRATEGY_ADAPTATION", "HORIZON_SHIFT"):
+        posture = StrategicPosture.from_dict(details["posture_after"])
+    elif event.event_type == "TRAJECTORY_UPDATE":
+        trajectories = trajectory_memory.trajectories.copy()
+        trajectories[details["trajectory_id"]] = StrategicTrajectory.from_dict(details["trajectory_after"])
+        trajectory_memory = StrategicTrajectoryMemory(trajectories)
+    elif event.event_type == "PATH_ABANDONMENT":
+        paths = memory.paths.copy()
+        paths[tuple(details["path_key"])] = PathStatus.from_dict(details["path_status_after"])
+        memory = StrategicMemory(paths)
+    elif event.event_type == "REBINDING":
+        trajectories = trajectory_memory.trajectories.copy()
+        for key in ("source_trajectory_after", "target_trajectory_after"):
+            trajectory = StrategicTrajectory.from_dict(details[key])
+            trajectories[trajectory.id] = trajectory
+        trajectory_memory = StrategicTrajectoryMemory(trajectories)
+    return StrategicStateBundle(
+        posture=posture,
+        memory=memory,
+        trajectory_memory=trajectory_memory,
+        last_snapshot=bundle.last_snapshot,
+        last_event_id=event.id,
+        version=bundle.version
+    )
+
+
+def test_replay_and_reduce_match_the_baseline_reducers():
+    reducer = CompositeStrategicReducer()
+    engine = StrategicReplayEngine(InMemoryStrategicStateBackend(), InMemoryStrategicLedger(), FrozenTimeSource(NOW))
+    for seed in range(5):
+        events = _events(300, seed)
+
+        expected = _initial()
+        reduced = _initial()
+        for event in events:
+            expected = _baseline_reduce(expected, event)
+            reduced = reducer.reduce(reduced, event)
+
+        for actual in (engine.replay(CONTEXT, _initial(), events), reduced):
+            assert actual == expected
+            # Insertion order matters for serialized snapshots.
+            assert list(actual.memory.paths.items()) == list(expected.memory.paths.items())
+            assert list(actual.trajectory_memory.trajectories.items()) == \
+                   list(expected.trajectory_memory.trajectories.items())
+
+
+def test_replay_never_mutates_the_input_bundle():
+    engine = StrategicReplayEngine(InMemoryStrategicStateBackend(), InMemoryStrategicLedger(), FrozenTimeSource(NOW))
+    events = _events(100, seed=7)
+    base = engine.replay(CONTEXT, _initial(), events[:50])
+    paths_before = dict(base.memory.paths)
+    trajectories_before = dict(base.trajectory_memory.trajectories)
+
+    engine.replay(CONTEXT, base, events[50:])
+
+    assert base.memory.paths == paths_before
+    assert base.trajectory_memory.trajectories == trajectories_before
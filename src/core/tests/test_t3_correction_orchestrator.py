@@ -64,7 +64,7 @@ class RecordingLifeLoop:
         self.last_memories = None
         self.last_human = None
 
-    def tick(self, human, signals, strategic_context, tick_count, last_executed_intent=None):
+    def tick(self, human, signals, strategic_context, tick_count, last_executed_intent=None, rng=None):
         self.last_memories = list(signals.memories)
         self.last_human = human
         return InternalContext(
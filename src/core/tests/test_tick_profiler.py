@@ -0,0 +1,113 @@
+from src.core.domain.strategic_context import StrategicContext
+from src.core.ledger.in_memory_ledger import InMemoryStrategicLedger
+import threading
+
+from src.core.observability.tick_profiler import (
+    EVICTED_SCOPE, HistogramTickProfiler, LatencyHistogram, TICK_SCOPE
+)
+from src.core.orchestration.strategic_orchestrator import StrategicOrchestrator
+from src.core.persistence.in_memory_backend import InMemoryStrategicStateBackend
+from src.core.time.frozen_time_source import FrozenTimeSource
+from src.core.tests.test_parallel_tick import NOW, _human, _orchestrator, _signals
+
+
+def test_latency_histogram_percentiles_are_bucket_bounded():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.add(ms / 1000.0)
+
+    assert histogram.count == 100
+    assert 0.050 <= histogram.quantile(0.50) <= 0.050 * 1.1
+    assert 0.095 <= histogram.quantile(0.95) <= 0.095 * 1.1
+    assert histogram.quantile(0.99) <= histogram.max == 0.1
+    # Only the buckets that were hit are stored
+    assert len(histogram.counts) < 60
+
+
+def test_profiler_times_orchestrator_and_lifeloop_stages_per_context():
+    exports = []
+    profiler = HistogramTickProfiler(exporter=exports.append, export_every_ticks=2, sample_rate=1.0)
+    orchestrator = StrategicOrchestrator(
+        time_source=FrozenTimeSource(NOW),
+        ledger=InMemoryStrategicLedger(),
+        backend=InMemoryStrategicStateBackend(),
+        tick_profiler=profiler,
+    )
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(3)]
+    for context in contexts:
+        orchestrator.register_context(context, _human())
+
+    for _ in range(2):
+        for _ in range(2):
+            orchestrator.tick(_human(), _signals())
+        # Exports run in the background; wait for each before the next is due
+        profiler.close()
+
+    latencies = {(l.context_key, l.stage): l for l in profiler.snapshot()}
+    for stage in ("routing", "memory", "evaluate", "learning", "budget_persist"):
+        assert latencies[(TICK_SCOPE, stage)].count == 4
+    for context in contexts:
+        for stage in ("lifeloop", "lifeloop.impulses", "lifeloop.strategy_filter"):
+            latency = latencies[(str(context), stage)]
+            assert latency.count == 4
+            assert latency.p50_ms <= latency.p95_ms <= latency.p99_ms <= latency.max_ms
+
+    assert len(exports) == 2
+    totals = {l.stage: l for l in profiler.stage_totals()}
+    assert totals["lifeloop"].count == 12
+
+
+def test_profiler_samples_whole_ticks_and_merges_worker_threads():
+    contexts = [StrategicContext("global", None, None, f"chat-{i}") for i in range(8)]
+    orchestrator, _, _ = _orchestrator(contexts, tick_workers=4)
+    profiler = HistogramTickProfiler(sample_rate=0.5, seed=1)
+    orchestrator.tick_profiler = profiler
+
+    for _ in range(40):
+        orchestrator.tick(_human(), _signals())
+    orchestrator.shutdown()
+
+    latencies = {(l.context_key, l.stage): l for l in profiler.snapshot()}
+    sampled = latencies[(TICK_SCOPE, "routing")].count
+    assert 0 < sampled < 40
+    for context in contexts:
+        assert latencies[(str(context), "lifeloop")].count == sampled
+
+    profiler.reset()
+    assert profiler.snapshot() == []
+
+
+def test_per_context_histograms_are_bounded_and_evictions_keep_totals():
+    profiler = HistogramTickProfiler(sample_rate=1.0, max_contexts=2)
+    for tick in range(3):
+        for i in range(5):
+            mark = profiler.clock()
+            profiler.lap(f"chat-{i}", "lifeloop", mark)
+            profiler.lap(f"chat-{i}", "memory", mark)
+
+    latencies = {(l.context_key, l.stage): l for l in profiler.snapshot()}
+    assert {key for key, _ in latencies} == {"chat-3", "chat-4", EVICTED_SCOPE}
+    # Cycling through more contexts than fit evicts each one before it comes round again
+    assert latencies[("chat-4", "lifeloop")].count == 1
+    assert latencies[(EVICTED_SCOPE, "lifeloop")].count == 13
+    totals = {l.stage: l.count for l in profiler.stage_totals()}
+    assert totals == {"lifeloop": 15, "memory": 15}
+
+
+def test_exports_run_off_the_tick_and_skip_while_one_is_pending():
+    release = threading.Event()
+    exports = []
+
+    def slow_exporter(latencies):
+        release.wait(5)
+        exports.append(latencies)
+
+    profiler = HistogramTickProfiler(exporter=slow_exporter, export_every_ticks=1, sample_rate=1.0)
+    profiler.lap("chat-0", "lifeloop", profiler.clock())
+    for _ in range(3):
+        profiler.tick_completed()  # returns at once; the later two find the export pending
+    assert exports == []
+
+    release.set()
+    profiler.close()
+    assert len(exports) == 1 and exports[0][0].context_key == "chat-0"
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from src.execution.domain.execution_job import DlqState
+
+
+class SettlementAction(Enum):
+    ACK = "ack"
+    RELEASE = "release"
+    DLQ = "dlq"
+
+
+@dataclass(frozen=True)
+class JobSettlement:
+    """
+    Outcome of one leased job, applied by ExecutionQueue.settle() together with others.
+    """
+    job_id: UUID
+    action: SettlementAction
+    available_at: Optional[datetime] = None
+    reason: Optional[str] = None
+    decrement_attempt: bool = False
+    dlq_state: Optional[DlqState] = None
+
+    @classmethod
+    def ack(cls, job_id: UUID) -> "JobSettlement":
+        return cls(job_id=job_id, action=SettlementAction.ACK)
+
+    @classmethod
+    def release(
+        cls,
+        job_id: UUID,
+        available_at: datetime,
+        reason: str,
+        decrement_attempt: bool = False,
+    ) -> "JobSettlement":
+        return cls(
+            job_id=job_id,
+            action=SettlementAction.RELEASE,
+            available_at=available_at,
+            reason=reason,
+            decrement_attempt=decrement_attempt,
+        )
+
+    @classmethod
+    def dlq(cls, job_id: UUID, state: DlqState, reason: str) -> "JobSettlement":
+        return cls(job_id=job_id, action=SettlementAction.DLQ, reason=reason, dlq_state=state)
@@ -1,10 +1,14 @@
+import heapq
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from threading import Lock
-from typing import Dict, List, Optional
+from threading import Condition, Lock
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from src.execution.domain.execution_job import DlqState, ExecutionJob, ExecutionJobState
+from src.execution.domain.job_settlement import JobSettlement, SettlementAction
 
 
 class ExecutionQueue(ABC):
@@ -67,12 +71,80 @@ class ExecutionQueue(ABC):
     def depth_by_context(self) -> Dict[str, int]:
         pass
 
+    def depth_for_context(self, context_domain: str) -> int:
+        return self.depth_by_context().get(context_domain, 0)
+
+    def settle(self, worker_id: str, settlements: Sequence[JobSettlement]) -> Dict[UUID, bool]:
+        """
+        Applies many ack/release/DLQ outcomes at once; returns whether each job was settled.
+        Only the first settlement of a job in the batch can succeed.
+        """
+        outcomes: Dict[UUID, bool] = {}
+        for settlement in settlements:
+            if settlement.job_id in outcomes:
+                continue
+            if settlement.action == SettlementAction.ACK:
+                settled = self.ack_success(settlement.job_id, worker_id)
+            elif settlement.action == SettlementAction.RELEASE:
+                settled = self.release(
+                    settlement.job_id,
+                    worker_id,
+                    available_at=settlement.available_at,
+                    reason=settlement.reason,
+                    decrement_attempt=settlement.decrement_attempt,
+                )
+            else:
+                settled = self.move_to_dlq(settlement.job_id, worker_id, settlement.dlq_state, settlement.reason)
+            outcomes[settlement.job_id] = settled
+        return outcomes
+
+    def supports_wakeups(self) -> bool:
+        """
+        True when wait_for_jobs() is woken as jobs become available, so workers may poll rarely.
+        """
+        return False
+
+    def wait_for_jobs(self, timeout: float) -> bool:
+        """
+        Blocks until jobs may be ready to lease, wake_waiters() is called, or timeout seconds pass.
+        Returns False on timeout. Queues without wakeups just sleep.
+        """
+        time.sleep(timeout)
+        return False
+
+    def wake_waiters(self) -> None:
+        pass
+
 
 class InMemoryExecutionQueue(ExecutionQueue):
-    def __init__(self):
-        self._jobs: Dict[UUID, ExecutionJob] = {}
+    """
+    Queued depth is kept as counters, total and per context.
+    Live jobs are indexed by heaps: delayed jobs by available_at, ready jobs by
+    (-priority, created_at), leases by lease_until. Heap entries are invalidated lazily.
+    Completed jobs and settled DLQ jobs move to a retention area holding the most recent
+    terminal_retention of them; evicted jobs are forgotten, intent de-duplication included.
+    DLQ jobs awaiting manual action are kept until replayed or resolved.
+    Waiting workers are woken as jobs are queued and when the earliest delayed job is due.
+    """
+
+    def __init__(self, terminal_retention: int = 10000):
+        if terminal_retention < 0:
+            raise ValueError("terminal_retention must be >= 0")
+        self.terminal_retention = terminal_retention
+        self._jobs: Dict[UUID, ExecutionJob] = {}  # queued and leased
+        self._dlq: Dict[UUID, ExecutionJob] = {}  # awaiting manual action
+        self._retained: "OrderedDict[UUID, ExecutionJob]" = OrderedDict()
         self._intent_index: Dict[UUID, UUID] = {}
+        self._delayed: List[Tuple[datetime, int, UUID]] = []
+        self._ready: List[Tuple[float, datetime, int, UUID]] = []
+        self._leases: List[Tuple[datetime, UUID]] = []
+        self._leased: Dict[UUID, datetime] = {}  # leased job -> its current lease_until
+        self._queued_seq: Dict[UUID, int] = {}  # queued job -> its current heap entry
+        self._queued_by_context: Dict[str, int] = {}
+        self._seq = 0
+        self._wake_generation = 0
         self._lock = Lock()
+        self._work = Condition(self._lock)
 
     def enqueue(self, job: ExecutionJob) -> UUID:
         with self._lock:
@@ -81,48 +153,44 @@ class InMemoryExecutionQueue(ExecutionQueue):
                 return existing
             self._jobs[job.id] = job
             self._intent_index[job.intent.id] = job.id
+            self._push_queued(job)
             return job.id
 
     def lease(self, worker_id: str, batch: int, visibility_timeout: timedelta) -> List[ExecutionJob]:
         now = datetime.now(timezone.utc)
         leased: List[ExecutionJob] = []
         with self._lock:
-            candidates = [
-                job
-                for job in self._jobs.values()
-                if job.state == ExecutionJobState.QUEUED and job.available_at <= now
-            ]
-            candidates.sort(key=lambda j: (-j.priority, j.created_at))
-            for job in candidates[:batch]:
+            self._promote_due(now)
+            while self._ready and len(leased) < batch:
+                _, _, seq, job_id = heapq.heappop(self._ready)
+                if self._queued_seq.get(job_id) != seq:
+                    continue
+                del self._queued_seq[job_id]
+                job = self._jobs[job_id]
+                self._count_queued(job.context_domain, -1)
                 job.state = ExecutionJobState.LEASED
                 job.leased_by = worker_id
                 job.lease_until = now + visibility_timeout
                 job.attempt_count += 1
                 job.updated_at = now
+                self._push_lease(job)
                 leased.append(job)
         return leased
 
     def heartbeat(self, job_id: UUID, worker_id: str, visibility_timeout: timedelta) -> bool:
         now = datetime.now(timezone.utc)
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job or job.state != ExecutionJobState.LEASED or job.leased_by != worker_id:
+            job = self._leased_job(job_id, worker_id)
+            if not job:
                 return False
             job.lease_until = now + visibility_timeout
             job.updated_at = now
+            self._push_lease(job)
             return True
 
     def ack_success(self, job_id: UUID, worker_id: str) -> bool:
-        now = datetime.now(timezone.utc)
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job or job.state != ExecutionJobState.LEASED or job.leased_by != worker_id:
-                return False
-            job.state = ExecutionJobState.COMPLETED
-            job.leased_by = None
-            job.lease_until = None
-            job.updated_at = now
-            return True
+            return self._settle_one(JobSettlement.ack(job_id), worker_id, datetime.now(timezone.utc))
 
     def release(
         self,
@@ -132,79 +200,64 @@ class InMemoryExecutionQueue(ExecutionQueue):
         reason: str,
         decrement_attempt: bool = False,
     ) -> bool:
-        now = datetime.now(timezone.utc)
+        settlement = JobSettlement.release(job_id, available_at, reason, decrement_attempt=decrement_attempt)
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job or job.state != ExecutionJobState.LEASED or job.leased_by != worker_id:
-                return False
-            job.state = ExecutionJobState.QUEUED
-            job.leased_by = None
-            job.lease_until = None
-            job.available_at = available_at
-            job.last_error = reason
-            if decrement_attempt and job.attempt_count > 0:
-                job.attempt_count -= 1
-            job.updated_at = now
-            return True
+            return self._settle_one(settlement, worker_id, datetime.now(timezone.utc))
 
     def move_to_dlq(self, job_id: UUID, worker_id: str, state: DlqState, reason: str) -> bool:
+        with self._lock:
+            return self._settle_one(JobSettlement.dlq(job_id, state, reason), worker_id, datetime.now(timezone.utc))
+
+    def settle(self, worker_id: str, settlements: Sequence[JobSettlement]) -> Dict[UUID, bool]:
         now = datetime.now(timezone.utc)
+        outcomes: Dict[UUID, bool] = {}
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job or job.state != ExecutionJobState.LEASED or job.leased_by != worker_id:
-                return False
-            job.state = ExecutionJobState.DLQ
-            job.dlq_state = state
-            job.last_error = reason
-            job.leased_by = None
-            job.lease_until = None
-            job.updated_at = now
-            return True
+            for settlement in settlements:
+                if settlement.job_id not in outcomes:
+                    outcomes[settlement.job_id] = self._settle_one(settlement, worker_id, now)
+        return outcomes
 
     def reclaim_expired(self) -> int:
         now = datetime.now(timezone.utc)
         reclaimed = 0
         with self._lock:
-            for job in self._jobs.values():
-                if (
-                    job.state == ExecutionJobState.LEASED
-                    and job.lease_until is not None
-                    and job.lease_until < now
-                ):
-                    job.state = ExecutionJobState.QUEUED
-                    job.leased_by = None
-                    job.lease_until = None
-                    job.available_at = now
-                    job.updated_at = now
-                    reclaimed += 1
+            while self._leases and self._leases[0][0] < now:
+                lease_until, job_id = heapq.heappop(self._leases)
+                job = self._jobs.get(job_id)
+                if not job or job.state != ExecutionJobState.LEASED or job.lease_until != lease_until:
+                    continue
+                del self._leased[job_id]
+                job.state = ExecutionJobState.QUEUED
+                job.leased_by = None
+                job.lease_until = None
+                job.available_at = now
+                job.updated_at = now
+                self._push_queued(job)
+                reclaimed += 1
         return reclaimed
 
     def get(self, job_id: UUID) -> Optional[ExecutionJob]:
         with self._lock:
-            return self._jobs.get(job_id)
+            return self._find(job_id)
 
     def list_dlq(self, limit: int = 100) -> List[ExecutionJob]:
         with self._lock:
-            items = [j for j in self._jobs.values() if j.state == ExecutionJobState.DLQ]
-            items.sort(key=lambda j: j.updated_at, reverse=True)
-            return items[:limit]
+            items = list(self._dlq.values())
+            items.extend(j for j in self._retained.values() if j.state == ExecutionJobState.DLQ)
+            return heapq.nlargest(limit, items, key=lambda j: j.updated_at)
 
     def replay_dlq(self, job_id: UUID, actor: str) -> Optional[ExecutionJob]:
         now = datetime.now(timezone.utc)
         with self._lock:
-            original = self._jobs.get(job_id)
+            original = self._find(job_id)
             if not original or original.state != ExecutionJobState.DLQ:
                 return None
-            existing_id = self._intent_index.get(original.intent.id)
-            if existing_id and existing_id in self._jobs:
-                existing_job = self._jobs[existing_id]
-                if existing_job.id != original.id and existing_job.state in (
-                    ExecutionJobState.QUEUED,
-                    ExecutionJobState.LEASED,
-                ):
-                    return existing_job
+            existing_job = self._jobs.get(self._intent_index.get(original.intent.id))
+            if existing_job and existing_job.id != original.id:
+                return existing_job
             original.dlq_state = DlqState.REPLAYED
             original.updated_at = now
+            self._retire(original)
 
             replay_job = ExecutionJob.new(
                 intent=original.intent,
@@ -218,6 +271,7 @@ class InMemoryExecutionQueue(ExecutionQueue):
             replay_job.last_error = f"Replayed by {actor}"
             self._jobs[replay_job.id] = replay_job
             self._intent_index[replay_job.intent.id] = replay_job.id
+            self._push_queued(replay_job)
             return replay_job
 
     def resolve_dlq(self, job_id: UUID, actor: str, state: DlqState) -> bool:
@@ -225,23 +279,131 @@ class InMemoryExecutionQueue(ExecutionQueue):
         if state not in (DlqState.TERMINAL, DlqState.RESOLVED):
             return False
         with self._lock:
-            job = self._jobs.get(job_id)
+            job = self._find(job_id)
             if not job or job.state != ExecutionJobState.DLQ:
                 return False
             job.dlq_state = state
             job.updated_at = now
             job.last_error = f"{state.value} by {actor}"
+            self._retire(job)
             return True
 
     def depth(self) -> int:
         with self._lock:
-            return len([j for j in self._jobs.values() if j.state == ExecutionJobState.QUEUED])
+            return len(self._queued_seq)
 
     def depth_by_context(self) -> Dict[str, int]:
-        out: Dict[str, int] = {}
         with self._lock:
-            for job in self._jobs.values():
-                if job.state != ExecutionJobState.QUEUED:
-                    continue
-                out[job.context_domain] = out.get(job.context_domain, 0) + 1
-        return out
+            return dict(self._queued_by_context)
+
+    def depth_for_context(self, context_domain: str) -> int:
+        with self._lock:
+            return self._queued_by_context.get(context_domain, 0)
+
+    def supports_wakeups(self) -> bool:
+        return True
+
+    def wait_for_jobs(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._work:
+            generation = self._wake_generation
+            while True:
+                now = datetime.now(timezone.utc)
+                self._promote_due(now)
+                if self._has_ready() or self._wake_generation != generation:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if self._delayed:
+                    remaining = min(remaining, (self._delayed[0][0] - now).total_seconds())
+                self._work.wait(remaining)
+
+    def wake_waiters(self) -> None:
+        with self._work:
+            self._wake_generation += 1
+            self._work.notify_all()
+
+    def _find(self, job_id: UUID) -> Optional[ExecutionJob]:
+        return self._jobs.get(job_id) or self._dlq.get(job_id) or self._retained.get(job_id)
+
+    def _leased_job(self, job_id: UUID, worker_id: str) -> Optional[ExecutionJob]:
+        job = self._jobs.get(job_id)
+        if not job or job.state != ExecutionJobState.LEASED or job.leased_by != worker_id:
+            return None
+        return job
+
+    def _settle_one(self, settlement: JobSettlement, worker_id: str, now: datetime) -> bool:
+        job = self._leased_job(settlement.job_id, worker_id)
+        if not job:
+            return False
+        del self._leased[job.id]
+        job.leased_by = None
+        job.lease_until = None
+        job.updated_at = now
+        if settlement.action == SettlementAction.ACK:
+            job.state = ExecutionJobState.COMPLETED
+            self._retire(job)
+        elif settlement.action == SettlementAction.RELEASE:
+            job.state = ExecutionJobState.QUEUED
+            job.available_at = settlement.available_at
+            job.last_error = settlement.reason
+            if settlement.decrement_attempt and job.attempt_count > 0:
+                job.attempt_count -= 1
+            self._push_queued(job)
+        else:
+            job.state = ExecutionJobState.DLQ
+            job.dlq_state = settlement.dlq_state
+            job.last_error = settlement.reason
+            if settlement.dlq_state == DlqState.AWAITING_MANUAL_ACTION:
+                del self._jobs[job.id]
+                self._dlq[job.id] = job
+            else:
+                self._retire(job)
+        return True
+
+    def _push_queued(self, job: ExecutionJob) -> None:
+        self._seq += 1
+        self._queued_seq[job.id] = self._seq
+        self._count_queued(job.context_domain, 1)
+        heapq.heappush(self._delayed, (job.available_at, self._seq, job.id))
+        self._work.notify_all()
+
+    def _count_queued(self, context_domain: str, delta: int) -> None:
+        count = self._queued_by_context.get(context_domain, 0) + delta
+        if count:
+            self._queued_by_context[context_domain] = count
+        else:
+            self._queued_by_context.pop(context_domain, None)
+
+    def _promote_due(self, now: datetime) -> None:
+        while self._delayed and self._delayed[0][0] <= now:
+            _, seq, job_id = heapq.heappop(self._delayed)
+            if self._queued_seq.get(job_id) != seq:
+                continue
+            job = self._jobs[job_id]
+            heapq.heappush(self._ready, (-job.priority, job.created_at, seq, job_id))
+
+    def _has_ready(self) -> bool:
+        while self._ready and self._queued_seq.get(self._ready[0][3]) != self._ready[0][2]:
+            heapq.heappop(self._ready)
+        return bool(self._ready)
+
+    def _push_lease(self, job: ExecutionJob) -> None:
+        self._leased[job.id] = job.lease_until
+        heapq.heappush(self._leases, (job.lease_until, job.id))
+        # Acked and heartbeated leases leave stale entries behind; rebuild from the live leases
+        # (not the backlog) once they dominate
+        if len(self._leases) > 2 * len(self._leased) + 64:
+            self._leases = [(lease_until, job_id) for job_id, lease_until in self._leased.items()]
+            heapq.heapify(self._leases)
+
+    def _retire(self, job: ExecutionJob) -> None:
+        self._jobs.pop(job.id, None)
+        self._dlq.pop(job.id, None)
+        self._retained.pop(job.id, None)
+        self._retained[job.id] = job
+        while len(self._retained) > self.terminal_retention:
+            _, evicted = self._retained.popitem(last=False)
+            if self._intent_index.get(evicted.intent.id) == evicted.id:
+                del self._intent_index[evicted.intent.id]
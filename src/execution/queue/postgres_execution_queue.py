@@ -1,25 +1,174 @@
+import heapq
+import inspect
 import json
+import select
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 from src.execution.domain.execution_job import DlqState, ExecutionJob, ExecutionJobState
+from src.execution.domain.job_settlement import JobSettlement, SettlementAction
 from src.execution.queue.execution_queue import ExecutionQueue
 from src.execution.serialization import deserialize_intent, serialize_intent
 
 
+READY_CHANNEL = "execution_jobs_ready"
+# Counter rows per context in execution_queue_depth; each backend updates the slot of its pid
+DEPTH_SLOTS = 16
+
+
+class _ReadyJobListener:
+    """
+    LISTENs on READY_CHANNEL from a dedicated connection in a daemon thread and wakes local
+    waiters. Each notification carries the job's available_at (epoch seconds), so waiters
+    also wake when a delayed job falls due. Reconnects after connection errors; a driver
+    that cannot wait for notifications with a timeout marks it unsupported, and workers poll.
+    """
+
+    def __init__(self, engine: Engine, reconnect_seconds: float = 5.0):
+        self.engine = engine
+        self.reconnect_seconds = reconnect_seconds
+        self.sequence = 0  # bumped on every wakeup
+        self.connected = False
+        self.unsupported = False
+        self._due: List[float] = []
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="execution-jobs-listener", daemon=True)
+        self._thread.start()
+
+    def wait(self, seen: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self.sequence == seen:
+                while self._due and self._due[0] <= time.time():
+                    heapq.heappop(self._due)
+                    self.sequence += 1
+                if self.sequence != seen:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if self._due:
+                    remaining = min(remaining, self._due[0] - time.time())
+                self._cond.wait(remaining)
+            return True
+
+    def wake(self) -> None:
+        with self._cond:
+            self.sequence += 1
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.wake()
+
+    def _announce(self, payload: str) -> None:
+        with self._cond:
+            try:
+                due = float(payload)
+            except ValueError:
+                due = 0.0
+            if due > time.time():
+                heapq.heappush(self._due, due)
+            else:
+                self.sequence += 1
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            raw = None
+            try:
+                raw = self.engine.raw_connection()
+                dbapi = raw.driver_connection
+                dbapi.autocommit = True
+                cursor = dbapi.cursor()
+                cursor.execute(f"LISTEN {READY_CHANNEL}")
+                cursor.close()
+                self.connected = True
+                # Jobs queued while disconnected were never announced
+                self.wake()
+                while not self._stopped.is_set():
+                    for payload in self._receive(dbapi, timeout=1.0):
+                        self._announce(payload)
+            except NotImplementedError:
+                self.unsupported = True
+                return
+            except Exception:
+                self._stopped.wait(self.reconnect_seconds)
+            finally:
+                self.connected = False
+                if raw is not None:
+                    try:
+                        raw.invalidate()
+                    except Exception:
+                        pass
+
+    @staticmethod
+    def _receive(dbapi, timeout: float) -> Iterator[str]:
+        if hasattr(dbapi, "poll"):  # psycopg2
+            if select.select([dbapi], [], [], timeout)[0]:
+                dbapi.poll()
+                while dbapi.notifies:
+                    yield dbapi.notifies.pop(0).payload
+        elif _accepts_timeout(getattr(dbapi, "notifies", None)):  # psycopg 3.2+
+            for notify in dbapi.notifies(timeout=timeout):
+                yield notify.payload
+        else:
+            # psycopg 3.0/3.1 notifies() blocks until a notification arrives, so stop() could
+            # never interrupt it
+            raise NotImplementedError(f"LISTEN is not supported by {type(dbapi).__module__}")
+
+
+def _accepts_timeout(method) -> bool:
+    if not callable(method):
+        return False
+    try:
+        return "timeout" in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 class PostgresExecutionQueue(ExecutionQueue):
-    def __init__(self, engine: Engine):
+    """
+    Queued depth per context is kept in execution_queue_depth by statement-level triggers on
+    execution_jobs, so depth reads never scan jobs and a lease batch touches each context's
+    counter once. A context's counter is striped over DEPTH_SLOTS rows, picked by backend,
+    so concurrent workers leasing from one context do not queue on a single row lock.
+    With depth_staleness_seconds > 0, depth reads are served from a local snapshot
+    refreshed at most that often.
+
+    Another trigger NOTIFYs READY_CHANNEL whenever a job is queued. With listen_for_wakeups,
+    wait_for_jobs() blocks on those notifications; while the listener is down, workers poll.
+    """
+
+    def __init__(self, engine: Engine, depth_staleness_seconds: float = 0.0, listen_for_wakeups: bool = True):
+        if depth_staleness_seconds < 0:
+            raise ValueError("depth_staleness_seconds must be >= 0")
         self.engine = engine
+        self.depth_staleness_seconds = depth_staleness_seconds
+        self.listen_for_wakeups = listen_for_wakeups
+        self._depth_snapshot: Optional[Tuple[float, Dict[str, int]]] = None
+        self._depth_lock = threading.Lock()
+        self._listener: Optional[_ReadyJobListener] = None
+        self._listener_lock = threading.Lock()
+        self._wakeup_seen = threading.local()  # listener sequence at this thread's last lease
         self.ensure_schema()
 
     @classmethod
-    def from_dsn(cls, dsn: str) -> "PostgresExecutionQueue":
+    def from_dsn(
+            cls,
+            dsn: str,
+            depth_staleness_seconds: float = 0.0,
+            listen_for_wakeups: bool = True
+    ) -> "PostgresExecutionQueue":
         engine = create_engine(dsn, pool_pre_ping=True, future=True)
-        return cls(engine)
+        return cls(engine, depth_staleness_seconds=depth_staleness_seconds, listen_for_wakeups=listen_for_wakeups)
 
     def ensure_schema(self) -> None:
         with self.engine.begin() as conn:
@@ -66,6 +215,149 @@ class PostgresExecutionQueue(ExecutionQueue):
                     """
                 )
             )
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS execution_queue_depth (
+                        context_domain TEXT NOT NULL,
+                        slot SMALLINT NOT NULL DEFAULT 0,
+                        queued BIGINT NOT NULL DEFAULT 0,
+                        PRIMARY KEY (context_domain, slot)
+                    )
+                    """
+                )
+            )
+            # Tables created with one counter row per context keep their counts in slot 0
+            conn.execute(
+                text(
+                    """
+                    DO $$
+                    BEGIN
+                        IF NOT EXISTS (
+                            SELECT 1 FROM information_schema.columns
+                            WHERE table_name = 'execution_queue_depth' AND column_name = 'slot'
+                        ) THEN
+                            ALTER TABLE execution_queue_depth ADD COLUMN slot SMALLINT NOT NULL DEFAULT 0;
+                            ALTER TABLE execution_queue_depth DROP CONSTRAINT execution_queue_depth_pkey;
+                            ALTER TABLE execution_queue_depth ADD PRIMARY KEY (context_domain, slot);
+                        END IF;
+                    END
+                    $$
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    f"""
+                    CREATE OR REPLACE FUNCTION execution_jobs_track_depth() RETURNS trigger AS $$
+                    DECLARE
+                        depth_slot SMALLINT := mod(pg_backend_pid(), {DEPTH_SLOTS});
+                    BEGIN
+                        -- One net delta per context per statement, applied in context_domain
+                        -- order so concurrent multi-context statements cannot deadlock. Each
+                        -- backend adds to its own slot of a context, so concurrent transactions
+                        -- rarely wait on one another's counter row; reads sum the slots.
+                        IF TG_OP = 'INSERT' THEN
+                            INSERT INTO execution_queue_depth (context_domain, slot, queued)
+                            SELECT context_domain, depth_slot, COUNT(*) FROM new_jobs
+                            WHERE state = 'queued'
+                            GROUP BY context_domain
+                            ORDER BY context_domain
+                            ON CONFLICT (context_domain, slot)
+                            DO UPDATE SET queued = execution_queue_depth.queued + EXCLUDED.queued;
+                        ELSIF TG_OP = 'DELETE' THEN
+                            INSERT INTO execution_queue_depth (context_domain, slot, queued)
+                            SELECT context_domain, depth_slot, -COUNT(*) FROM old_jobs
+                            WHERE state = 'queued'
+                            GROUP BY context_domain
+                            ORDER BY context_domain
+                            ON CONFLICT (context_domain, slot)
+                            DO UPDATE SET queued = execution_queue_depth.queued + EXCLUDED.queued;
+                        ELSE
+                            INSERT INTO execution_queue_depth (context_domain, slot, queued)
+                            SELECT context_domain, depth_slot, SUM(delta) FROM (
+                                SELECT context_domain, 1 AS delta FROM new_jobs WHERE state = 'queued'
+                                UNION ALL
+                                SELECT context_domain, -1 AS delta FROM old_jobs WHERE state = 'queued'
+                            ) changes
+                            GROUP BY context_domain
+                            HAVING SUM(delta) <> 0
+                            ORDER BY context_domain
+                            ON CONFLICT (context_domain, slot)
+                            DO UPDATE SET queued = execution_queue_depth.queued + EXCLUDED.queued;
+                        END IF;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+            )
+            # Statement-level triggers with transition tables need one trigger per event. They
+            # replace the former row-level trg_execution_jobs_depth, which updated a shared
+            # counter row per job. Installing them locks out writers, so the backfill matches
+            # the jobs table.
+            conn.execute(
+                text(
+                    """
+                    DO $$
+                    BEGIN
+                        IF NOT EXISTS (
+                            SELECT 1 FROM pg_trigger WHERE tgname = 'trg_execution_jobs_depth_update'
+                        ) THEN
+                            DROP TRIGGER IF EXISTS trg_execution_jobs_depth ON execution_jobs;
+                            CREATE TRIGGER trg_execution_jobs_depth_insert
+                            AFTER INSERT ON execution_jobs
+                            REFERENCING NEW TABLE AS new_jobs
+                            FOR EACH STATEMENT EXECUTE PROCEDURE execution_jobs_track_depth();
+                            CREATE TRIGGER trg_execution_jobs_depth_update
+                            AFTER UPDATE ON execution_jobs
+                            REFERENCING OLD TABLE AS old_jobs NEW TABLE AS new_jobs
+                            FOR EACH STATEMENT EXECUTE PROCEDURE execution_jobs_track_depth();
+                            CREATE TRIGGER trg_execution_jobs_depth_delete
+                            AFTER DELETE ON execution_jobs
+                            REFERENCING OLD TABLE AS old_jobs
+                            FOR EACH STATEMENT EXECUTE PROCEDURE execution_jobs_track_depth();
+                            DELETE FROM execution_queue_depth;
+                            INSERT INTO execution_queue_depth (context_domain, queued)
+                            SELECT context_domain, COUNT(*) FROM execution_jobs
+                            WHERE state = 'queued'
+                            GROUP BY context_domain;
+                        END IF;
+                    END
+                    $$
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    f"""
+                    CREATE OR REPLACE FUNCTION execution_jobs_notify_ready() RETURNS trigger AS $$
+                    BEGIN
+                        PERFORM pg_notify('{READY_CHANNEL}', extract(epoch FROM NEW.available_at)::text);
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    DO $$
+                    BEGIN
+                        IF NOT EXISTS (
+                            SELECT 1 FROM pg_trigger WHERE tgname = 'trg_execution_jobs_ready'
+                        ) THEN
+                            CREATE TRIGGER trg_execution_jobs_ready
+                            AFTER INSERT OR UPDATE OF state, available_at ON execution_jobs
+                            FOR EACH ROW WHEN (NEW.state = 'queued')
+                            EXECUTE PROCEDURE execution_jobs_notify_ready();
+                        END IF;
+                    END
+                    $$
+                    """
+                )
+            )
             conn.execute(
                 text(
                     """
@@ -129,7 +421,8 @@ class PostgresExecutionQueue(ExecutionQueue):
                         state, priority, available_at, created_at, updated_at,
                         attempt_count, max_attempts, job_version, parent_job_id
                     ) VALUES (
-                        :id, :intent_id, :intent_json::jsonb, :context_domain, :reservation_delta::jsonb,
+                        :id, :intent_id, CAST(:intent_json AS jsonb), :context_domain,
+                        CAST(:reservation_delta AS jsonb),
                         :state, :priority, :available_at, :created_at, :updated_at,
                         :attempt_count, :max_attempts, :job_version, :parent_job_id
                     )
@@ -155,6 +448,8 @@ class PostgresExecutionQueue(ExecutionQueue):
             return job.id
 
     def lease(self, worker_id: str, batch: int, visibility_timeout: timedelta) -> List[ExecutionJob]:
+        if self._listener is not None:
+            self._wakeup_seen.sequence = self._listener.sequence
         with self.engine.begin() as conn:
             rows = conn.execute(
                 text(
@@ -276,6 +571,108 @@ class PostgresExecutionQueue(ExecutionQueue):
                 self._record_dlq_event(conn, job_id, state.value, worker_id, {"reason": reason})
             return bool(count)
 
+    def settle(self, worker_id: str, settlements: Sequence[JobSettlement]) -> Dict[UUID, bool]:
+        first: Dict[UUID, JobSettlement] = {}
+        for settlement in settlements:
+            first.setdefault(settlement.job_id, settlement)
+        by_action: Dict[SettlementAction, List[JobSettlement]] = {action: [] for action in SettlementAction}
+        for settlement in first.values():
+            by_action[settlement.action].append(settlement)
+
+        settled = set()
+        with self.engine.begin() as conn:
+            acks = by_action[SettlementAction.ACK]
+            if acks:
+                rows = conn.execute(
+                    text(
+                        """
+                        UPDATE execution_jobs
+                        SET state='completed',
+                            leased_by=NULL,
+                            lease_until=NULL,
+                            updated_at=now()
+                        WHERE id = ANY(CAST(:job_ids AS uuid[])) AND state='leased' AND leased_by=:worker_id
+                        RETURNING id
+                        """
+                    ),
+                    {"job_ids": [s.job_id for s in acks], "worker_id": worker_id},
+                ).fetchall()
+                settled.update(UUID(str(row.id)) for row in rows)
+
+            releases = by_action[SettlementAction.RELEASE]
+            if releases:
+                rows = conn.execute(
+                    text(
+                        """
+                        UPDATE execution_jobs j
+                        SET state='queued',
+                            leased_by=NULL,
+                            lease_until=NULL,
+                            available_at=s.available_at,
+                            last_error=s.reason,
+                            updated_at=now(),
+                            attempt_count=CASE WHEN s.decrement THEN GREATEST(j.attempt_count-1,0)
+                                               ELSE j.attempt_count END
+                        FROM unnest(
+                            CAST(:job_ids AS uuid[]),
+                            CAST(:available_ats AS timestamptz[]),
+                            CAST(:reasons AS text[]),
+                            CAST(:decrements AS boolean[])
+                        ) AS s(id, available_at, reason, decrement)
+                        WHERE j.id = s.id AND j.state='leased' AND j.leased_by=:worker_id
+                        RETURNING j.id
+                        """
+                    ),
+                    {
+                        "job_ids": [s.job_id for s in releases],
+                        "available_ats": [s.available_at for s in releases],
+                        "reasons": [s.reason for s in releases],
+                        "decrements": [s.decrement_attempt for s in releases],
+                        "worker_id": worker_id,
+                    },
+                ).fetchall()
+                settled.update(UUID(str(row.id)) for row in rows)
+
+            dead = by_action[SettlementAction.DLQ]
+            if dead:
+                rows = conn.execute(
+                    text(
+                        """
+                        UPDATE execution_jobs j
+                        SET state='dlq',
+                            dlq_state=s.dlq_state,
+                            leased_by=NULL,
+                            lease_until=NULL,
+                            last_error=s.reason,
+                            updated_at=now()
+                        FROM unnest(
+                            CAST(:job_ids AS uuid[]), CAST(:dlq_states AS text[]), CAST(:reasons AS text[])
+                        )
+                            AS s(id, dlq_state, reason)
+                        WHERE j.id = s.id AND j.state='leased' AND j.leased_by=:worker_id
+                        RETURNING j.id
+                        """
+                    ),
+                    {
+                        "job_ids": [s.job_id for s in dead],
+                        "dlq_states": [s.dlq_state.value for s in dead],
+                        "reasons": [s.reason for s in dead],
+                        "worker_id": worker_id,
+                    },
+                ).fetchall()
+                moved = {UUID(str(row.id)) for row in rows}
+                settled.update(moved)
+                for settlement in dead:
+                    if settlement.job_id in moved:
+                        self._record_dlq_event(
+                            conn,
+                            settlement.job_id,
+                            settlement.dlq_state.value,
+                            worker_id,
+                            {"reason": settlement.reason},
+                        )
+        return {job_id: job_id in settled for job_id in first}
+
     def reclaim_expired(self) -> int:
         with self.engine.begin() as conn:
             count = conn.execute(
@@ -372,7 +769,8 @@ class PostgresExecutionQueue(ExecutionQueue):
                         state, priority, available_at, created_at, updated_at,
                         attempt_count, max_attempts, job_version, parent_job_id, last_error
                     ) VALUES (
-                        :id, :intent_id, :intent_json::jsonb, :context_domain, :reservation_delta::jsonb,
+                        :id, :intent_id, CAST(:intent_json AS jsonb), :context_domain,
+                        CAST(:reservation_delta AS jsonb),
                         :state, :priority, :available_at, :created_at, :updated_at,
                         :attempt_count, :max_attempts, :job_version, :parent_job_id, :last_error
                     )
@@ -417,35 +815,86 @@ class PostgresExecutionQueue(ExecutionQueue):
             return bool(count)
 
     def depth(self) -> int:
+        if self.depth_staleness_seconds > 0:
+            return sum(self._cached_depths().values())
         with self.engine.begin() as conn:
             value = conn.execute(
-                text("SELECT COUNT(*) FROM execution_jobs WHERE state='queued'")
+                text("SELECT COALESCE(SUM(queued), 0) FROM execution_queue_depth")
             ).scalar_one()
             return int(value)
 
     def depth_by_context(self) -> Dict[str, int]:
-        out: Dict[str, int] = {}
+        if self.depth_staleness_seconds > 0:
+            return dict(self._cached_depths())
+        return self._read_depths()
+
+    def depth_for_context(self, context_domain: str) -> int:
+        if self.depth_staleness_seconds > 0:
+            return self._cached_depths().get(context_domain, 0)
+        with self.engine.begin() as conn:
+            value = conn.execute(
+                text("SELECT SUM(queued) FROM execution_queue_depth WHERE context_domain=:context_domain"),
+                {"context_domain": context_domain},
+            ).scalar()
+            return int(value or 0)
+
+    def supports_wakeups(self) -> bool:
+        listener = self._ensure_listener()
+        return listener is not None and listener.connected
+
+    def wait_for_jobs(self, timeout: float) -> bool:
+        listener = self._ensure_listener()
+        if listener is None or not listener.connected:
+            return super().wait_for_jobs(timeout)
+        seen = getattr(self._wakeup_seen, "sequence", listener.sequence)
+        return listener.wait(seen, timeout)
+
+    def wake_waiters(self) -> None:
+        if self._listener is not None:
+            self._listener.wake()
+
+    def close(self) -> None:
+        with self._listener_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+
+    def _ensure_listener(self) -> Optional[_ReadyJobListener]:
+        if not self.listen_for_wakeups:
+            return None
+        with self._listener_lock:
+            if self._listener is None:
+                self._listener = _ReadyJobListener(self.engine)
+            elif self._listener.unsupported:
+                return None
+            return self._listener
+
+    def _read_depths(self) -> Dict[str, int]:
         with self.engine.begin() as conn:
             rows = conn.execute(
                 text(
                     """
-                    SELECT context_domain, COUNT(*) AS cnt
-                    FROM execution_jobs
-                    WHERE state='queued'
+                    SELECT context_domain, SUM(queued) AS queued FROM execution_queue_depth
                     GROUP BY context_domain
+                    HAVING SUM(queued) > 0
                     """
                 )
             ).fetchall()
-            for row in rows:
-                out[row.context_domain] = int(row.cnt)
-        return out
+        return {row.context_domain: int(row.queued) for row in rows}
+
+    def _cached_depths(self) -> Dict[str, int]:
+        with self._depth_lock:
+            now = time.monotonic()
+            if self._depth_snapshot is None or now - self._depth_snapshot[0] >= self.depth_staleness_seconds:
+                self._depth_snapshot = (now, self._read_depths())
+            return self._depth_snapshot[1]
 
     def _record_dlq_event(self, conn, job_id: UUID, event_type: str, actor: str, payload: Dict) -> None:
         conn.execute(
             text(
                 """
                 INSERT INTO execution_dlq_events (id, job_id, event_type, actor, created_at, payload)
-                VALUES (:id, :job_id, :event_type, :actor, :created_at, :payload::jsonb)
+                VALUES (:id, :job_id, :event_type, :actor, :created_at, CAST(:payload AS jsonb))
                 """
             ),
             {
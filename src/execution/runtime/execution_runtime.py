@@ -32,6 +32,8 @@ class ExecutionRuntimeConfig:
     worker_count: int = 1
     worker_batch_size: int = 10
     worker_poll_interval_seconds: float = 0.2
+    worker_idle_poll_interval_seconds: float = 5.0
+    worker_max_in_flight: int = 1
     worker_visibility_timeout_seconds: int = 30
     worker_stale_in_progress_seconds: int = 120
     dispatcher_batch_size: int = 50
@@ -106,6 +108,8 @@ class ExecutionRuntime:
                     worker_id=f"worker-{idx + 1}",
                     batch_size=self.config.worker_batch_size,
                     poll_interval_seconds=self.config.worker_poll_interval_seconds,
+                    idle_poll_interval_seconds=self.config.worker_idle_poll_interval_seconds,
+                    max_in_flight=self.config.worker_max_in_flight,
                     visibility_timeout_seconds=self.config.worker_visibility_timeout_seconds,
                     stale_in_progress_seconds=self.config.worker_stale_in_progress_seconds,
                 ),
@@ -1,6 +1,11 @@
+import threading
+import time
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+import pytest
+
 from src.core.domain.execution_intent import ExecutionIntent
 from src.core.domain.execution_result import ExecutionFailureType
 from src.core.domain.resource import ResourceCost
@@ -100,8 +105,8 @@ def test_environment_failure_retries_then_moves_to_dlq():
     assert job.state == ExecutionJobState.QUEUED
     assert job.attempt_count == 1
 
-    # Force immediate retry for deterministic test.
-    job.available_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    # Wait out the retry delay (floored at 100ms); the queue indexes available_at, so it is not edited in place.
+    time.sleep(0.15)
 
     assert worker.run_once() == 1
     job = queue.get(job_id)
@@ -124,3 +129,142 @@ def test_dlq_replay_creates_versioned_job():
     assert replay.job_version == 2
     assert replay.parent_job_id == job_id
     assert queue.get(job_id).dlq_state == DlqState.REPLAYED
+
+
+def test_idle_worker_is_woken_by_enqueue_and_stop():
+    queue = InMemoryExecutionQueue()
+    registry = ExecutionAdapterRegistry()
+    registry.register("telegram", SuccessTelegramAdapter())
+    worker = ExecutionWorker(
+        config=ExecutionWorkerConfig(worker_id="w1", idle_poll_interval_seconds=30.0),
+        queue=queue,
+        inbox=InMemoryExecutionResultInbox(),
+        adapter_registry=registry,
+    )
+    thread = threading.Thread(target=worker.run_forever, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+
+    job_id = queue.enqueue(ExecutionJob.new(_intent(), "telegram:chat-1", {}))
+    deadline = time.monotonic() + 2.0
+    while queue.get(job_id).state != ExecutionJobState.COMPLETED and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert queue.get(job_id).state == ExecutionJobState.COMPLETED
+
+    worker.stop()
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+
+class CountingQueue(InMemoryExecutionQueue):
+    def __init__(self):
+        super().__init__()
+        self.calls = {"lease": 0, "depth": 0, "settle": 0, "single": 0, "heartbeat": 0}
+
+    def lease(self, worker_id, batch, visibility_timeout):
+        self.calls["lease"] += 1
+        return super().lease(worker_id, batch, visibility_timeout)
+
+    def depth(self):
+        self.calls["depth"] += 1
+        return super().depth()
+
+    def settle(self, worker_id, settlements):
+        self.calls["settle"] += 1
+        return super().settle(worker_id, settlements)
+
+    def ack_success(self, job_id, worker_id):
+        self.calls["single"] += 1
+        return super().ack_success(job_id, worker_id)
+
+    def heartbeat(self, job_id, worker_id, visibility_timeout):
+        self.calls["heartbeat"] += 1
+        return super().heartbeat(job_id, worker_id, visibility_timeout)
+
+
+def test_worker_settles_each_leased_batch_in_one_call():
+    queue = CountingQueue()
+    inbox = InMemoryExecutionResultInbox()
+    registry = ExecutionAdapterRegistry()
+    registry.register("telegram", SuccessTelegramAdapter())
+    job_ids = [queue.enqueue(ExecutionJob.new(_intent(), "telegram:chat-1", {})) for _ in range(20)]
+
+    worker = ExecutionWorker(
+        config=ExecutionWorkerConfig(worker_id="w1", batch_size=10),
+        queue=queue,
+        inbox=inbox,
+        adapter_registry=registry,
+    )
+    assert worker.run_once() == 10
+    assert worker.run_once() == 10
+
+    assert all(queue.get(job_id).state == ExecutionJobState.COMPLETED for job_id in job_ids)
+    # Every queue round trip, depth reads included, is per batch
+    assert queue.calls == {"lease": 2, "depth": 2, "settle": 2, "single": 0, "heartbeat": 0}
+    assert sum(queue.calls.values()) / len(job_ids) < 1
+    assert inbox.depth() == 20
+
+
+class SlowRecordingAdapter:
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def execute(self, intent):
+        started = time.monotonic()
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            self.calls.append((intent.constraints["target_id"], intent.constraints["text"], started, time.monotonic()))
+        return ResultNormalizer.success(effects=["message_sent"], costs={"api_calls": 1.0})
+
+
+def _chat_intent(target_id: str, text: str) -> ExecutionIntent:
+    return replace(_intent(), constraints={"platform": "telegram", "target_id": target_id, "text": text})
+
+
+def _run_batch(max_in_flight: int, jobs):
+    queue = InMemoryExecutionQueue()
+    adapter = SlowRecordingAdapter(latency_seconds=0.1)
+    registry = ExecutionAdapterRegistry()
+    registry.register("telegram", adapter)
+    for target_id, text in jobs:
+        queue.enqueue(ExecutionJob.new(_chat_intent(target_id, text), f"telegram:{target_id}", {}))
+    worker = ExecutionWorker(
+        config=ExecutionWorkerConfig(worker_id="w1", batch_size=len(jobs), max_in_flight=max_in_flight),
+        queue=queue,
+        inbox=InMemoryExecutionResultInbox(),
+        adapter_registry=registry,
+    )
+    started = time.monotonic()
+    assert worker.run_once() == len(jobs)
+    elapsed = time.monotonic() - started
+    worker.shutdown()
+    return elapsed, adapter.calls, queue
+
+
+def test_concurrent_worker_overlaps_chats_and_keeps_per_chat_order():
+    distinct_chats = [(f"chat-{i}", "hello") for i in range(8)]
+    serial_elapsed, _, _ = _run_batch(1, distinct_chats)
+    concurrent_elapsed, _, queue = _run_batch(8, distinct_chats)
+    assert serial_elapsed >= 0.8
+    assert concurrent_elapsed < 0.4
+    assert queue.depth() == 0 and len(queue._retained) == 8
+
+    # One chat stays serial and in lease order while another runs alongside it
+    mixed = [("chat-a", "a1"), ("chat-b", "b1"), ("chat-a", "a2"), ("chat-a", "a3"), ("chat-b", "b2")]
+    elapsed, calls, _ = _run_batch(4, mixed)
+    chat_a = [call for call in calls if call[0] == "chat-a"]
+    assert [text for _, text, _, _ in chat_a] == ["a1", "a2", "a3"]
+    assert all(earlier[3] <= later[2] for earlier, later in zip(chat_a, chat_a[1:]))
+    assert elapsed < 0.45
+
+
+def test_invalid_in_flight_limit_is_rejected():
+    with pytest.raises(ValueError):
+        ExecutionWorker(
+            config=ExecutionWorkerConfig(worker_id="w1", max_in_flight=0),
+            queue=InMemoryExecutionQueue(),
+            inbox=InMemoryExecutionResultInbox(),
+            adapter_registry=ExecutionAdapterRegistry(),
+        )
@@ -0,0 +1,200 @@
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.execution.domain.execution_job import DlqState, ExecutionJob, ExecutionJobState
+from src.execution.domain.job_settlement import JobSettlement
+from src.execution.queue.execution_queue import ExecutionQueue, InMemoryExecutionQueue
+from src.execution.tests.test_execution_runtime_pipeline import _intent
+
+LEASE = timedelta(seconds=30)
+
+
+def _job(priority: float = 0.0) -> ExecutionJob:
+    return ExecutionJob.new(_intent(), "telegram:chat-1", {}, priority=priority)
+
+
+def test_lease_orders_by_priority_then_age_and_skips_delayed_jobs():
+    queue = InMemoryExecutionQueue()
+    low = queue.enqueue(_job(priority=0.1))
+    high = queue.enqueue(_job(priority=0.9))
+    mid_old = queue.enqueue(_job(priority=0.5))
+    mid_new = queue.enqueue(_job(priority=0.5))
+    later = _job(priority=1.0)
+    later.available_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    queue.enqueue(later)
+
+    leased = queue.lease("w1", batch=10, visibility_timeout=LEASE)
+    assert [job.id for job in leased] == [high, mid_old, mid_new, low]
+    assert queue.depth() == 1
+
+    # A released job is leased again once it is due, ahead of lower priorities
+    assert queue.release(high, "w1", datetime.now(timezone.utc), "retry")
+    assert [job.id for job in queue.lease("w1", batch=10, visibility_timeout=LEASE)] == [high]
+    assert queue.get(high).attempt_count == 2
+
+
+def test_expired_leases_are_reclaimed_once():
+    queue = InMemoryExecutionQueue()
+    job_id = queue.enqueue(_job())
+    queue.lease("w1", batch=1, visibility_timeout=timedelta(seconds=-1))
+    assert queue.heartbeat(job_id, "w2", LEASE) is False
+
+    assert queue.reclaim_expired() == 1
+    assert queue.reclaim_expired() == 0
+    assert queue.get(job_id).state == ExecutionJobState.QUEUED
+    assert queue.ack_success(job_id, "w1") is False
+
+    [job] = queue.lease("w2", batch=1, visibility_timeout=LEASE)
+    assert queue.heartbeat(job_id, "w2", LEASE)
+    assert queue.reclaim_expired() == 0
+    assert queue.ack_success(job.id, "w2")
+
+
+def test_terminal_jobs_are_retained_up_to_the_limit():
+    queue = InMemoryExecutionQueue(terminal_retention=50)
+    awaiting = queue.enqueue(_job())
+    queue.lease("w1", batch=1, visibility_timeout=LEASE)
+    queue.move_to_dlq(awaiting, "w1", DlqState.AWAITING_MANUAL_ACTION, "manual")
+
+    job_ids = []
+    for _ in range(20):
+        job_ids.extend(queue.enqueue(_job()) for _ in range(100))
+        for job in queue.lease("w1", batch=100, visibility_timeout=LEASE):
+            assert queue.ack_success(job.id, "w1")
+
+    assert queue.get(job_ids[0]) is None
+    assert queue.get(job_ids[-1]).state == ExecutionJobState.COMPLETED
+    assert len(queue._retained) == 50 and len(queue._intent_index) == 51
+    assert not queue._jobs and not queue._ready and not queue._delayed
+    # Stale lease entries are compacted; at most one batch of leases is left behind
+    assert len(queue._leases) <= 2 * 100 + 64
+    # DLQ jobs awaiting an operator are never evicted
+    assert [job.id for job in queue.list_dlq()] == [awaiting]
+
+    assert queue.resolve_dlq(awaiting, "operator", DlqState.RESOLVED)
+    assert queue.get(awaiting).dlq_state == DlqState.RESOLVED
+    assert len(queue._retained) == 50 and not queue._dlq
+
+
+class _ScanCountingDict(dict):
+    scans = 0
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+
+def test_stale_lease_entries_are_compacted_without_scanning_the_backlog():
+    queue = InMemoryExecutionQueue()
+    for _ in range(2000):
+        queue.enqueue(_job())
+    queue._jobs = _ScanCountingDict(queue._jobs)
+
+    for _ in range(500):
+        [job] = queue.lease("w1", batch=1, visibility_timeout=LEASE)
+        assert queue.heartbeat(job.id, "w1", LEASE)
+        assert queue.ack_success(job.id, "w1")
+
+    assert queue._jobs.scans == 0
+    assert queue.depth() == 1500 and not queue._leased
+    assert len(queue._leases) <= 64
+
+
+def test_depth_counters_follow_every_transition():
+    queue = InMemoryExecutionQueue(terminal_retention=5)
+    rng = random.Random(7)
+    contexts = ["telegram:chat-1", "telegram:chat-2", "slack:ops"]
+
+    def scanned():
+        out = {}
+        for job in queue._jobs.values():
+            if job.state == ExecutionJobState.QUEUED:
+                out[job.context_domain] = out.get(job.context_domain, 0) + 1
+        return out
+
+    for _ in range(300):
+        queue.enqueue(ExecutionJob.new(_intent(), rng.choice(contexts), {}))
+        for job in queue.lease("w1", batch=rng.randint(0, 2), visibility_timeout=LEASE):
+            action = rng.choice(["ack", "release", "dlq", "expire"])
+            if action == "ack":
+                queue.ack_success(job.id, "w1")
+            elif action == "release":
+                queue.release(job.id, "w1", datetime.now(timezone.utc), "retry")
+            elif action == "dlq":
+                queue.move_to_dlq(job.id, "w1", DlqState.AWAITING_MANUAL_ACTION, "manual")
+                queue.replay_dlq(job.id, "operator")
+            else:
+                queue.heartbeat(job.id, "w1", timedelta(seconds=-1))
+                queue.reclaim_expired()
+        expected = scanned()
+        assert queue.depth_by_context() == expected
+        assert queue.depth() == sum(expected.values())
+        assert all(queue.depth_for_context(c) == expected.get(c, 0) for c in contexts)
+
+
+def _wait_in_thread(queue, timeout):
+    outcome = {}
+
+    def wait():
+        started = time.monotonic()
+        outcome["woken"] = queue.wait_for_jobs(timeout)
+        outcome["elapsed"] = time.monotonic() - started
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.05)
+    return thread, outcome
+
+
+def test_waiters_wake_on_enqueue_due_jobs_and_explicit_wake():
+    queue = InMemoryExecutionQueue()
+    assert queue.wait_for_jobs(0.01) is False
+
+    thread, outcome = _wait_in_thread(queue, timeout=5.0)
+    queue.enqueue(_job())
+    thread.join(timeout=1.0)
+    assert outcome["woken"] and outcome["elapsed"] < 1.0
+    # Ready jobs do not block at all
+    assert queue.wait_for_jobs(5.0) is True
+
+    queue.lease("w1", batch=1, visibility_timeout=LEASE)
+    delayed = _job()
+    delayed.available_at = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+    queue.enqueue(delayed)
+    started = time.monotonic()
+    assert queue.wait_for_jobs(5.0) is True
+    assert 0.1 < time.monotonic() - started < 1.0
+
+    queue.lease("w1", batch=1, visibility_timeout=LEASE)
+    thread, outcome = _wait_in_thread(queue, timeout=5.0)
+    queue.wake_waiters()
+    thread.join(timeout=1.0)
+    assert outcome["woken"] and outcome["elapsed"] < 1.0
+
+
+def test_settle_applies_mixed_outcomes_and_reports_each_job():
+    for settle in (InMemoryExecutionQueue.settle, ExecutionQueue.settle):
+        queue = InMemoryExecutionQueue()
+        ids = [queue.enqueue(_job()) for _ in range(4)]
+        queue.lease("w1", batch=4, visibility_timeout=LEASE)
+        not_leased = queue.enqueue(_job())
+        retry_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        outcomes = settle(queue, "w1", [
+            JobSettlement.ack(ids[0]),
+            JobSettlement.release(ids[1], retry_at, "retry", decrement_attempt=True),
+            JobSettlement.dlq(ids[2], DlqState.AWAITING_MANUAL_ACTION, "manual"),
+            JobSettlement.ack(ids[1]),  # only the first settlement of a job applies
+            JobSettlement.ack(not_leased),
+        ])
+
+        assert outcomes == {ids[0]: True, ids[1]: True, ids[2]: True, not_leased: False}
+        assert queue.get(ids[0]).state == ExecutionJobState.COMPLETED
+        released = queue.get(ids[1])
+        assert released.state == ExecutionJobState.QUEUED and released.available_at == retry_at
+        assert released.attempt_count == 0 and released.last_error == "retry"
+        assert [job.id for job in queue.list_dlq()] == [ids[2]]
+        assert queue.settle("w2", [JobSettlement.ack(ids[3])]) == {ids[3]: False}
+        assert queue.get(ids[3]).state == ExecutionJobState.LEASED
@@ -0,0 +1,232 @@
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from src.execution.domain.execution_job import DlqState, ExecutionJob
+from src.execution.domain.job_settlement import JobSettlement
+from src.execution.queue.postgres_execution_queue import PostgresExecutionQueue, _ReadyJobListener
+from src.execution.serialization import serialize_intent
+from src.execution.tests.test_execution_runtime_pipeline import _intent
+from src.execution.tests.test_in_memory_execution_queue import LEASE
+
+CONTEXTS = ["telegram:chat-1", "telegram:chat-2", "slack:ops", "slack:alerts"]
+
+
+@pytest.fixture
+def postgres_queue():
+    dsn = os.getenv("EXECUTION_QUEUE_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("EXECUTION_QUEUE_POSTGRES_DSN is not set")
+    queue = PostgresExecutionQueue.from_dsn(dsn, listen_for_wakeups=False)
+    with queue.engine.begin() as conn:
+        conn.execute(text("TRUNCATE execution_jobs, execution_queue_depth, execution_dlq_events"))
+    yield queue
+    queue.close()
+    queue.engine.dispose()
+
+
+def _scanned_depths(queue):
+    with queue.engine.begin() as conn:
+        rows = conn.execute(
+            text("SELECT context_domain, COUNT(*) AS n FROM execution_jobs WHERE state='queued' GROUP BY 1")
+        ).fetchall()
+    return {row.context_domain: int(row.n) for row in rows}
+
+
+def test_concurrent_leases_over_mixed_contexts_keep_depth_exact(postgres_queue):
+    queue = postgres_queue
+    job_ids = [queue.enqueue(ExecutionJob.new(_intent(), CONTEXTS[i % 4], {})) for i in range(400)]
+    assert queue.depth_by_context() == _scanned_depths(queue) == {c: 100 for c in CONTEXTS}
+
+    barrier = threading.Barrier(2)
+    leased = {"w1": [], "w2": []}
+    errors = []
+
+    def work(worker_id):
+        try:
+            barrier.wait()
+            while True:
+                jobs = queue.lease(worker_id, batch=7, visibility_timeout=LEASE)
+                if not jobs:
+                    return
+                leased[worker_id].extend(job.id for job in jobs)
+                # Hand every third job back, so both workers keep crossing contexts
+                for job in jobs[::3]:
+                    if job.attempt_count < 3:
+                        queue.release(job.id, worker_id, datetime.now(timezone.utc), "retry")
+        except Exception as exc:  # a deadlock surfaces here
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(worker_id,)) for worker_id in leased]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert errors == []
+    assert set(leased["w1"]) | set(leased["w2"]) == set(job_ids)
+    assert queue.depth() == 0 and queue.depth_by_context() == _scanned_depths(queue) == {}
+
+
+class _RecordingConnection:
+    def __init__(self, statements, rows):
+        self.statements = statements
+        self.rows = rows
+
+    def execute(self, statement, params=None):
+        self.statements.append((statement, params or {}))
+        job_ids = (params or {}).get("job_ids", [])
+        return SimpleNamespace(
+            fetchall=lambda: [SimpleNamespace(id=job_id) for job_id in job_ids],
+            first=lambda: self.rows.pop(0) if self.rows else None,
+            rowcount=0,
+        )
+
+
+class _RecordingEngine:
+    def __init__(self):
+        self.statements = []
+        self.rows = []  # returned by first(), in order
+
+    @contextmanager
+    def begin(self):
+        yield _RecordingConnection(self.statements, self.rows)
+
+
+def _assert_bound(statements):
+    for statement, params in statements:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert set(compiled.params) == set(params)
+        assert not re.search(r"%\(\w+\)s::", str(compiled))
+
+
+def test_settle_statements_bind_every_parameter():
+    engine = _RecordingEngine()
+    queue = PostgresExecutionQueue(engine, listen_for_wakeups=False)
+    del engine.statements[:]
+    jobs = [uuid4() for _ in range(3)]
+    outcomes = queue.settle("w1", [
+        JobSettlement.ack(jobs[0]),
+        JobSettlement.release(jobs[1], datetime.now(timezone.utc), "retry", decrement_attempt=True),
+        JobSettlement.dlq(jobs[2], DlqState.AWAITING_MANUAL_ACTION, "manual"),
+    ])
+    assert outcomes == {job_id: True for job_id in jobs}
+
+    # ack, release, dlq and the dlq event
+    assert len(engine.statements) == 4
+    _assert_bound(engine.statements)
+
+
+def test_enqueue_and_replay_statements_bind_every_parameter():
+    engine = _RecordingEngine()
+    queue = PostgresExecutionQueue(engine, listen_for_wakeups=False)
+    del engine.statements[:]
+    job = ExecutionJob.new(_intent(), CONTEXTS[0], {"energy": -1.0})
+    assert queue.enqueue(job) == job.id
+
+    dead = ExecutionJob.new(_intent(), CONTEXTS[1], {"energy": -1.0})
+    engine.rows.append(SimpleNamespace(**{
+        **vars(dead),
+        "intent_json": serialize_intent(dead.intent),
+        "state": "dlq",
+        "dlq_state": DlqState.AWAITING_MANUAL_ACTION.value,
+    }))
+    replayed = queue.replay_dlq(dead.id, "operator")
+    assert replayed.parent_job_id == dead.id
+
+    inserts = [(s, p) for s, p in engine.statements if "INSERT INTO execution_jobs" in str(s)]
+    assert len(inserts) == 2
+    _assert_bound(engine.statements)
+
+
+class _Psycopg31Connection:
+    autocommit = False
+
+    def cursor(self):
+        return SimpleNamespace(execute=lambda statement: None, close=lambda: None)
+
+    def notifies(self):
+        yield SimpleNamespace(payload="0")
+
+
+class _Psycopg32Connection(_Psycopg31Connection):
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def notifies(self, timeout=None, stop_after=None):
+        for payload in self.payloads:
+            yield SimpleNamespace(payload=payload)
+
+
+class _Psycopg2Connection:
+    def __init__(self, payloads):
+        self.read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"x")
+        os.close(write_fd)
+        self.pending = [SimpleNamespace(payload=payload) for payload in payloads]
+        self.notifies = []
+
+    def fileno(self):
+        return self.read_fd
+
+    def poll(self):
+        self.notifies.extend(self.pending)
+        self.pending = []
+
+
+class _ListenerEngine:
+    def __init__(self, dbapi):
+        self.dbapi = dbapi
+        self.connects = 0
+
+    def raw_connection(self):
+        self.connects += 1
+        return SimpleNamespace(driver_connection=self.dbapi, invalidate=lambda: None)
+
+
+def test_listener_receives_from_psycopg2_and_timed_psycopg3_notifies():
+    psycopg2_connection = _Psycopg2Connection(["1.5", "2.5"])
+    assert list(_ReadyJobListener._receive(psycopg2_connection, timeout=1.0)) == ["1.5", "2.5"]
+    os.close(psycopg2_connection.read_fd)
+    assert list(_ReadyJobListener._receive(_Psycopg32Connection(["3.5"]), timeout=1.0)) == ["3.5"]
+
+
+def test_listener_without_timed_notifies_is_unsupported_instead_of_reconnecting():
+    with pytest.raises(NotImplementedError):
+        list(_ReadyJobListener._receive(_Psycopg31Connection(), timeout=1.0))
+
+    engine = _ListenerEngine(_Psycopg31Connection())
+    listener = _ReadyJobListener(engine, reconnect_seconds=0.01)
+    listener._thread.join(timeout=2.0)
+    assert not listener._thread.is_alive()
+    assert listener.unsupported and not listener.connected
+    # One connection and the wakeup it owed for jobs queued while it connected
+    assert engine.connects == 1 and listener.sequence == 1
+
+
+def test_listener_wait_wakes_on_due_and_delayed_announcements():
+    listener = _ReadyJobListener(_ListenerEngine(_Psycopg31Connection()))
+    listener._thread.join(timeout=2.0)
+
+    seen = listener.sequence
+    assert listener.wait(seen, timeout=0.05) is False
+    listener._announce("not-a-timestamp")
+    assert listener.wait(seen, timeout=0.0) is True and listener.sequence == seen + 1
+
+    # A job due later wakes waiters only once it falls due
+    seen = listener.sequence
+    listener._announce(str(time.time() + 0.1))
+    assert listener.sequence == seen
+    started = time.monotonic()
+    assert listener.wait(seen, timeout=2.0) is True
+    assert time.monotonic() - started >= 0.05
+    assert listener.sequence == seen + 1 and listener._due == []
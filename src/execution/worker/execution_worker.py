@@ -1,8 +1,8 @@
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from src.content.services.content_generation_service import ContentGenerationService
 from src.core.domain.execution_result import ExecutionFailureType, ExecutionResult, ExecutionStatus
@@ -12,6 +12,7 @@ from src.integration.registry import ExecutionAdapterRegistry
 from src.integration.normalizer import ResultNormalizer
 from src.execution.domain.execution_job import DlqState
 from src.execution.domain.execution_result_envelope import ExecutionResultEnvelope
+from src.execution.domain.job_settlement import JobSettlement
 from src.execution.idempotency.idempotency_store import (
     IdempotencyState,
     IdempotencyStore,
@@ -34,10 +35,13 @@ class ExecutionWorkerConfig:
     worker_id: str
     batch_size: int = 10
     poll_interval_seconds: float = 0.2
+    idle_poll_interval_seconds: float = 5.0  # fallback poll when the queue pushes wakeups
     visibility_timeout_seconds: int = 30
     lease_heartbeat_interval_seconds: int = 10
     stale_in_progress_seconds: int = 120
     reclaim_interval_seconds: float = 1.0
+    settle_in_batches: bool = True  # one queue.settle() per leased batch instead of one call per job
+    max_in_flight: int = 1  # leased jobs executed concurrently; jobs for one chat still run in order
 
 
 class ExecutionWorker:
@@ -74,18 +78,40 @@ class ExecutionWorker:
         self.adaptive_rate_controller = adaptive_rate_controller
         self.anomaly_hook = anomaly_hook or NoopAnomalyHook()
         self.structured_logger = structured_logger
+        if config.max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
 
+        self._pending_settlements: List[JobSettlement] = []
+        self._pending_lease_until: List[datetime] = []
+        self._settlement_lock = threading.Lock()
+        self._job_executor: Optional[ThreadPoolExecutor] = None
         self._stop_event = threading.Event()
         self._last_reclaim = datetime.now(timezone.utc)
 
     def run_forever(self) -> None:
         while not self._stop_event.is_set():
-            self.run_once()
-            time.sleep(self.config.poll_interval_seconds)
+            if self.run_once() < self.config.batch_size:
+                self._wait_for_jobs()
+        self.shutdown()
         self.heartbeat_store.beat(self.config.worker_id, status="stopped")
 
     def stop(self) -> None:
         self._stop_event.set()
+        self.queue.wake_waiters()
+
+    def shutdown(self) -> None:
+        """
+        Releases the in-flight job pool, if one was started.
+        """
+        if self._job_executor:
+            self._job_executor.shutdown(wait=True)
+            self._job_executor = None
+
+    def _wait_for_jobs(self) -> None:
+        if self.queue.supports_wakeups():
+            self.queue.wait_for_jobs(self.config.idle_poll_interval_seconds)
+        else:
+            self._stop_event.wait(self.config.poll_interval_seconds)
 
     def run_once(self) -> int:
         if self._stop_event.is_set():
@@ -104,21 +130,59 @@ class ExecutionWorker:
             visibility_timeout=timedelta(seconds=self.config.visibility_timeout_seconds),
         )
         processed = 0
-        for job in jobs:
-            self._handle_job(job)
-            processed += 1
+        # One depth read per leased batch; every job of the batch sees the same lag
+        queue_lag = float(self.queue.depth()) if jobs else 0.0
+        try:
+            if self.config.max_in_flight > 1 and len(jobs) > 1:
+                processed = self._handle_jobs_concurrently(jobs, queue_lag)
+            else:
+                processed = self._handle_jobs_in_order(jobs, queue_lag)
+        finally:
+            self._flush_settlements()
 
         if self.on_circuit_transition:
             for transition in self.circuit_breaker.drain_transitions():
                 self.on_circuit_transition(transition)
         return processed
 
-    def _handle_job(self, job) -> None:
-        now = datetime.now(timezone.utc)
+    def _handle_jobs_in_order(self, jobs, queue_lag: float) -> int:
+        processed = 0
+        for job in jobs:
+            self._flush_settlements_before_expiry()
+            self._handle_job(job, queue_lag)
+            processed += 1
+        return processed
+
+    def _handle_jobs_concurrently(self, jobs, queue_lag: float) -> int:
+        # Chats run in parallel; the jobs of one chat run in lease order on a single thread
+        by_chat: Dict[str, List[Any]] = {}
+        for job in jobs:
+            by_chat.setdefault(self._chat_key(job), []).append(job)
+        executor = self._get_job_executor()
+        futures = [
+            executor.submit(self._handle_jobs_in_order, chat_jobs, queue_lag) for chat_jobs in by_chat.values()
+        ]
+        wait(futures)
+        return sum(future.result() for future in futures)
+
+    def _get_job_executor(self) -> ThreadPoolExecutor:
+        if self._job_executor is None:
+            self._job_executor = ThreadPoolExecutor(
+                max_workers=self.config.max_in_flight,
+                thread_name_prefix=f"{self.config.worker_id}-job",
+            )
+        return self._job_executor
+
+    @staticmethod
+    def _chat_key(job) -> str:
         platform = str(job.intent.constraints.get("platform", "default"))
         target_id = str(job.intent.constraints.get("target_id", "unknown"))
-        chat_key = f"{platform}:{target_id}"
-        queue_lag = float(self.queue.depth()) if hasattr(self.queue, "depth") else 0.0
+        return f"{platform}:{target_id}"
+
+    def _handle_job(self, job, queue_lag: float) -> None:
+        now = datetime.now(timezone.utc)
+        platform = str(job.intent.constraints.get("platform", "default"))
+        chat_key = self._chat_key(job)
         self._log(
             "WORKER_JOB_START",
             worker_id=self.config.worker_id,
@@ -131,12 +195,14 @@ class ExecutionWorker:
         if self.adaptive_rate_controller:
             adaptive_delay = self.adaptive_rate_controller.pre_send_delay(platform, queue_lag=queue_lag)
             if adaptive_delay > 0:
-                self.queue.release(
-                    job.id,
-                    self.config.worker_id,
-                    available_at=now + timedelta(seconds=adaptive_delay),
-                    reason="Adaptive throttling",
-                    decrement_attempt=True,
+                self._settle(
+                    job,
+                    JobSettlement.release(
+                        job.id,
+                        available_at=now + timedelta(seconds=adaptive_delay),
+                        reason="Adaptive throttling",
+                        decrement_attempt=True,
+                    ),
                 )
                 self._log(
                     "WORKER_ADAPTIVE_THROTTLE",
@@ -149,12 +215,14 @@ class ExecutionWorker:
                 return
 
         if not self.circuit_breaker.allow(platform, now=now):
-            self.queue.release(
-                job.id,
-                self.config.worker_id,
-                available_at=now + timedelta(seconds=1),
-                reason="Circuit open",
-                decrement_attempt=True,
+            self._settle(
+                job,
+                JobSettlement.release(
+                    job.id,
+                    available_at=now + timedelta(seconds=1),
+                    reason="Circuit open",
+                    decrement_attempt=True,
+                ),
             )
             self._log(
                 "WORKER_CIRCUIT_OPEN",
@@ -168,12 +236,14 @@ class ExecutionWorker:
 
         allowed, retry_after = self.rate_limiter.allow(chat_key, now=now)
         if not allowed:
-            self.queue.release(
-                job.id,
-                self.config.worker_id,
-                available_at=now + timedelta(seconds=retry_after),
-                reason="Rate limited",
-                decrement_attempt=True,
+            self._settle(
+                job,
+                JobSettlement.release(
+                    job.id,
+                    available_at=now + timedelta(seconds=retry_after),
+                    reason="Rate limited",
+                    decrement_attempt=True,
+                ),
             )
             self._log(
                 "WORKER_RATE_LIMITED",
@@ -187,7 +257,7 @@ class ExecutionWorker:
 
         idem_state = self.idempotency_store.begin(job.intent.id)
         if idem_state == IdempotencyState.DONE:
-            self.queue.ack_success(job.id, self.config.worker_id)
+            self._settle(job, JobSettlement.ack(job.id))
             self._log(
                 "WORKER_IDEMPOTENT_DONE",
                 worker_id=self.config.worker_id,
@@ -204,11 +274,9 @@ class ExecutionWorker:
                     reason="Unknown execution outcome after stale in-progress lock",
                     failure_type=ExecutionFailureType.ENVIRONMENT,
                 )
-                self.queue.move_to_dlq(
-                    job.id,
-                    self.config.worker_id,
-                    state=DlqState.AWAITING_MANUAL_ACTION,
-                    reason=result.reason,
+                self._settle(
+                    job,
+                    JobSettlement.dlq(job.id, state=DlqState.AWAITING_MANUAL_ACTION, reason=result.reason),
                 )
                 self._publish_terminal_result(job, result)
                 self._log(
@@ -219,12 +287,14 @@ class ExecutionWorker:
                     context_domain=job.context_domain,
                 )
             else:
-                self.queue.release(
-                    job.id,
-                    self.config.worker_id,
-                    available_at=now + timedelta(seconds=1),
-                    reason="Execution already in progress",
-                    decrement_attempt=True,
+                self._settle(
+                    job,
+                    JobSettlement.release(
+                        job.id,
+                        available_at=now + timedelta(seconds=1),
+                        reason="Execution already in progress",
+                        decrement_attempt=True,
+                    ),
                 )
             return
 
@@ -274,11 +344,7 @@ class ExecutionWorker:
                 )
 
         try:
-            self.queue.heartbeat(
-                job.id,
-                self.config.worker_id,
-                visibility_timeout=timedelta(seconds=self.config.visibility_timeout_seconds),
-            )
+            self._extend_lease(job)
             result = self.adapter_registry.execute_safe(runtime_intent)
         except Exception as exc:
             result = ResultNormalizer.failure(
@@ -286,15 +352,11 @@ class ExecutionWorker:
                 failure_type=ExecutionFailureType.INTERNAL,
             )
         finally:
-            self.queue.heartbeat(
-                job.id,
-                self.config.worker_id,
-                visibility_timeout=timedelta(seconds=self.config.visibility_timeout_seconds),
-            )
+            self._extend_lease(job)
 
         if result.status == ExecutionStatus.SUCCESS:
             self.idempotency_store.complete(job.intent.id, metadata=result.observations)
-            self.queue.ack_success(job.id, self.config.worker_id)
+            self._settle(job, JobSettlement.ack(job.id))
             self.circuit_breaker.record_success(platform, now=now)
             if self.adaptive_rate_controller:
                 self.adaptive_rate_controller.record_result(platform, result)
@@ -317,11 +379,13 @@ class ExecutionWorker:
             if self.retry_scheduler.should_retry(job.attempt_count):
                 self.idempotency_store.clear_in_progress(job.intent.id)
                 retry_at = self.retry_scheduler.next_retry_at(job.attempt_count, now=now)
-                self.queue.release(
-                    job.id,
-                    self.config.worker_id,
-                    available_at=retry_at,
-                    reason=result.reason or "Environment failure",
+                self._settle(
+                    job,
+                    JobSettlement.release(
+                        job.id,
+                        available_at=retry_at,
+                        reason=result.reason or "Environment failure",
+                    ),
                 )
                 self._log(
                     "WORKER_JOB_RETRY",
@@ -335,11 +399,13 @@ class ExecutionWorker:
                 return
 
             self.idempotency_store.clear_in_progress(job.intent.id)
-            self.queue.move_to_dlq(
-                job.id,
-                self.config.worker_id,
-                state=DlqState.AWAITING_MANUAL_ACTION,
-                reason=result.reason or "Max retries exceeded",
+            self._settle(
+                job,
+                JobSettlement.dlq(
+                    job.id,
+                    state=DlqState.AWAITING_MANUAL_ACTION,
+                    reason=result.reason or "Max retries exceeded",
+                ),
             )
             self._log(
                 "WORKER_JOB_DLQ",
@@ -353,7 +419,7 @@ class ExecutionWorker:
             return
 
         self.idempotency_store.clear_in_progress(job.intent.id)
-        self.queue.ack_success(job.id, self.config.worker_id)
+        self._settle(job, JobSettlement.ack(job.id))
         if self.adaptive_rate_controller:
             self.adaptive_rate_controller.record_result(platform, result)
         self._emit_anomaly(result, job.context_domain)
@@ -367,6 +433,48 @@ class ExecutionWorker:
             reason=result.reason,
         )
 
+    def _settle(self, job, settlement: JobSettlement) -> None:
+        with self._settlement_lock:
+            self._pending_settlements.append(settlement)
+            if job.lease_until is not None:
+                self._pending_lease_until.append(job.lease_until)
+        if not self.config.settle_in_batches:
+            self._flush_settlements()
+
+    def _flush_settlements_before_expiry(self) -> None:
+        # Settled jobs stay leased until flushed; flush before any of those leases runs low
+        with self._settlement_lock:
+            if not self._pending_lease_until:
+                return
+            remaining = min(self._pending_lease_until) - datetime.now(timezone.utc)
+        if remaining.total_seconds() < self.config.lease_heartbeat_interval_seconds:
+            self._flush_settlements()
+
+    def _flush_settlements(self) -> None:
+        with self._settlement_lock:
+            if not self._pending_settlements:
+                return
+            settlements = self._pending_settlements
+            self._pending_settlements = []
+            self._pending_lease_until = []
+        outcomes = self.queue.settle(self.config.worker_id, settlements)
+        for job_id, settled in outcomes.items():
+            if not settled:
+                self._log("WORKER_SETTLEMENT_REJECTED", worker_id=self.config.worker_id, job_id=str(job_id))
+
+    def _extend_lease(self, job) -> None:
+        # Heartbeat only once the lease has aged past lease_heartbeat_interval_seconds
+        if job.lease_until is not None:
+            remaining = (job.lease_until - datetime.now(timezone.utc)).total_seconds()
+            threshold = self.config.visibility_timeout_seconds - self.config.lease_heartbeat_interval_seconds
+            if remaining > threshold:
+                return
+        self.queue.heartbeat(
+            job.id,
+            self.config.worker_id,
+            visibility_timeout=timedelta(seconds=self.config.visibility_timeout_seconds),
+        )
+
     def _publish_terminal_result(self, job, result: ExecutionResult) -> None:
         self.inbox.append(
             ExecutionResultEnvelope(
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Hashable, Optional, Tuple
 from src.admin.interfaces.governance_service import GovernanceService
 from src.governance.runtime.governance_runtime_context import RuntimeGovernanceContext
 
@@ -6,12 +6,23 @@ class GovernanceRuntimeProvider:
     """
     Provider that fetches active governance state and builds a runtime context.
     Ensures a consistent view of governance for a single execution cycle.
+    The built context is reused until the service reports a new revision.
     """
     def __init__(self, governance_service: GovernanceService):
         self.governance_service = governance_service
+        self._cached: Optional[Tuple[Hashable, RuntimeGovernanceContext]] = None
+
+    def revision(self) -> Optional[Hashable]:
+        return self.governance_service.revision()
 
     def get_context(self) -> RuntimeGovernanceContext:
+        revision = self.governance_service.revision()
+        cached = self._cached
+        if revision is not None and cached is not None and cached[0] == revision:
+            return cached[1]
         # Fetch all active decisions
-        # In a real system, this might be cached or optimized, but here we fetch fresh.
         decisions = self.governance_service.get_active_decisions()
-        return RuntimeGovernanceContext.build(decisions)
\ No newline at end of file
+        context = RuntimeGovernanceContext.build(decisions)
+        if revision is not None:
+            self._cached = (revision, context)
+        return context
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Hashable, Optional
 
 from src.autonomy.domain.autonomy_mode import AutonomyMode
 from src.core.domain.entity import AIHuman
@@ -43,6 +43,22 @@ class HierarchicalGovernanceResolver:
         self.projection_service = projection_service
         self.runtime_provider = runtime_provider
 
+    def revision(self) -> Optional[Hashable]:
+        """
+        Changes whenever a hierarchy directive, override or governance decision changes;
+        None if some source cannot tell. resolve() results may be reused while it holds.
+        """
+        projection_revision = self.projection_service.revision()
+        if projection_revision is None:
+            return None
+        if not self.runtime_provider:
+            return projection_revision, None
+        runtime_revision = getattr(self.runtime_provider, "revision", None)
+        runtime_revision = runtime_revision() if runtime_revision else None
+        if runtime_revision is None:
+            return None
+        return projection_revision, runtime_revision
+
     def resolve(self, context: StrategicContext, human: Optional[AIHuman] = None) -> ResolvedGovernanceSource:
         base = self.runtime_provider.get_context() if self.runtime_provider else _empty_context()
         effective = self.projection_service.resolve_for_context(context, human)
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Hashable, List
 
 from src.hierarchy.domain.hierarchy_models import (
     HierarchyDirective,
@@ -26,6 +26,16 @@ class HierarchyConfigLoader:
         payload = self._read_json()
         return self._parse(payload)
 
+    def revision(self) -> Hashable:
+        """
+        Changes when the config file is created, removed or rewritten.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            return None, None
+        return stat.st_mtime_ns, stat.st_size
+
     def _read_json(self) -> Dict[str, Any]:
         with self.config_path.open("r", encoding="utf-8") as f:
             return json.load(f)
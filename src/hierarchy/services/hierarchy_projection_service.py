@@ -1,6 +1,6 @@
 import fnmatch
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Hashable, List, Optional, Tuple
 
 from src.core.domain.entity import AIHuman
 from src.core.domain.strategic_context import StrategicContext
@@ -20,6 +20,7 @@ class EffectiveHierarchyView:
 class HierarchyProjectionService:
     """
     Builds effective hierarchy directives from config + runtime overrides.
+    The merged graph is rebuilt only when revision() changes.
     """
 
     def __init__(
@@ -29,8 +30,33 @@ class HierarchyProjectionService:
     ):
         self.config_loader = config_loader or HierarchyConfigLoader()
         self.override_store = override_store
+        self._cached_graph: Optional[Tuple[Hashable, HierarchyGraph]] = None
+
+    def revision(self) -> Optional[Hashable]:
+        """
+        Combined revision of the config and the override store; None if either cannot tell.
+        """
+        config_revision = getattr(self.config_loader, "revision", None)
+        if config_revision is None:
+            return None
+        if not self.override_store:
+            return config_revision(), None
+        override_revision = getattr(self.override_store, "revision", None)
+        if override_revision is None:
+            return None
+        return config_revision(), override_revision()
 
     def build_graph(self) -> HierarchyGraph:
+        revision = self.revision()
+        cached = self._cached_graph
+        if revision is not None and cached is not None and cached[0] == revision:
+            return cached[1]
+        graph = self._build_graph()
+        if revision is not None:
+            self._cached_graph = (revision, graph)
+        return graph
+
+    def _build_graph(self) -> HierarchyGraph:
         base_graph = self.config_loader.load()
         if not self.override_store:
             return base_graph
@@ -1,6 +1,6 @@
 import json
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Hashable, List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import create_engine, text
@@ -109,6 +109,24 @@ class PostgresHierarchyOverrideStore:
             ).fetchall()
         return [self._to_directive(row) for row in rows]
 
+    def revision(self) -> Hashable:
+        """
+        Changes whenever an override is created or deactivated, by any process.
+        """
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT count(*) AS total,
+                           count(*) FILTER (WHERE active) AS active,
+                           max(created_at) AS last_created,
+                           max(deactivated_at) AS last_deactivated
+                    FROM hierarchy_overrides
+                    """
+                )
+            ).first()
+        return row.total, row.active, row.last_created, row.last_deactivated
+
     def get(self, override_id: UUID) -> Optional[HierarchyDirective]:
         with self.engine.begin() as conn:
             row = conn.execute(
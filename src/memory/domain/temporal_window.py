@@ -3,6 +3,12 @@ from datetime import datetime, timedelta
 from src.memory.domain.event_record import EventRecord
 
 
+# Upper age bounds in seconds (hardcoded for M.2 determinism)
+IMMEDIATE_MAX_AGE_SECONDS = 60  # 1 minute
+RECENT_MAX_AGE_SECONDS = 3600  # 1 hour
+MID_TERM_MAX_AGE_SECONDS = 86400  # 24 hours
+
+
 class TemporalWindow(Enum):
     IMMEDIATE = "IMMEDIATE"  # Very recent (e.g., last few ticks)
     RECENT = "RECENT"  # Short term (e.g., minutes)
@@ -14,14 +20,18 @@ def classify_window(event: EventRecord, now: datetime) -> TemporalWindow:
     """
     Pure function to classify an event into a temporal window.
     """
-    age = (now - event.issued_at).total_seconds()
+    return classify_age((now - event.issued_at).total_seconds())
+
 
-    # Thresholds (configurable in a real system, hardcoded for M.2 determinism)
-    if age < 60:  # 1 minute
+def classify_age(age: float) -> TemporalWindow:
+    """
+    Classifies an event age in seconds. Shared by the per-event and batch analysis paths.
+    """
+    if age < IMMEDIATE_MAX_AGE_SECONDS:
         return TemporalWindow.IMMEDIATE
-    elif age < 3600:  # 1 hour
+    elif age < RECENT_MAX_AGE_SECONDS:
         return TemporalWindow.RECENT
-    elif age < 86400:  # 24 hours
+    elif age < MID_TERM_MAX_AGE_SECONDS:
         return TemporalWindow.MID_TERM
     else:
         return TemporalWindow.LONG_TERM
\ No newline at end of file
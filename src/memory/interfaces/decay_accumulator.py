@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class DecayAccumulator(ABC):
+    """
+    Running sum of coefficient * decay(age) over a set of terms.
+    Ages are relative to the accumulator's reference time; advance() moves that time forward
+    without revisiting the terms. Only terms with age >= 0 may be added.
+    """
+
+    @abstractmethod
+    def add(self, coefficient: float, age_seconds: float) -> Optional[float]:
+        """
+        Adds a term. Returns the age at which its closed form stops holding (and the sum
+        must be rebuilt), or None if it holds for any later age.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, coefficient: float, age_seconds: float) -> None:
+        """
+        Removes a term previously added, given its age at the current reference time.
+        """
+        pass
+
+    @abstractmethod
+    def advance(self, elapsed_seconds: float) -> None:
+        """
+        Moves the reference time forward; every term ages by elapsed_seconds.
+        """
+        pass
+
+    @abstractmethod
+    def value(self) -> float:
+        pass
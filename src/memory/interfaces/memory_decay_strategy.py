@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
+from typing import List, Optional
+from src.memory.interfaces.decay_accumulator import DecayAccumulator
 
 class MemoryDecayStrategy(ABC):
     """
@@ -11,4 +13,18 @@ class MemoryDecayStrategy(ABC):
         """
         Returns a float between 0.0 (forgotten) and 1.0 (fresh).
         """
-        pass
\ No newline at end of file
+        pass
+
+    def decay_many(self, ages_seconds: List[float]) -> List[float]:
+        """
+        Batch form of decay() over ages in seconds, same order.
+        Strategies should override with a closed form; this default delegates per age.
+        """
+        return [self.decay(timedelta(seconds=age)) for age in ages_seconds]
+
+    def accumulator(self) -> Optional[DecayAccumulator]:
+        """
+        Returns an empty DecayAccumulator for this strategy, or None if the decayed sum
+        has no incremental form and must be recomputed as time passes.
+        """
+        return None
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from src.memory.domain.event_record import EventRecord
+
+
+class MemoryStoreListener(ABC):
+    """
+    Interface for components that maintain derived views over a MemoryStore.
+    Notified synchronously on every store mutation.
+    """
+
+    @abstractmethod
+    def on_append(self, event: EventRecord) -> None:
+        """Called after a single event was appended."""
+        pass
+
+    @abstractmethod
+    def on_reset(self) -> None:
+        """Called after a bulk mutation (clear/extend); derived views must be rebuilt."""
+        pass
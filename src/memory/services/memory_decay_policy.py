@@ -1,5 +1,7 @@
 import math
 from datetime import timedelta
+from typing import List, Optional
+from src.memory.interfaces.decay_accumulator import DecayAccumulator
 from src.memory.interfaces.memory_decay_strategy import MemoryDecayStrategy
 
 class LinearDecay(MemoryDecayStrategy):
@@ -12,6 +14,13 @@ class LinearDecay(MemoryDecayStrategy):
             return 0.0
         return 1.0 - (age_seconds / self.max_age_seconds)
 
+    def decay_many(self, ages_seconds: List[float]) -> List[float]:
+        max_age = self.max_age_seconds
+        return [0.0 if age >= max_age else 1.0 - (age / max_age) for age in ages_seconds]
+
+    def accumulator(self) -> DecayAccumulator:
+        return LinearDecayAccumulator(self.max_age_seconds)
+
 class ExponentialDecay(MemoryDecayStrategy):
     def __init__(self, half_life_seconds: float):
         self.half_life_seconds = half_life_seconds
@@ -21,4 +30,66 @@ class ExponentialDecay(MemoryDecayStrategy):
         if age_seconds < 0:
             return 1.0
         # Formula: N(t) = N0 * (1/2)^(t / half_life)
-        return math.pow(0.5, age_seconds / self.half_life_seconds)
\ No newline at end of file
+        return math.pow(0.5, age_seconds / self.half_life_seconds)
+
+    def decay_many(self, ages_seconds: List[float]) -> List[float]:
+        half_life = self.half_life_seconds
+        pow_ = math.pow
+        return [1.0 if age < 0 else pow_(0.5, age / half_life) for age in ages_seconds]
+
+    def accumulator(self) -> DecayAccumulator:
+        return ExponentialDecayAccumulator(self.half_life_seconds)
+
+
+class LinearDecayAccumulator(DecayAccumulator):
+    """
+    sum(c * (1 - age / max_age)) over live terms, kept as sum(c) and sum(c * age).
+    A term stops contributing at max_age, so its closed form holds until then.
+    """
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._coefficients = 0.0
+        self._weighted_ages = 0.0
+
+    def add(self, coefficient: float, age_seconds: float) -> Optional[float]:
+        if age_seconds >= self.max_age_seconds:
+            return None
+        self._coefficients += coefficient
+        self._weighted_ages += coefficient * age_seconds
+        return self.max_age_seconds
+
+    def remove(self, coefficient: float, age_seconds: float) -> None:
+        if age_seconds >= self.max_age_seconds:
+            return
+        self._coefficients -= coefficient
+        self._weighted_ages -= coefficient * age_seconds
+
+    def advance(self, elapsed_seconds: float) -> None:
+        self._weighted_ages += self._coefficients * elapsed_seconds
+
+    def value(self) -> float:
+        return self._coefficients - self._weighted_ages / self.max_age_seconds
+
+
+class ExponentialDecayAccumulator(DecayAccumulator):
+    """
+    sum(c * 0.5^(age / half_life)); every term halves together, so advancing rescales the sum.
+    """
+
+    def __init__(self, half_life_seconds: float):
+        self.half_life_seconds = half_life_seconds
+        self._sum = 0.0
+
+    def add(self, coefficient: float, age_seconds: float) -> Optional[float]:
+        self._sum += coefficient * math.pow(0.5, age_seconds / self.half_life_seconds)
+        return None
+
+    def remove(self, coefficient: float, age_seconds: float) -> None:
+        self._sum -= coefficient * math.pow(0.5, age_seconds / self.half_life_seconds)
+
+    def advance(self, elapsed_seconds: float) -> None:
+        self._sum *= math.pow(0.5, elapsed_seconds / self.half_life_seconds)
+
+    def value(self) -> float:
+        return self._sum
@@ -1,20 +1,81 @@
-from typing import List
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Tuple
 from src.memory.store.memory_store import MemoryStore
+from src.memory.interfaces.memory_store_listener import MemoryStoreListener
 from src.memory.domain.event_record import EventRecord
 from src.memory.domain.scoped_memory_view import ScopedMemoryView
 from src.core.domain.strategic_context import StrategicContext
 
 
-class MemoryScopeResolver:
+class MemoryScopeResolver(MemoryStoreListener):
     """
     Pure service. Resolves relevant memory events for a given strategic context.
     Currently filters by exact context match, but can be extended for hierarchical scoping.
+
+    With window_size set, keeps a bounded per-domain window of the most recent events,
+    updated on append instead of rescanning the store on every resolve. The window is
+    equal to the last window_size events of the full scan, in store order.
+    version() then gives a cheap per-domain change marker.
+
+    Stores that other processes append to cannot be tracked through listeners; for those
+    each resolve reads the domain's last window_size events from the store instead.
     """
 
-    def __init__(self, store: MemoryStore):
+    def __init__(self, store: MemoryStore, window_size: Optional[int] = None):
+        if window_size is not None and window_size < 1:
+            raise ValueError("window_size must be >= 1")
         self.store = store
+        self.window_size = window_size
+        self._windows: Dict[str, Deque[EventRecord]] = {}
+        self._appends: Dict[str, int] = {}
+        self._resets = 0
+        self._lock = Lock()
+        self._tracked = window_size is not None and not store.has_external_writers()
+        if self._tracked:
+            store.add_listener(self)
+
+    def on_append(self, event: EventRecord) -> None:
+        domain = getattr(event, 'context_domain', None)
+        with self._lock:
+            self._appends[domain] = self._appends.get(domain, 0) + 1
+            window = self._windows.get(domain)
+            # Unseeded domains are built from the store on first resolve.
+            # A seed racing with this append may already hold the event.
+            if window is not None and not (window and window[-1] is event):
+                window.append(event)
+
+    def on_reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self._appends.clear()
+            self._resets += 1
+
+    def version(self, domain: str) -> Optional[Tuple[int, int]]:
+        """
+        Marker that changes whenever the domain's window may have changed.
+        None when no window is maintained (window_size unset, or a store shared with other
+        writers).
+        """
+        if not self._tracked:
+            return None
+        with self._lock:
+            return self._resets, self._appends.get(domain, 0)
+
+    def forget(self, domain: str) -> None:
+        """
+        Drops the domain's window; the next resolve seeds it from the store again.
+        """
+        with self._lock:
+            if self._windows.pop(domain, None) is not None:
+                self._appends[domain] = self._appends.get(domain, 0) + 1
 
     def resolve(self, context: StrategicContext) -> ScopedMemoryView:
+        if self.window_size is not None:
+            if not self._tracked:
+                return ScopedMemoryView(events=self._read_window(context.domain))
+            return ScopedMemoryView(events=self._resolve_window(context.domain))
+
         # In M.1, EventRecord doesn't explicitly store StrategicContext.
         # However, LifeLoop emits events with 'context_domain' which maps to context.
         # Wait, EventRecord in M.1 stores:
@@ -51,4 +112,15 @@ class MemoryScopeResolver:
             if getattr(e, 'context_domain', None) == context.domain
         ]
 
-        return ScopedMemoryView(events=scoped_events)
\ No newline at end of file
+        return ScopedMemoryView(events=scoped_events)
+
+    def _resolve_window(self, domain: str) -> List[EventRecord]:
+        with self._lock:
+            window = self._windows.get(domain)
+            if window is None:
+                window = deque(self._read_window(domain), maxlen=self.window_size)
+                self._windows[domain] = window
+            return list(window)
+
+    def _read_window(self, domain: str) -> List[EventRecord]:
+        return self.store.list_by_context(domain, limit=self.window_size)[::-1]
@@ -1,6 +1,6 @@
 from typing import List, Dict
 from src.memory.domain.memory_signal import MemorySignal
-from src.memory.services.temporal_memory_analyzer import WeightedEvent, TemporalMemoryAnalyzer
+from src.memory.services.temporal_memory_analyzer import WeightedEvent, TemporalMemoryAnalyzer, TemporalSummary
 from src.memory.domain.temporal_window import TemporalWindow
 from src.core.domain.execution_result import ExecutionStatus
 
@@ -55,4 +55,28 @@ class MemorySignalBuilder:
             missed_opportunity_pressure=counterfactual_metrics.get("missed_opportunity_pressure", 0.0),
             governance_friction_index=counterfactual_metrics.get("governance_friction_index", 0.0),
             policy_conflict_density=counterfactual_metrics.get("policy_conflict_density", 0.0)
-        )
\ No newline at end of file
+        )
+
+    def build_from_summary(
+            self,
+            summary: TemporalSummary,
+            analyzer: TemporalMemoryAnalyzer,
+            counterfactual_metrics: Dict[str, float]
+    ) -> MemorySignal:
+        """
+        Counterpart of build() fed by TemporalMemoryAnalyzer.summarize; used by MemorySignalTracker rebuilds.
+        """
+        if summary.recent_count == 0:
+            gov_ratio = 0.0
+        else:
+            gov_ratio = summary.recent_governance_suppressed / summary.recent_count
+
+        return MemorySignal(
+            failure_pressure=summary.failure_pressure,
+            recent_success=summary.recent_success,
+            instability_detected=summary.recent_failure_pressure >= analyzer.FAILURE_CLUSTER_THRESHOLD,
+            governance_suppressed_ratio=gov_ratio,
+            missed_opportunity_pressure=counterfactual_metrics.get("missed_opportunity_pressure", 0.0),
+            governance_friction_index=counterfactual_metrics.get("governance_friction_index", 0.0),
+            policy_conflict_density=counterfactual_metrics.get("policy_conflict_density", 0.0)
+        )
@@ -0,0 +1,280 @@
+from dataclasses import dataclass
+import math
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.domain.execution_result import ExecutionStatus
+from src.memory.domain.counterfactual_event import CounterfactualEvent
+from src.memory.domain.event_record import EventRecord
+from src.memory.domain.memory_signal import MemorySignal
+from src.memory.domain.strategic_memory_context import StrategicMemoryContext
+from src.memory.domain.temporal_window import RECENT_MAX_AGE_SECONDS
+from src.memory.interfaces.decay_accumulator import DecayAccumulator
+from src.memory.services.counterfactual_analyzer import CounterfactualAnalyzer
+from src.memory.services.memory_signal_builder import MemorySignalBuilder
+from src.memory.services.memory_strategy_adapter import MemoryStrategyAdapter
+from src.memory.services.temporal_memory_analyzer import TemporalMemoryAnalyzer, TemporalSummary
+
+
+_HORIZON_MARGIN_SECONDS = 1e-3
+
+
+@dataclass(frozen=True)
+class TrackedMemory:
+    """
+    A context's memory analysis as of one tick.
+    """
+    signal: MemorySignal
+    memory_context: StrategicMemoryContext
+    recent_events: List[EventRecord]
+    recent_counterfactuals: List[CounterfactualEvent]
+
+
+@dataclass
+class _Term:
+    event: EventRecord
+    coefficient: float  # |static weight| of a failure, 0.0 otherwise
+    failure_run: int
+    success: bool
+    suppressed: bool
+
+
+class _ContextMemory:
+    def __init__(self):
+        self.events_version: Any = None
+        self.counterfactuals_version: Any = None
+        self.events: List[EventRecord] = []
+        self.counterfactuals: List[CounterfactualEvent] = []
+        self.cf_metrics: Dict[str, float] = {}
+        # None when the window is not in issued_at order or the decay has no accumulator
+        self.terms: Optional[List[_Term]] = None
+        self.reference: Optional[datetime] = None
+        # Seconds after reference until a term changes window or leaves its closed form
+        self.horizon = math.inf
+        self.failure: Optional[DecayAccumulator] = None
+        self.recent_failure: Optional[DecayAccumulator] = None
+        self.pending_failure = 0.0  # future-dated failures, decay 1.0 until issued
+        self.recent_count = 0
+        self.recent_suppressed = 0
+        self.recent_successes = 0
+        self.summary: Optional[TemporalSummary] = None
+        self.tracked: Optional[TrackedMemory] = None
+
+
+class MemorySignalTracker:
+    """
+    Maintains each context's MemorySignal across ticks instead of recomputing it.
+
+    - No new memory input and the same tick time: the previous result is returned as is.
+    - No new input, later tick time: decayed sums are advanced in O(1) through the decay
+      strategy's DecayAccumulator; counts only change when an event leaves the recent
+      window or decay range, which triggers a rebuild of that context.
+    - New events appended in issued_at order: only the appended and evicted events are
+      folded in. Out-of-order events, or evictions that cut a failure run (density depends
+      on the run), rebuild the context.
+
+    Results match the per-event path within 1e-9 (float summation order differs).
+    Inputs are detected through store version markers; None means "unknown, reload".
+    Not thread-safe; the orchestrator calls it from its serial stage.
+    """
+
+    def __init__(
+            self,
+            analyzer: TemporalMemoryAnalyzer,
+            counterfactual_analyzer: CounterfactualAnalyzer,
+            signal_builder: MemorySignalBuilder,
+            strategy_adapter: MemoryStrategyAdapter
+    ):
+        self.analyzer = analyzer
+        self.counterfactual_analyzer = counterfactual_analyzer
+        self.signal_builder = signal_builder
+        self.strategy_adapter = strategy_adapter
+        self._contexts: Dict[str, _ContextMemory] = {}
+
+    def track(
+            self,
+            key: str,
+            now: datetime,
+            events_version: Any,
+            counterfactuals_version: Any,
+            load_events: Callable[[], List[EventRecord]],
+            load_counterfactuals: Callable[[], List[CounterfactualEvent]]
+    ) -> TrackedMemory:
+        state = self._contexts.get(key)
+        if state is None:
+            state = self._contexts[key] = _ContextMemory()
+
+        events_changed = events_version is None or events_version != state.events_version or state.tracked is None
+        cf_changed = (
+                counterfactuals_version is None
+                or counterfactuals_version != state.counterfactuals_version
+                or state.tracked is None
+        )
+        if not events_changed and not cf_changed and now == state.reference:
+            return state.tracked
+
+        if cf_changed:
+            state.counterfactuals = load_counterfactuals()
+            state.cf_metrics = self.counterfactual_analyzer.analyze(state.counterfactuals, now)
+            state.counterfactuals_version = counterfactuals_version
+
+        if events_changed:
+            events = load_events()
+            if not self._fold(state, events, now):
+                self._rebuild(state, events, now)
+            state.events_version = events_version
+        elif now != state.reference:
+            if not self._advance(state, now):
+                self._rebuild(state, state.events, now)
+
+        return self._publish(state)
+
+    def forget(self, key: str) -> None:
+        self._contexts.pop(key, None)
+
+    def _publish(self, state: _ContextMemory) -> TrackedMemory:
+        summary = state.summary
+        if summary is None:
+            summary = TemporalSummary(
+                failure_pressure=state.failure.value() + state.pending_failure,
+                recent_failure_pressure=state.recent_failure.value() + state.pending_failure,
+                recent_success=state.recent_successes > 0,
+                recent_count=state.recent_count,
+                recent_governance_suppressed=state.recent_suppressed
+            )
+        signal = self.signal_builder.build_from_summary(summary, self.analyzer, state.cf_metrics)
+
+        previous = state.tracked
+        if previous is not None and previous.signal == signal:
+            memory_context = previous.memory_context
+        else:
+            memory_context = self.strategy_adapter.adapt(signal)
+        state.tracked = TrackedMemory(signal, memory_context, state.events, state.counterfactuals)
+        return state.tracked
+
+    def _advance(self, state: _ContextMemory, now: datetime) -> bool:
+        if state.terms is None or now < state.reference:
+            return False
+        elapsed = (now - state.reference).total_seconds()
+        # Margin absorbs float drift so a term never crosses a boundary unnoticed
+        if elapsed >= state.horizon - _HORIZON_MARGIN_SECONDS:
+            return False
+        state.horizon -= elapsed
+        state.failure.advance(elapsed)
+        state.recent_failure.advance(elapsed)
+        state.reference = now
+        return True
+
+    def _fold(self, state: _ContextMemory, events: List[EventRecord], now: datetime) -> bool:
+        if not self._advance(state, now):
+            return False
+        old = state.events
+        terms = state.terms
+
+        if old:
+            tail = None
+            for index in range(len(events) - 1, -1, -1):
+                if events[index] is old[-1]:
+                    tail = index
+                    break
+            if tail is None:
+                return False
+            evicted = len(old) - (tail + 1)
+            if evicted < 0 or events[0] is not old[evicted]:
+                return False
+            if evicted and terms[evicted - 1].failure_run > 0:
+                return False
+            appended = events[tail + 1:]
+        else:
+            evicted = 0
+            appended = events
+
+        previous = old[-1] if old else None
+        for event in appended:
+            if previous is not None and event.issued_at < previous.issued_at:
+                return False
+            previous = event
+
+        for term in terms[:evicted]:
+            self._remove_term(state, term, now)
+        run = terms[-1].failure_run if terms else 0
+        del terms[:evicted]
+        self._append_terms(state, appended, run, now)
+        state.events = events
+        state.summary = None
+        return True
+
+    def _rebuild(self, state: _ContextMemory, events: List[EventRecord], now: datetime) -> None:
+        state.events = events
+        state.reference = now
+        state.horizon = math.inf
+        state.failure = self.analyzer.decay_strategy.accumulator()
+        state.recent_failure = self.analyzer.decay_strategy.accumulator()
+        if state.failure is None:
+            # No incremental form: recompute on every new tick time.
+            state.terms = None
+            state.summary = self.analyzer.summarize(events, now)
+            return
+
+        state.summary = None
+        state.pending_failure = 0.0
+        state.recent_count = 0
+        state.recent_suppressed = 0
+        state.recent_successes = 0
+        ordered = sorted(events, key=attrgetter("issued_at"))
+        state.terms = []
+        self._append_terms(state, ordered, 0, now)
+        if any(a is not b for a, b in zip(ordered, events)):
+            state.terms = None
+
+    def _append_terms(self, state: _ContextMemory, events: List[EventRecord], run: int, now: datetime) -> None:
+        weights, runs = self.analyzer.static_weights(events, run)
+        for event, weight, failure_run in zip(events, weights, runs):
+            governance = event.governance_snapshot
+            term = _Term(
+                event=event,
+                coefficient=-weight if weight < 0 else 0.0,
+                failure_run=failure_run,
+                success=event.execution_status == ExecutionStatus.SUCCESS,
+                suppressed=governance.is_execution_locked or governance.is_autonomy_locked
+            )
+            self._add_term(state, term, now)
+            state.terms.append(term)
+
+    def _add_term(self, state: _ContextMemory, term: _Term, now: datetime) -> None:
+        age = (now - term.event.issued_at).total_seconds()
+        if age < 0:
+            # Decay starts once the event is issued.
+            if -age < state.horizon:
+                state.horizon = -age
+            state.pending_failure += term.coefficient
+        else:
+            if term.coefficient:
+                limit = state.failure.add(term.coefficient, age)
+                if limit is not None and limit - age < state.horizon:
+                    state.horizon = limit - age
+            if age >= RECENT_MAX_AGE_SECONDS:
+                return
+            if RECENT_MAX_AGE_SECONDS - age < state.horizon:
+                state.horizon = RECENT_MAX_AGE_SECONDS - age
+            if term.coefficient:
+                state.recent_failure.add(term.coefficient, age)
+        state.recent_count += 1
+        state.recent_successes += int(term.success)
+        state.recent_suppressed += int(term.suppressed)
+
+    def _remove_term(self, state: _ContextMemory, term: _Term, now: datetime) -> None:
+        age = (now - term.event.issued_at).total_seconds()
+        if age < 0:
+            state.pending_failure -= term.coefficient
+        else:
+            if term.coefficient:
+                state.failure.remove(term.coefficient, age)
+            if age >= RECENT_MAX_AGE_SECONDS:
+                return
+            if term.coefficient:
+                state.recent_failure.remove(term.coefficient, age)
+        state.recent_count -= 1
+        state.recent_successes -= int(term.success)
+        state.recent_suppressed -= int(term.suppressed)
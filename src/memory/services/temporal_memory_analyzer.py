@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List, Dict, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -5,7 +6,7 @@ from dataclasses import dataclass
 from src.memory.domain.event_record import EventRecord
 from src.core.domain.execution_result import ExecutionStatus
 from src.memory.interfaces.memory_decay_strategy import MemoryDecayStrategy
-from src.memory.domain.temporal_window import TemporalWindow, classify_window
+from src.memory.domain.temporal_window import TemporalWindow, classify_window, RECENT_MAX_AGE_SECONDS
 
 
 @dataclass(frozen=True)
@@ -15,6 +16,19 @@ class WeightedEvent:
     window: TemporalWindow
 
 
+@dataclass(frozen=True)
+class TemporalSummary:
+    """
+    Aggregates of one context's weighted events, as consumed by MemorySignalBuilder.
+    Produced by summarize() instead of materializing WeightedEvents.
+    """
+    failure_pressure: float  # sum of |weight| over negative weights
+    recent_failure_pressure: float  # same, IMMEDIATE/RECENT windows only
+    recent_success: bool
+    recent_count: int
+    recent_governance_suppressed: int
+
+
 class TemporalMemoryAnalyzer:
     """
     Analyzes a list of events to compute weights, detect clusters, and classify windows.
@@ -89,4 +103,109 @@ class TemporalMemoryAnalyzer:
             if we.weight < 0 and we.window in (TemporalWindow.IMMEDIATE, TemporalWindow.RECENT)
         )
 
-        return weighted_failure_sum >= self.FAILURE_CLUSTER_THRESHOLD
\ No newline at end of file
+        return weighted_failure_sum >= self.FAILURE_CLUSTER_THRESHOLD
+
+    def static_weights(
+            self,
+            ordered_events: List[EventRecord],
+            consecutive_failures: int = 0
+    ) -> Tuple[List[float], List[int]]:
+        """
+        Time-independent part of each event's weight (base * governance * density), for events
+        already in issued_at order, continuing a failure run of consecutive_failures.
+        Also returns the failure run length after each event.
+        """
+        weights = []
+        runs = []
+        for event in ordered_events:
+            status = event.execution_status
+            if status == ExecutionStatus.SUCCESS:
+                base_weight = 1.0
+                density_mod = 1.0
+                consecutive_failures = 0
+            elif status == ExecutionStatus.FAILED or status == ExecutionStatus.REJECTED:
+                base_weight = -1.0 if status == ExecutionStatus.FAILED else -1.5
+                consecutive_failures += 1
+                density_mod = 1.0 + (0.5 * (consecutive_failures - 1))
+            else:
+                base_weight = 0.0
+                density_mod = 1.0
+
+            gov_mod = 1.0
+            if event.governance_snapshot.is_execution_locked:
+                gov_mod *= 0.2
+            if event.governance_snapshot.is_autonomy_locked:
+                gov_mod *= 0.4
+
+            weights.append(base_weight * gov_mod * density_mod)
+            runs.append(consecutive_failures)
+        return weights, runs
+
+    def summarize(self, events: List[EventRecord], now: datetime) -> TemporalSummary:
+        """
+        The aggregates MemorySignalBuilder derives from analyze(), computed without building
+        WeightedEvents; ages are decayed in one decay_many call. Matches the analyze() path
+        to within 1e-9; with LinearDecay and ExponentialDecay the terms and summation order
+        are the same, so results are identical.
+        """
+        ordered = sorted(events, key=attrgetter("issued_at"))
+        ages = [(now - event.issued_at).total_seconds() for event in ordered]
+        decays = self.decay_strategy.decay_many([age if age > 0 else 0.0 for age in ages])
+
+        success = ExecutionStatus.SUCCESS
+        failed = ExecutionStatus.FAILED
+        rejected = ExecutionStatus.REJECTED
+        failure_terms = []
+        recent_failure_terms = []
+        recent_success = False
+        recent_count = 0
+        recent_suppressed = 0
+        consecutive_failures = 0
+
+        for event, age, decay in zip(ordered, ages, decays):
+            decay_factor = 1.0 if age < 0 else decay
+
+            status = event.execution_status
+            if status is success:
+                base_weight = 1.0
+                density_mod = 1.0
+                consecutive_failures = 0
+            elif status is failed or status is rejected:
+                base_weight = -1.0 if status is failed else -1.5
+                consecutive_failures += 1
+                density_mod = 1.0 + (0.5 * (consecutive_failures - 1))
+            else:
+                base_weight = 0.0
+                density_mod = 1.0
+
+            governance = event.governance_snapshot
+            execution_locked = governance.is_execution_locked
+            autonomy_locked = governance.is_autonomy_locked
+            gov_mod = 1.0
+            if execution_locked:
+                gov_mod *= 0.2
+            if autonomy_locked:
+                gov_mod *= 0.4
+
+            weight = base_weight * decay_factor * gov_mod * density_mod
+            # IMMEDIATE or RECENT window
+            recent = age < RECENT_MAX_AGE_SECONDS
+
+            if weight < 0:
+                failure_terms.append(-weight)
+                if recent:
+                    recent_failure_terms.append(-weight)
+            if recent:
+                recent_count += 1
+                if status is success:
+                    recent_success = True
+                if execution_locked or autonomy_locked:
+                    recent_suppressed += 1
+
+        return TemporalSummary(
+            failure_pressure=sum(failure_terms),
+            recent_failure_pressure=sum(recent_failure_terms),
+            recent_success=recent_success,
+            recent_count=recent_count,
+            recent_governance_suppressed=recent_suppressed
+        )
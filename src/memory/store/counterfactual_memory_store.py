@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from src.memory.domain.counterfactual_event import CounterfactualEvent
 
 
@@ -6,19 +6,30 @@ class CounterfactualMemoryStore:
     """
     Append-only in-memory storage for CounterfactualEvents.
     Separate from the main MemoryStore to avoid polluting factual history.
+    Events are also indexed by context domain.
     """
 
     def __init__(self):
         self._events: List[CounterfactualEvent] = []
+        self._by_domain: Dict[str, List[CounterfactualEvent]] = {}
+        self._clears = 0
 
     def append(self, event: CounterfactualEvent) -> None:
         self._events.append(event)
+        self._by_domain.setdefault(event.context_domain, []).append(event)
 
     def list_all(self) -> List[CounterfactualEvent]:
         return list(self._events)
 
     def list_by_context(self, context_domain: str) -> List[CounterfactualEvent]:
-        return [e for e in self._events if e.context_domain == context_domain]
+        return list(self._by_domain.get(context_domain, ()))
+
+    def version(self, context_domain: str) -> Optional[Tuple[int, int]]:
+        """
+        Marker that changes whenever events are added to or cleared from the domain.
+        None when the store cannot tell (e.g. shared external storage).
+        """
+        return self._clears, len(self._by_domain.get(context_domain, ()))
 
     def clear(self) -> None:
         """
@@ -26,10 +37,13 @@ class CounterfactualMemoryStore:
         Explicit public API for memory management.
         """
         self._events.clear()
+        self._by_domain.clear()
+        self._clears += 1
 
     def extend(self, events: List[CounterfactualEvent]) -> None:
         """
         Appends multiple events to the store.
         Explicit public API for bulk operations.
         """
-        self._events.extend(events)
\ No newline at end of file
+        for event in events:
+            self.append(event)
\ No newline at end of file
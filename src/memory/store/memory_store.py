@@ -1,29 +1,71 @@
-from typing import List
+from typing import Dict, List
 from src.memory.domain.event_record import EventRecord
+from src.memory.interfaces.memory_store_listener import MemoryStoreListener
 
 class MemoryStore:
     """
     Append-only in-memory storage for EventRecords.
+    Events are also indexed by context domain.
     """
     def __init__(self):
         self._events: List[EventRecord] = []
+        self._by_domain: Dict[str, List[EventRecord]] = {}
+        self._listeners: List[MemoryStoreListener] = []
+
+    def add_listener(self, listener: MemoryStoreListener) -> None:
+        """
+        Registers a listener notified on every mutation.
+        Used by derived views (e.g. per-context windows) to stay in sync without rescanning.
+        """
+        self._listeners.append(listener)
 
     def append(self, event: EventRecord) -> None:
         self._events.append(event)
+        self._index(event)
+        self._notify_append(event)
 
     def list_all(self) -> List[EventRecord]:
         return list(self._events)
 
+    def list_by_context(self, context_domain: str, limit: int = 100) -> List[EventRecord]:
+        """
+        The domain's most recent events, newest first.
+        """
+        events = self._by_domain.get(context_domain, [])
+        return events[:-limit - 1:-1] if limit > 0 else []
+
+    def has_external_writers(self) -> bool:
+        """
+        True when other processes append to the same storage, so listeners miss their events.
+        """
+        return False
+
     def clear(self) -> None:
         """
         Clears all events from the store.
         Explicit public API for memory management.
         """
         self._events.clear()
+        self._by_domain.clear()
+        self._notify_reset()
 
     def extend(self, events: List[EventRecord]) -> None:
         """
         Appends multiple events to the store.
         Explicit public API for bulk operations.
         """
-        self._events.extend(events)
\ No newline at end of file
+        self._events.extend(events)
+        for event in events:
+            self._index(event)
+        self._notify_reset()
+
+    def _index(self, event: EventRecord) -> None:
+        self._by_domain.setdefault(getattr(event, 'context_domain', None), []).append(event)
+
+    def _notify_append(self, event: EventRecord) -> None:
+        for listener in self._listeners:
+            listener.on_append(event)
+
+    def _notify_reset(self) -> None:
+        for listener in self._listeners:
+            listener.on_reset()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
@@ -82,3 +82,8 @@ class PostgresCounterfactualMemoryStore(CounterfactualMemoryStore):
                 {"context_domain": context_domain},
             ).fetchall()
             return [decode_payload(row.payload) for row in rows]
+
+
+    def version(self, context_domain: str) -> Optional[Tuple[int, int]]:
+        # Other writers share the table, so there is no local change marker.
+        return None
@@ -68,6 +68,7 @@ class PostgresMemoryStore(MemoryStore):
                     "payload": encode_payload(event),
                 },
             )
+        self._notify_append(event)
 
     def list_all(self) -> List[EventRecord]:
         with self.engine.begin() as conn:
@@ -76,6 +77,10 @@ class PostgresMemoryStore(MemoryStore):
             ).fetchall()
             return [decode_payload(row.payload) for row in rows]
 
+    def has_external_writers(self) -> bool:
+        # Other writers share the table
+        return True
+
     def list_by_context(self, context_domain: str, limit: int = 100) -> List[EventRecord]:
         with self.engine.begin() as conn:
             rows = conn.execute(
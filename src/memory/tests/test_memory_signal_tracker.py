@@ -0,0 +1,116 @@
+import random
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.autonomy.domain.autonomy_mode import AutonomyMode
+from src.autonomy.domain.autonomy_state import AutonomyState
+from src.core.domain.execution_result import ExecutionResult, ExecutionStatus, ExecutionFailureType
+from src.interaction.domain.policy_decision import PolicyDecision
+from src.memory.domain.event_record import EventRecord
+from src.memory.domain.governance_snapshot import GovernanceSnapshot
+from src.memory.interfaces.memory_decay_strategy import MemoryDecayStrategy
+from src.memory.services.counterfactual_analyzer import CounterfactualAnalyzer
+from src.memory.services.memory_decay_policy import LinearDecay, ExponentialDecay
+from src.memory.services.memory_signal_builder import MemorySignalBuilder
+from src.memory.services.memory_signal_tracker import MemorySignalTracker
+from src.memory.services.memory_strategy_adapter import MemoryStrategyAdapter
+from src.memory.services.temporal_memory_analyzer import TemporalMemoryAnalyzer
+
+START = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+STATUSES = [ExecutionStatus.SUCCESS, ExecutionStatus.FAILED, ExecutionStatus.REJECTED]
+TOLERANCE = 1e-9
+
+
+class StepDecay(MemoryDecayStrategy):
+    """
+    Decay without an accumulator: exercises the recompute fallback.
+    """
+
+    def decay(self, age: timedelta) -> float:
+        return 1.0 if age.total_seconds() < 600 else 0.25
+
+
+def _event(rng: random.Random, issued_at: datetime) -> EventRecord:
+    status = rng.choice(STATUSES)
+    locked = rng.random() < 0.2
+    return EventRecord(
+        id=uuid4(),
+        intent_id=uuid4(),
+        execution_status=status,
+        execution_result=ExecutionResult(status, issued_at, failure_type=ExecutionFailureType.NONE),
+        autonomy_state_before=AutonomyState(AutonomyMode.READY, "test", 0.5, [], False),
+        policy_decision=PolicyDecision(True, "OK", []),
+        governance_snapshot=GovernanceSnapshot(locked, rng.random() < 0.2, locked),
+        issued_at=issued_at,
+        context_domain="test"
+    )
+
+
+def _tracker(decay: MemoryDecayStrategy) -> MemorySignalTracker:
+    return MemorySignalTracker(
+        TemporalMemoryAnalyzer(decay), CounterfactualAnalyzer(), MemorySignalBuilder(), MemoryStrategyAdapter()
+    )
+
+
+@pytest.mark.parametrize("decay", [LinearDecay(3600), ExponentialDecay(900), StepDecay()])
+@pytest.mark.parametrize("offsets", [[0], [0, 0, 0, -5, -4000, 120]])
+def test_tracked_signal_matches_full_recompute(decay, offsets):
+    rng = random.Random(3)
+    tracker = _tracker(decay)
+    builder = MemorySignalBuilder()
+    window = deque(maxlen=20)
+    version = 0
+    now = START
+
+    for _ in range(400):
+        now += timedelta(seconds=rng.choice([0, 1, 30, 240, 900]))
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(1, 4)):
+                # Mostly in order, sometimes late or future-dated
+                offset = rng.choice(offsets)
+                window.append(_event(rng, now + timedelta(seconds=offset)))
+                version += 1
+
+        tracked = tracker.track("ctx", now, version, 0, lambda: list(window), lambda: [])
+
+        analyzer = tracker.analyzer
+        expected = builder.build(analyzer.analyze(list(window), now), analyzer, {})
+        actual = tracked.signal
+        assert abs(actual.failure_pressure - expected.failure_pressure) <= TOLERANCE
+        assert abs(actual.governance_suppressed_ratio - expected.governance_suppressed_ratio) <= TOLERANCE
+        assert actual.recent_success == expected.recent_success
+        assert actual.instability_detected == expected.instability_detected
+        assert tracked.memory_context == MemoryStrategyAdapter().adapt(actual)
+
+
+def test_idle_context_skips_memory_loads():
+    rng = random.Random(5)
+    tracker = _tracker(LinearDecay(3600))
+    events = [_event(rng, START - timedelta(seconds=s)) for s in (300, 200, 100)]
+    loads = []
+
+    def load_events():
+        loads.append("events")
+        return events
+
+    def load_counterfactuals():
+        loads.append("counterfactuals")
+        return []
+
+    first = tracker.track("ctx", START, 1, 1, load_events, load_counterfactuals)
+    assert sorted(loads) == ["counterfactuals", "events"]
+
+    # Same input, same time: previous result is reused
+    assert tracker.track("ctx", START, 1, 1, load_events, load_counterfactuals) is first
+
+    # Same input, later time: decay advances without reloading
+    later = tracker.track("ctx", START + timedelta(seconds=60), 1, 1, load_events, load_counterfactuals)
+    assert len(loads) == 2
+    assert later.signal.failure_pressure <= first.signal.failure_pressure
+
+    tracker.forget("ctx")
+    tracker.track("ctx", START, 1, 1, load_events, load_counterfactuals)
+    assert len(loads) == 4
@@ -50,4 +50,92 @@ def test_scope_resolution():
     view_finance = resolver.resolve(context_finance)
 
     assert len(view_finance.events) == 1
-    assert view_finance.events[0] == e2
\ No newline at end of file
+    assert view_finance.events[0] == e2
+
+def test_windowed_scope_matches_full_scan_tail():
+    store = MemoryStore()
+    full = MemoryScopeResolver(store)
+    windowed = MemoryScopeResolver(store, window_size=3)
+    social = StrategicContext("global", None, None, "social")
+    finance = StrategicContext("global", None, None, "finance")
+
+    # Seed one domain before any appends, the other lazily afterwards.
+    assert windowed.resolve(social).events == []
+    for i in range(7):
+        store.append(create_event("social" if i % 3 else "finance"))
+        assert windowed.resolve(social).events == full.resolve(social).events[-3:]
+
+    assert windowed.resolve(finance).events == full.resolve(finance).events[-3:]
+
+
+def test_windowed_scope_rebuilds_after_bulk_mutation():
+    store = MemoryStore()
+    full = MemoryScopeResolver(store)
+    windowed = MemoryScopeResolver(store, window_size=2)
+    social = StrategicContext("global", None, None, "social")
+
+    for _ in range(4):
+        store.append(create_event("social"))
+    assert windowed.resolve(social).events == full.resolve(social).events[-2:]
+
+    kept = [create_event("social")]
+    store.clear()
+    store.extend(kept)
+    assert windowed.resolve(social).events == kept
+
+    store.append(create_event("social"))
+    assert windowed.resolve(social).events == full.resolve(social).events[-2:]
+
+
+def test_window_size_must_be_positive():
+    with pytest.raises(ValueError):
+        MemoryScopeResolver(MemoryStore(), window_size=0)
+
+
+
+def _append_unnoticed(store: MemoryStore, event: EventRecord) -> None:
+    # What another process writing to shared storage looks like to this one's listeners
+    store._events.append(event)
+    store._index(event)
+
+
+class _SharedStore(MemoryStore):
+    def has_external_writers(self) -> bool:
+        return True
+
+
+def test_windows_seed_from_the_domain_without_scanning_the_store():
+    store = MemoryStore()
+    for i in range(6):
+        store.append(create_event("social" if i % 2 else "finance"))
+    store.list_all = None  # a full scan would fail
+    windowed = MemoryScopeResolver(store, window_size=2)
+    social = StrategicContext("global", None, None, "social")
+
+    assert windowed.resolve(social).events == store.list_by_context("social")[1::-1]
+
+
+def test_forget_reseeds_the_window():
+    store = MemoryStore()
+    resolver = MemoryScopeResolver(store, window_size=2)
+    social = StrategicContext("global", None, None, "social")
+    store.append(create_event("social"))
+    assert len(resolver.resolve(social).events) == 1
+
+    before = resolver.version("social")
+    _append_unnoticed(store, create_event("social"))
+    resolver.forget("social")
+    assert resolver.version("social") != before
+    assert resolver.resolve(social).events == store.list_all()
+
+
+def test_stores_with_external_writers_are_read_through():
+    store = _SharedStore()
+    resolver = MemoryScopeResolver(store, window_size=2)
+    social = StrategicContext("global", None, None, "social")
+    assert resolver.version("social") is None
+
+    store.append(create_event("social"))
+    _append_unnoticed(store, create_event("social"))
+    _append_unnoticed(store, create_event("social"))
+    assert resolver.resolve(social).events == store.list_all()[-2:]
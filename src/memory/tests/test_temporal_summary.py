@@ -0,0 +1,53 @@
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.autonomy.domain.autonomy_mode import AutonomyMode
+from src.autonomy.domain.autonomy_state import AutonomyState
+from src.core.domain.execution_result import ExecutionResult, ExecutionStatus, ExecutionFailureType
+from src.interaction.domain.policy_decision import PolicyDecision
+from src.memory.domain.event_record import EventRecord
+from src.memory.domain.governance_snapshot import GovernanceSnapshot
+from src.memory.services.memory_decay_policy import LinearDecay, ExponentialDecay
+from src.memory.services.memory_signal_builder import MemorySignalBuilder
+from src.memory.services.temporal_memory_analyzer import TemporalMemoryAnalyzer
+
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+STATUSES = [ExecutionStatus.SUCCESS, ExecutionStatus.FAILED, ExecutionStatus.REJECTED]
+TOLERANCE = 1e-9
+
+
+def _event(rng: random.Random) -> EventRecord:
+    status = rng.choice(STATUSES)
+    execution_locked = rng.random() < 0.2
+    autonomy_locked = rng.random() < 0.2
+    return EventRecord(
+        id=uuid4(),
+        intent_id=uuid4(),
+        execution_status=status,
+        execution_result=ExecutionResult(status, FIXED_NOW, failure_type=ExecutionFailureType.NONE),
+        autonomy_state_before=AutonomyState(AutonomyMode.READY, "test", 0.5, [], False),
+        policy_decision=PolicyDecision(True, "OK", []),
+        governance_snapshot=GovernanceSnapshot(execution_locked, autonomy_locked, execution_locked),
+        # Includes future-dated events (negative age)
+        issued_at=FIXED_NOW - timedelta(seconds=rng.uniform(-120, 7200)),
+        context_domain="test"
+    )
+
+
+@pytest.mark.parametrize("decay", [LinearDecay(3600), ExponentialDecay(600)])
+def test_summary_signals_match_per_event_path(decay):
+    rng = random.Random(7)
+    analyzer = TemporalMemoryAnalyzer(decay)
+    builder = MemorySignalBuilder()
+    for _ in range(40):
+        events = [_event(rng) for _ in range(rng.randint(0, 30))]
+
+        expected = builder.build(analyzer.analyze(events, FIXED_NOW), analyzer, {})
+        actual = builder.build_from_summary(analyzer.summarize(events, FIXED_NOW), analyzer, {})
+        assert abs(actual.failure_pressure - expected.failure_pressure) <= TOLERANCE
+        assert abs(actual.governance_suppressed_ratio - expected.governance_suppressed_ratio) <= TOLERANCE
+        assert actual.recent_success == expected.recent_success
+        assert actual.instability_detected == expected.instability_detected
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Optional, Tuple
 
 from src.memory.domain.counterfactual_event import CounterfactualEvent
 from src.memory.domain.event_record import EventRecord
@@ -52,6 +52,7 @@ class DualWriteMemoryStore(MemoryStore):
         self.postgres_store.append(event)
         if self.config.memory_write_enabled:
             self.memory_store.append(event)
+        self._notify_append(event)
 
     def list_all(self) -> List[EventRecord]:
         if self.config.postgres_read_primary:
@@ -88,6 +89,10 @@ class DualWriteCounterfactualStore(CounterfactualMemoryStore):
             return self.memory_store.list_by_context(context_domain)
         return [e for e in self.list_all() if e.context_domain == context_domain]
 
+    def version(self, context_domain: str) -> Optional[Tuple[int, int]]:
+        store = self.postgres_store if self.config.postgres_read_primary else self.memory_store
+        return store.version(context_domain)
+
 
 class DualWriteWorldObservationStore(WorldObservationStore):
     def __init__(
@@ -0,0 +1,42 @@
+import timeit
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from src.core.domain.intention import Intention
+from src.core.domain.strategic_memory import PathStatus
+from src.core.domain.strategic_trajectory import StrategicTrajectory, TrajectoryStatus
+from src.core.domain.strategy import StrategicPosture, StrategicMode
+from src.core.ledger.event_serialization import serialize_for_event, serialize_for_event_asdict
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+REPEAT = 5
+NUMBER = 20000
+
+
+def _payloads():
+    return {
+        "trajectory": StrategicTrajectory("expand_social_presence", TrajectoryStatus.ACTIVE, 0.7, NOW, NOW),
+        "posture": StrategicPosture(["engage", "observe", "reply"], 0.4, 0.6, 1.2, StrategicMode.TACTICAL),
+        "path_status": PathStatus(3, "FAILED", "soft", NOW, cooldown_until=NOW + timedelta(hours=2)),
+        "intention": Intention(
+            UUID(int=7), "post", "status update", 0.8, NOW, 600, {"source": "impulse", "pressure": 0.6}
+        ),
+    }
+
+
+def _best_us(serializer, payload) -> float:
+    runs = timeit.repeat(lambda: serializer(payload), repeat=REPEAT, number=NUMBER)
+    return min(runs) / NUMBER * 1e6
+
+
+def main():
+    print(f"{'payload':<12} {'asdict us':>10} {'fast us':>10} {'speedup':>8}")
+    for name, payload in _payloads().items():
+        assert serialize_for_event(payload) == serialize_for_event_asdict(payload)
+        reference = _best_us(serialize_for_event_asdict, payload)
+        fast = _best_us(serialize_for_event, payload)
+        print(f"{name:<12} {reference:>10.2f} {fast:>10.2f} {reference / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from typing import List
+from src.world.context.observation_index import ObservationIndex
 from src.world.domain.world_observation import WorldObservation
 
 class ContextBuffer:
@@ -23,3 +24,9 @@ class ContextBuffer:
 
     def depth(self) -> int:
         return len(self._buffer)
+
+    def pop_indexed(self) -> ObservationIndex:
+        """
+        pop_all(), routed by context domain.
+        """
+        return ObservationIndex(self.pop_all())
@@ -0,0 +1,46 @@
+from heapq import merge
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class ObservationIndex:
+    """
+    Observations of one tick grouped by context domain.
+
+    Each observation is rendered into its memory line and routed once, so a context reads
+    only its own domain's lines plus the unscoped ones (no or empty context_domain), in
+    arrival order.
+    """
+
+    def __init__(self, observations: Iterable[Any] = ()):
+        self._by_domain: Dict[Any, List[Tuple[int, str]]] = {}
+        self._unscoped: List[Tuple[int, str]] = []
+        self._count = 0
+        for position, obs in enumerate(observations):
+            self._count += 1
+            line = _memory_line(obs)
+            if line is None:
+                continue
+            domain = getattr(obs, "context_domain", None)
+            if domain:
+                self._by_domain.setdefault(domain, []).append((position, line))
+            else:
+                self._unscoped.append((position, line))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def memories_for(self, context_domain: str) -> List[str]:
+        scoped = self._by_domain.get(context_domain)
+        if not scoped:
+            return [line for _, line in self._unscoped]
+        if not self._unscoped:
+            return [line for _, line in scoped]
+        return [line for _, line in merge(scoped, self._unscoped)]
+
+
+def _memory_line(obs: Any) -> Optional[str]:
+    if obs.interaction:
+        return f"Observed interaction: {obs.interaction.message_type} from {obs.interaction.user_id}"
+    if obs.signal:
+        return f"Observed signal: {obs.signal.source_id}"
+    return None
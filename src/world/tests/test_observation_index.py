@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.interaction.domain.interaction_event import InteractionEvent
+from src.world.context.context_buffer import ContextBuffer
+from src.world.context.observation_index import ObservationIndex
+from src.world.domain.signal import NormalizedSignal
+from src.world.domain.world_observation import WorldObservation
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _observation(i: int, domain) -> WorldObservation:
+    if i % 3 == 0:
+        signal = NormalizedSignal(UUID(int=i + 1), f"rss:{i}", NOW, NOW, "content")
+        return WorldObservation(signal=signal, context_domain=domain)
+    if i % 3 == 1:
+        interaction = InteractionEvent(UUID(int=i + 1), "telegram", f"user-{i}", "chat", "hi", "text", NOW, {})
+        return WorldObservation(interaction=interaction, context_domain=domain)
+    return WorldObservation(context_domain=domain)
+
+
+def _scan(observations, context_domain):
+    # Per-context filtering the index replaces.
+    memories = []
+    for obs in observations:
+        obs_domain = getattr(obs, "context_domain", None)
+        if obs_domain and obs_domain != context_domain:
+            continue
+        if obs.interaction:
+            memories.append(f"Observed interaction: {obs.interaction.message_type} from {obs.interaction.user_id}")
+        elif obs.signal:
+            memories.append(f"Observed signal: {obs.signal.source_id}")
+    return memories
+
+
+def test_index_matches_per_context_scan():
+    domains = ["social", "finance", None, "", "social", "ops", None]
+    observations = [_observation(i, domains[i % len(domains)]) for i in range(60)]
+    index = ObservationIndex(observations)
+
+    assert len(index) == 60
+    for domain in ("social", "finance", "ops", "unknown", None, ""):
+        assert index.memories_for(domain) == _scan(observations, domain)
+
+
+def test_buffer_pop_indexed_drains_buffer():
+    buffer = ContextBuffer()
+    buffer.add(_observation(0, "social"))
+    buffer.add(_observation(1, None))
+
+    index = buffer.pop_indexed()
+
+    assert index.memories_for("social") == ["Observed signal: rss:0", "Observed interaction: text from user-1"]
+    assert index.memories_for("finance") == ["Observed interaction: text from user-1"]
+    assert buffer.depth() == 0
+    assert len(buffer.pop_indexed()) == 0